@@ -0,0 +1,169 @@
+"""
+Short-TTL async response cache with request coalescing.
+
+Used to share upstream responses between tools that ask for the same data
+within a few seconds of each other. Concurrent lookups for a key that is
+already being fetched await the same in-flight request instead of issuing
+a second upstream call.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlight:
+    """An upstream fetch shared by every caller waiting on the same key."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncTTLCache:
+    """
+    LRU cache whose entries expire ``ttl_seconds`` after they were stored.
+
+    Only successful fetches are cached; exceptions propagate to every
+    coalesced caller and nothing is stored. If every caller waiting on an
+    in-flight fetch is cancelled, the fetch itself is cancelled too.
+
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float = 60.0, max_entries: int = 1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, _InFlight] = {}
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a fresh cached value or None (does not touch hit/miss counters)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for ``key``, fetching it at most once.
+
+        Args:
+            key: Hashable cache key
+            fetch: Zero-argument coroutine function that loads the value
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        value = self.get(key)
+        if value is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.task.get_loop() is loop:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            inflight = _InFlight(loop.create_task(fetch()))
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(
+                lambda task, key=key, inflight=inflight: self._on_fetch_done(key, inflight, task)
+            )
+
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            if not inflight.task.done():
+                inflight.waiters -= 1
+                if inflight.waiters == 0:
+                    inflight.task.cancel()
+            raise
+
+    def _on_fetch_done(self, key: Hashable, inflight: _InFlight, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if task.result() is not None:
+            self.set(key, task.result())
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of cache effectiveness for logging/monitoring."""
+        lookups = self._hits + self._misses + self._coalesced
+        return {
+            "name": self.name,
+            "ttl_seconds": self.ttl_seconds,
+            "size": len(self._entries),
+            "in_flight": len(self._inflight),
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "evictions": self._evictions,
+            "hit_rate": round((self._hits + self._coalesced) / lookups, 3) if lookups else 0.0,
+        }
+
+
+# ============================================================================
+# Named cache registry
+# ============================================================================
+_caches: Dict[str, AsyncTTLCache] = {}
+
+
+def get_cache(name: str, **settings) -> AsyncTTLCache:
+    """
+    Get (or create) a shared named cache.
+
+    ``settings`` are only used the first time the cache is created.
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = AsyncTTLCache(name, **settings)
+        _caches[name] = cache
+    return cache
+
+
+def get_cache_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every registered cache, keyed by name."""
+    return {name: cache.metrics() for name, cache in _caches.items()}
+
+
+def reset_caches() -> None:
+    """Drop all registered caches (useful for testing)."""
+    _caches.clear()
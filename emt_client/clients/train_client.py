@@ -1,11 +1,45 @@
 from .client import EMTClient
-from emt_client.config import PNR_STATUS_URL, TRAIN_ROUTE_API_URL
+from emt_client.cache import get_cache
+from emt_client.concurrency import get_limiter
+from emt_client.config import (
+    PNR_STATUS_URL,
+    TRAIN_ROUTE_API_URL,
+    TRAIN_AVAILABILITY_INITIAL_CONCURRENCY,
+    TRAIN_AVAILABILITY_MIN_CONCURRENCY,
+    TRAIN_AVAILABILITY_MAX_CONCURRENCY,
+    TRAIN_AVAILABILITY_LATENCY_THRESHOLD,
+    TRAIN_AVAILABILITY_CACHE_TTL,
+)
 
 AVAILABILITY_CHECK_URL = "https://railways.easemytrip.com/Train/AvailToCheck"
 TRAIN_GET_DATES_URL = "https://solr.easemytrip.com/v1/api/auto/Train_GetDates"
 TRAIN_LIVE_STATUS_URL = "https://railways.easemytrip.com/TrainService/TrainLiveStatus"
 TRAIN_AUTOSUGGEST_URL = "https://autosuggest.easemytrip.com/api/auto/train_name?useby=popularu&key=jNUYK0Yj5ibO6ZVIkfTiFA=="
 
+# Limiter name for AvailToCheck - shared by train search fan-out and availability tool
+AVAILABILITY_UPSTREAM = "train_avail_to_check"
+
+
+def get_availability_limiter():
+    """Shared adaptive concurrency limiter for the AvailToCheck upstream."""
+    return get_limiter(
+        AVAILABILITY_UPSTREAM,
+        initial_limit=TRAIN_AVAILABILITY_INITIAL_CONCURRENCY,
+        min_limit=TRAIN_AVAILABILITY_MIN_CONCURRENCY,
+        max_limit=TRAIN_AVAILABILITY_MAX_CONCURRENCY,
+        latency_threshold=TRAIN_AVAILABILITY_LATENCY_THRESHOLD,
+    )
+
+
+def get_availability_cache():
+    """
+    Shared short-TTL cache of AvailToCheck responses.
+
+    Keyed on (train, class, quota, date, from, to) so train search fan-out
+    and the availability tool reuse each other's results.
+    """
+    return get_cache(AVAILABILITY_UPSTREAM, ttl_seconds=TRAIN_AVAILABILITY_CACHE_TTL)
+
 
 class TrainApiClient:
     """Train API client for EaseMyTrip railways service."""
@@ -28,6 +62,7 @@ class TrainApiClient:
         journey_date: str,
         from_display: str,
         to_display: str,
+        use_cache: bool = True,
     ) -> dict:
         """
         Check real-time availability for a specific train class.
@@ -44,10 +79,47 @@ class TrainApiClient:
             journey_date: Date in DD/MM/YYYY format
             from_display: Full from station display (e.g., "Delhi All Stations (NDLS)") - not used in current API
             to_display: Full to station display (e.g., "BaniBihar (BNBH)") - not used in current API
+            use_cache: Reuse a response cached within TRAIN_AVAILABILITY_CACHE_TTL
+                (concurrent identical checks share one upstream call; error
+                responses are shared by those concurrent callers only)
 
         Returns:
-            API response with avlDayList containing real availability
+            API response with avlDayList containing real availability.
+            Cached responses are shared between callers - do not mutate.
+
+        Calls are gated by the shared AvailToCheck adaptive limiter, which
+        raises concurrency while the upstream is healthy and backs off on
+        errors or latency spikes.
         """
+        if not use_cache:
+            return await self._fetch_availability(
+                train_no, class_code, quota, from_station_code, to_station_code, journey_date
+            )
+
+        cache_key = (train_no, class_code, quota, journey_date, from_station_code, to_station_code)
+        cache = get_availability_cache()
+        response = await cache.get_or_fetch(
+            cache_key,
+            lambda: self._fetch_availability(
+                train_no, class_code, quota, from_station_code, to_station_code, journey_date
+            ),
+        )
+        # Upstream-side errors (ErrorMsg) and responses without availability are not kept
+        error = response.get("ErrorMsg") if isinstance(response, dict) else None
+        if not isinstance(response, dict) or (error and error.get("ErrorMessage")) or not response.get("avlDayList"):
+            cache.invalidate(cache_key)
+        return response
+
+    async def _fetch_availability(
+        self,
+        train_no: str,
+        class_code: str,
+        quota: str,
+        from_station_code: str,
+        to_station_code: str,
+        journey_date: str,
+    ) -> dict:
+        """Call AvailToCheck (uncached) under the shared adaptive limiter."""
         payload = {
             "cls": class_code,
             "trainNo": train_no,
@@ -139,7 +211,8 @@ class TrainApiClient:
             "tkn": "",
             "IPAdress": ""
         }
-        return await self.client.post(AVAILABILITY_CHECK_URL, payload)
+        async with get_availability_limiter().slot():
+            return await self.client.post(AVAILABILITY_CHECK_URL, payload)
 
     async def check_route(
         self,
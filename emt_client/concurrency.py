@@ -0,0 +1,266 @@
+"""
+Adaptive concurrency control for upstream API fan-out.
+
+Provides an AIMD (additive-increase / multiplicative-decrease) limiter that
+grows the number of in-flight requests while an upstream is healthy and backs
+off on errors or latency spikes. One limiter is kept per upstream name so
+every caller hitting the same endpoint shares the same budget.
+
+run_with_deadline fans out independent searches (fare calendar days,
+multi-route flights, multi-city hotels) with a fixed concurrency cap and
+one shared deadline.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter for a single upstream.
+
+    - Every successful call with healthy latency adds 1/limit to the limit
+      (i.e. roughly +1 per fully utilised window).
+    - An error, or a latency above the spike threshold, multiplies the limit
+      by ``backoff_ratio``. At most one decrease is applied per cooldown
+      window so a burst of failures doesn't collapse the limit to the floor.
+
+    A call counts as a latency spike when it takes longer than
+    ``latency_threshold`` seconds, or longer than ``latency_tolerance`` times
+    the smoothed latency of recent healthy calls.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        latency_threshold: float = 5.0,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.5,
+        cooldown_seconds: float = 1.0,
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must be >= min_limit")
+
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.cooldown_seconds = cooldown_seconds
+
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latency_ewma: Optional[float] = None
+        self._last_backoff = 0.0
+
+        # Metrics
+        self._successes = 0
+        self._errors = 0
+        self._latency_spikes = 0
+        self._backoffs = 0
+        self._peak_in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit (whole requests)."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one upstream slot for the duration of the block.
+
+        The outcome is recorded automatically: an exception counts as an
+        error, otherwise the elapsed time is fed to the latency tracker.
+        Cancellation releases the slot without affecting the limit.
+        """
+        await self._acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._on_error()
+            raise
+        else:
+            self._on_success(time.monotonic() - start)
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._take_slot()
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed to us right before cancellation - give it back
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def _take_slot(self) -> None:
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._take_slot()
+            waiter.set_result(None)
+
+    def _on_success(self, latency: float) -> None:
+        baseline = self._latency_ewma
+        spike_at = self.latency_threshold
+        if baseline is not None:
+            spike_at = min(spike_at, max(baseline * self.latency_tolerance, 0.5))
+
+        if latency > spike_at:
+            self._latency_spikes += 1
+            self._backoff(f"latency {latency:.2f}s > {spike_at:.2f}s")
+            return
+
+        self._successes += 1
+        self._latency_ewma = latency if baseline is None else (0.8 * baseline + 0.2 * latency)
+
+        previous = self.limit
+        self._limit = min(float(self.max_limit), self._limit + 1.0 / max(self._limit, 1.0))
+        if self.limit > previous:
+            logger.debug(f"[{self.name}] concurrency limit raised to {self.limit}")
+            self._wake_waiters()
+
+    def _on_error(self) -> None:
+        self._errors += 1
+        self._backoff("upstream error")
+
+    def _backoff(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_backoff < self.cooldown_seconds:
+            return
+        self._last_backoff = now
+
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        self._backoffs += 1
+        logger.info(f"[{self.name}] concurrency limit {previous} -> {self.limit} ({reason})")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of the limiter state for logging/monitoring."""
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "peak_in_flight": self._peak_in_flight,
+            "successes": self._successes,
+            "errors": self._errors,
+            "latency_spikes": self._latency_spikes,
+            "backoffs": self._backoffs,
+            "latency_ewma_ms": (
+                round(self._latency_ewma * 1000, 1) if self._latency_ewma is not None else None
+            ),
+        }
+
+
+# ============================================================================
+# Per-upstream registry
+# ============================================================================
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_limiter(name: str, **settings) -> AdaptiveConcurrencyLimiter:
+    """
+    Get (or create) the shared limiter for an upstream.
+
+    ``settings`` are only used the first time the limiter is created.
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(name, **settings)
+        _limiters[name] = limiter
+    return limiter
+
+
+def get_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every registered upstream limiter, keyed by name."""
+    return {name: limiter.metrics() for name, limiter in _limiters.items()}
+
+
+def reset_limiters() -> None:
+    """Drop all registered limiters (useful for testing)."""
+    _limiters.clear()
+
+
+# ============================================================================
+# Bounded fan-out with a shared deadline
+# ============================================================================
+async def run_with_deadline(
+    jobs: Dict[str, Callable[[], Awaitable[Any]]],
+    max_concurrent: int,
+    timeout: float,
+) -> Dict[str, Tuple[str, Any]]:
+    """
+    Run independent searches with at most ``max_concurrent`` in flight and
+    one shared deadline.
+
+    Returns ``{key: (status, value)}`` with ``("ok", result)``,
+    ``("error", exception)`` or ``("timeout", None)`` for jobs still pending
+    at the deadline (those are cancelled).
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def _bounded(job: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await job()
+
+    tasks = {key: asyncio.create_task(_bounded(job)) for key, job in jobs.items()}
+    try:
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+
+    outcomes: Dict[str, Tuple[str, Any]] = {}
+    for key, task in tasks.items():
+        if task.cancelled():
+            outcomes[key] = ("timeout", None)
+        elif task.exception() is not None:
+            outcomes[key] = ("error", task.exception())
+        else:
+            outcomes[key] = ("ok", task.result())
+    return outcomes
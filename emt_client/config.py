@@ -145,6 +145,7 @@ HOTEL_DEEPLINK = "https://www.easemytrip.com/hotel-new/details?"
 LOGIN_URL = f"{BASE_URL}/HotelService/UserLogin"
 HOTEL_SEARCH_URL = f"{BASE_URL}/HotelService/HotelListIdWiseNew"
 HOTEL_SEARCH_WITH_FILTER_URL = f"{BASE_URL}/HotelService/HotelSearch"
+HOTEL_DETAILS_URL = f"{BASE_URL}/HotelService/HotelDetails"
 
 # 🚂 TRAIN SERVICE BASE URL
 TRAIN_BASE_URL = "https://railways.easemytrip.com"
@@ -431,6 +432,7 @@ BOOKING_POLICIES = {
 # Allow environment variables to override any URL
 LOGIN_URL = getenv("LOGIN_URL", LOGIN_URL)
 HOTEL_SEARCH_URL = getenv("HOTEL_SEARCH_URL", HOTEL_SEARCH_URL)
+HOTEL_DETAILS_URL = getenv("HOTEL_DETAILS_URL", HOTEL_DETAILS_URL)
 
 # ============================================================================
 # 🚌 BUS API CONFIGURATION
@@ -485,6 +487,221 @@ BUS_DECRYPTION_KEY = _get_config_value(
     default='TMTOO1vDhT9aWsV1'
 )
 
+# Seconds a raw GetSearchResult response is reused (filter changes, next page)
+BUS_SEARCH_CACHE_TTL = float(_get_config_value(
+    'BUS_SEARCH_CACHE_TTL',
+    'BUS_SEARCH_CACHE_TTL',
+    default=60
+))
+
+# Seconds a processed SeatBind layout is reused for the same bus/route/date/points
+BUS_SEAT_LAYOUT_CACHE_TTL = float(_get_config_value(
+    'BUS_SEAT_LAYOUT_CACHE_TTL',
+    'BUS_SEAT_LAYOUT_CACHE_TTL',
+    default=30
+))
+
+# Seat layouts prefetched in the background for the top buses of a page (0 = off)
+BUS_SEAT_LAYOUT_PREFETCH_COUNT = int(_get_config_value(
+    'BUS_SEAT_LAYOUT_PREFETCH_COUNT',
+    'BUS_SEAT_LAYOUT_PREFETCH_COUNT',
+    default=0
+))
+
+# Max SeatBind calls in flight for one prefetch
+BUS_SEAT_LAYOUT_PREFETCH_CONCURRENCY = int(_get_config_value(
+    'BUS_SEAT_LAYOUT_PREFETCH_CONCURRENCY',
+    'BUS_SEAT_LAYOUT_PREFETCH_CONCURRENCY',
+    default=2
+))
+
+# ============================================================================
+# 🚂 TRAIN AVAILABILITY FAN-OUT CONFIGURATION
+# ============================================================================
+
+# Adaptive (AIMD) concurrency bounds for AvailToCheck calls
+TRAIN_AVAILABILITY_INITIAL_CONCURRENCY = int(_get_config_value(
+    'TRAIN_AVAILABILITY_INITIAL_CONCURRENCY',
+    'TRAIN_AVAILABILITY_INITIAL_CONCURRENCY',
+    default=5
+))
+
+TRAIN_AVAILABILITY_MIN_CONCURRENCY = int(_get_config_value(
+    'TRAIN_AVAILABILITY_MIN_CONCURRENCY',
+    'TRAIN_AVAILABILITY_MIN_CONCURRENCY',
+    default=2
+))
+
+TRAIN_AVAILABILITY_MAX_CONCURRENCY = int(_get_config_value(
+    'TRAIN_AVAILABILITY_MAX_CONCURRENCY',
+    'TRAIN_AVAILABILITY_MAX_CONCURRENCY',
+    default=12
+))
+
+# Seconds after which a single AvailToCheck call counts as a latency spike
+TRAIN_AVAILABILITY_LATENCY_THRESHOLD = float(_get_config_value(
+    'TRAIN_AVAILABILITY_LATENCY_THRESHOLD',
+    'TRAIN_AVAILABILITY_LATENCY_THRESHOLD',
+    default=4.0
+))
+
+# Max trains checked per search when filtering by class availability
+TRAIN_AVAILABILITY_MAX_TRAINS = int(_get_config_value(
+    'TRAIN_AVAILABILITY_MAX_TRAINS',
+    'TRAIN_AVAILABILITY_MAX_TRAINS',
+    default=20
+))
+
+# Seconds an AvailToCheck response is reused (keep within 30-120s)
+TRAIN_AVAILABILITY_CACHE_TTL = float(_get_config_value(
+    'TRAIN_AVAILABILITY_CACHE_TTL',
+    'TRAIN_AVAILABILITY_CACHE_TTL',
+    default=60
+))
+
+# ============================================================================
+# 🎫 PNR STATUS BULK CONFIGURATION
+# ============================================================================
+
+# Max PnrchkStatus calls in flight for one bulk PNR check
+PNR_STATUS_BULK_CONCURRENCY = int(_get_config_value(
+    'PNR_STATUS_BULK_CONCURRENCY',
+    'PNR_STATUS_BULK_CONCURRENCY',
+    default=5
+))
+
+# Seconds a successful PNR status response is reused
+PNR_STATUS_CACHE_TTL = float(_get_config_value(
+    'PNR_STATUS_CACHE_TTL',
+    'PNR_STATUS_CACHE_TTL',
+    default=60
+))
+
+# ============================================================================
+# ✈️ FLIGHT FARE CALENDAR CONFIGURATION
+# ============================================================================
+
+# Max AirBus_New searches in flight for one fare calendar
+FLIGHT_FARE_CALENDAR_CONCURRENCY = int(_get_config_value(
+    'FLIGHT_FARE_CALENDAR_CONCURRENCY',
+    'FLIGHT_FARE_CALENDAR_CONCURRENCY',
+    default=4
+))
+
+# Seconds the whole fare calendar may take; days still pending are reported as timed out
+FLIGHT_FARE_CALENDAR_TIMEOUT = float(_get_config_value(
+    'FLIGHT_FARE_CALENDAR_TIMEOUT',
+    'FLIGHT_FARE_CALENDAR_TIMEOUT',
+    default=25
+))
+
+# Seconds a raw AirBus_New response is reused (calendar day -> full search)
+FLIGHT_SEARCH_CACHE_TTL = float(_get_config_value(
+    'FLIGHT_SEARCH_CACHE_TTL',
+    'FLIGHT_SEARCH_CACHE_TTL',
+    default=120
+))
+
+# ============================================================================
+# ✈️ FLIGHT MULTI-ROUTE SEARCH CONFIGURATION
+# ============================================================================
+
+# Max AirBus_New searches in flight for one multi-origin / multi-city search
+FLIGHT_MULTI_SEARCH_CONCURRENCY = int(_get_config_value(
+    'FLIGHT_MULTI_SEARCH_CONCURRENCY',
+    'FLIGHT_MULTI_SEARCH_CONCURRENCY',
+    default=4
+))
+
+# Seconds the whole multi-route search may take; routes still pending are reported as timed out
+FLIGHT_MULTI_SEARCH_TIMEOUT = float(_get_config_value(
+    'FLIGHT_MULTI_SEARCH_TIMEOUT',
+    'FLIGHT_MULTI_SEARCH_TIMEOUT',
+    default=30
+))
+
+# Max origin/destination/date searches in one request
+FLIGHT_MULTI_SEARCH_MAX_ROUTES = int(_get_config_value(
+    'FLIGHT_MULTI_SEARCH_MAX_ROUTES',
+    'FLIGHT_MULTI_SEARCH_MAX_ROUTES',
+    default=6
+))
+
+# ============================================================================
+# 🏨 HOTEL PROGRESSIVE LISTING CONFIGURATION
+# ============================================================================
+
+# Upstream HotelListIdWiseNew pages fetched ahead in the background (0 = one-shot search)
+HOTEL_PREFETCH_PAGES = int(_get_config_value(
+    'HOTEL_PREFETCH_PAGES',
+    'HOTEL_PREFETCH_PAGES',
+    default=2
+))
+
+# Seconds a progressively loaded hotel listing is kept for "show more"
+HOTEL_LISTING_CACHE_TTL = float(_get_config_value(
+    'HOTEL_LISTING_CACHE_TTL',
+    'HOTEL_LISTING_CACHE_TTL',
+    default=300
+))
+
+# ============================================================================
+# 🏨 HOTEL MULTI-CITY SEARCH CONFIGURATION
+# ============================================================================
+
+# Max HotelListIdWiseNew searches in flight for one multi-city search
+HOTEL_MULTI_SEARCH_CONCURRENCY = int(_get_config_value(
+    'HOTEL_MULTI_SEARCH_CONCURRENCY',
+    'HOTEL_MULTI_SEARCH_CONCURRENCY',
+    default=3
+))
+
+# Seconds the whole multi-city search may take; cities still pending are reported as timed out
+HOTEL_MULTI_SEARCH_TIMEOUT = float(_get_config_value(
+    'HOTEL_MULTI_SEARCH_TIMEOUT',
+    'HOTEL_MULTI_SEARCH_TIMEOUT',
+    default=25
+))
+
+# Max cities in one multi-city search
+HOTEL_MULTI_SEARCH_MAX_CITIES = int(_get_config_value(
+    'HOTEL_MULTI_SEARCH_MAX_CITIES',
+    'HOTEL_MULTI_SEARCH_MAX_CITIES',
+    default=4
+))
+
+# ============================================================================
+# 🏨 HOTEL DETAIL ENRICHMENT CONFIGURATION
+# ============================================================================
+
+# Hotels at the top of a result page enriched with get_hotel_details (0 = off)
+HOTEL_DETAILS_ENRICH_COUNT = int(_get_config_value(
+    'HOTEL_DETAILS_ENRICH_COUNT',
+    'HOTEL_DETAILS_ENRICH_COUNT',
+    default=0
+))
+
+# Max hotel detail requests in flight for one page
+HOTEL_DETAILS_CONCURRENCY = int(_get_config_value(
+    'HOTEL_DETAILS_CONCURRENCY',
+    'HOTEL_DETAILS_CONCURRENCY',
+    default=3
+))
+
+# Seconds hotel details are cached per hotel and check-in/check-out dates
+HOTEL_DETAILS_CACHE_TTL = float(_get_config_value(
+    'HOTEL_DETAILS_CACHE_TTL',
+    'HOTEL_DETAILS_CACHE_TTL',
+    default=1800
+))
+
+# Seconds a hotel search waits for details; later ones only warm the cache
+HOTEL_DETAILS_BUDGET = float(_get_config_value(
+    'HOTEL_DETAILS_BUDGET',
+    'HOTEL_DETAILS_BUDGET',
+    default=0.3
+))
+
 # ============================================================================
 # 📦 EXPORT ALL CONFIGURATIONS
 # ============================================================================
@@ -508,6 +725,7 @@ __all__ = [
     "HOTEL_SEARCH_WITH_FILTER_URL",
     "PAYMENT_CHECKOUT_BASE_URL",
     "HOTEL_DEEPLINK",
+    "HOTEL_DETAILS_URL",
 
     # Flight Endpoints
     "FLIGHT_AMENITIES_URL",
@@ -521,6 +739,10 @@ __all__ = [
     "BUS_AUTOSUGGEST_KEY",
     "BUS_ENCRYPTED_HEADER",
     "BUS_DECRYPTION_KEY",
+    "BUS_SEARCH_CACHE_TTL",
+    "BUS_SEAT_LAYOUT_CACHE_TTL",
+    "BUS_SEAT_LAYOUT_PREFETCH_COUNT",
+    "BUS_SEAT_LAYOUT_PREFETCH_CONCURRENCY",
     # Train Endpoints
     "TRAIN_API_URL",
     "TRAIN_LIST_INFO_URL",
@@ -531,6 +753,29 @@ __all__ = [
     "TRAIN_ROUTE_API_URL",
     "PNR_ENCRYPTION_KEY",
     "PNR_ENCRYPTION_IV",
+    "TRAIN_AVAILABILITY_INITIAL_CONCURRENCY",
+    "TRAIN_AVAILABILITY_MIN_CONCURRENCY",
+    "TRAIN_AVAILABILITY_MAX_CONCURRENCY",
+    "TRAIN_AVAILABILITY_LATENCY_THRESHOLD",
+    "TRAIN_AVAILABILITY_MAX_TRAINS",
+    "TRAIN_AVAILABILITY_CACHE_TTL",
+    "PNR_STATUS_BULK_CONCURRENCY",
+    "PNR_STATUS_CACHE_TTL",
+    "FLIGHT_FARE_CALENDAR_CONCURRENCY",
+    "FLIGHT_FARE_CALENDAR_TIMEOUT",
+    "FLIGHT_SEARCH_CACHE_TTL",
+    "FLIGHT_MULTI_SEARCH_CONCURRENCY",
+    "FLIGHT_MULTI_SEARCH_TIMEOUT",
+    "FLIGHT_MULTI_SEARCH_MAX_ROUTES",
+    "HOTEL_PREFETCH_PAGES",
+    "HOTEL_LISTING_CACHE_TTL",
+    "HOTEL_MULTI_SEARCH_CONCURRENCY",
+    "HOTEL_MULTI_SEARCH_TIMEOUT",
+    "HOTEL_MULTI_SEARCH_MAX_CITIES",
+    "HOTEL_DETAILS_ENRICH_COUNT",
+    "HOTEL_DETAILS_CONCURRENCY",
+    "HOTEL_DETAILS_CACHE_TTL",
+    "HOTEL_DETAILS_BUDGET",
 
     # Autosuggest Services
     "SOLR_BASE_URL",
@@ -0,0 +1,53 @@
+"""
+Benchmark: eager vs deferred flight deeplinks on a large AirBus_New response.
+
+Usage:
+    python -m tests.bench_flight_deeplinks [segments_per_journey] [repeats]
+"""
+import sys
+import time
+
+from tools_factory.flights.flight_search_service import attach_deep_links, process_flight_results
+from tests.flight_fixtures import domestic_response, search_context
+
+PAGE_SIZE = 15
+
+
+def _time(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(segments: int = 400, repeats: int = 5) -> None:
+    response = domestic_response(outbound_count=segments, return_count=segments)
+    context = search_context(return_date="2026-03-14")
+
+    def eager():
+        process_flight_results(response, True, False, context, use_short_links=False)
+
+    def lazy():
+        result = process_flight_results(
+            response, True, False, context, use_short_links=False, defer_deep_links=True
+        )
+        result.update(passengers=context["passengers"], outbound_date=context["outbound_date"],
+                      return_date=context["return_date"])
+        attach_deep_links(
+            result,
+            result["outbound_flights"][:PAGE_SIZE] + result["return_flights"][:PAGE_SIZE],
+        )
+
+    eager_s = _time(eager, repeats)
+    lazy_s = _time(lazy, repeats)
+    print(f"segments per journey: {segments} (x2 journeys), page size: {PAGE_SIZE}")
+    print(f"eager deeplinks : {eager_s * 1000:8.2f} ms")
+    print(f"deferred (page) : {lazy_s * 1000:8.2f} ms")
+    print(f"saved per search: {(eager_s - lazy_s) * 1000:8.2f} ms ({(1 - lazy_s / eager_s) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
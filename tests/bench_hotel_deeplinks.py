@@ -0,0 +1,64 @@
+"""
+Benchmark: per-hotel deeplink cost, one-off _build_deep_link per hotel vs
+one HotelDeepLinkBuilder per search, on a 100-hotel HotelListIdWiseNew response.
+
+Usage:
+    python -m tests.bench_hotel_deeplinks [hotels] [repeats]
+"""
+import sys
+import time
+
+from tools_factory.hotels.hotel_schema import HotelSearchInput
+from tools_factory.hotels.hotel_search_service import HotelSearchService
+from tests.hotel_fixtures import hotel_list_response
+
+
+def _time(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(hotels: int = 100, repeats: int = 50) -> None:
+    service = HotelSearchService()
+    search_input = HotelSearchInput(
+        city_name="Pune", check_in_date="2026-03-10", check_out_date="2026-03-12",
+        num_rooms=2, num_adults=3, num_children=1, child_ages=[6],
+    )
+    response = hotel_list_response(count=hotels, total=hotels)
+    room_details = service._build_room_details(search_input)
+
+    def per_hotel():
+        for hotel in response["htllist"]:
+            service._build_deep_link(
+                city_name="PUNE,INDIA", check_in=search_input.check_in_date,
+                check_out=search_input.check_out_date, num_rooms=search_input.num_rooms,
+                room_details=room_details, emt_id=hotel["ecid"], hotel_id=hotel["hid"],
+                lat=18.52, lon=73.85, stype="city",
+            )
+
+    def per_search():
+        builder = service._deep_link_builder("PUNE,INDIA", search_input, 18.52, 73.85, "city")
+        for hotel in response["htllist"]:
+            builder.build(hotel["ecid"], hotel["hid"])
+
+    def process():
+        service._process_response(response, "PUNE,INDIA", search_input, "key", 18.52, 73.85, "city",
+                                  use_short_links=False)
+
+    per_hotel_s = _time(per_hotel, repeats)
+    per_search_s = _time(per_search, repeats)
+    process_s = _time(process, repeats)
+    print(f"hotels: {hotels}")
+    print(f"per-hotel setup   : {per_hotel_s / hotels * 1e6:8.2f} us/hotel")
+    print(f"per-search builder: {per_search_s / hotels * 1e6:8.2f} us/hotel")
+    print(f"saved per search  : {(per_hotel_s - per_search_s) * 1000:8.2f} ms ({(1 - per_search_s / per_hotel_s) * 100:.0f}%)")
+    print(f"_process_response : {process_s * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,37 @@
+"""
+Benchmark: plain-dict train records vs validating every train with TrainInfo.
+
+Usage:
+    python -m tests.bench_train_results [trains] [repeats]
+"""
+import sys
+import time
+
+from tools_factory.trains.train_search_service import process_train_results
+from tests.train_fixtures import train_search_response
+
+
+def _time(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(trains: int = 60, repeats: int = 20) -> None:
+    response = train_search_response(train_count=trains, classes_per_train=8)
+    classes = sum(len(t["TrainClassWiseFare"]) for t in response["trainBtwnStnsList"])
+
+    validated_s = _time(lambda: process_train_results(response, validate=True), repeats)
+    fast_s = _time(lambda: process_train_results(response, validate=False), repeats)
+    print(f"trains: {trains}, classes: {classes}")
+    print(f"validated (TrainInfo) : {validated_s * 1000:8.2f} ms")
+    print(f"plain records         : {fast_s * 1000:8.2f} ms")
+    print(f"saved per search      : {(validated_s - fast_s) * 1000:8.2f} ms ({(1 - fast_s / validated_s) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
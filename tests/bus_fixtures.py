@@ -0,0 +1,103 @@
+"""
+Synthetic GetSearchResult / SeatBind responses for offline bus-processing tests.
+
+The shapes mirror the fields read by bus_search_service (Response.AvailableTrips,
+bdPoints, dpPoints, cancelPolicyList, lstamenities); values are generated
+deterministically from the index. Every fourth trip uses the alternate key
+casing some engines send (travels, DepartureTime, Seater, ...).
+"""
+
+OPERATORS = ["Zingbus", "IntrCity SmartBus", "Laxmi Holidays", "HRTC", "Shrinath Travels"]
+BUS_TYPES = ["Volvo A/C Sleeper (2+1)", "A/C Seater (2+2)", "Non A/C Sleeper (2+1)", "Bharat Benz A/C Seater/Sleeper"]
+
+
+def _points(i, count, prefix, id_key, name_key, time_key):
+    return [
+        {
+            id_key: f"{prefix}{i}{p}",
+            name_key: f"98{i:04d}{p:04d} {prefix.upper()} Point {p}" if p % 3 == 0 else f"{prefix.upper()} Point {p}",
+            "landmark": f"Near Gate {p}",
+            time_key: f"{(18 + p) % 24:02d}:{(p * 10) % 60:02d}",
+            "contactNumber": "9800000000",
+            "latitude": "28.6",
+            "longitude": "77.2",
+        }
+        for p in range(count)
+    ]
+
+
+def _trip(i, points):
+    dep_minutes = (i * 47) % (24 * 60)
+    arr_minutes = (dep_minutes + 600) % (24 * 60)
+    is_ac = i % 3 != 2
+    is_sleeper = i % 2 == 0
+    trip = {
+        "id": f"BUS{i:04d}",
+        "operatorid": 100 + i % len(OPERATORS),
+        "busType": BUS_TYPES[i % len(BUS_TYPES)],
+        "ArrivalTime": f"{arr_minutes // 60:02d}:{arr_minutes % 60:02d}",
+        "duration": "10h 00m",
+        "AvailableSeats": str(5 + i % 30),
+        "price": str(650 + (i * 131) % 1800),
+        "fares": [str(650 + (i * 131) % 1800), str(900 + (i * 131) % 1800)],
+        "isVolvo": i % 4 == 0,
+        "isSemiSleeper": False,
+        "rt": str(30 + i % 20),
+        "liveTrackingAvailable": i % 2 == 1,
+        "isCancellable": True,
+        "mTicketEnabled": "true",
+        "departureDate": "2026-03-10",
+        "arrivalDate": "2026-03-11",
+        "routeId": 5000 + i,
+        "engineId": 2 + i % 3,
+        "TraceID": f"trace-{i}",
+        "bdPoints": _points(i, points, "bp", "bdid", "bdLongName", "time"),
+        "dpPoints": _points(i, points // 2 + 1, "dp", "dpId", "dpName", "dpTime"),
+        "lstamenities": [{"id": a, "name": name} for a, name in enumerate(["WiFi", "Water Bottle", "Charging Point"][: i % 4])],
+        "cancelPolicyList": [
+            {"timeFrom": 0, "timeTo": 12, "percentageCharge": 100.0, "flatCharge": 0, "isFlat": False},
+            {"timeFrom": 12, "timeTo": 48, "percentageCharge": 25.0, "flatCharge": 0, "isFlat": False},
+        ],
+    }
+    departure = f"{dep_minutes // 60:02d}:{dep_minutes % 60:02d}"
+    if i % 4 == 3:
+        trip.update(travels=OPERATORS[i % len(OPERATORS)], DepartureTime=departure,
+                    ac=is_ac, NonAC=not is_ac, Seater=not is_sleeper, Sleeper=is_sleeper)
+    else:
+        trip.update(Travels=OPERATORS[i % len(OPERATORS)], departureTime=departure,
+                    AC=is_ac, nonAC=not is_ac, seater=not is_sleeper, sleeper=is_sleeper)
+    return trip
+
+
+def bus_search_response(trip_count=200, points=24):
+    """GetSearchResult response with trip_count trips of `points` boarding points each."""
+    trips = [_trip(i, points) for i in range(trip_count)]
+    return {
+        "Response": {
+            "AvailableTrips": trips,
+            "TotalTrips": trip_count,
+            "AcCount": sum(1 for i in range(trip_count) if i % 3 != 2),
+            "NonAcCount": sum(1 for i in range(trip_count) if i % 3 == 2),
+            "MaxPrice": 2449,
+            "MinPrice": 650,
+        }
+    }
+
+
+def seat_bind_response(seat_count=30, upper=True):
+    """SeatBind response with seat_count seats; every third seat is booked."""
+    seats = []
+    for n in range(seat_count):
+        on_upper = upper and n >= seat_count // 2
+        seats.append({
+            "name": f"{'U' if on_upper else 'L'}{n + 1}",
+            "seatType": "Unavailable" if n % 3 == 0 else "Available",
+            "available": n % 3 != 0,
+            "fare": str(800 + n * 10),
+            "rowNo": (n % (seat_count // 2 or 1)) // 3,
+            "columnNo": n % 3,
+            "seatStyle": "SL" if on_upper else "ST",
+            "lowerShow": not on_upper,
+            "upperShow": on_upper,
+        })
+    return {"Seats": seats, "TravelName": "Zingbus", "deptTime": "21:30", "arrTime": "07:30"}
@@ -0,0 +1,11 @@
+import pytest
+
+from emt_client.cache import reset_caches
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Every test starts and ends with empty shared response caches."""
+    reset_caches()
+    yield
+    reset_caches()
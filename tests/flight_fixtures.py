@@ -0,0 +1,167 @@
+"""
+Synthetic AirBus_New responses for offline flight-processing tests.
+
+The shapes mirror the fields read by flight_search_service (j/s/b/lstFr,
+dctFltDtl, C); values are generated deterministically from the index.
+"""
+
+AIRLINES = {"6E": "IndiGo", "AI": "Air India", "SG": "SpiceJet", "QP": "Akasa Air"}
+_CODES = list(AIRLINES)
+
+
+def _detail(flight_no, airline, origin, destination, date, dep_minutes, duration):
+    arr_minutes = dep_minutes + duration
+    return {
+        "AC": airline,
+        "FN": str(flight_no),
+        "OG": origin,
+        "DT": destination,
+        "DDT": date,
+        "DTM": f"{dep_minutes // 60 % 24:02d}:{dep_minutes % 60:02d}",
+        "ADT": date,
+        "ATM": f"{arr_minutes // 60 % 24:02d}:{arr_minutes % 60:02d}",
+        "CB": "E",
+        "FCLS": "T",
+        "DUR": f"{duration // 60:02d}h {duration % 60:02d}m",
+        "BW": "15",
+        "BU": "KG",
+    }
+
+
+def _journey(details, journey_index, count, origin, destination, date, start_id):
+    segments = []
+    for i in range(count):
+        airline = _CODES[i % len(_CODES)]
+        dep_minutes = (5 * 60 + i * 37) % (23 * 60)
+        stops = i % 3 == 2
+        flight_ids = []
+        if stops:
+            first_id, second_id = str(start_id + 2 * i), str(start_id + 2 * i + 1)
+            details[first_id] = _detail(1000 + i, airline, origin, "HYD", date, dep_minutes, 80)
+            details[second_id] = _detail(2000 + i, airline, "HYD", destination, date, dep_minutes + 140, 75)
+            flight_ids = [first_id, second_id]
+        else:
+            flight_id = str(start_id + 2 * i)
+            details[flight_id] = _detail(1000 + i, airline, origin, destination, date, dep_minutes, 125 + (i % 5) * 10)
+            flight_ids = [flight_id]
+
+        fare = 3500 + (i * 389) % 4000 + journey_index * 100
+        segments.append({
+            "id": f"{journey_index}-{i}",
+            "SK": f"SK{journey_index}{i:04d}",
+            "RF": i % 2,
+            "b": [{
+                "JyTm": f"{(295 if stops else 125 + (i % 5) * 10) // 60:02d}h {(295 if stops else 125 + (i % 5) * 10) % 60:02d}m",
+                "stp": "1" if stops else "0",
+                "FL": flight_ids,
+            }],
+            "lstFr": [
+                {"SID": f"F{i}", "FN": "Saver", "BF": fare - 500, "TF": fare, "TTXMP": 500, "DA": 0},
+                {"SID": f"G{i}", "FN": "Flexi", "BF": fare + 300, "TF": fare + 800, "TTXMP": 500, "DA": 0},
+            ],
+        })
+    return {"s": segments}
+
+
+def domestic_response(outbound_count=40, return_count=0, origin="DEL", destination="BOM",
+                      outbound_date="10Mar2026", return_date="14Mar2026"):
+    """Domestic one-way (or round-trip when return_count > 0) AirBus_New response."""
+    details = {}
+    journeys = [_journey(details, 0, outbound_count, origin, destination, outbound_date, 10_000)]
+    if return_count:
+        journeys.append(_journey(details, 1, return_count, destination, origin, return_date, 50_000))
+    return {"C": dict(AIRLINES), "dctFltDtl": details, "j": journeys}
+
+
+def international_roundtrip_response(combo_count=60, origin="DEL", destination="DXB",
+                                     outbound_date="10Mar2026", return_date="17Mar2026",
+                                     distinct_flights=8):
+    """International round-trip response whose combos reuse a small pool of flights."""
+    details = {}
+    for i in range(distinct_flights):
+        airline = _CODES[i % len(_CODES)]
+        details[str(100 + i)] = _detail(500 + i, airline, origin, destination, outbound_date, 6 * 60 + i * 45, 215)
+        details[str(200 + i)] = _detail(600 + i, airline, destination, origin, return_date, 9 * 60 + i * 50, 200)
+
+    segments = []
+    for i in range(combo_count):
+        out_id = str(100 + i % distinct_flights)
+        in_id = str(200 + (i * 3) % distinct_flights)
+        segments.append({
+            "RF": i % 2,
+            "TF": 24000 + (i * 733) % 9000,
+            "lstFr": [{"SID": f"C{i}", "FN": "Saver", "BF": 20000, "TF": 24000 + (i * 733) % 9000}],
+            "l_OB": [{"FL": [out_id], "JyTm": "03h 35m", "RF": i % 2}],
+            "l_IB": [{"FL": [in_id], "JyTm": "03h 20m", "RF": i % 2}],
+        })
+    return {"C": dict(AIRLINES), "dctFltDtl": details, "j": [{"s": segments}]}
+
+
+def search_context(outbound_date="2026-03-10", return_date=None, is_international=False, **filters):
+    """search_context dict as built by search_flights (filters passed as keyword args)."""
+    context = {
+        "origin": "DEL",
+        "destination": "BOM",
+        "origin_name": "Delhi",
+        "destination_name": "Mumbai",
+        "origin_country": "India",
+        "destination_country": "India",
+        "outbound_date": outbound_date,
+        "return_date": return_date,
+        "adults": 1,
+        "children": 0,
+        "infants": 0,
+        "passengers": {"adults": 1, "children": 0, "infants": 0},
+        "cabin": 0,
+        "is_international": is_international,
+        "stops": None,
+        "fare_type": 0,
+        "fastest": None,
+        "refundable": None,
+        "departure_time_window": None,
+        "arrival_time_window": None,
+        "airline_names": None,
+    }
+    context.update(filters)
+    return context
+
+
+CITY_INFO = {
+    "DEL": ("DEL", "India", "Delhi"),
+    "BOM": ("BOM", "India", "Mumbai"),
+    "JAI": ("JAI", "India", "Jaipur"),
+    "GOI": ("GOI", "India", "Goa"),
+    "BLR": ("BLR", "India", "Bangalore"),
+    "DXB": ("DXB", "United Arab Emirates", "Dubai"),
+}
+
+
+def patch_flight_search(monkeypatch, response_for):
+    """
+    Make search_flights run offline.
+
+    ``response_for(payload)`` returns the AirBus_New response for a search
+    payload. Autosuggest resolves from CITY_INFO and short links are the
+    identity. Cached search responses are cleared first. Returns the list
+    of search payloads sent.
+    """
+    from emt_client.cache import reset_caches
+    import tools_factory.flights.flight_search_service as service
+    import tools_factory.flights.flight_search_tool as tool
+    from emt_client.clients.flight_client import FlightApiClient
+
+    reset_caches()
+    searches = []
+
+    async def fake_city(client, term):
+        return CITY_INFO.get(term.upper(), (term.upper(), "India", term))
+
+    async def fake_search(self, url, payload):
+        searches.append(payload)
+        return response_for(payload)
+
+    monkeypatch.setattr(service, "fetch_first_city_code_country", fake_city)
+    monkeypatch.setattr(FlightApiClient, "search", fake_search)
+    monkeypatch.setattr(service, "generate_short_link", lambda results, product_type: results)
+    monkeypatch.setattr(tool, "generate_short_link", lambda results, product_type: results)
+    return searches
@@ -0,0 +1,68 @@
+"""
+Synthetic HotelListIdWiseNew responses for offline hotel-search tests.
+
+The shapes mirror the fields read by HotelSearchService._process_response
+(htllist, key); values are generated deterministically from the index.
+patch_hotel_search serves PageNo/HotelCount slices of one fixed inventory,
+so a paged search sees the same hotels as a one-shot search.
+"""
+import tools_factory.hotels.hotel_search_service as service
+import tools_factory.hotels.hotel_search_tool as tool
+from emt_client.cache import reset_caches
+from emt_client.clients.hotel_client import HotelApiClient
+
+AREAS = ["Koregaon Park", "Viman Nagar", "Hinjewadi", "Baner", "Kalyani Nagar"]
+HIGHLIGHTS = ["Free WiFi, Breakfast", "Swimming Pool, Spa", "Parking, Restaurant", None]
+
+
+def hotel(i, city="PUNE"):
+    return {
+        "hid": f"{city[:3]}{i:05d}",
+        "ecid": f"EMT{city[:3]}{i:05d}",
+        "nm": f"{city.title()} Hotel {i}",
+        "rat": str(2 + i % 4),
+        "prc": 1800 + (i * 373) % 9000,
+        "disc": (i * 37) % 400 if i % 3 else 0,
+        "curr": "INR",
+        "loc": f"{AREAS[i % len(AREAS)]}, {city.title()}",
+        "highlt": HIGHLIGHTS[i % len(HIGHLIGHTS)],
+        "imgU": f"https://img.example.com/{city.lower()}/{i}.jpg",
+    }
+
+
+def hotel_list_response(start=0, count=50, total=200, city="PUNE"):
+    """One upstream page: hotels start..start+count of a `total`-hotel inventory."""
+    return {
+        "htllist": [hotel(i, city) for i in range(start, min(start + count, total))],
+        "key": f"15~INR~{city},INDIA~search",
+    }
+
+
+def patch_hotel_search(monkeypatch, total=200, response_for=None):
+    """
+    Make HotelSearchService run offline.
+
+    City resolution returns "<CITY>,INDIA" and HotelListIdWiseNew serves the
+    PageNo/HotelCount slice of a `total`-hotel inventory, or
+    ``response_for(payload)`` when given. Short links are the identity.
+    Cached listings are cleared first. Returns the list of search payloads sent.
+    """
+    reset_caches()
+    searches = []
+
+    async def fake_resolve(raw_city):
+        return f"{raw_city.upper()},INDIA", 18.52, 73.85, "city"
+
+    async def fake_search(self, url, payload):
+        searches.append(dict(payload))
+        if response_for is not None:
+            return response_for(payload)
+        count = payload["HotelCount"]
+        city = payload["CityName"].split(",")[0]
+        return hotel_list_response((payload["PageNo"] - 1) * count, count, total, city)
+
+    monkeypatch.setattr(service, "resolve_city_name", fake_resolve)
+    monkeypatch.setattr(service, "generate_short_link", lambda results, product_type: results)
+    monkeypatch.setattr(tool, "generate_short_link", lambda results, product_type: results)
+    monkeypatch.setattr(HotelApiClient, "search", fake_search)
+    return searches
@@ -0,0 +1,153 @@
+"""
+Tests for the adaptive (AIMD) concurrency limiter used for the train
+availability fan-out.
+"""
+
+import asyncio
+
+import pytest
+
+from emt_client.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_limiter,
+    get_limiter_metrics,
+    reset_limiters,
+)
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_requests():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=3, max_limit=3)
+    peak = 0
+    active = 0
+
+    async def call():
+        nonlocal peak, active
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(10)))
+
+    assert peak == 3
+    assert limiter.in_flight == 0
+    assert limiter.metrics()["successes"] == 10
+
+
+@pytest.mark.asyncio
+async def test_limiter_increases_while_healthy():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=2, max_limit=6)
+
+    for _ in range(20):
+        async with limiter.slot():
+            pass
+
+    assert limiter.limit > 2
+    assert limiter.limit <= 6
+
+
+@pytest.mark.asyncio
+async def test_limiter_backs_off_on_error():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=8, min_limit=2, max_limit=10)
+
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("upstream 503")
+
+    assert limiter.limit == 4
+    metrics = limiter.metrics()
+    assert metrics["errors"] == 1
+    assert metrics["backoffs"] == 1
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_cooldown_limits_consecutive_backoffs():
+    limiter = AdaptiveConcurrencyLimiter(
+        "test", initial_limit=8, min_limit=1, max_limit=10, cooldown_seconds=60
+    )
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            async with limiter.slot():
+                raise RuntimeError("boom")
+
+    # Only the first error in the cooldown window shrinks the limit
+    assert limiter.limit == 4
+    assert limiter.metrics()["errors"] == 3
+
+
+@pytest.mark.asyncio
+async def test_limiter_backs_off_on_latency_spike():
+    limiter = AdaptiveConcurrencyLimiter(
+        "test", initial_limit=6, min_limit=1, latency_threshold=0.01
+    )
+
+    async with limiter.slot():
+        await asyncio.sleep(0.05)
+
+    assert limiter.limit == 3
+    assert limiter.metrics()["latency_spikes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_never_drops_below_min():
+    limiter = AdaptiveConcurrencyLimiter(
+        "test", initial_limit=2, min_limit=2, cooldown_seconds=0
+    )
+
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("bad")
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_nothing():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=1, max_limit=1)
+    gate = asyncio.Event()
+
+    async def holder():
+        async with limiter.slot():
+            await gate.wait()
+
+    async def waiter():
+        async with limiter.slot():
+            pass
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiter_task = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    assert limiter.metrics()["queued"] == 1
+
+    waiter_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter_task
+
+    gate.set()
+    await holder_task
+    assert limiter.in_flight == 0
+    assert limiter.metrics()["queued"] == 0
+
+
+def test_registry_shares_limiter_per_upstream():
+    reset_limiters()
+    first = get_limiter("avail", initial_limit=4)
+    second = get_limiter("avail", initial_limit=9)
+
+    assert first is second
+    assert first.limit == 4
+    assert "avail" in get_limiter_metrics()
+    reset_limiters()
+
+
+def test_invalid_bounds_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter("test", min_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter("test", min_limit=5, max_limit=2)
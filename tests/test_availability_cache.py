@@ -0,0 +1,200 @@
+"""
+Tests for the short-TTL AvailToCheck cache and request coalescing.
+Upstream calls are faked so no network access is needed.
+"""
+
+import asyncio
+
+import pytest
+
+from emt_client.cache import AsyncTTLCache, get_cache_metrics
+from emt_client.clients.client import EMTClient
+from emt_client.clients.train_client import TrainApiClient, get_availability_cache
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    calls = []
+
+    async def post(self, url, payload):
+        calls.append(payload)
+        await asyncio.sleep(0.01)
+        return {
+            "trainNo": payload["trainNo"],
+            "avlDayList": [{"availablityStatusNew": f"AVAILABLE-{len(calls):04d}"}],
+        }
+
+    monkeypatch.setattr(EMTClient, "post", post)
+    return calls
+
+
+def _check(client, train_no="12816", class_code="3A", use_cache=True):
+    return client.check_availability(
+        train_no=train_no,
+        class_code=class_code,
+        quota="GN",
+        from_station_code="ANVT",
+        to_station_code="BBS",
+        journey_date="10/03/2026",
+        from_display="",
+        to_display="",
+        use_cache=use_cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeat_check_is_served_from_cache(fake_post):
+    client = TrainApiClient()
+
+    first = await _check(client)
+    second = await _check(client)
+
+    assert len(fake_post) == 1
+    assert first is second
+    metrics = get_availability_cache().metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_simultaneous_checks_are_coalesced(fake_post):
+    # Separate client instances (search fan-out vs availability tool) share the cache
+    results = await asyncio.gather(*(_check(TrainApiClient()) for _ in range(5)))
+
+    assert len(fake_post) == 1
+    assert all(r is results[0] for r in results)
+    assert get_availability_cache().metrics()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_shared(fake_post):
+    client = TrainApiClient()
+
+    await asyncio.gather(_check(client, class_code="3A"), _check(client, class_code="SL"))
+
+    assert len(fake_post) == 2
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_bypasses_cache(fake_post):
+    client = TrainApiClient()
+
+    await _check(client)
+    await _check(client, use_cache=False)
+
+    assert len(fake_post) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached(monkeypatch):
+    attempts = []
+
+    async def flaky_post(self, url, payload):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("upstream timeout")
+        return {"avlDayList": []}
+
+    monkeypatch.setattr(EMTClient, "post", flaky_post)
+    client = TrainApiClient()
+
+    with pytest.raises(RuntimeError):
+        await _check(client)
+    assert await _check(client) == {"avlDayList": []}
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_error_response_is_not_cached(monkeypatch):
+    attempts = []
+
+    async def post(self, url, payload):
+        attempts.append(1)
+        if len(attempts) == 1:
+            return {"ErrorMsg": {"ErrorMessage": "Service temporarily unavailable "}, "avlDayList": None}
+        return {"ErrorMsg": None, "avlDayList": [{"availablityStatusNew": "AVAILABLE-0010"}]}
+
+    monkeypatch.setattr(EMTClient, "post", post)
+    client = TrainApiClient()
+
+    assert (await _check(client))["ErrorMsg"]["ErrorMessage"]
+    second = await _check(client)
+    third = await _check(client)
+
+    assert second["avlDayList"] and third is second
+    assert len(attempts) == 2
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    cache = AsyncTTLCache("test", ttl_seconds=0.01)
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        return {"value": len(fetches)}
+
+    assert (await cache.get_or_fetch("k", fetch))["value"] == 1
+    await asyncio.sleep(0.02)
+    assert (await cache.get_or_fetch("k", fetch))["value"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    cache = AsyncTTLCache("test", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+    assert cache.metrics()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_cancelled_when_all_waiters_cancel():
+    cache = AsyncTTLCache("test")
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_fetch():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    waiter = asyncio.create_task(cache.get_or_fetch("k", slow_fetch))
+    await started.wait()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0)
+
+    assert cancelled == [True]
+    assert cache.metrics()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_survives_if_another_waiter_remains():
+    cache = AsyncTTLCache("test")
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    second = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "ok"
+    assert cache.get("k") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics_registry(fake_post):
+    await _check(TrainApiClient())
+
+    assert "train_avail_to_check" in get_cache_metrics()
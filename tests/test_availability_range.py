@@ -0,0 +1,188 @@
+"""
+Tests for multi-date train availability windows built from avlDayList.
+Upstream calls are faked so no network access is needed.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from emt_client.clients.client import EMTClient
+from tools_factory.trains.Train_AvailabilityCheck.availability_check_service import (
+    AvailabilityCheckService,
+    build_whatsapp_availability_calendar_response,
+)
+from tools_factory.trains.Train_AvailabilityCheck.availability_check_renderer import (
+    render_availability_calendar,
+)
+from tools_factory.trains.Train_AvailabilityCheck.availability_check_tool import (
+    TrainAvailabilityCheckTool,
+)
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    """Every response covers the requested date plus the next 5 days."""
+    calls = []
+
+    async def post(self, url, payload):
+        calls.append(payload)
+        await asyncio.sleep(0)
+        start = datetime.strptime(payload["e"], "%d/%m/%Y")
+        days = [start + timedelta(days=offset) for offset in range(6)]
+        return {
+            "trainNo": payload["trainNo"],
+            "trainName": "RAJDHANI EXP",
+            "totalFare": "1450",
+            "avlDayList": [
+                {
+                    "availablityDate": day.strftime("%d-%m-%Y"),
+                    "availablityStatusNew": "REGRET" if day.day % 3 == 0 else f"AVAILABLE-{day.day:04d}",
+                }
+                for day in days
+            ],
+        }
+
+    monkeypatch.setattr(EMTClient, "post", post)
+    return calls
+
+
+def _range(service, start_date="01-03-2026", days=6, class_code="3A"):
+    return service.check_availability_range(
+        train_no="12951",
+        class_code=class_code,
+        quota="GN",
+        start_date=start_date,
+        days=days,
+        from_station_code="NDLS",
+        to_station_code="BCT",
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_call_covers_every_date_in_avl_day_list(fake_post):
+    result = await _range(AvailabilityCheckService())
+
+    assert result["success"]
+    assert len(fake_post) == 1
+    assert [d["date"] for d in result["days"]] == [
+        "01-03-2026", "02-03-2026", "03-03-2026", "04-03-2026", "05-03-2026", "06-03-2026",
+    ]
+    assert result["days"][0]["status"] == "AVAILABLE-0001"
+    assert result["days"][2]["status"] == "REGRET"
+    assert result["days"][0]["fare"] == 1450
+    assert result["train_info"]["train_name"] == "RAJDHANI EXP"
+
+
+@pytest.mark.asyncio
+async def test_only_missing_dates_are_fetched(fake_post):
+    service = AvailabilityCheckService()
+
+    await _range(service, days=6)
+    result = await _range(service, start_date="04-03-2026", days=7)
+
+    # 04..06 come from the first response, one more call covers 07..10
+    assert len(fake_post) == 2
+    assert fake_post[1]["e"] == "07/03/2026"
+    assert result["upstream_calls"] == 1
+    assert len(result["days"]) == 7
+
+
+@pytest.mark.asyncio
+async def test_error_message_applies_to_requested_date_only(monkeypatch):
+    calls = []
+
+    async def post(self, url, payload):
+        calls.append(payload["e"])
+        if payload["e"] == "01/03/2026":
+            return {"ErrorMsg": {"ErrorMessage": "Tatkal quota not open "}}
+        return {"avlDayList": [{"availablityDate": payload["e"].replace("/", "-"),
+                                "availablityStatusNew": "GNWL12/WL10"}]}
+
+    monkeypatch.setattr(EMTClient, "post", post)
+
+    result = await _range(AvailabilityCheckService(), days=2)
+
+    assert calls == ["01/03/2026", "02/03/2026"]
+    assert [d["status"] for d in result["days"]] == ["Tatkal quota not open", "GNWL12/WL10"]
+
+
+@pytest.mark.asyncio
+async def test_errored_day_is_queried_again(monkeypatch):
+    calls = []
+
+    async def post(self, url, payload):
+        calls.append(payload["e"])
+        if len(calls) == 1:
+            return {"ErrorMsg": {"ErrorMessage": "Service temporarily unavailable"}}
+        return {"avlDayList": [{"availablityDate": payload["e"].replace("/", "-"),
+                                "availablityStatusNew": "AVAILABLE-0040"}]}
+
+    monkeypatch.setattr(EMTClient, "post", post)
+    service = AvailabilityCheckService()
+
+    first = await _range(service, days=1)
+    second = await _range(service, days=1)
+
+    assert calls == ["01/03/2026", "01/03/2026"]
+    assert first["days"][0]["status"] == "Service temporarily unavailable"
+    assert second["days"][0]["status"] == "AVAILABLE-0040"
+
+
+@pytest.mark.asyncio
+async def test_calendar_checks_each_class(fake_post):
+    result = await AvailabilityCheckService().check_availability_calendar(
+        train_no="12951",
+        classes=["3A", "2A"],
+        quota="GN",
+        start_date="01-03-2026",
+        days=4,
+        from_station_code="NDLS",
+        to_station_code="BCT",
+    )
+
+    assert result["success"]
+    assert [row["class_code"] for row in result["calendar"]] == ["3A", "2A"]
+    assert all(len(row["days"]) == 4 for row in result["calendar"])
+    assert len(fake_post) == 2
+
+    whatsapp = build_whatsapp_availability_calendar_response(
+        train_info=result["train_info"],
+        calendar=result["calendar"],
+        route_info=result["route_info"],
+    )
+    days = whatsapp["data"]["classes"][0]["days"]
+    assert whatsapp["type"] == "availability_calendar"
+    assert days[0]["booking_link"]
+    assert days[2]["booking_link"] is None  # REGRET
+
+    html = render_availability_calendar(
+        train_info=result["train_info"],
+        calendar=result["calendar"],
+        from_station="NDLS",
+        to_station="BCT",
+        quota="GN",
+        from_station_code="NDLS",
+        to_station_code="BCT",
+    )
+    assert "train-avl-calendar" in html
+    assert "Sun 01 Mar" in html
+    assert "REGRET" in html
+
+
+@pytest.mark.asyncio
+async def test_tool_uses_calendar_when_days_requested(fake_post):
+    result = await TrainAvailabilityCheckTool().execute(
+        trainNo="12951",
+        journeyDate="01-03-2026",
+        classes=["3A"],
+        fromStationCode="NDLS",
+        toStationCode="BCT",
+        days=5,
+    )
+
+    assert not result.is_error
+    assert len(fake_post) == 1
+    assert len(result.structured_content["calendar"][0]["days"]) == 5
+    assert "train-avl-calendar" in result.html
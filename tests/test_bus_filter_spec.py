@@ -0,0 +1,157 @@
+"""
+Tests for BusFilterSpec: filters compiled once per search, trips normalized
+once, and re-filtering a cached GetSearchResult without another API call.
+"""
+
+import pytest
+
+from emt_client.clients.bus_client import BusApiClient
+from tools_factory.buses.bus_search_service import (
+    BusFilterSpec,
+    _parse_time_to_minutes,
+    process_bus_results,
+    search_buses,
+)
+from tests.bus_fixtures import bus_search_response
+
+FILTER_CASES = [
+    {},
+    {"volvo": True},
+    {"ac": True},
+    {"ac": False},
+    {"seater": True},
+    {"sleeper": True, "ac": True},
+    {"departure_from": "06:00", "departure_to": "18:00"},
+    {"departure_from": "21:00", "departure_to": "06:00"},
+    {"departure_from": "20:00"},
+    {"departure_to": "09:30"},
+]
+
+
+def _expected(bus, filters):
+    """Reference filter over the flags shown on the summary record."""
+    if filters.get("volvo") is True and not bus["is_volvo"]:
+        return False
+    if filters.get("ac") is True and not bus["is_ac"]:
+        return False
+    if filters.get("ac") is False and not bus["is_non_ac"]:
+        return False
+    if filters.get("seater") is True and not bus["is_seater"]:
+        return False
+    if filters.get("sleeper") is True and not bus["is_sleeper"]:
+        return False
+    minutes = _parse_time_to_minutes(bus["departure_time"])
+    start = _parse_time_to_minutes(filters.get("departure_from"))
+    end = _parse_time_to_minutes(filters.get("departure_to"))
+    if minutes is None:
+        return True
+    if start is not None and end is not None:
+        return (minutes >= start or minutes < end) if start > end else start <= minutes < end
+    if start is not None:
+        return minutes >= start
+    if end is not None:
+        return minutes < end
+    return True
+
+
+def _process(response, **kwargs):
+    return process_bus_results(response, "733", "757", "10-03-2026", "Delhi", "Manali", **kwargs)
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_spec_matches_reference_filter(filters):
+    response = bus_search_response(trip_count=120, points=2)
+    everything = _process(response)["buses"]
+
+    filtered = _process(response, filter_spec=BusFilterSpec.compile(**filters))["buses"]
+
+    assert filtered == [bus for bus in everything if _expected(bus, filters)]
+
+
+def test_spec_and_filter_args_agree():
+    response = bus_search_response(trip_count=80, points=2)
+
+    by_args = _process(response, filter_ac=True, filter_departure_from="21:00", filter_departure_to="06:00")
+    by_spec = _process(response, filter_spec=BusFilterSpec.compile(ac=True, departure_from="21:00", departure_to="06:00"))
+
+    assert by_args == by_spec
+
+
+def test_alternate_key_casing_is_filtered_like_displayed_flags():
+    response = bus_search_response(trip_count=40, points=2)
+
+    ac_buses = _process(response, filter_spec=BusFilterSpec.compile(ac=True))["buses"]
+
+    # Trips 3, 7, 11, ... send "ac" instead of "AC"
+    assert any(bus["bus_id"] == "BUS0007" for bus in ac_buses)
+    assert all(bus["is_ac"] for bus in ac_buses)
+
+
+def test_compiled_once_and_hashable():
+    spec = BusFilterSpec.compile(ac=True, departure_from="21:00", departure_to="06:00")
+
+    assert spec is BusFilterSpec.compile(ac=True, departure_from="21:00", departure_to="06:00")
+    assert (spec.departure_from, spec.departure_to, spec.wraps_midnight) == (1260, 360, True)
+    assert {spec: 1}[BusFilterSpec.compile(ac=True, departure_from="21:00", departure_to="06:00")] == 1
+    assert BusFilterSpec.compile().is_empty
+    assert not spec.is_empty
+
+
+def test_unparseable_departure_is_kept():
+    response = bus_search_response(trip_count=3, points=2)
+    response["Response"]["AvailableTrips"][1]["departureTime"] = "TBA"
+
+    result = _process(response, filter_spec=BusFilterSpec.compile(departure_from="23:00"))
+
+    assert [bus["bus_id"] for bus in result["buses"]] == ["BUS0001"]
+
+
+@pytest.fixture
+def search_calls(monkeypatch):
+    calls = []
+
+    async def fake_search(self, payload):
+        calls.append(payload)
+        return bus_search_response(trip_count=60, points=2)
+
+    monkeypatch.setattr(BusApiClient, "search", fake_search)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_filter_change_refilters_cached_trips(search_calls):
+    first = await search_buses(source_id="733", destination_id="757", journey_date="10-03-2026")
+    second = await search_buses(
+        source_id="733", destination_id="757", journey_date="10-03-2026",
+        filter_spec=BusFilterSpec.compile(ac=True, sleeper=True),
+    )
+
+    assert len(search_calls) == 1
+    assert second["session_id"] == first["session_id"] == search_calls[0]["Sid"]
+    assert [b["bus_id"] for b in second["buses"]] == [
+        b["bus_id"] for b in first["buses"] if b["is_ac"] and b["is_sleeper"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_other_date_searches_again(search_calls):
+    await search_buses(source_id="733", destination_id="757", journey_date="10-03-2026")
+    await search_buses(source_id="733", destination_id="757", journey_date="11-03-2026")
+
+    assert [call["JournyDate"] for call in search_calls] == ["10-03-2026", "11-03-2026"]
+
+
+@pytest.mark.asyncio
+async def test_error_response_not_cached(monkeypatch):
+    calls = []
+
+    async def failing_search(self, payload):
+        calls.append(payload)
+        return {"error": "API returned status 502"}
+
+    monkeypatch.setattr(BusApiClient, "search", failing_search)
+
+    for _ in range(2):
+        result = await search_buses(source_id="733", destination_id="757", journey_date="10-03-2026")
+        assert result["error"] == "API_ERROR"
+    assert len(calls) == 2
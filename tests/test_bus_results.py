@@ -0,0 +1,70 @@
+"""
+Tests for compact bus records: every trip gets a summary, detail sections
+(boarding/dropping points, cancellation policy) only for displayed buses.
+"""
+
+import pytest
+
+from emt_client.clients.bus_client import BusApiClient
+from tools_factory.buses.bus_schema import BusInfo
+from tools_factory.buses.bus_search_service import process_bus_results
+from tools_factory.buses.bus_search_tool import BusSearchTool
+from tests.bus_fixtures import bus_search_response
+
+DETAIL_KEYS = ("boarding_points", "dropping_points", "cancellation_policy")
+
+
+def _process(response, **kwargs):
+    return process_bus_results(response, "733", "757", "10-03-2026", "Delhi", "Manali", **kwargs)
+
+
+def test_full_records_match_bus_info():
+    result = _process(bus_search_response(trip_count=20, points=6))
+
+    assert result["total_count"] == 20
+    for bus in result["buses"]:
+        assert BusInfo.model_validate(bus).model_dump() == bus
+
+
+def test_details_only_for_selected_buses():
+    result = _process(bus_search_response(trip_count=60), detail_slice=slice(10, 20))
+
+    assert len(result["buses"]) == 60
+    for index, bus in enumerate(result["buses"]):
+        has_details = 10 <= index < 20
+        assert all((key in bus) == has_details for key in DETAIL_KEYS)
+        assert bus["book_now"] and bus["price"]
+
+
+def test_details_follow_filtered_order():
+    response = bus_search_response(trip_count=40, points=4)
+    full = _process(response, filter_ac=True)
+    paged = _process(response, filter_ac=True, detail_slice=slice(5, 10))
+
+    assert [b["bus_id"] for b in paged["buses"]] == [b["bus_id"] for b in full["buses"]]
+    assert paged["buses"][5:10] == full["buses"][5:10]
+
+
+def test_boarding_point_phone_prefix_kept_in_record():
+    bus = _process(bus_search_response(trip_count=1, points=4))["buses"][0]
+
+    assert bus["boarding_points"][0]["bd_id"] == "bp00"
+    assert bus["boarding_points"][0]["bd_long_name"].startswith("98")
+    assert [p["time_from"] for p in bus["cancellation_policy"]] == [0, 12]
+
+
+@pytest.mark.asyncio
+async def test_tool_returns_details_for_page(monkeypatch):
+    async def fake_search(self, payload):
+        return bus_search_response(trip_count=80)
+
+    monkeypatch.setattr(BusApiClient, "search", fake_search)
+
+    result = await BusSearchTool().execute(
+        sourceId="733", destinationId="757", journeyDate="10-03-2026", page=2, _limit=10,
+    )
+
+    buses = result.structured_content["buses"]
+    assert len(buses) == 10
+    assert all(bus["boarding_points"] and bus["dropping_points"] for bus in buses)
+    assert result.structured_content["pagination"]["total_results"] == 80
@@ -0,0 +1,162 @@
+"""
+Tests for the seat layout cache and the background prefetch of layouts for
+the top buses of a result page.
+"""
+
+import asyncio
+
+import pytest
+
+import tools_factory.buses.bus_search_service as service
+from emt_client.clients.bus_client import BusApiClient
+from tools_factory.buses.bus_search_service import (
+    cancel_seat_layout_prefetch,
+    get_seat_layout,
+    prefetch_seat_layouts,
+    process_bus_results,
+)
+from tools_factory.buses.bus_search_tool import BusSearchTool
+from tests.bus_fixtures import bus_search_response, seat_bind_response
+
+LAYOUT_ARGS = dict(
+    source_id="733", destination_id="757", journey_date="10-03-2026",
+    bus_id="BUS0001", route_id="5001", engine_id=3,
+    boarding_point_id="bp10", dropping_point_id="dp10",
+)
+
+
+@pytest.fixture
+def seat_bind_calls(monkeypatch):
+    calls = []
+
+    async def fake_seat_layout(self, payload):
+        calls.append(payload)
+        await asyncio.sleep(0)
+        return seat_bind_response()
+
+    monkeypatch.setattr(BusApiClient, "get_seat_layout", fake_seat_layout)
+    return calls
+
+
+def _page(trip_count=10):
+    result = process_bus_results(bus_search_response(trip_count=trip_count, points=4), "733", "757", "10-03-2026")
+    result.update(source_id="733", destination_id="757", journey_date="10-03-2026", session_id="sid", visitor_id="vid")
+    return result
+
+
+@pytest.mark.asyncio
+async def test_layout_reused_for_same_bus_and_points(seat_bind_calls):
+    first = await get_seat_layout(**LAYOUT_ARGS)
+    second = await get_seat_layout(**LAYOUT_ARGS)
+
+    assert first["success"] and second is first
+    assert first["layout"]["total_seats"] == 30
+    assert len(seat_bind_calls) == 1
+
+    await get_seat_layout(**dict(LAYOUT_ARGS, boarding_point_id="bp11"))
+    assert len(seat_bind_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_layout_not_cached(monkeypatch):
+    calls = []
+
+    async def failing(self, payload):
+        calls.append(payload)
+        return {"error": "API returned status 500"}
+
+    monkeypatch.setattr(BusApiClient, "get_seat_layout", failing)
+
+    for _ in range(2):
+        assert not (await get_seat_layout(**LAYOUT_ARGS))["success"]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_prefetch_warms_top_buses(seat_bind_calls):
+    page = _page()
+
+    task = prefetch_seat_layouts(page, page["buses"], session_key="s1", count=3)
+    await task
+
+    assert [call["id"] for call in seat_bind_calls] == ["BUS0000", "BUS0001", "BUS0002"]
+    assert all(call["bpId"] and call["dpId"] and call["Sid"] == "sid" for call in seat_bind_calls)
+
+    bus = page["buses"][1]
+    layout = await get_seat_layout(**service._seat_layout_args(page, bus))
+    assert layout["success"]
+    assert len(seat_bind_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_concurrency_is_bounded(monkeypatch):
+    running = []
+    peak = []
+
+    async def slow(self, payload):
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return seat_bind_response()
+
+    monkeypatch.setattr(BusApiClient, "get_seat_layout", slow)
+    page = _page()
+
+    await prefetch_seat_layouts(page, page["buses"], session_key="s1", count=6, concurrency=2)
+
+    assert len(peak) == 6
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_new_search_cancels_previous_prefetch(monkeypatch):
+    release = asyncio.Event()
+
+    async def blocked(self, payload):
+        await release.wait()
+        return seat_bind_response()
+
+    monkeypatch.setattr(BusApiClient, "get_seat_layout", blocked)
+    page = _page()
+
+    old = prefetch_seat_layouts(page, page["buses"], session_key="s1", count=3)
+    await asyncio.sleep(0)
+    other = prefetch_seat_layouts(page, page["buses"][3:], session_key="s2", count=1)
+    new = prefetch_seat_layouts(page, page["buses"][5:], session_key="s1", count=2)
+
+    with pytest.raises(asyncio.CancelledError):
+        await old
+    assert not other.done() and not new.done()
+
+    cancel_seat_layout_prefetch("s1")
+    with pytest.raises(asyncio.CancelledError):
+        await new
+    release.set()
+    await other
+    assert service._seat_layout_prefetches == {}
+
+
+def test_prefetch_disabled_by_default(seat_bind_calls):
+    page = _page()
+
+    assert prefetch_seat_layouts(page, page["buses"], session_key="s1") is None
+    assert seat_bind_calls == []
+
+
+@pytest.mark.asyncio
+async def test_tool_prefetches_page_layouts(seat_bind_calls, monkeypatch):
+    async def fake_search(self, payload):
+        return bus_search_response(trip_count=40, points=4)
+
+    monkeypatch.setattr(BusApiClient, "search", fake_search)
+    monkeypatch.setattr(service, "BUS_SEAT_LAYOUT_PREFETCH_COUNT", 2)
+
+    result = await BusSearchTool().execute(
+        sourceId="733", destinationId="757", journeyDate="10-03-2026", page=2, _limit=10,
+        _session_id="chat-1",
+    )
+    await service._seat_layout_prefetches["chat-1"]
+
+    page_ids = [bus["bus_id"] for bus in result.structured_content["buses"][:2]]
+    assert [call["id"] for call in seat_bind_calls] == page_ids
@@ -0,0 +1,112 @@
+"""
+Tests for sort-and-sweep domestic round-trip pairing.
+The result must match the original all-pairs scan exactly.
+"""
+
+import copy
+import random
+
+import pytest
+
+from tools_factory.flights.flight_search_service import (
+    filter_domestic_roundtrip_flights,
+    is_valid_domestic_roundtrip,
+)
+
+
+def _flight(idx, date, dep, arr):
+    return {
+        "segment_id": idx,
+        "journey_time": "02h 10m",
+        "total_stops": 0,
+        "legs": [{
+            "airline_name": "IndiGo",
+            "airline_code": "6E",
+            "flight_number": str(idx),
+            "origin": "DEL",
+            "destination": "BOM",
+            "departure_date": date,
+            "departure_time": dep,
+            "arrival_date": date,
+            "arrival_time": arr,
+        }],
+    }
+
+
+def _random_flights(rng, count, dates, prefix):
+    flights = []
+    for i in range(count):
+        dep = rng.randrange(0, 22 * 60)
+        arr = dep + rng.randrange(60, 150)
+        dep_time = f"{dep // 60:02d}:{dep % 60:02d}"
+        arr_time = f"{arr // 60:02d}:{arr % 60:02d}"
+        if rng.random() < 0.05:
+            arr_time = dep_time = ""  # unparseable times never pair
+        flights.append(_flight(f"{prefix}{i}", rng.choice(dates), dep_time, arr_time))
+    return flights
+
+
+def _all_pairs_reference(outbound_flights, return_flights):
+    """Original O(N x M) implementation."""
+    valid_pairs = [
+        (o_idx, r_idx)
+        for o_idx, out_f in enumerate(outbound_flights)
+        for r_idx, ret_f in enumerate(return_flights)
+        if is_valid_domestic_roundtrip(out_f, ret_f)
+    ]
+    ordered_out, ordered_ret, seen_out, seen_ret = [], [], set(), set()
+    for o_idx, r_idx in valid_pairs:
+        if o_idx not in seen_out:
+            ordered_out.append(outbound_flights[o_idx])
+            seen_out.add(o_idx)
+        if r_idx not in seen_ret:
+            ordered_ret.append(return_flights[r_idx])
+            seen_ret.add(r_idx)
+    return ordered_out, ordered_ret
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_pairing_matches_all_pairs_scan(seed):
+    rng = random.Random(seed)
+    outbound = _random_flights(rng, rng.randrange(1, 60), ["10Mar2026", "11Mar2026"], "o")
+    returns = _random_flights(rng, rng.randrange(1, 60), ["10Mar2026", "11Mar2026"], "r")
+    expected_out, expected_ret = _all_pairs_reference(outbound, returns)
+
+    result = filter_domestic_roundtrip_flights({
+        "is_roundtrip": True,
+        "is_international": False,
+        "outbound_flights": copy.deepcopy(outbound),
+        "return_flights": copy.deepcopy(returns),
+    })
+
+    assert result["outbound_flights"] == expected_out
+    assert result["return_flights"] == expected_ret
+
+
+def test_gap_must_exceed_four_hours():
+    outbound = [_flight("o", "10Mar2026", "06:00", "08:00")]
+    returns = [
+        _flight("exact", "10Mar2026", "12:00", "14:00"),
+        _flight("ok", "10Mar2026", "12:01", "14:01"),
+    ]
+
+    result = filter_domestic_roundtrip_flights({
+        "is_roundtrip": True,
+        "is_international": False,
+        "outbound_flights": outbound,
+        "return_flights": returns,
+    })
+
+    assert [f["segment_id"] for f in result["return_flights"]] == ["ok"]
+
+
+def test_no_valid_pairs_clears_both_lists():
+    result = filter_domestic_roundtrip_flights({
+        "is_roundtrip": True,
+        "is_international": False,
+        "outbound_flights": [_flight("o", "10Mar2026", "18:00", "20:00")],
+        "return_flights": [_flight("r", "10Mar2026", "09:00", "11:00")],
+    })
+
+    assert result["outbound_flights"] == []
+    assert result["return_flights"] == []
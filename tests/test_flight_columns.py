@@ -0,0 +1,117 @@
+"""
+Tests for the columnar flight view: masks, orderings and top-K selections
+must agree with the dict-based helpers they replace.
+"""
+
+import pytest
+
+import tools_factory.flights.flight_columns as flight_columns
+from tools_factory.flights.flight_columns import FlightColumns
+from tools_factory.flights.flight_filters import FlightFilterSpec, _flight_duration_minutes
+from tools_factory.flights.flight_search_service import process_flight_results, refine_flight_results
+from tests.flight_fixtures import domestic_response, international_roundtrip_response, search_context
+from tests.test_flight_filter_first import FILTER_CASES
+
+
+@pytest.fixture(scope="module")
+def flights():
+    result = process_flight_results(
+        domestic_response(outbound_count=90), False, False, search_context(), use_short_links=False,
+    )
+    return result["outbound_flights"]
+
+
+@pytest.fixture(scope="module")
+def combos():
+    result = process_flight_results(
+        international_roundtrip_response(combo_count=50), True, True,
+        search_context(return_date="2026-03-17", is_international=True), use_short_links=False,
+    )
+    return result["international_combos"]
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_mask_matches_dict_filters(flights, filters):
+    compiled = FlightFilterSpec.from_context(search_context(**filters))
+
+    columns = FlightColumns(flights)
+
+    expected = [i for i, f in enumerate(flights) if compiled.matches(f)]
+    assert columns.mask(compiled) == expected
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_combo_mask_checks_both_directions(combos, filters):
+    compiled = FlightFilterSpec.from_context(search_context(**filters))
+
+    columns = FlightColumns.for_combos(combos)
+
+    expected = [
+        i for i, c in enumerate(combos)
+        if compiled.matches(c["onward_flight"])
+        and compiled.matches(c["return_flight"], check_time=False)
+    ]
+    assert columns.mask(compiled) == expected
+
+
+def test_orderings_match_sorted(flights, combos):
+    columns = FlightColumns(flights)
+
+    assert columns.take(columns.argsort("duration")) == sorted(flights, key=_flight_duration_minutes)
+    assert columns.top_k("duration", 7) == columns.argsort("duration")[:7]
+    assert columns.top_k("fare", 5) == columns.argsort("fare")[:5]
+
+    combo_columns = FlightColumns.for_combos(combos)
+    expected = sorted(
+        combos,
+        key=lambda c: _flight_duration_minutes(c["onward_flight"]) + _flight_duration_minutes(c["return_flight"]),
+    )
+    assert combo_columns.take(combo_columns.argsort("duration")) == expected
+
+
+def test_argmin_finds_cheapest_within_mask(flights):
+    columns = FlightColumns(flights)
+    nonstop = columns.mask(FlightFilterSpec.from_context(search_context(stops=0)))
+
+    cheapest = columns.argmin("fare", nonstop)
+
+    fares = {i: min(o["total_fare"] for o in flights[i]["fare_options"]) for i in nonstop}
+    assert cheapest in nonstop
+    assert fares[cheapest] == min(fares.values())
+    assert columns.argmin("fare", []) is None
+    assert FlightColumns([{"legs": [], "fare_options": []}]).argmin("fare") is None
+
+
+def test_fastest_search_orders_by_duration():
+    context = search_context(fastest=True)
+    result = process_flight_results(domestic_response(outbound_count=40), False, False, context, use_short_links=False)
+
+    durations = [_flight_duration_minutes(f) for f in result["outbound_flights"]]
+    assert durations == sorted(durations)
+
+
+def test_unknown_column_is_rejected(flights):
+    with pytest.raises(ValueError):
+        FlightColumns(flights).argsort("price")
+
+
+def test_columns_travel_with_the_result(monkeypatch):
+    result = process_flight_results(
+        domestic_response(outbound_count=40), False, False, search_context(), use_short_links=False,
+    )
+    base = result["_columns"]["outbound_flights"]
+    assert base.items is result["outbound_flights"]
+
+    parsed = []
+    monkeypatch.setitem(
+        flight_columns._PARSERS, "duration", ("d", lambda f: parsed.append(f) or _flight_duration_minutes(f)),
+    )
+    nonstop = FlightFilterSpec.from_context(search_context(stops=0))
+    for _ in range(2):
+        refined = refine_flight_results(result, nonstop, fastest=True, rank_limit=10)
+        view = refined["_columns"]["outbound_flights"]
+        assert view.items is refined["outbound_flights"]
+        assert list(view.duration) == [_flight_duration_minutes(f) for f in view.items]
+
+    # Durations of the cached base list are parsed once and reused by every refinement
+    assert len(parsed) == len(result["outbound_flights"])
@@ -0,0 +1,174 @@
+"""
+Tests for the flexible-date fare calendar: one cached search per day,
+cheapest fare per day, bounded concurrency and a shared deadline.
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from tools_factory.flights.flight_fare_calendar_tool import FlightFareCalendarTool
+from tools_factory.flights.flight_search_service import (
+    process_flight_results,
+    search_flights,
+    search_flights_flexible,
+)
+from tests.flight_fixtures import domestic_response, patch_flight_search, search_context
+
+CENTER = date.today() + timedelta(days=30)
+
+
+def _day(offset):
+    return (CENTER + timedelta(days=offset)).isoformat()
+
+
+def _response_for(payload):
+    """Same schedule every day, with fares shifted by how far the day is from CENTER."""
+    shift = abs((date.fromisoformat(payload["deptDT"]) - CENTER).days) * 250 + 100
+    response = domestic_response(outbound_count=30)
+    for segment in response["j"][0]["s"]:
+        for fare in segment["lstFr"]:
+            fare["TF"] += shift
+            fare["BF"] += shift
+    return response
+
+
+def _expected_min_fare(day_iso, **filters):
+    context = search_context(outbound_date=day_iso, **filters)
+    flights = process_flight_results(_response_for({"deptDT": day_iso}), False, False, context, use_short_links=False)
+    fares = [option["total_fare"] for f in flights["outbound_flights"] for option in f["fare_options"]]
+    return min(fares) if fares else None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters", [{}, {"airline_names": ["SpiceJet"], "stops": 1}, {"departure_time_window": "10:00-14:00"}])
+async def test_min_fare_per_day_matches_processed_results(monkeypatch, filters):
+    patch_flight_search(monkeypatch, _response_for)
+
+    calendar = await search_flights_flexible("DEL", "BOM", CENTER.isoformat(), days_before=2, days_after=2, **filters)
+
+    assert [d["date"] for d in calendar["days"]] == [_day(o) for o in range(-2, 3)]
+    for day in calendar["days"]:
+        assert day["min_fare"] == _expected_min_fare(day["date"], **filters)
+        assert day["status"] == "ok"
+    assert calendar["cheapest"]["date"] == CENTER.isoformat()
+    assert calendar["summary"]["with_fares"] == 5
+
+
+@pytest.mark.asyncio
+async def test_day_without_matching_flights(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+
+    calendar = await search_flights_flexible(
+        "DEL", "BOM", CENTER.isoformat(), days_before=0, days_after=1, airline_names=["Vistara"],
+    )
+
+    assert {d["status"] for d in calendar["days"]} == {"no_flights"}
+    assert calendar["cheapest"] is None
+    assert calendar["error"] == "NO_FARES"
+
+
+@pytest.mark.asyncio
+async def test_past_dates_are_skipped(monkeypatch):
+    searches = patch_flight_search(monkeypatch, _response_for)
+    today = date.today()
+
+    calendar = await search_flights_flexible("DEL", "BOM", today.isoformat(), days_before=3, days_after=1)
+
+    assert [d["date"] for d in calendar["days"]] == [today.isoformat(), (today + timedelta(days=1)).isoformat()]
+    assert len(searches) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+    from emt_client.clients.flight_client import FlightApiClient
+
+    in_flight = []
+    peak = []
+
+    async def slow_search(self, url, payload):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return _response_for(payload)
+
+    monkeypatch.setattr(FlightApiClient, "search", slow_search)
+
+    calendar = await search_flights_flexible(
+        "DEL", "BOM", CENTER.isoformat(), days_before=3, days_after=3, max_concurrent=2,
+    )
+
+    assert calendar["summary"]["with_fares"] == 7
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_days_time_out(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+    from emt_client.clients.flight_client import FlightApiClient
+
+    async def search(self, url, payload):
+        if payload["deptDT"] == _day(1):
+            await asyncio.sleep(5)
+        return _response_for(payload)
+
+    monkeypatch.setattr(FlightApiClient, "search", search)
+
+    calendar = await search_flights_flexible(
+        "DEL", "BOM", CENTER.isoformat(), days_before=1, days_after=1, timeout=0.2,
+    )
+
+    statuses = {d["date"]: d["status"] for d in calendar["days"]}
+    assert statuses == {_day(-1): "ok", _day(0): "ok", _day(1): "timeout"}
+    assert calendar["summary"]["timed_out"] == 1
+    assert calendar["cheapest"]["date"] == _day(0)
+
+
+@pytest.mark.asyncio
+async def test_picking_a_day_reuses_the_cached_search(monkeypatch):
+    searches = patch_flight_search(monkeypatch, _response_for)
+
+    calendar = await search_flights_flexible("DEL", "BOM", CENTER.isoformat(), days_before=1, days_after=1)
+    assert len(searches) == 3
+
+    chosen = calendar["cheapest"]["date"]
+    results = await search_flights("DEL", "BOM", chosen, None, 1, 0, 0, use_short_links=False)
+
+    assert len(searches) == 3
+    assert min(
+        option["total_fare"] for f in results["outbound_flights"] for option in f["fare_options"]
+    ) == calendar["cheapest"]["min_fare"]
+
+
+@pytest.mark.asyncio
+async def test_fare_calendar_tool_website_and_whatsapp(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+    tool = FlightFareCalendarTool()
+    args = dict(origin="DEL", destination="BOM", outboundDate=CENTER.isoformat(), daysBefore=1, daysAfter=1)
+
+    website = await tool.execute(**args)
+    assert not website.is_error
+    assert "Pick a date" in website.response_text
+    assert len(website.structured_content["days"]) == 3
+    assert "fare-cal" in website.html
+
+    whatsapp = await tool.execute(**args, _user_type="whatsapp")
+    assert whatsapp.structured_content is None
+    assert whatsapp.html is None
+    payload = whatsapp.whatsapp_response
+    assert payload["type"] == "flight_fare_calendar"
+    assert payload["cheapest_date"] == CENTER.isoformat()
+    assert [d["is_cheapest"] for d in payload["days"]] == [False, True, False]
+
+
+@pytest.mark.asyncio
+async def test_fare_calendar_tool_rejects_wide_window():
+    result = await FlightFareCalendarTool().execute(
+        origin="DEL", destination="BOM", outboundDate=CENTER.isoformat(), daysAfter=10,
+    )
+
+    assert result.is_error
+    assert result.structured_content["error"] == "VALIDATION_ERROR"
@@ -0,0 +1,139 @@
+"""
+Tests for filter-first flight processing: filters are evaluated on raw
+segments so only surviving flights are fully materialized.
+"""
+
+import re
+
+import pytest
+
+import tools_factory.flights.flight_search_service as service
+from tools_factory.flights.flight_filters import FlightFilterSpec, _time_to_minutes
+from tools_factory.flights.flight_search_service import process_flight_results
+from tools_factory.flights.flight_schema import FlightSearchInput
+from tests.flight_fixtures import domestic_response, international_roundtrip_response, search_context
+
+FILTER_CASES = [
+    {},
+    {"departure_time_window": "06:00-12:00"},
+    {"arrival_time_window": "21:00-03:00"},
+    {"airline_names": ["indigo", "Air India"]},
+    {"airline_names": ["SG"]},
+    {"refundable": True},
+    {"refundable": False},
+    {"stops": 0},
+    {"stops": 1, "departure_time_window": "05:00-18:00"},
+    {"departure_time_window": "06:00-12:00", "airline_names": ["akasa"], "refundable": True, "stops": 0},
+]
+
+
+def _reference(response, is_roundtrip, is_international, context):
+    """Process without filters, then filter the finished flights (pre-change behavior)."""
+    unfiltered = {k: v for k, v in context.items()}
+    unfiltered.update(departure_time_window=None, arrival_time_window=None,
+                      airline_names=None, refundable=None, stops=None)
+    result = process_flight_results(response, is_roundtrip, is_international, unfiltered, use_short_links=False)
+    filters = FlightFilterSpec.from_context(context)
+    return {
+        "outbound": [f for f in result["outbound_flights"] if filters.matches(f)],
+        "return": [f for f in result["return_flights"] if filters.matches(f)],
+        "combos": [
+            c for c in result["international_combos"]
+            if filters.matches(c["onward_flight"])
+            and filters.matches(c["return_flight"], check_time=False)
+        ],
+    }
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_filter_first_matches_filtering_processed_flights(filters):
+    response = domestic_response(outbound_count=60, return_count=45)
+    context = search_context(return_date="2026-03-14", **filters)
+
+    result = process_flight_results(response, True, False, context, use_short_links=False)
+    expected = _reference(response, True, False, context)
+
+    assert result["outbound_flights"] == expected["outbound"]
+    assert result["return_flights"] == expected["return"]
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_filter_first_international_combos(filters):
+    response = international_roundtrip_response(combo_count=40)
+    context = search_context(return_date="2026-03-17", is_international=True, **filters)
+
+    result = process_flight_results(response, True, True, context, use_short_links=False)
+    expected = _reference(response, True, True, context)
+
+    assert result["international_combos"] == expected["combos"]
+
+
+def test_rejected_segments_are_not_materialized(monkeypatch):
+    processed = []
+    deeplinks = []
+    original_process = service.process_segment
+    original_deeplink = service.build_deep_link
+
+    def counting_process(segment, *args, **kwargs):
+        processed.append(segment["id"])
+        return original_process(segment, *args, **kwargs)
+
+    def counting_deeplink(*args, **kwargs):
+        deeplinks.append(1)
+        return original_deeplink(*args, **kwargs)
+
+    monkeypatch.setattr(service, "process_segment", counting_process)
+    monkeypatch.setattr(service, "build_deep_link", counting_deeplink)
+
+    context = search_context(airline_names=["IndiGo"], stops=0)
+    result = process_flight_results(domestic_response(outbound_count=80), False, False, context, use_short_links=False)
+
+    assert result["outbound_flights"]
+    assert len(processed) == len(result["outbound_flights"])
+    assert len(deeplinks) == len(result["outbound_flights"])
+    assert all(f["legs"][0]["airline_code"] == "6E" and f["total_stops"] == 0 for f in result["outbound_flights"])
+
+
+def test_filter_spec_from_context():
+    filters = FlightFilterSpec.from_context(search_context(
+        departure_time_window="21:00-03:00", airline_names=["IndiGo"], stops="1",
+    ))
+
+    assert filters.departure_window == (21 * 60, 3 * 60, True)
+    assert filters.arrival_window == (0, 1440, False)
+    assert filters.airline_names == ("indigo",)
+    assert filters.stops == 1
+
+
+def test_filter_spec_is_hashable_and_reused():
+    payload = FlightSearchInput.model_validate({
+        "origin": "DEL", "destination": "BOM", "outboundDate": "2026-03-10",
+        "departureTimeWindow": "6am-11am", "flightNames": "IndiGo, Air India", "stops": 0,
+    })
+
+    spec = FlightFilterSpec.from_input(payload)
+    same = FlightFilterSpec.from_input(payload.model_copy(update={"page": 2}))
+
+    assert spec is same
+    assert {spec: "cached"}[same] == "cached"
+    assert spec == FlightFilterSpec.from_context(search_context(
+        departure_time_window="06:00-11:00", airline_names=["IndiGo", "Air India"], stops=0,
+    ))
+    assert FlightFilterSpec.from_context(search_context()).is_empty
+    assert not spec.is_empty
+
+
+@pytest.mark.parametrize("raw", ["06:05", "6:05", "0605", "605", "24:00", "23:75", "07:30 AM", "", None, "١٢:٣٠"])
+def test_time_parsing_fast_path_matches_regex(raw):
+    expected = None
+    if raw is not None:
+        digits = re.sub(r"\D", "", str(raw))
+        if digits:
+            if len(digits) == 3:
+                hour, minute = int(digits[0]), int(digits[1:])
+            else:
+                hour, minute = int(digits[:2]), int(digits[2:4]) if len(digits) >= 4 else 0
+            if hour <= 24 and minute <= 59:
+                expected = 23 * 60 + 59 if hour == 24 and minute > 0 else hour * 60 + minute
+
+    assert _time_to_minutes(raw) == expected
@@ -0,0 +1,91 @@
+"""
+Tests for deferred flight deeplinks: links are only built for the page
+returned to the user and never for chat-gpt.
+"""
+
+import pytest
+
+import tools_factory.flights.flight_search_service as service
+from tools_factory.flights.flight_search_service import attach_deep_links, process_flight_results
+from tools_factory.flights.flight_search_tool import FlightSearchTool
+from tests.flight_fixtures import (
+    domestic_response,
+    international_roundtrip_response,
+    patch_flight_search,
+    search_context,
+)
+
+
+def _results_with_context(result, context):
+    result.update(
+        passengers=context["passengers"],
+        outbound_date=context["outbound_date"],
+        return_date=context["return_date"],
+    )
+    return result
+
+
+def test_deferred_links_match_eager_links():
+    response = domestic_response(outbound_count=20, return_count=20)
+    context = search_context(return_date="2026-03-14")
+
+    eager = process_flight_results(response, True, False, context, use_short_links=False)
+    lazy = process_flight_results(response, True, False, context, use_short_links=False, defer_deep_links=True)
+
+    assert all("deepLink" not in f for f in lazy["outbound_flights"] + lazy["return_flights"])
+
+    _results_with_context(lazy, context)
+    attach_deep_links(lazy, lazy["outbound_flights"] + lazy["return_flights"])
+    assert lazy["outbound_flights"] == eager["outbound_flights"]
+    assert lazy["return_flights"] == eager["return_flights"]
+
+
+def test_deferred_combo_links_match_eager_links():
+    response = international_roundtrip_response(combo_count=12)
+    context = search_context(return_date="2026-03-17", is_international=True)
+
+    eager = process_flight_results(response, True, True, context, use_short_links=False)
+    lazy = process_flight_results(response, True, True, context, use_short_links=False, defer_deep_links=True)
+    assert all("deepLink" not in c for c in lazy["international_combos"])
+
+    _results_with_context(lazy, context)
+    attach_deep_links(lazy, [], lazy["international_combos"])
+    assert [c["deepLink"] for c in lazy["international_combos"]] == [
+        c["deepLink"] for c in eager["international_combos"]
+    ]
+
+
+@pytest.fixture
+def counted_links(monkeypatch):
+    calls = []
+    original = service.build_deep_link
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(service, "build_deep_link", counting)
+    patch_flight_search(monkeypatch, lambda payload: domestic_response(outbound_count=120))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_tool_builds_links_for_page_only(counted_links):
+    result = await FlightSearchTool().execute(
+        origin="DEL", destination="BOM", outboundDate="2026-03-10", page=2, _limit=15,
+    )
+
+    flights = result.structured_content["outbound_flights"]
+    assert len(flights) == 15
+    assert len(counted_links) == 15
+    assert all(f["deepLink"].startswith("http") for f in flights)
+
+
+@pytest.mark.asyncio
+async def test_tool_builds_no_links_for_chatgpt(counted_links):
+    result = await FlightSearchTool().execute(
+        origin="DEL", destination="BOM", outboundDate="2026-03-10", _user_type="chat-gpt",
+    )
+
+    assert result.structured_content["outbound_flights"]
+    assert counted_links == []
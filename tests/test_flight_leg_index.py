@@ -0,0 +1,67 @@
+"""
+Tests for the per-response leg index used by process_segment and the
+international combo builder.
+"""
+
+import tools_factory.flights.flight_search_service as service
+from tools_factory.flights.flight_search_service import (
+    _LegIndex,
+    _build_leg_from_detail,
+    _process_international_combos,
+    process_flight_results,
+)
+from tests.flight_fixtures import domestic_response, international_roundtrip_response, search_context
+
+
+def test_combo_legs_are_built_once_per_flight(monkeypatch):
+    response = international_roundtrip_response(combo_count=300, distinct_flights=8)
+    built = []
+    original = service._build_leg_from_detail
+
+    def counting_build(detail, airlines_map=None):
+        built.append(detail["FN"])
+        return original(detail, airlines_map)
+
+    monkeypatch.setattr(service, "_build_leg_from_detail", counting_build)
+
+    combos = _process_international_combos(response["j"], response["dctFltDtl"], response["C"])
+
+    assert len(combos) == 300
+    assert len(built) == 16
+    # Combos referencing the same flight share one leg object
+    assert combos[0]["onward_flight"]["legs"][0] is combos[8]["onward_flight"]["legs"][0]
+
+
+def test_combo_legs_match_per_ref_lookup():
+    response = international_roundtrip_response(combo_count=5)
+    details = dict(response["dctFltDtl"], bad="not-a-dict")
+    index = _LegIndex(details, response["C"])
+
+    for refs in (["100", "101"], "200", 200, ["missing", "bad", "101"], []):
+        found = [details.get(str(ref)) or details.get(ref) for ref in (refs if isinstance(refs, list) else [refs])]
+        expected = [_build_leg_from_detail(d, response["C"]) for d in found if d]
+        assert index.combo_legs(refs) == expected
+        assert index.combo_legs(refs) == expected  # cached path
+
+
+def test_combo_keys_tolerate_other_spellings():
+    response = international_roundtrip_response(combo_count=20)
+    expected = _process_international_combos(response["j"], response["dctFltDtl"], response["C"])
+
+    for segment in response["j"][0]["s"]:
+        segment["lob"] = segment.pop("l_OB")
+        segment["L_IB"] = segment.pop("l_IB")
+
+    assert _process_international_combos(response["j"], response["dctFltDtl"], response["C"]) == expected
+
+
+def test_segment_legs_are_shared_across_segments():
+    response = domestic_response(outbound_count=10)
+    # Point a second segment at the first segment's flight
+    segments = response["j"][0]["s"]
+    segments[1]["b"][0]["FL"] = list(segments[0]["b"][0]["FL"])
+
+    flights = process_flight_results(response, False, False, search_context(), use_short_links=False)["outbound_flights"]
+
+    assert flights[0]["legs"][0] is flights[1]["legs"][0]
+    assert flights[0]["legs"][0]["airline_name"] == "IndiGo"
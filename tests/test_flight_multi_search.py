@@ -0,0 +1,183 @@
+"""
+Tests for multi-origin / multi-city flight search: shared resolution and
+client, bounded fan-out, and one merged, deduplicated ranking.
+"""
+
+import asyncio
+
+import pytest
+
+import tools_factory.flights.flight_search_service as service
+from tools_factory.flights.flight_columns import FlightColumns
+from tools_factory.flights.flight_multi_search_tool import FlightMultiSearchTool
+from tools_factory.flights.flight_schema import FlightMultiSearchInput
+from tools_factory.flights.flight_search_service import (
+    merge_ranked_flights,
+    process_flight_results,
+    search_flights_multi,
+)
+from tests.flight_fixtures import domestic_response, patch_flight_search, search_context
+
+SHIFT = {"DEL": 0, "JAI": 450, "BOM": 900}
+
+
+def _response_for(payload):
+    """Per-route schedule; fares shifted per origin so the routes interleave."""
+    response = domestic_response(outbound_count=20, origin=payload["org"], destination=payload["dept"])
+    for segment in response["j"][0]["s"]:
+        for fare in segment["lstFr"]:
+            fare["TF"] += SHIFT.get(payload["org"], 0)
+            fare["BF"] += SHIFT.get(payload["org"], 0)
+    return response
+
+
+def _legs(*routes, date="2026-12-10"):
+    return [{"origin": o, "destination": d, "outbound_date": date} for o, d in routes]
+
+
+@pytest.mark.asyncio
+async def test_multi_origin_merges_into_one_ranking(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+
+    result = await search_flights_multi(_legs(("DEL", "GOI"), ("JAI", "GOI")))
+
+    flights = result["outbound_flights"]
+    fares = list(FlightColumns(flights).fare)
+    assert len(flights) == 40
+    assert fares == sorted(fares)
+    assert {f["route_index"] for f in flights} == {0, 1}
+    assert all(
+        f["legs"][0]["origin"] == result["routes"][f["route_index"]]["origin"] for f in flights
+    )
+    assert result["origin"] == "DEL / JAI"
+    assert result["destination"] == "GOI"
+    assert result["summary"]["with_flights"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fastest_ranks_by_journey_time(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+
+    result = await search_flights_multi(_legs(("DEL", "GOI"), ("JAI", "GOI")), fastest=True)
+
+    columns = FlightColumns(result["outbound_flights"])
+    keys = list(zip(columns.duration, columns.fare))
+    assert keys == sorted(keys)
+
+
+@pytest.mark.asyncio
+async def test_filters_apply_to_every_route(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+
+    result = await search_flights_multi(_legs(("DEL", "GOI"), ("JAI", "GOI")), airline_names=["IndiGo"], stops=0)
+
+    flights = result["outbound_flights"]
+    assert flights
+    assert all(f["legs"][0]["airline_code"] == "6E" and f["total_stops"] == 0 for f in flights)
+
+
+@pytest.mark.asyncio
+async def test_cities_resolved_once_with_one_client(monkeypatch):
+    searches = patch_flight_search(monkeypatch, _response_for)
+    resolved = []
+    clients = []
+    fake_city = service.fetch_first_city_code_country
+
+    async def counting_city(client, term):
+        resolved.append(term)
+        clients.append(client)
+        return await fake_city(client, term)
+
+    monkeypatch.setattr(service, "fetch_first_city_code_country", counting_city)
+
+    result = await search_flights_multi(_legs(("DEL", "GOI"), ("JAI", "GOI"), ("DEL", "BOM"), ("DEL", "GOI")))
+
+    assert sorted(resolved) == ["BOM", "DEL", "GOI", "JAI"]
+    assert len({id(client) for client in clients}) == 1
+    assert len(result["routes"]) == 3
+    assert len(searches) == 3
+
+
+def test_merge_drops_duplicates_keeping_cheapest():
+    context = search_context()
+    cheap = process_flight_results(domestic_response(outbound_count=10), False, False, context, use_short_links=False)
+    dear = process_flight_results(domestic_response(outbound_count=10), False, False, context, use_short_links=False)
+    for flight in dear["outbound_flights"]:
+        for option in flight["fare_options"]:
+            option["total_fare"] += 1000
+
+    merged, duplicates = merge_ranked_flights([dear["outbound_flights"], cheap["outbound_flights"]])
+
+    assert duplicates == 10
+    assert len(merged) == 10
+    assert all(any(flight is f for f in cheap["outbound_flights"]) for flight in merged)
+
+
+@pytest.mark.asyncio
+async def test_slow_route_times_out(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+    from emt_client.clients.flight_client import FlightApiClient
+
+    async def search(self, url, payload):
+        if payload["org"] == "JAI":
+            await asyncio.sleep(5)
+        return _response_for(payload)
+
+    monkeypatch.setattr(FlightApiClient, "search", search)
+
+    result = await search_flights_multi(_legs(("DEL", "GOI"), ("JAI", "GOI")), timeout=0.2)
+
+    assert [route["status"] for route in result["routes"]] == ["ok", "timeout"]
+    assert result["summary"]["timed_out"] == 1
+    assert {f["route_index"] for f in result["outbound_flights"]} == {0}
+
+
+@pytest.mark.asyncio
+async def test_too_many_routes(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+    monkeypatch.setattr(service, "FLIGHT_MULTI_SEARCH_MAX_ROUTES", 2)
+
+    result = await search_flights_multi(_legs(("DEL", "GOI"), ("JAI", "GOI"), ("BOM", "GOI")))
+
+    assert result["error"] == "TOO_MANY_ROUTES"
+
+
+def test_input_expands_origins_and_destinations():
+    payload = FlightMultiSearchInput.model_validate({
+        "origins": "del, jai", "destinations": ["GOI", "JAI"], "outboundDate": "2026-12-10",
+    })
+
+    assert payload.route_legs() == _legs(("DEL", "GOI"), ("DEL", "JAI"), ("JAI", "GOI"))
+
+
+def test_input_requires_routes():
+    with pytest.raises(ValueError):
+        FlightMultiSearchInput.model_validate({"origins": ["DEL"], "outboundDate": "2026-12-10"})
+
+
+@pytest.mark.asyncio
+async def test_tool_links_page_only_and_builds_whatsapp_options(monkeypatch):
+    patch_flight_search(monkeypatch, _response_for)
+    tool = FlightMultiSearchTool()
+    args = {
+        "legs": [
+            {"origin": "DEL", "destination": "GOI", "outboundDate": "2026-12-10"},
+            {"origin": "JAI", "destination": "BOM", "outboundDate": "2026-12-12"},
+        ],
+        "page": 2,
+        "_limit": 10,
+    }
+
+    website = await tool.execute(**args)
+    flights = website.structured_content["outbound_flights"]
+    assert not website.is_error
+    assert len(flights) == 10
+    assert all("deepLink" in f for f in flights)
+    assert website.structured_content["pagination"]["total_results"] == 40
+    assert website.html
+
+    whatsapp = await tool.execute(**args, _user_type="whatsapp")
+    options = whatsapp.whatsapp_response["whatsapp_json"]["options"]
+    routes = {(o["outbound_flight"]["origin"], o["outbound_flight"]["date"]) for o in options}
+    assert routes <= {("DEL", "2026-12-10"), ("JAI", "2026-12-12")}
+    assert whatsapp.structured_content is None
@@ -0,0 +1,134 @@
+"""
+Tests for incremental re-filtering: a refinement of a recent unfiltered
+search is answered from the cached result without autosuggest or AirBus_New.
+"""
+
+import pytest
+
+import tools_factory.flights.flight_search_service as service
+from emt_client.cache import reset_caches
+from tools_factory.flights.flight_filters import _flight_duration_minutes
+from tools_factory.flights.flight_search_service import search_flights
+from tools_factory.flights.flight_search_tool import FlightSearchTool
+from tests.flight_fixtures import (
+    domestic_response,
+    international_roundtrip_response,
+    patch_flight_search,
+)
+from tests.test_flight_filter_first import FILTER_CASES
+
+
+@pytest.fixture
+def city_lookups(monkeypatch):
+    """Call after patch_flight_search; counts autosuggest lookups from then on."""
+    def install():
+        lookups = []
+        fake_city = service.fetch_first_city_code_country
+
+        async def counting(client, term):
+            lookups.append(term)
+            return await fake_city(client, term)
+
+        monkeypatch.setattr(service, "fetch_first_city_code_country", counting)
+        return lookups
+
+    return install
+
+
+async def _search(filters, return_date="2026-03-14", **kwargs):
+    return await search_flights(
+        "DEL", "BOM", "2026-03-10", return_date, 1, 0, 0,
+        use_short_links=False, defer_deep_links=True, **filters, **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters", FILTER_CASES)
+async def test_refinement_matches_fresh_search(monkeypatch, filters):
+    searches = patch_flight_search(monkeypatch, lambda payload: domestic_response(outbound_count=60, return_count=45))
+
+    await _search({})
+    refined = await _search(filters)
+    assert len(searches) == 1
+
+    reset_caches()
+    fresh = await _search(filters)
+
+    assert refined["outbound_flights"] == fresh["outbound_flights"]
+    assert refined["return_flights"] == fresh["return_flights"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters", FILTER_CASES[1:4])
+async def test_refinement_of_international_combos(monkeypatch, filters):
+    searches = patch_flight_search(monkeypatch, lambda payload: international_roundtrip_response(combo_count=40))
+
+    await _search({}, return_date="2026-03-17", fastest=True)
+    refined = await _search(filters, return_date="2026-03-17", fastest=True)
+    assert len(searches) == 1
+
+    reset_caches()
+    fresh = await _search(filters, return_date="2026-03-17", fastest=True)
+
+    assert refined["international_combos"] == fresh["international_combos"]
+
+
+@pytest.mark.asyncio
+async def test_refinement_skips_autosuggest_and_search(monkeypatch, city_lookups):
+    searches = patch_flight_search(monkeypatch, lambda payload: domestic_response(outbound_count=30))
+    lookups = city_lookups()
+
+    await _search({}, return_date=None)
+    assert len(lookups) == 2
+
+    morning = await _search({"departure_time_window": "06:00-12:00"}, return_date=None)
+    nonstop_fastest = await _search({"stops": 0}, return_date=None, fastest=True)
+
+    assert len(searches) == 1
+    assert len(lookups) == 2
+    assert morning["origin"] == "DEL" and morning["outbound_date"] == "2026-03-10"
+    durations = [_flight_duration_minutes(f) for f in nonstop_fastest["outbound_flights"]]
+    assert durations == sorted(durations)
+    assert {f["total_stops"] for f in nonstop_fastest["outbound_flights"]} == {0}
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_is_not_cached_as_base(monkeypatch):
+    patch_flight_search(monkeypatch, lambda payload: domestic_response(outbound_count=30))
+
+    nonstop = await _search({"stops": 0}, return_date=None)
+    everything = await _search({}, return_date=None)
+
+    assert len(everything["outbound_flights"]) > len(nonstop["outbound_flights"])
+
+
+@pytest.mark.asyncio
+async def test_different_pax_is_a_new_search(monkeypatch):
+    searches = patch_flight_search(monkeypatch, lambda payload: domestic_response(outbound_count=30))
+
+    await _search({}, return_date=None)
+    await search_flights(
+        "DEL", "BOM", "2026-03-10", None, 2, 0, 0, use_short_links=False, defer_deep_links=True,
+    )
+
+    assert len(searches) == 2
+
+
+@pytest.mark.asyncio
+async def test_page_links_do_not_leak_into_cached_result(monkeypatch):
+    patch_flight_search(monkeypatch, lambda payload: domestic_response(outbound_count=40))
+    tool = FlightSearchTool()
+
+    first = await tool.execute(origin="DEL", destination="BOM", outboundDate="2026-03-10", _limit=10)
+    assert all("deepLink" in f for f in first.structured_content["outbound_flights"])
+
+    cached = await search_flights(
+        "DEL", "BOM", "2026-03-10", None, 1, 0, 0, use_short_links=True, defer_deep_links=True,
+    )
+    assert all("deepLink" not in f for f in cached["outbound_flights"])
+
+    refined = await tool.execute(
+        origin="DEL", destination="BOM", outboundDate="2026-03-10", flightNames=["IndiGo"], _limit=10,
+    )
+    flights = refined.structured_content["outbound_flights"]
+    assert flights and all(f["legs"][0]["airline_name"] == "IndiGo" for f in flights)
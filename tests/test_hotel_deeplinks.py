@@ -0,0 +1,59 @@
+"""
+Tests for HotelDeepLinkBuilder: links built from a per-search prefix are
+identical to the one-off _build_deep_link output.
+"""
+
+from tools_factory.hotels.hotel_schema import HotelSearchInput
+from tools_factory.hotels.hotel_search_service import HotelDeepLinkBuilder, HotelSearchService
+from tests.hotel_fixtures import hotel_list_response
+
+
+def _input(**overrides):
+    return HotelSearchInput(**{
+        "city_name": "Pune", "check_in_date": "2026-03-10", "check_out_date": "2026-03-12", **overrides,
+    })
+
+
+def test_single_room_link_format():
+    builder = HotelDeepLinkBuilder("PUNE,INDIA", "2026-03-10", "2026-03-12", 1, "2", 18.52, 73.85, "city")
+
+    link = builder.build("EMT1", "H1", trace_id="trace1")
+
+    assert link == {
+        "deepLink": (
+            "https://www.easemytrip.com/hotel-new/details?cityName=PUNE%2CINDIA&sText=PUNE%2CINDIA&"
+            "checkinDate=10/03/2026&checkoutDate=12/03/2026&Rooms=1&pax=2&lat=18.52&lon=73.85&"
+            "emthid=EMT1&hid=H1&tid=trace1&stype=city"
+        ),
+        "traceId": "trace1",
+    }
+
+
+def test_builder_matches_one_off_link_for_multi_room():
+    service = HotelSearchService()
+    search_input = _input(num_rooms=2, num_adults=3, num_children=2, child_ages=[4, 9])
+    builder = service._deep_link_builder("GOA,INDIA", search_input, None, None, "city")
+
+    one_off = service._build_deep_link(
+        city_name="GOA,INDIA", check_in="2026-03-10", check_out="2026-03-12", num_rooms=2,
+        room_details=service._build_room_details(search_input),
+        emt_id="E9", hotel_id="H9", trace_id="t9", stype="city",
+    )
+
+    assert builder.build("E9", "H9", trace_id="t9") == one_off
+    assert "pax=2_1_4?1_1_9&" in one_off["deepLink"]
+
+
+def test_process_response_links_share_prefix():
+    service = HotelSearchService()
+    search_input = _input()
+
+    result = service._process_response(
+        hotel_list_response(count=20), "PUNE,INDIA", search_input, "key", 18.52, 73.85, "city",
+        use_short_links=False,
+    )
+
+    prefix = service._deep_link_builder("PUNE,INDIA", search_input, 18.52, 73.85, "city").prefix
+    for hotel in result["hotels"]:
+        assert hotel["deepLink"] == f"{prefix}{hotel['emtId']}&hid={hotel['hotelId']}&tid={hotel['traceId']}&stype=city"
+    assert len({hotel["traceId"] for hotel in result["hotels"]}) == 20
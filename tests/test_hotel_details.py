@@ -0,0 +1,158 @@
+"""
+Tests for hotel detail enrichment: per hotel/date caching, bounded
+concurrent fetches and the budget that keeps the listing from waiting.
+"""
+
+import asyncio
+
+import pytest
+
+import tools_factory.hotels.hotel_search_service as service
+from emt_client.clients.hotel_client import HotelApiClient
+from tools_factory.hotels.hotel_schema import HotelSearchInput
+from tools_factory.hotels.hotel_search_service import HotelSearchService, _summarize_hotel_details
+from tools_factory.hotels.hotel_search_tool import HotelSearchTool
+from tests.hotel_fixtures import patch_hotel_search
+
+SEARCH = dict(city_name="Pune", check_in_date="2026-03-10", check_out_date="2026-03-12")
+
+
+def _input(**overrides):
+    return HotelSearchInput(**{**SEARCH, **overrides})
+
+
+def _hotels(count=10):
+    return [{"hotelId": f"PUN{i:05d}", "emtId": f"EMTPUN{i:05d}"} for i in range(count)]
+
+
+def details_response(hotel_id):
+    return {
+        "HotelDetails": {
+            "Description": f"About {hotel_id}",
+            "Address": "Koregaon Park, Pune",
+            "Amenities": ["Free WiFi", "Pool"],
+            "Images": [f"https://img.example.com/{hotel_id}/{i}.jpg" for i in range(8)],
+            "CheckInTime": "12:00",
+            "RoomRates": [{"price": 4200}],
+        }
+    }
+
+
+@pytest.fixture
+def detail_calls(monkeypatch):
+    calls = []
+
+    async def fake_details(self, url, payload):
+        calls.append(payload)
+        await asyncio.sleep(0)
+        return details_response(payload["HotelId"])
+
+    monkeypatch.setattr(HotelApiClient, "get_hotel_details", fake_details)
+    return calls
+
+
+async def _settle():
+    await asyncio.gather(*service._detail_fetches)
+
+
+def test_summary_keeps_listing_fields_only():
+    details = _summarize_hotel_details(details_response("H1"))
+
+    assert set(details) == {"description", "address", "amenities", "images", "checkInTime"}
+    assert len(details["images"]) == 5
+    assert _summarize_hotel_details({}) is None
+    assert _summarize_hotel_details({"error": "API returned status 500"}) is None
+
+
+@pytest.mark.asyncio
+async def test_details_cached_per_hotel_and_dates(detail_calls):
+    hotel_service = HotelSearchService()
+    hotel = _hotels(1)[0]
+
+    first = await hotel_service.get_hotel_details(hotel, _input())
+    second = await hotel_service.get_hotel_details(hotel, _input(num_adults=3))
+    assert first["description"] == "About PUN00000" and second is first
+    assert len(detail_calls) == 1
+    assert detail_calls[0]["CheckInDate"] == "2026-03-10" and detail_calls[0]["CheckOut"] == "2026-03-12"
+
+    await hotel_service.get_hotel_details(hotel, _input(check_out_date="2026-03-13"))
+    assert len(detail_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_details_not_cached(monkeypatch):
+    calls = []
+
+    async def failing(self, url, payload):
+        calls.append(payload)
+        raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(HotelApiClient, "get_hotel_details", failing)
+    hotel_service = HotelSearchService()
+
+    for _ in range(2):
+        assert await hotel_service.get_hotel_details(_hotels(1)[0], _input()) is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_enrich_top_hotels_with_bounded_concurrency(monkeypatch):
+    running = []
+    peak = []
+
+    async def slow(self, url, payload):
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return details_response(payload["HotelId"])
+
+    monkeypatch.setattr(HotelApiClient, "get_hotel_details", slow)
+
+    details = await HotelSearchService().enrich_hotels(_hotels(), _input(), count=6, concurrency=2, budget=5)
+
+    assert sorted(details) == [f"PUN{i:05d}" for i in range(6)]
+    assert len(peak) == 6 and max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_budget_does_not_wait_for_slow_details(monkeypatch):
+    release = asyncio.Event()
+    calls = []
+
+    async def blocked(self, url, payload):
+        calls.append(payload)
+        await release.wait()
+        return details_response(payload["HotelId"])
+
+    monkeypatch.setattr(HotelApiClient, "get_hotel_details", blocked)
+    hotel_service = HotelSearchService()
+
+    assert await hotel_service.enrich_hotels(_hotels(), _input(), count=3, budget=0.01) == {}
+
+    # The fetches finish in the background and serve the next view of the page
+    release.set()
+    await _settle()
+    details = await hotel_service.enrich_hotels(_hotels(), _input(), count=3, budget=0)
+    assert sorted(details) == ["PUN00000", "PUN00001", "PUN00002"]
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_enrichment_off_by_default(detail_calls):
+    assert await HotelSearchService().enrich_hotels(_hotels(), _input()) == {}
+    assert detail_calls == []
+
+
+@pytest.mark.asyncio
+async def test_tool_attaches_details_to_page(monkeypatch, detail_calls):
+    patch_hotel_search(monkeypatch)
+    monkeypatch.setattr(service, "HOTEL_DETAILS_ENRICH_COUNT", 2)
+    monkeypatch.setattr(service, "HOTEL_DETAILS_BUDGET", 5)
+
+    result = await HotelSearchTool().execute(**SEARCH, _limit=10, _user_type="chat-gpt")
+
+    hotels = result.structured_content["hotels"]
+    assert [h["details"]["description"] for h in hotels[:2]] == [f"About {h['hotelId']}" for h in hotels[:2]]
+    assert all("details" not in h for h in hotels[2:])
+    assert [call["HotelId"] for call in detail_calls] == [h["hotelId"] for h in hotels[:2]]
@@ -0,0 +1,152 @@
+"""
+Tests for local hotel refinement: price/star filters and price sorts applied
+over the cached unfiltered listing instead of a new upstream search.
+"""
+
+import pytest
+
+from tools_factory.hotels.hotel_index import HotelIndex, HotelRefinement
+from tools_factory.hotels.hotel_schema import HotelSearchInput
+from tools_factory.hotels.hotel_search_service import HotelSearchService
+from tests.hotel_fixtures import patch_hotel_search
+
+SEARCH = dict(city_name="Pune", check_in_date="2026-03-10", check_out_date="2026-03-12")
+
+
+def _input(**overrides):
+    return HotelSearchInput(**{**SEARCH, **overrides})
+
+
+def _reference(hotels, min_price=None, max_price=None, stars=(), sort_type="Popular|DSC"):
+    kept = [
+        h for h in hotels
+        if (not stars or int(h["rating"]) in stars)
+        and (min_price is None or h["price"]["amount"] >= min_price)
+        and (max_price is None or h["price"]["amount"] <= max_price)
+    ]
+    if sort_type == "price|ASC":
+        kept.sort(key=lambda h: h["price"]["amount"])
+    elif sort_type == "price|DESC":
+        kept.sort(key=lambda h: -h["price"]["amount"])
+    return kept
+
+
+def _ids(hotels):
+    return [h["hotelId"] for h in hotels]
+
+
+def test_refinement_from_input():
+    assert HotelRefinement.from_input(_input()).is_empty
+    assert HotelRefinement.from_input(_input(sort_type="cheapest")).sort_type == "price|ASC"
+
+    refinement = HotelRefinement.from_input(_input(rating=["5", "3", "x"], max_price=6000))
+    assert refinement.stars == (3, 5)
+    assert refinement.max_price == 6000 and refinement.min_price is None
+    assert {refinement: 1}[HotelRefinement.from_input(_input(rating=["3", "5"], max_price=6000))] == 1
+
+
+REFINEMENTS = [
+    dict(stars=(4, 5)),
+    dict(min_price=3000, max_price=7000),
+    dict(sort_type="price|ASC"),
+    dict(stars=(3,), sort_type="price|DESC"),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("refinement", REFINEMENTS)
+async def test_index_matches_reference(monkeypatch, refinement):
+    patch_hotel_search(monkeypatch)
+    hotels = (await HotelSearchService().search(_input(hotel_count=60), use_short_links=False))["hotels"]
+
+    index = HotelIndex(hotels)
+    rows = index.rows(index.select(HotelRefinement(**refinement)))
+
+    assert _ids(rows) == _ids(_reference(hotels, **refinement))
+
+
+def test_unknown_price_dropped_by_price_filter_and_sorted_last():
+    hotels = [
+        {"hotelId": "a", "rating": "4", "price": {"amount": None}},
+        {"hotelId": "b", "rating": "4", "price": {"amount": 900}},
+        {"hotelId": "c", "rating": None, "price": {"amount": 500}},
+    ]
+    index = HotelIndex(hotels)
+
+    assert _ids(index.rows(index.select(HotelRefinement(max_price=1000)))) == ["b", "c"]
+    assert _ids(index.rows(index.select(HotelRefinement(sort_type="price|ASC")))) == ["c", "b", "a"]
+    assert _ids(index.rows(index.select(HotelRefinement(stars=(4,))))) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_refinement_served_from_cached_listing(monkeypatch):
+    searches = patch_hotel_search(monkeypatch, total=45)
+    service = HotelSearchService()
+
+    full = await service.search_progressive(_input(page=4), page_size=15, prefetch_pages=0)
+    assert len(full["hotels"]) == 45 and full["has_more"] is False
+    calls = len(searches)
+
+    refined = await service.search_progressive(
+        _input(rating=["4", "5"], sort_type="price|ASC"), page_size=15, prefetch_pages=0,
+    )
+
+    assert len(searches) == calls
+    assert _ids(refined["hotels"]) == _ids(_reference(full["hotels"], stars=(4, 5), sort_type="price|ASC"))
+    assert refined["has_more"] is False
+    assert refined["searchKey"] == full["searchKey"]
+
+
+@pytest.mark.asyncio
+async def test_partly_loaded_listing_is_not_completed_for_a_refinement(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    service = HotelSearchService()
+
+    await service.search_progressive(_input(), page_size=15, prefetch_pages=0)
+    await service.search_progressive(_input(rating=["4", "5"]), page_size=15, prefetch_pages=0)
+
+    # One filtered upstream search instead of loading the rest of the unfiltered listing
+    assert len(searches) == 2
+    assert searches[-1]["selectedRating"] == ["4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_refinement_of_capped_listing_searches_upstream(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    service = HotelSearchService()
+
+    full = await service.search_progressive(_input(page=4), page_size=15, prefetch_pages=0)
+    assert len(full["hotels"]) == 50 and full["has_more"] is False
+
+    # hotel_count stopped the listing before the inventory ended, so its
+    # 4/5-star or cheapest hotels are not all of upstream's
+    stars = await service.search_progressive(_input(rating=["4", "5"]), page_size=15, prefetch_pages=0)
+    assert searches[-1]["selectedRating"] == ["4", "5"]
+    assert stars["has_more"] is True
+
+    await service.search_progressive(_input(sort_type="price|ASC"), page_size=15, prefetch_pages=0)
+    assert searches[-1]["sorttype"] == "price|ASC"
+
+
+@pytest.mark.asyncio
+async def test_complete_inventory_is_refined_locally_even_if_small(monkeypatch):
+    searches = patch_hotel_search(monkeypatch, total=12)
+    service = HotelSearchService()
+
+    await service.search_progressive(_input(), page_size=15, prefetch_pages=0)
+    refined = await service.search_progressive(_input(rating=["5"]), page_size=15, prefetch_pages=0)
+
+    assert len(searches) == 1
+    assert refined["hotels"] and all(h["rating"] == "5" for h in refined["hotels"])
+
+
+@pytest.mark.asyncio
+async def test_guest_rating_is_not_refined_locally(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    service = HotelSearchService()
+
+    await service.search_progressive(_input(), page_size=15, prefetch_pages=0)
+    await service.search_progressive(_input(user_rating=["5"], rating=["4"]), page_size=15, prefetch_pages=0)
+
+    assert searches[-1]["selectedTARating"] == ["5"]
+    assert searches[-1]["selectedRating"] == ["4"]
@@ -0,0 +1,165 @@
+"""
+Tests for multi-city hotel search: concurrent resolution with one token
+fetch, bounded fan-out under a deadline, and per-city plus merged views.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import emt_client.auth.hotel_auth as hotel_auth
+import tools_factory.hotels.hotel_search_service as service
+from emt_client.clients.hotel_client import HotelApiClient
+from tools_factory.hotels.hotel_schema import HotelSearchInput
+from tools_factory.hotels.hotel_search_service import HotelSearchService
+from tests.hotel_fixtures import hotel_list_response, patch_hotel_search
+
+SEARCH = dict(city_name="Goa", check_in_date="2026-03-10", check_out_date="2026-03-12", hotel_count=10)
+
+
+def _input(**overrides):
+    return HotelSearchInput(**{**SEARCH, **overrides})
+
+
+def _ids(hotels):
+    return [h["hotelId"] for h in hotels]
+
+
+@pytest.mark.asyncio
+async def test_per_city_and_merged_popularity_views(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+
+    result = await HotelSearchService().search_multi_city(_input(), ["Goa", "Gokarna"], top_k=4)
+
+    assert sorted(s["CityName"] for s in searches) == ["GOA,INDIA", "GOKARNA,INDIA"]
+    goa, gokarna = result["cities"]
+    assert (goa["city"], goa["status"], goa["totalResults"]) == ("GOA,INDIA", "ok", 10)
+    assert _ids(goa["hotels"]) == ["GOA00000", "GOA00001", "GOA00002", "GOA00003"]
+    assert gokarna["viewAll"] and gokarna["searchKey"]
+
+    # Popularity interleaves the cities' own rankings
+    assert _ids(result["hotels"]) == ["GOA00000", "GOK00000", "GOA00001", "GOK00001"]
+    assert [h["city_index"] for h in result["hotels"]] == [0, 1, 0, 1]
+    assert result["totalResults"] == 20
+    assert result["city"] == "GOA,INDIA / GOKARNA,INDIA"
+    assert result["summary"]["with_hotels"] == 2
+
+
+@pytest.mark.asyncio
+async def test_price_sort_ranks_across_cities(monkeypatch):
+    patch_hotel_search(monkeypatch)
+
+    result = await HotelSearchService().search_multi_city(
+        _input(sort_type="price|ASC"), ["Goa", "Gokarna", "Manali"],
+    )
+
+    prices = [h["price"]["amount"] for h in result["hotels"]]
+    assert len(prices) == 30
+    assert prices == sorted(prices)
+    assert {h["city_index"] for h in result["hotels"]} == {0, 1, 2}
+
+
+@pytest.mark.asyncio
+async def test_same_city_searched_once(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+
+    async def resolve(raw_city):
+        city = "GOA" if raw_city.lower() in ("goa", "panjim") else raw_city.upper()
+        return f"{city},INDIA", 15.49, 73.82, "city"
+
+    monkeypatch.setattr(service, "resolve_city_name", resolve)
+
+    result = await HotelSearchService().search_multi_city(_input(), ["Goa", " goa", "Panjim", "Gokarna"])
+
+    assert len(searches) == 2
+    assert [c["query"] for c in result["cities"]] == ["Goa", "Gokarna"]
+
+
+@pytest.mark.asyncio
+async def test_hotel_in_two_cities_listed_once(monkeypatch):
+    patch_hotel_search(monkeypatch, response_for=lambda payload: hotel_list_response(0, 5, city="GOA"))
+
+    result = await HotelSearchService().search_multi_city(_input(), ["North Goa", "South Goa"])
+
+    assert _ids(result["hotels"]) == [f"GOA{i:05d}" for i in range(5)]
+    assert all(h["city_index"] == 0 for h in result["hotels"])
+    assert result["summary"]["duplicates_removed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_one_token_fetch_for_all_cities(monkeypatch):
+    patch_hotel_search(monkeypatch)
+    fetches = []
+
+    async def fetch_tokens(self):
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        self._token, self._emt_token, self._token_expiry = "jwt", "emt", time.time() + 3600
+        return {"token": self._token, "emtToken": self._emt_token}
+
+    async def search(self, url, payload):
+        await self._inject_hotel_tokens()
+        return hotel_list_response(0, payload["HotelCount"], city=payload["CityName"].split(",")[0])
+
+    monkeypatch.setattr(hotel_auth, "TOKEN_CACHE_ENABLED", True)
+    monkeypatch.setattr(hotel_auth.HotelTokenProvider, "_fetch_new_tokens", fetch_tokens)
+    monkeypatch.setattr(HotelApiClient, "search", search)
+
+    result = await HotelSearchService().search_multi_city(_input(), ["Goa", "Gokarna", "Manali"])
+
+    assert result["summary"]["with_hotels"] == 3
+    assert len(fetches) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(monkeypatch):
+    patch_hotel_search(monkeypatch)
+    running = []
+    peak = []
+
+    async def slow(self, url, payload):
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return hotel_list_response(0, 5, city=payload["CityName"].split(",")[0])
+
+    monkeypatch.setattr(HotelApiClient, "search", slow)
+
+    await HotelSearchService().search_multi_city(_input(), ["Goa", "Gokarna", "Manali", "Shimla"], max_concurrent=2)
+
+    assert len(peak) == 4 and max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_and_failed_cities_are_reported(monkeypatch):
+    patch_hotel_search(monkeypatch)
+
+    async def search(self, url, payload):
+        city = payload["CityName"].split(",")[0]
+        if city == "MANALI":
+            await asyncio.sleep(5)
+        if city == "SHIMLA":
+            return None
+        return hotel_list_response(0, 5, city=city)
+
+    monkeypatch.setattr(HotelApiClient, "search", search)
+
+    result = await HotelSearchService().search_multi_city(_input(), ["Goa", "Manali", "Shimla"], timeout=0.2)
+
+    assert [c["status"] for c in result["cities"]] == ["ok", "timeout", "error"]
+    assert result["cities"][2]["message"] == "Hotel API returned no response"
+    assert result["summary"]["timed_out"] == 1 and result["summary"]["failed"] == 1
+    assert {h["city_index"] for h in result["hotels"]} == {0}
+
+
+@pytest.mark.asyncio
+async def test_too_many_cities(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    monkeypatch.setattr(service, "HOTEL_MULTI_SEARCH_MAX_CITIES", 2)
+
+    result = await HotelSearchService().search_multi_city(_input(), ["Goa", "Gokarna", "Manali"])
+
+    assert result["error"] == "TOO_MANY_CITIES"
+    assert result["hotels"] == [] and searches == []
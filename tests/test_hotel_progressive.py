@@ -0,0 +1,138 @@
+"""
+Tests for progressive hotel search: a small first upstream page, later
+pages prefetched in the background and "show more" served from them.
+"""
+
+import asyncio
+
+import pytest
+
+from emt_client.clients.hotel_client import HotelApiClient
+from tools_factory.hotels.hotel_schema import HotelSearchInput
+from tools_factory.hotels.hotel_search_service import HotelSearchService
+from tools_factory.hotels.hotel_search_tool import HotelSearchTool
+from tests.hotel_fixtures import hotel_list_response, patch_hotel_search
+
+SEARCH = dict(city_name="Pune", check_in_date="2026-03-10", check_out_date="2026-03-12")
+
+
+def _input(**overrides):
+    return HotelSearchInput(**{**SEARCH, **overrides})
+
+
+def _listing_of(result):
+    return [(h["hotelId"], h["name"], h["price"]["amount"]) for h in result["hotels"]]
+
+
+async def _settle():
+    """Let background prefetch tasks finish."""
+    await asyncio.gather(*(task for task in asyncio.all_tasks() if task is not asyncio.current_task()))
+
+
+@pytest.mark.asyncio
+async def test_first_page_is_small_then_prefetched(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    service = HotelSearchService()
+
+    first = await service.search_progressive(_input(), page_size=10, prefetch_pages=2)
+
+    assert [(s["PageNo"], s["HotelCount"]) for s in searches] == [(1, 10)]
+    assert len(first["hotels"]) == 10 and first["has_more"]
+
+    await _settle()
+    assert [s["PageNo"] for s in searches] == [1, 2, 3]
+
+    second = await service.search_progressive(_input(page=2), page_size=10, prefetch_pages=2)
+    assert len(second["hotels"]) == 30
+    assert second["viewAll"] == first["viewAll"]
+    await _settle()
+    assert [s["PageNo"] for s in searches] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_progressive_listing_matches_one_shot_search(monkeypatch):
+    patch_hotel_search(monkeypatch)
+    service = HotelSearchService()
+
+    one_shot = await service.search(_input(hotel_count=40), use_short_links=False)
+    progressive = await service.search_progressive(_input(hotel_count=40, page=4), page_size=15, use_short_links=False)
+
+    assert _listing_of(progressive) == _listing_of(one_shot)
+    assert progressive["has_more"] is False
+    assert progressive["searchKey"] == one_shot["searchKey"]
+
+
+@pytest.mark.asyncio
+async def test_short_inventory_ends_listing(monkeypatch):
+    searches = patch_hotel_search(monkeypatch, total=23)
+    service = HotelSearchService()
+
+    await service.search_progressive(_input(), page_size=10, prefetch_pages=5)
+    await _settle()
+    last = await service.search_progressive(_input(page=3), page_size=10)
+
+    assert len(last["hotels"]) == 23 and last["has_more"] is False
+    assert [s["PageNo"] for s in searches] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_show_more_waits_for_page_in_flight(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    release = asyncio.Event()
+
+    async def slow_pages(self, url, payload):
+        searches.append(dict(payload))
+        if payload["PageNo"] > 1:
+            await release.wait()
+        return hotel_list_response((payload["PageNo"] - 1) * 10, 10)
+
+    monkeypatch.setattr(HotelApiClient, "search", slow_pages)
+    service = HotelSearchService()
+
+    await service.search_progressive(_input(), page_size=10, prefetch_pages=1)
+    show_more = asyncio.ensure_future(service.search_progressive(_input(page=2), page_size=10, prefetch_pages=0))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert len((await show_more)["hotels"]) == 20
+    assert [s["PageNo"] for s in searches] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_first_page_is_not_cached(monkeypatch):
+    searches = patch_hotel_search(monkeypatch, response_for=lambda payload: None)
+    service = HotelSearchService()
+
+    for _ in range(2):
+        result = await service.search_progressive(_input(), page_size=10)
+        assert result["error"] == "API_ERROR" and result["hotels"] == []
+    assert len(searches) == 2
+
+
+@pytest.mark.asyncio
+async def test_filters_change_listing(monkeypatch):
+    searches = patch_hotel_search(monkeypatch)
+    service = HotelSearchService()
+
+    await service.search_progressive(_input(), page_size=10, prefetch_pages=0)
+    await service.search_progressive(_input(sort_type="price|ASC"), page_size=10, prefetch_pages=0)
+
+    # The unfiltered listing is only partly loaded, so the sort goes upstream at once
+    assert [s["sorttype"] for s in searches] == ["Popular|DSC", "price|ASC"]
+
+
+@pytest.mark.asyncio
+async def test_tool_pages_through_prefetched_listing(monkeypatch):
+    searches = patch_hotel_search(monkeypatch, total=35)
+    tool = HotelSearchTool()
+
+    first = await tool.execute(**SEARCH, _limit=15, _user_type="chat-gpt")
+    assert first.structured_content["pagination"]["has_next_page"] is True
+    await _settle()
+
+    second = await tool.execute(**SEARCH, page=2, _limit=15, _user_type="chat-gpt")
+    third = await tool.execute(**SEARCH, page=3, _limit=15, _user_type="chat-gpt")
+
+    assert [len(r.structured_content["hotels"]) for r in (first, second, third)] == [15, 15, 5]
+    assert third.structured_content["pagination"]["has_next_page"] is False
+    assert [s["PageNo"] for s in searches] == [1, 2, 3]
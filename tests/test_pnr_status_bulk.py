@@ -0,0 +1,152 @@
+"""
+Tests for bulk PNR status checks and PNR result caching.
+PnrchkStatus responses are faked so no network access is needed.
+"""
+
+import asyncio
+
+import pytest
+
+from emt_client.clients.train_client import TrainApiClient
+from tools_factory.trains.Train_PnrStatus.pnr_status_service import (
+    PnrStatusService,
+    build_whatsapp_bulk_pnr_response,
+    encrypt_pnr,
+    normalize_pnr,
+)
+from tools_factory.trains.Train_PnrStatus.pnr_status_tool import TrainPnrStatusTool
+
+VALID_PNRS = ["2729257223", "4512345678", "8412345670"]
+UNKNOWN_PNR = "1111111111"
+
+
+@pytest.fixture
+def fake_pnr_api(monkeypatch):
+    """Tracks calls and peak concurrency; UNKNOWN_PNR returns an API error."""
+    encrypted_to_pnr = {encrypt_pnr(p): p for p in VALID_PNRS + [UNKNOWN_PNR]}
+    state = {"calls": [], "in_flight": 0, "peak": 0}
+
+    async def check_pnr_status(self, encrypted_pnr):
+        pnr = encrypted_to_pnr[encrypted_pnr]
+        state["calls"].append(pnr)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            state["in_flight"] -= 1
+
+        if pnr == UNKNOWN_PNR:
+            return {"errorMessage": "Invalid PNR"}
+        return {
+            "pnrNumber": pnr,
+            "trainNumber": "12951",
+            "trainName": "MUMBAI RAJDHANI",
+            "dateOfJourney": "10-Mar-2026",
+            "sourceStation": "NDLS",
+            "SrcStnName": "New Delhi",
+            "destinationStation": "MMCT",
+            "DestStnName": "Mumbai Central",
+            "journeyClass": "3A",
+            "quota": "GN",
+            "chartStatus": "Chart Not Prepared",
+            "passengerList": [
+                {"passengerSerialNumber": "1", "bookingStatus": "WL/10", "currentStatus": "CNF"},
+            ],
+        }
+
+    monkeypatch.setattr(TrainApiClient, "check_pnr_status", check_pnr_status)
+    return state
+
+
+def test_normalize_pnr():
+    assert normalize_pnr("272-925 7223") == "2729257223"
+    assert normalize_pnr("27292572") is None
+    assert normalize_pnr("27292572AB") is None
+    assert normalize_pnr("") is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_validates_and_dedupes(fake_pnr_api):
+    result = await PnrStatusService().check_pnr_status_bulk(
+        ["2729257223", "272-925-7223", "12345", "4512345678"]
+    )
+
+    assert sorted(fake_pnr_api["calls"]) == ["2729257223", "4512345678"]
+    assert [r["pnr_number"] for r in result["results"]] == ["2729257223", "4512345678"]
+    assert result["invalid_pnrs"] == ["12345"]
+    assert result["summary"] == {
+        "requested": 4, "checked": 2, "found": 2, "failed": 0, "invalid": 1, "duplicates": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_respects_concurrency_bound(fake_pnr_api):
+    pnrs = VALID_PNRS + [UNKNOWN_PNR]
+
+    result = await PnrStatusService().check_pnr_status_bulk(pnrs, max_concurrent=2)
+
+    assert fake_pnr_api["peak"] == 2
+    assert result["success"]
+    assert result["summary"]["failed"] == 1
+    failed = result["results"][-1]
+    assert failed == {
+        "pnr_number": UNKNOWN_PNR, "success": False, "error": "INVALID_PNR", "message": "Invalid PNR",
+    }
+
+
+@pytest.mark.asyncio
+async def test_successful_results_are_cached_errors_are_not(fake_pnr_api):
+    service = PnrStatusService()
+
+    await service.check_pnr_status("2729257223")
+    await service.check_pnr_status("2729 257 223")
+    await service.check_pnr_status(UNKNOWN_PNR)
+    await service.check_pnr_status(UNKNOWN_PNR)
+
+    assert fake_pnr_api["calls"] == ["2729257223", UNKNOWN_PNR, UNKNOWN_PNR]
+
+
+@pytest.mark.asyncio
+async def test_whatsapp_bulk_response(fake_pnr_api):
+    result = await PnrStatusService().check_pnr_status_bulk(["2729257223", UNKNOWN_PNR, "99"])
+
+    whatsapp = build_whatsapp_bulk_pnr_response(result)
+
+    assert whatsapp["type"] == "pnr_status_bulk"
+    assert whatsapp["total"] == 3
+    assert whatsapp["found"] == 1
+    assert whatsapp["pnrs"][0]["pnr_number"] == "2729257223"
+    assert [e["pnr_number"] for e in whatsapp["errors"]] == [UNKNOWN_PNR, "99"]
+
+
+@pytest.mark.asyncio
+async def test_tool_bulk_mode(fake_pnr_api):
+    tool = TrainPnrStatusTool()
+
+    result = await tool.execute(pnrNumbers=VALID_PNRS)
+
+    assert not result.is_error
+    assert result.structured_content["summary"]["found"] == 3
+    assert result.html.count("pnr-status-card") >= 3
+    assert all(pnr in result.response_text for pnr in VALID_PNRS)
+
+    whatsapp = await tool.execute(pnrNumbers=VALID_PNRS[:2], _user_type="whatsapp")
+    assert whatsapp.whatsapp_response["found"] == 2
+    assert whatsapp.html is None
+
+
+@pytest.mark.asyncio
+async def test_tool_bulk_all_invalid_is_error(fake_pnr_api):
+    result = await TrainPnrStatusTool().execute(pnrNumbers=["123", "456"])
+
+    assert result.is_error
+    assert fake_pnr_api["calls"] == []
+
+
+@pytest.mark.asyncio
+async def test_tool_rejects_too_many_pnrs():
+    result = await TrainPnrStatusTool().execute(pnrNumbers=[f"{i:010d}" for i in range(21)])
+
+    assert result.is_error
+    assert result.structured_content["error"] == "VALIDATION_ERROR"
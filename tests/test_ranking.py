@@ -0,0 +1,95 @@
+"""
+Tests for the shared top-K ranking helpers and their use in the search tools.
+"""
+
+import random
+
+import pytest
+
+from tools_factory.buses.bus_search_service import bus_actual_price
+from tools_factory.flights.flight_filters import _flight_duration_minutes
+from tools_factory.flights.flight_search_service import process_flight_results
+from tools_factory.ranking import best_indices, page_highlights, ranked_indices, top_k, top_k_indices, to_number
+from tools_factory.trains.train_search_service import extract_train_summary, train_cheapest_fare
+from tests.flight_fixtures import domestic_response, search_context
+
+
+def _keys(seed, count=200):
+    rng = random.Random(seed)
+    return [None if rng.random() < 0.1 else rng.randrange(50) for _ in range(count)]
+
+
+def _reference_order(keys):
+    return sorted(range(len(keys)), key=lambda i: (keys[i] is None, keys[i] or 0))
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("k", [None, 0, 1, 15, 199, 500])
+def test_top_k_matches_stable_sort(seed, k):
+    keys = _keys(seed)
+    expected = _reference_order(keys)
+
+    assert top_k_indices(keys, k) == (expected if k is None else expected[:k])
+
+
+def test_ranked_indices_keeps_every_row():
+    keys = _keys(7)
+    top = _reference_order(keys)[:10]
+
+    ranked = ranked_indices(keys, 10)
+
+    assert ranked[:10] == top
+    assert ranked[10:] == [i for i in range(len(keys)) if i not in top]
+    assert ranked_indices(keys) == _reference_order(keys)
+
+
+def test_best_indices_and_highlights():
+    items = [
+        {"fare": "900", "mins": 300},
+        {"fare": None, "mins": 120},
+        {"fare": "450.5", "mins": None},
+        {"fare": "450.5", "mins": 120},
+    ]
+    keys = {"cheapest": lambda i: to_number(i["fare"]), "fastest": lambda i: i["mins"]}
+
+    assert best_indices(items, **keys) == {"cheapest": 2, "fastest": 1}
+    assert best_indices([], **keys) == {"cheapest": None, "fastest": None}
+    assert page_highlights(items, 2, **keys) == {
+        "cheapest": {"position": 3, "page": 2},
+        "fastest": {"position": 2, "page": 1},
+    }
+    assert top_k(items, 2, key=lambda i: i["mins"]) == [items[1], items[3]]
+
+
+def test_fastest_rank_limit_orders_only_the_visible_prefix():
+    response = domestic_response(outbound_count=60)
+    context = search_context(fastest=True)
+
+    full = process_flight_results(response, False, False, context, use_short_links=False)["outbound_flights"]
+    limited = process_flight_results(response, False, False, context, use_short_links=False, rank_limit=15)["outbound_flights"]
+
+    assert limited[:15] == full[:15]
+    assert len(limited) == len(full)
+    assert [_flight_duration_minutes(f) for f in full] == sorted(_flight_duration_minutes(f) for f in full)
+
+
+def test_bus_price_prefers_price_then_lowest_fare():
+    assert bus_actual_price({"price": "799", "fares": ["500"]}) == 799.0
+    assert bus_actual_price({"price": "0", "fares": ["900", "x", "650"]}) == 650.0
+    assert bus_actual_price({"price": "", "fares": []}) is None
+
+
+def test_train_cheapest_class():
+    train = {"classes": [
+        {"class_name": "3A", "fare": "1450", "availability_status": "AVL-10"},
+        {"class_name": "SL", "fare": "", "availability_status": "WL 5"},
+        {"class_name": "2S", "fare": "310", "availability_status": "AVL-90"},
+    ]}
+
+    summary = extract_train_summary(train)
+
+    assert summary["cheapest_fare"] == 310.0
+    assert summary["cheapest_class"] == "2S"
+    assert summary["availability"] == "AVL-90"
+    assert train_cheapest_fare(train) == 310.0
+    assert train_cheapest_fare({"classes": []}) is None
@@ -0,0 +1,199 @@
+"""
+Tests for streaming train availability checks with early termination.
+Availability responses are faked so no upstream calls are made.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+import tools_factory.trains.train_search_tool as train_search_tool
+from tools_factory.trains.Train_AvailabilityCheck.availability_check_service import (
+    AvailabilityCheckService,
+)
+from tools_factory.trains.train_search_service import (
+    check_and_filter_trains_by_availability,
+    stream_bookable_trains,
+)
+
+
+def _make_trains(count):
+    return [
+        {
+            "train_number": f"1{i:04d}",
+            "train_name": f"Express {i}",
+            "from_station_code": "NDLS",
+            "from_station_name": "New Delhi (NDLS)",
+            "to_station_code": "BCT",
+            "to_station_name": "Mumbai Central (BCT)",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def fake_availability(monkeypatch):
+    """Odd train numbers are bookable; responses arrive in random order."""
+    calls = []
+    cancelled = []
+
+    async def fake_check(self, train_no, classes, journey_date, quota="GN",
+                         from_station_code=None, to_station_code=None):
+        calls.append(train_no)
+        try:
+            await asyncio.sleep(random.uniform(0, 0.02))
+        except asyncio.CancelledError:
+            cancelled.append(train_no)
+            raise
+        status = "AVAILABLE-0012" if int(train_no) % 2 else "REGRET"
+        return {
+            "success": True,
+            "classes": [{"class_code": classes[0], "status": status, "fare": 1200}],
+        }
+
+    monkeypatch.setattr(AvailabilityCheckService, "check_availability_multiple_classes", fake_check)
+    return calls, cancelled
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_bookable_trains_in_route_order(fake_availability):
+    trains = _make_trains(12)
+
+    streamed = [
+        t["train_number"]
+        async for t in stream_bookable_trains(trains, "3A", "10-03-2026", max_concurrent=4)
+    ]
+
+    expected = [t["train_number"] for t in trains if int(t["train_number"]) % 2]
+    assert streamed == expected
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_launching_checks_once_target_reached(fake_availability, monkeypatch):
+    calls, _ = fake_availability
+    monkeypatch.setattr(random, "uniform", lambda a, b: 0.005)  # complete in launch order
+    trains = _make_trains(20)
+
+    streamed = [
+        t async for t in stream_bookable_trains(
+            trains, "3A", "10-03-2026", max_concurrent=3, target_count=2
+        )
+    ]
+
+    assert [t["train_number"] for t in streamed] == ["10001", "10003"]
+    # Only a window beyond the 4 needed trains may have been launched
+    assert len(calls) <= 4 + 3
+    assert len(calls) < len(trains)
+
+
+@pytest.mark.asyncio
+async def test_stream_enriches_trains(fake_availability):
+    trains = _make_trains(2)
+
+    streamed = [t async for t in stream_bookable_trains(trains, "3A", "10-03-2026")]
+
+    assert len(streamed) == 1
+    train = streamed[0]
+    assert train["availability_status"] == "AVAILABLE-0012"
+    assert train["fare"] == 1200
+    assert train["booking_link"].endswith("/3A/10001/NDLS/BCT/GN/10-3-2026")
+
+
+@pytest.mark.asyncio
+async def test_check_and_filter_matches_full_scan_without_target(fake_availability):
+    trains = _make_trains(9)
+
+    result = await check_and_filter_trains_by_availability(trains, "SL", "10-03-2026")
+
+    assert [t["train_number"] for t in result] == ["10001", "10003", "10005", "10007"]
+
+
+@pytest.mark.asyncio
+async def test_check_and_filter_respects_target_and_max_trains(fake_availability):
+    calls, _ = fake_availability
+    trains = _make_trains(30)
+
+    limited = await check_and_filter_trains_by_availability(
+        trains, "SL", "10-03-2026", max_trains=6
+    )
+    assert [t["train_number"] for t in limited] == ["10001", "10003", "10005"]
+    assert sorted(calls) == [t["train_number"] for t in trains[:6]]
+
+    paged = await check_and_filter_trains_by_availability(
+        trains, "SL", "10-03-2026", target_count=3
+    )
+    assert len(paged) == 3
+
+
+@pytest.mark.asyncio
+async def test_progress_reports_unchecked_trains(fake_availability):
+    trains = _make_trains(10)
+
+    progress = {}
+    await check_and_filter_trains_by_availability(trains, "SL", "10-03-2026", target_count=3, progress=progress)
+    assert progress["stopped_early"] is True
+
+    # Exactly target_count bookable trains and the list ran out: nothing more to show
+    progress = {}
+    result = await check_and_filter_trains_by_availability(trains, "SL", "10-03-2026", target_count=5, progress=progress)
+    assert len(result) == 5
+    assert progress["stopped_early"] is False
+
+
+@pytest.mark.asyncio
+async def test_tool_marks_totals_of_a_stopped_stream_as_lower_bounds(fake_availability, monkeypatch):
+    async def fake_search(**kwargs):
+        return {"trains": _make_trains(10), "total_count": 10}
+
+    responses = []
+
+    def fake_whatsapp(payload, train_results, tatkal_note=""):
+        responses.append(train_results)
+        return None
+
+    monkeypatch.setattr(train_search_tool, "search_trains", fake_search)
+    monkeypatch.setattr(train_search_tool, "build_whatsapp_train_response", fake_whatsapp)
+    search = dict(fromStation="NDLS", toStation="BCT", journeyDate="10-03-2026", travelClass="SL")
+    tool = train_search_tool.TrainSearchTool()
+
+    # 3 of the 5 bookable trains fill the page; the rest were never checked
+    result = await tool.execute(**search, _limit=3, _user_type="whatsapp")
+    pagination = responses[-1]["pagination"]
+    assert pagination["total_results"] == 3 and pagination["total_is_lower_bound"] is True
+    assert pagination["total_pages"] == 2 and pagination["has_next_page"] is True
+    assert "more available" in result.response_text and " of 3 " not in result.response_text
+
+    # Every train checked: the totals are exact
+    result = await tool.execute(**search, _limit=5, _user_type="whatsapp")
+    pagination = responses[-1]["pagination"]
+    assert pagination["total_is_lower_bound"] is False
+    assert pagination["total_pages"] == 1 and pagination["has_next_page"] is False
+    assert "Showing trains 1-5 of 5 " in result.response_text
+
+
+@pytest.mark.asyncio
+async def test_early_exit_cancels_outstanding_checks(monkeypatch):
+    cancelled = []
+
+    async def fake_check(self, train_no, classes, journey_date, quota="GN",
+                         from_station_code=None, to_station_code=None):
+        delay = 0 if train_no == "10000" else 1.0
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(train_no)
+            raise
+        return {"success": True, "classes": [{"class_code": "3A", "status": "AVAILABLE-0001"}]}
+
+    monkeypatch.setattr(AvailabilityCheckService, "check_availability_multiple_classes", fake_check)
+
+    result = await asyncio.wait_for(
+        check_and_filter_trains_by_availability(
+            _make_trains(5), "3A", "10-03-2026", max_concurrent=5, target_count=1
+        ),
+        timeout=0.5,
+    )
+
+    assert [t["train_number"] for t in result] == ["10000"]
+    assert sorted(cancelled) == ["10001", "10002", "10003", "10004"]
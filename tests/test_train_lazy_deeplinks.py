@@ -0,0 +1,92 @@
+"""
+Tests for deferred train deeplinks: book_now links are only built for the
+page returned to the user and never for WhatsApp.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import tools_factory.trains.train_search_service as service
+from emt_client.clients.train_client import TrainApiClient
+from tools_factory.trains.train_search_service import attach_train_deep_links, process_train_results
+from tools_factory.trains.train_search_tool import TrainSearchTool
+from tests.train_fixtures import train_search_response
+
+
+def _links(trains):
+    return [[cls["book_now"] for cls in train["classes"]] for train in trains]
+
+
+@pytest.mark.parametrize("quota", ["GN", "SS"])
+def test_deferred_links_match_eager_links(quota):
+    response = train_search_response(train_count=30)
+
+    eager = process_train_results(response, quota=quota)
+    lazy = process_train_results(response, quota=quota, defer_deep_links=True)
+    assert all(link is None for links in _links(lazy["trains"]) for link in links)
+
+    attach_train_deep_links(lazy["trains"], quota=quota)
+    assert lazy["trains"] == eager["trains"]
+
+
+def test_links_for_selected_classes_only():
+    lazy = process_train_results(train_search_response(train_count=20), defer_deep_links=True)
+
+    attach_train_deep_links(lazy["trains"], class_codes=["3A"])
+
+    for train in lazy["trains"]:
+        for cls in train["classes"]:
+            assert bool(cls["book_now"]) == (cls["class_code"] == "3A")
+
+
+def test_deeplink_format():
+    link = service._build_train_deeplink(
+        "New Delhi", "Mumbai Central", "3A", "12951", "NDLS", "MMCT", "GN", "09Feb2026",
+    )
+    assert link == "https://railways.easemytrip.com/TrainInfo/New-Delhi-to-Mumbai-Central/3A/12951/NDLS/MMCT/GN/9-2-2026"
+
+
+@pytest.fixture
+def counted_links(monkeypatch):
+    calls = []
+    original = service._build_train_deeplink
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    async def fake_search(self, url, payload):
+        return train_search_response(train_count=40)
+
+    monkeypatch.setattr(service, "_build_train_deeplink", counting)
+    monkeypatch.setattr(TrainApiClient, "search", fake_search)
+    return calls
+
+
+def _journey_date():
+    return (datetime.now() + timedelta(days=7)).strftime("%d-%m-%Y")
+
+
+@pytest.mark.asyncio
+async def test_tool_builds_links_for_page_only(counted_links):
+    result = await TrainSearchTool().execute(
+        fromStation="New Delhi (NDLS)", toStation="Mumbai Central (MMCT)",
+        journeyDate=_journey_date(), page=2, _limit=10,
+    )
+
+    trains = result.structured_content["trains"]
+    assert len(trains) == 10
+    assert len(counted_links) == sum(len(train["classes"]) for train in trains)
+    assert all(cls["book_now"].startswith("https://") for train in trains for cls in train["classes"])
+
+
+@pytest.mark.asyncio
+async def test_tool_builds_no_links_for_whatsapp(counted_links):
+    result = await TrainSearchTool().execute(
+        fromStation="New Delhi (NDLS)", toStation="Mumbai Central (MMCT)",
+        journeyDate=_journey_date(), _user_type="whatsapp",
+    )
+
+    assert result.whatsapp_response["whatsapp_json"]["options"]
+    assert counted_links == []
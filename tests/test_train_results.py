@@ -0,0 +1,55 @@
+"""
+Tests for plain-dict train result records: output is identical to the
+TrainInfo/TrainClassAvailability model_dump() it replaces.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from tools_factory.trains.train_schema import TrainInfo
+from tools_factory.trains.train_search_service import process_train_results
+from tests.train_fixtures import train_search_response
+
+FILTER_CASES = [
+    {},
+    {"preferred_class": "3A"},
+    {"quota": "TQ"},
+    {"departure_time_min": "06:00", "departure_time_max": "18:00"},
+    {"arrival_time_min": "20:00"},
+]
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_records_match_model_dump(filters):
+    result = process_train_results(train_search_response(train_count=60), validate=False, **filters)
+
+    assert result["trains"]
+    for train in result["trains"]:
+        dumped = TrainInfo.model_validate(train).model_dump()
+        assert train == dumped
+        assert list(train) == list(dumped)
+        assert [list(c) for c in train["classes"]] == [list(c) for c in dumped["classes"]]
+
+
+def test_validation_does_not_change_output():
+    response = train_search_response(train_count=40)
+
+    assert process_train_results(response, validate=True) == process_train_results(response, validate=False)
+
+
+def test_validation_flag_rejects_malformed_trains():
+    response = train_search_response(train_count=3)
+    response["trainBtwnStnsList"][1]["trainName"] = None
+
+    result = process_train_results(response, validate=False)
+    assert result["trains"][1]["train_name"] is None
+
+    with pytest.raises(ValidationError):
+        process_train_results(response, validate=True)
+
+
+def test_nearby_station_flag():
+    result = process_train_results(train_search_response(train_count=10), validate=False)
+
+    assert result["has_nearby_stations"] is True
+    assert [t["is_nearby_station"] for t in result["trains"]] == [i % 5 == 0 for i in range(10)]
@@ -0,0 +1,75 @@
+"""
+Synthetic _TrainBtwnStationList responses for offline train-processing tests.
+
+The shapes mirror the fields read by train_search_service (trainBtwnStnsList,
+TrainClassWiseFare, avlDayList, quotaList); values are generated
+deterministically from the index.
+"""
+
+CLASSES = [
+    ("1A", "First AC"),
+    ("2A", "Second AC"),
+    ("3A", "Third AC"),
+    ("3E", "AC 3 Economy"),
+    ("SL", "Sleeper"),
+    ("CC", "AC Chair Car"),
+    ("EC", "Executive Chair Car"),
+    ("2S", "Second Sitting"),
+]
+STATUSES = ["AVAILABLE-0042", "RLWL12/WL7", "GNWL45/WL30", "REGRET", "Tap To Refresh", ""]
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _class_fare(i, c, class_code, class_name, journey_date):
+    return {
+        "enqClass": class_code,
+        "enqClassName": class_name,
+        "totalFare": str(450 + c * 610 + (i * 37) % 300) if (i + c) % 9 else None,
+        "UpdationTime": f"{(i + c) % 59} min ago" if c % 2 else None,
+        "quota": "GN" if (i + c) % 4 else "TQ",
+        "quotaName": "GENERAL" if (i + c) % 4 else "TATKAL",
+        "avlDayList": [
+            {
+                "availablityDate": journey_date,
+                "availablityStatusNew": STATUSES[(i + c) % len(STATUSES)],
+            }
+        ] if (i + c) % 7 else [],
+    }
+
+
+def train_search_response(train_count=50, classes_per_train=7, journey_date="10Mar2026"):
+    """_TrainBtwnStationList response with train_count trains of up to classes_per_train classes."""
+    trains = []
+    for i in range(train_count):
+        dep_minutes = (i * 53) % (24 * 60)
+        duration = 300 + (i * 71) % 1200
+        arr_minutes = (dep_minutes + duration) % (24 * 60)
+        class_count = 1 + (i % classes_per_train)
+        offset = i % len(CLASSES)
+        train = {
+            "trainNumber": f"{12000 + i}",
+            "trainName": f"Express {i}",
+            "fromStnCode": "NDLS" if i % 5 else "NZM",
+            "fromStnName": "New Delhi" if i % 5 else "Hazrat Nizamuddin",
+            "toStnCode": "MMCT",
+            "toStnName": "Mumbai Central",
+            "departureTime": f"{dep_minutes // 60:02d}:{dep_minutes % 60:02d}",
+            "arrivalTime": f"{arr_minutes // 60:02d}:{arr_minutes % 60:02d}",
+            "duration": f"{duration // 60:02d}:{duration % 60:02d}",
+            "distance": str(1380 + i % 40),
+            "departuredate": journey_date,
+            "ArrivalDate": journey_date,
+            "NearByStation": None if i % 5 else "NZM",
+            "TrainClassWiseFare": [
+                _class_fare(i, c, *CLASSES[(offset + c) % len(CLASSES)], journey_date)
+                for c in range(class_count)
+            ],
+        }
+        for d, day in enumerate(_DAYS):
+            train[f"running{day}"] = "Y" if (i + d) % 3 else "N"
+        trains.append(train)
+
+    return {
+        "trainBtwnStnsList": trains,
+        "quotaList": [{"quota": "GN", "quotaName": "GENERAL"}, {"quota": "TQ", "quotaName": "TATKAL"}],
+    }
@@ -1,15 +1,17 @@
+import asyncio
 import base64
 import json
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import re
 import aiohttp
 
 try:
     from .bus_schema import (
         BusSearchInput,
-        BusInfo,
         BoardingPoint,
         DroppingPoint,
         CancellationPolicy,
@@ -19,7 +21,6 @@ try:
 except ImportError:
     from bus_schema import (
         BusSearchInput,
-        BusInfo,
         BoardingPoint,
         DroppingPoint,
         CancellationPolicy,
@@ -35,8 +36,14 @@ from emt_client.config import (
     BUS_AUTOSUGGEST_KEY,
     BUS_ENCRYPTED_HEADER,
     BUS_DECRYPTION_KEY,
+    BUS_SEARCH_CACHE_TTL,
+    BUS_SEAT_LAYOUT_CACHE_TTL,
+    BUS_SEAT_LAYOUT_PREFETCH_COUNT,
+    BUS_SEAT_LAYOUT_PREFETCH_CONCURRENCY,
 )
+from emt_client.cache import get_cache
 from emt_client.clients.bus_client import BusApiClient
+from tools_factory.ranking import best_indices, to_number
 
 
 # ============================================================================
@@ -430,6 +437,141 @@ def _extract_amenities(lst_amenities: List[Dict[str, Any]]) -> List[str]:
     return [amenity.get("name", "") for amenity in lst_amenities if amenity.get("name")]
 
 
+def _flag(value: Any) -> bool:
+    """Boolean trip flag; accepts the "true"/"false" strings some engines send."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+class _TripFields(NamedTuple):
+    """Filterable fields of a raw trip, with the key-casing variants resolved."""
+
+    is_volvo: bool
+    is_ac: bool
+    is_non_ac: bool
+    is_seater: bool
+    is_sleeper: bool
+    departure_time: str
+    departure_minutes: Optional[int]
+
+
+def _trip_fields(bus: Dict[str, Any]) -> _TripFields:
+    """Normalize one raw trip for filtering; done once per trip per search."""
+    departure_time = bus.get("departureTime", "") or bus.get("DepartureTime", "")
+    return _TripFields(
+        is_volvo=_flag(bus.get("isVolvo", False)),
+        is_ac=_flag(bus.get("AC", False) or bus.get("ac", False)),
+        is_non_ac=_flag(bus.get("nonAC", False) or bus.get("NonAC", False)),
+        is_seater=_flag(bus.get("seater", False) or bus.get("Seater", False)),
+        is_sleeper=_flag(bus.get("sleeper", False) or bus.get("Sleeper", False)),
+        departure_time=departure_time,
+        departure_minutes=_parse_time_to_minutes(departure_time),
+    )
+
+
+@dataclass(frozen=True)
+class BusFilterSpec:
+    """
+    Filter parameters of a bus search, parsed once.
+
+    Departure bounds are minutes of day; wraps_midnight marks windows such
+    as 21:00-06:00. The spec is immutable and hashable, so the same instance
+    can be reused across pages and re-filters and can be part of a cache key.
+    """
+
+    volvo: Optional[bool] = None
+    ac: Optional[bool] = None
+    seater: Optional[bool] = None
+    sleeper: Optional[bool] = None
+    departure_from: Optional[int] = None
+    departure_to: Optional[int] = None
+    wraps_midnight: bool = False
+
+    @classmethod
+    def compile(
+        cls,
+        volvo: Optional[bool] = None,
+        ac: Optional[bool] = None,
+        seater: Optional[bool] = None,
+        sleeper: Optional[bool] = None,
+        departure_from: Optional[str] = None,
+        departure_to: Optional[str] = None,
+    ) -> "BusFilterSpec":
+        """Spec for the raw filter arguments of search_buses."""
+        return _compile_bus_filter_spec(volvo, ac, seater, sleeper, departure_from, departure_to)
+
+    @classmethod
+    def from_input(cls, payload: Any) -> "BusFilterSpec":
+        """Spec for a validated BusSearchInput."""
+        return _compile_bus_filter_spec(
+            payload.is_volvo,
+            payload.is_ac,
+            payload.is_seater,
+            payload.is_sleeper,
+            payload.departure_time_from,
+            payload.departure_time_to,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self == _NO_BUS_FILTERS
+
+    def matches(self, trip: _TripFields) -> bool:
+        """Evaluate the spec against a normalized trip."""
+        if self.volvo is True and not trip.is_volvo:
+            return False
+        # AC filter: True = only AC, False = only Non-AC, None = all
+        if self.ac is True and not trip.is_ac:
+            return False
+        if self.ac is False and not trip.is_non_ac:
+            return False
+        if self.seater is True and not trip.is_seater:
+            return False
+        if self.sleeper is True and not trip.is_sleeper:
+            return False
+
+        minutes = trip.departure_minutes
+        if minutes is None:
+            # Unparseable departure time is never filtered out
+            return True
+        start, end = self.departure_from, self.departure_to
+        if start is not None and end is not None:
+            if self.wraps_midnight:
+                return minutes >= start or minutes < end
+            return start <= minutes < end
+        if start is not None:
+            return minutes >= start
+        if end is not None:
+            return minutes < end
+        return True
+
+
+_NO_BUS_FILTERS = BusFilterSpec()
+
+
+@lru_cache(maxsize=256, typed=True)
+def _compile_bus_filter_spec(
+    volvo: Optional[bool],
+    ac: Optional[bool],
+    seater: Optional[bool],
+    sleeper: Optional[bool],
+    departure_from: Optional[str],
+    departure_to: Optional[str],
+) -> BusFilterSpec:
+    from_minutes = _parse_time_to_minutes(departure_from)
+    to_minutes = _parse_time_to_minutes(departure_to)
+    return BusFilterSpec(
+        volvo=volvo,
+        ac=ac,
+        seater=seater,
+        sleeper=sleeper,
+        departure_from=from_minutes,
+        departure_to=to_minutes,
+        wraps_midnight=from_minutes is not None and to_minutes is not None and from_minutes > to_minutes,
+    )
+
+
 def _process_boarding_points(bd_points: List[Dict[str, Any]]) -> List[BoardingPoint]:
     """Process boarding points from API response."""
     if not bd_points:
@@ -505,66 +647,17 @@ def _process_single_bus(
     journey_date: str,
     source_name: str = "",
     destination_name: str = "",
-    filter_volvo: Optional[bool] = None,
-    filter_ac: Optional[bool] = None,
-    filter_seater: Optional[bool] = None,
-    filter_sleeper: Optional[bool] = None,
-    filter_departure_from: Optional[str] = None,
-    filter_departure_to: Optional[str] = None,
-) -> Optional[BusInfo]:
+    fields: Optional[_TripFields] = None,
+) -> Dict[str, Any]:
     """
-    Process a single bus from API response.
+    Process a single bus from API response into its summary record.
     
-    Handles the new API response format from GetSearchResult.
+    Handles the new API response format from GetSearchResult. The summary
+    has every BusInfo field except the detail sections (see _bus_details).
+    fields is the trip's _trip_fields(), when the caller already has it.
     """
-    is_volvo = bus.get("isVolvo", False)
-    if filter_volvo is True and not is_volvo:
-        return None
-
-    # AC filter: True = only AC, False = only Non-AC, None = all
-    bus_is_ac = bus.get("AC", False)
-    bus_is_non_ac = bus.get("nonAC", False)
-    if filter_ac is True and not bus_is_ac:
-        return None
-    if filter_ac is False and not bus_is_non_ac:
-        return None
-
-    # Seater filter: True = only Seater, None = all
-    bus_is_seater = bus.get("seater", False)
-    if filter_seater is True and not bus_is_seater:
-        return None
-
-    # Sleeper filter: True = only Sleeper, None = all
-    bus_is_sleeper = bus.get("sleeper", False)
-    if filter_sleeper is True and not bus_is_sleeper:
-        return None
-    
-    # Departure time filter
-    bus_departure_time = bus.get("departureTime", "") or bus.get("DepartureTime", "")
-    bus_departure_minutes = _parse_time_to_minutes(bus_departure_time)
-    
-    if bus_departure_minutes is not None:
-        from_minutes = _parse_time_to_minutes(filter_departure_from) if filter_departure_from else None
-        to_minutes = _parse_time_to_minutes(filter_departure_to) if filter_departure_to else None
-        
-        # Handle overnight time ranges (e.g., 21:00 to 06:00)
-        if from_minutes is not None and to_minutes is not None:
-            if from_minutes > to_minutes:
-                # Overnight range: bus must depart >= from_minutes OR < to_minutes
-                if not (bus_departure_minutes >= from_minutes or bus_departure_minutes < to_minutes):
-                    return None
-            else:
-                # Normal range: bus must depart >= from_minutes AND < to_minutes
-                if bus_departure_minutes < from_minutes or bus_departure_minutes >= to_minutes:
-                    return None
-        elif from_minutes is not None:
-            # Only from filter: bus must depart >= from_minutes
-            if bus_departure_minutes < from_minutes:
-                return None
-        elif to_minutes is not None:
-            # Only to filter: bus must depart < to_minutes
-            if bus_departure_minutes >= to_minutes:
-                return None
+    if fields is None:
+        fields = _trip_fields(bus)
 
     bus_id = str(bus.get("id", ""))
     
@@ -577,15 +670,8 @@ def _process_single_bus(
         destination_name=destination_name,
     )
 
-    # Process boarding/dropping points
-    boarding_points = _process_boarding_points(bus.get("bdPoints", []))
-    dropping_points = _process_dropping_points(bus.get("dpPoints", []))
-    
     # Process amenities
     amenities = _extract_amenities(bus.get("lstamenities", []))
-    
-    # Process cancellation policy
-    cancellation_policy = _process_cancellation_policy(bus.get("cancelPolicyList", []))
 
     # Get fares
     fares = bus.get("fares", [])
@@ -597,38 +683,57 @@ def _process_single_bus(
     raw_rating = bus.get("rt") or bus.get("rating")
     normalized_rating = _normalize_rating(raw_rating)
 
-    return BusInfo(
-        bus_id=bus_id,
-        operator_name=bus.get("Travels", "") or bus.get("travels", ""),
-        operator_id=str(bus.get("operatorid", "") or bus.get("OperatorId", "")),
-        bus_type=bus.get("busType", "") or bus.get("bustype", ""),
-        departure_time=bus.get("departureTime", "") or bus.get("DepartureTime", ""),
-        arrival_time=bus.get("ArrivalTime", "") or bus.get("arrivalTime", ""),
-        duration=bus.get("duration", "") or bus.get("Duration", ""),
-        available_seats=str(bus.get("AvailableSeats", "0") or bus.get("availableSeats", "0")),
-        price=str(bus.get("price", "0")),
-        fares=fares,
-        is_ac=bus.get("AC", False) or bus.get("ac", False),
-        is_non_ac=bus.get("nonAC", False) or bus.get("NonAC", False),
-        is_volvo=is_volvo,
-        is_seater=bus.get("seater", False) or bus.get("Seater", False),
-        is_sleeper=bus.get("sleeper", False) or bus.get("Sleeper", False),
-        is_semi_sleeper=bus.get("isSemiSleeper", False),
-        rating=normalized_rating,
-        live_tracking_available=bus.get("liveTrackingAvailable", False),
-        is_cancellable=bus.get("isCancellable", False),
-        m_ticket_enabled=str(bus.get("mTicketEnabled", "")),
-        departure_date=bus.get("departureDate", "") or bus.get("DepartureDate", ""),
-        arrival_date=bus.get("arrivalDate", "") or bus.get("ArrivalDate", ""),
-        route_id=str(bus.get("routeId", "") or bus.get("routeid", "")),
-        engine_id=bus.get("engineId", 0) or bus.get("EngineId", 0),
-        trace_id=bus.get("TraceID") or bus.get("traceId"),
-        boarding_points=boarding_points,
-        dropping_points=dropping_points,
-        amenities=amenities,
-        cancellation_policy=cancellation_policy,
-        book_now=book_now,
-    )
+    engine_id = bus.get("engineId", 0) or bus.get("EngineId", 0)
+    try:
+        engine_id = int(engine_id)
+    except (TypeError, ValueError):
+        engine_id = 0
+
+    return {
+        "bus_id": bus_id,
+        "operator_name": bus.get("Travels", "") or bus.get("travels", ""),
+        "operator_id": str(bus.get("operatorid", "") or bus.get("OperatorId", "")),
+        "bus_type": bus.get("busType", "") or bus.get("bustype", ""),
+        "departure_time": fields.departure_time,
+        "arrival_time": bus.get("ArrivalTime", "") or bus.get("arrivalTime", ""),
+        "duration": bus.get("duration", "") or bus.get("Duration", ""),
+        "available_seats": str(bus.get("AvailableSeats", "0") or bus.get("availableSeats", "0")),
+        "price": str(bus.get("price", "0")),
+        "fares": fares,
+        "is_ac": fields.is_ac,
+        "is_non_ac": fields.is_non_ac,
+        "is_volvo": fields.is_volvo,
+        "is_seater": fields.is_seater,
+        "is_sleeper": fields.is_sleeper,
+        "is_semi_sleeper": _flag(bus.get("isSemiSleeper", False)),
+        "rating": normalized_rating,
+        "live_tracking_available": _flag(bus.get("liveTrackingAvailable", False)),
+        "is_cancellable": _flag(bus.get("isCancellable", False)),
+        "m_ticket_enabled": str(bus.get("mTicketEnabled", "")),
+        "departure_date": bus.get("departureDate", "") or bus.get("DepartureDate", ""),
+        "arrival_date": bus.get("arrivalDate", "") or bus.get("ArrivalDate", ""),
+        "route_id": str(bus.get("routeId", "") or bus.get("routeid", "")),
+        "engine_id": engine_id,
+        "trace_id": bus.get("TraceID") or bus.get("traceId"),
+        "amenities": amenities,
+        "book_now": book_now,
+    }
+
+
+def _bus_details(bus: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Detail sections of a raw trip: boarding/dropping points and cancellation policy.
+
+    Same values BusInfo.model_dump() produced for these fields. These are the
+    bulk of a bus record, so they are only built for buses being displayed.
+    """
+    return {
+        "boarding_points": [bp.model_dump() for bp in _process_boarding_points(bus.get("bdPoints", []))],
+        "dropping_points": [dp.model_dump() for dp in _process_dropping_points(bus.get("dpPoints", []))],
+        "cancellation_policy": [
+            policy.model_dump() for policy in _process_cancellation_policy(bus.get("cancelPolicyList", []))
+        ],
+    }
 
 
 def process_bus_results(
@@ -644,13 +749,24 @@ def process_bus_results(
     filter_sleeper: Optional[bool] = None,
     filter_departure_from: Optional[str] = None,
     filter_departure_to: Optional[str] = None,
+    detail_slice: Optional[slice] = None,
+    filter_spec: Optional[BusFilterSpec] = None,
 ) -> Dict[str, Any]:
     """
     Process bus search results from the new API.
     
     The new API returns data in Response.AvailableTrips structure.
+
+    filter_spec, when given, replaces the individual filter_* arguments.
+    Each trip is normalized once (_trip_fields) and checked against the
+    compiled spec before its summary is built.
+
+    Every matching trip gets a summary record; boarding/dropping points and
+    cancellation policy are only added to the buses selected by detail_slice
+    (e.g. the page being returned). None adds them to every bus.
     """
     buses = []
+    matched_trips = []
     
     # Handle new API response structure
     response_data = search_response.get("Response", search_response)
@@ -670,23 +786,32 @@ def process_bus_results(
             "is_bus_available": False,
         }
 
+    filters = filter_spec if filter_spec is not None else _compile_bus_filter_spec(
+        filter_volvo,
+        filter_ac,
+        filter_seater,
+        filter_sleeper,
+        filter_departure_from,
+        filter_departure_to,
+    )
+
     for bus in available_trips:
-        processed_bus = _process_single_bus(
+        fields = _trip_fields(bus)
+        if not filters.matches(fields):
+            continue
+        buses.append(_process_single_bus(
             bus,
             source_id,
             destination_id,
             journey_date,
             source_name,
             destination_name,
-            filter_volvo,
-            filter_ac,
-            filter_seater,
-            filter_sleeper,
-            filter_departure_from,
-            filter_departure_to,
-        )
-        if processed_bus:
-            buses.append(processed_bus.model_dump())
+            fields,
+        ))
+        matched_trips.append(bus)
+
+    for bus, trip in zip(buses[detail_slice or slice(None)], matched_trips[detail_slice or slice(None)]):
+        bus.update(_bus_details(trip))
 
     return {
         "buses": buses,
@@ -704,6 +829,58 @@ def process_bus_results(
 # MAIN SEARCH FUNCTION
 # ============================================================================
 
+def get_bus_search_cache():
+    """Shared short-TTL cache of raw GetSearchResult responses (with their Sid/Vid)."""
+    return get_cache("bus_search", ttl_seconds=BUS_SEARCH_CACHE_TTL)
+
+
+async def _fetch_search_response(
+    source_id: str,
+    destination_id: str,
+    journey_date: str,
+    source_name: str,
+    destination_name: str,
+) -> Tuple[Dict[str, Any], str, str]:
+    """
+    POST GetSearchResult through the shared cache.
+
+    Filters are applied locally, so re-searching the same route and date
+    with other filters (or for the next page) within BUS_SEARCH_CACHE_TTL
+    reuses one response. The Sid/Vid it was fetched with are kept alongside
+    for seat layout calls. Error responses are not kept.
+    """
+    key = (source_id, destination_id, journey_date)
+    cache = get_bus_search_cache()
+
+    async def fetch():
+        # Generate session IDs
+        sid = _generate_session_id()
+        vid = _generate_visitor_id()
+
+        # Build payload for new API
+        payload = {
+            "SourceCityId": source_id,
+            "DestinationCityId": destination_id,
+            "SourceCityName": source_name,
+            "DestinatinCityName": destination_name,  # Note: API has typo
+            "JournyDate": journey_date,  # Note: API has typo "JournyDate"
+            "Vid": vid,
+            "Sid": sid,
+            "agentCode": "NAN",
+            "agentType": "NAN",
+            "CurrencyDomain": "IN",
+            "snapApp": "Emt",
+            "TravelPolicy": [],
+            "isInventory": 0,
+        }
+        return await BusApiClient().search(payload), sid, vid
+
+    result = await cache.get_or_fetch(key, fetch)
+    if not isinstance(result[0], dict) or "error" in result[0]:
+        cache.invalidate(key)
+    return result
+
+
 async def search_buses(
     source_id: Optional[str] = None,
     destination_id: Optional[str] = None,
@@ -716,6 +893,8 @@ async def search_buses(
     destination_name: Optional[str] = None,
     departure_time_from: Optional[str] = None,
     departure_time_to: Optional[str] = None,
+    detail_slice: Optional[slice] = None,
+    filter_spec: Optional[BusFilterSpec] = None,
 ) -> Dict[str, Any]:
     """
     Search for buses using the new EaseMyTrip API.
@@ -729,6 +908,9 @@ async def search_buses(
         is_volvo: Filter for Volvo buses only
         source_name: Source city name (e.g., "Delhi") - will be resolved to ID
         destination_name: Destination city name (e.g., "Manali") - will be resolved to ID
+        detail_slice: Buses (in result order) that get boarding/dropping points and
+            cancellation policy; None for every bus
+        filter_spec: Precompiled BusFilterSpec; replaces the individual filter args
         
     Returns:
         Dict with buses, counts, and metadata
@@ -780,34 +962,14 @@ async def search_buses(
             "is_bus_available": False,
         }
     
-    # Convert date to API format (dd-MM-yyyy)
-    # api_date = journey_date
-    api_date = journey_date
-
-    # Generate session IDs
-    sid = _generate_session_id()
-    vid = _generate_visitor_id()
-    
-    # Build payload for new API
-    payload = {
-        "SourceCityId": resolved_source_id,
-        "DestinationCityId": resolved_dest_id,
-        "SourceCityName": resolved_source_name,
-        "DestinatinCityName": resolved_dest_name,  # Note: API has typo
-        "JournyDate": api_date,  # Note: API has typo "JournyDate"
-        "Vid": vid,
-        "Sid": sid,
-        "agentCode": "NAN",
-        "agentType": "NAN",
-        "CurrencyDomain": "IN",
-        "snapApp": "Emt",
-        "TravelPolicy": [],
-        "isInventory": 0,
-    }
-    
     try:
-        client = BusApiClient()
-        data = await client.search(payload)
+        data, sid, vid = await _fetch_search_response(
+            resolved_source_id,
+            resolved_dest_id,
+            journey_date,
+            resolved_source_name,
+            resolved_dest_name,
+        )
         
         if "error" in data:
             return {
@@ -841,6 +1003,8 @@ async def search_buses(
         is_sleeper,
         departure_time_from,
         departure_time_to,
+        detail_slice=detail_slice,
+        filter_spec=filter_spec,
     )
     
     # Add metadata
@@ -869,32 +1033,28 @@ async def search_buses(
 # WHATSAPP RESPONSE BUILDER
 # ============================================================================
 
+def bus_actual_price(bus: Dict[str, Any]) -> Optional[float]:
+    """
+    Price shown for a bus: the 'price' field (actual/discounted price shown on
+    website), falling back to the minimum of the 'fares' array. None if neither
+    is numeric.
+    """
+    price_val = bus.get("price")
+    if price_val != "0":
+        actual_price = to_number(price_val)
+        if actual_price is not None:
+            return actual_price
+
+    fares = bus.get("fares", [])
+    index = best_indices(fares, cheapest=to_number)["cheapest"]
+    return to_number(fares[index]) if index is not None else None
+
+
 def extract_bus_summary(bus: Dict[str, Any]) -> Dict[str, Any]:
     """Extract summary information from a bus for WhatsApp response."""
     
-    # Use 'price' field first (this is the actual/discounted price shown on website)
-    # Fall back to minimum from 'fares' array only if price is not available
-    actual_price = None
-    
-    # Try to get the price field first (actual price after discount)
-    try:
-        price_val = bus.get("price")
-        if price_val is not None and price_val != "" and price_val != "0":
-            actual_price = float(price_val)
-    except (ValueError, TypeError):
-        pass
-    
-    # If no price field, find minimum from fares array
-    if actual_price is None:
-        fares = bus.get("fares", [])
-        for fare in fares:
-            try:
-                fare_val = float(fare)
-                if actual_price is None or fare_val < actual_price:
-                    actual_price = fare_val
-            except (ValueError, TypeError):
-                continue
-    
+    actual_price = bus_actual_price(bus)
+
     # Final fallback
     if actual_price is None:
         actual_price = 0
@@ -1265,6 +1425,12 @@ async def get_seat_layout(
     Get seat layout from the new SeatBind API.
     
     Uses the new endpoint: https://bus.easemytrip.com/Home/SeatBind/
+
+    Processed layouts are kept for BUS_SEAT_LAYOUT_CACHE_TTL per bus, route,
+    engine, date and boarding/dropping point, so reopening a layout (or one
+    prefetched by prefetch_seat_layouts) does not call SeatBind again.
+    Failed lookups are not kept. The returned dict is shared; treat it as
+    read-only.
     """
     
     # Convert date to API format
@@ -1306,31 +1472,149 @@ async def get_seat_layout(
         "searchReq": search_req,
     }
     
-    try:
-        client = BusApiClient()
-        data = await client.get_seat_layout(payload)
+    async def fetch():
+        try:
+            client = BusApiClient()
+            data = await client.get_seat_layout(payload)
         
-        if "error" in data:
+            if "error" in data:
+                return {
+                    "success": False,
+                    "message": data.get("error", "Unknown error"),
+                    "layout": None,
+                    "raw_response": None,
+                }
+                
+        except Exception as e:
             return {
                 "success": False,
-                "message": data.get("error", "Unknown error"),
+                "message": f"API Error: {str(e)}",
                 "layout": None,
                 "raw_response": None,
             }
-                
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"API Error: {str(e)}",
-            "layout": None,
-            "raw_response": None,
-        }
     
-    return process_seat_layout_response(
-        data,
-        bus_id,
-        boarding_point_id,
-        dropping_point_id,
-        operator_name,
-        bus_type,
-    )
\ No newline at end of file
+        return process_seat_layout_response(
+            data,
+            bus_id,
+            boarding_point_id,
+            dropping_point_id,
+            operator_name,
+            bus_type,
+        )
+
+    key = _seat_layout_key(bus_id, route_id, engine_id, journey_date, boarding_point_id, dropping_point_id)
+    cache = get_seat_layout_cache()
+
+    result = await cache.get_or_fetch(key, fetch)
+    if not result.get("success"):
+        cache.invalidate(key)
+    return result
+
+
+def get_seat_layout_cache():
+    """Shared short-TTL cache of processed SeatBind layouts."""
+    return get_cache("bus_seat_layout", ttl_seconds=BUS_SEAT_LAYOUT_CACHE_TTL)
+
+
+def _seat_layout_key(
+    bus_id: str,
+    route_id: str,
+    engine_id: Any,
+    journey_date: str,
+    boarding_point_id: str,
+    dropping_point_id: str,
+) -> tuple:
+    return (str(bus_id), str(route_id), str(engine_id), journey_date, str(boarding_point_id), str(dropping_point_id))
+
+
+# ============================================================================
+# SEAT LAYOUT PREFETCH
+# ============================================================================
+
+# Running prefetch per chat session; a new search in the session cancels the old one
+_seat_layout_prefetches: Dict[Any, asyncio.Task] = {}
+
+
+def _seat_layout_args(bus_results: Dict[str, Any], bus: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """get_seat_layout arguments for a bus record, using its first boarding/dropping point."""
+    boarding_points = bus.get("boarding_points") or []
+    dropping_points = bus.get("dropping_points") or []
+    if not boarding_points or not dropping_points:
+        return None
+    return {
+        "source_id": bus_results.get("source_id", ""),
+        "destination_id": bus_results.get("destination_id", ""),
+        "journey_date": bus_results.get("journey_date", ""),
+        "bus_id": bus.get("bus_id", ""),
+        "route_id": bus.get("route_id", ""),
+        "engine_id": bus.get("engine_id", 0),
+        "boarding_point_id": boarding_points[0].get("bd_id", ""),
+        "dropping_point_id": dropping_points[0].get("dp_id", ""),
+        "source_name": bus_results.get("source_name", ""),
+        "destination_name": bus_results.get("destination_name", ""),
+        "operator_id": bus.get("operator_id", ""),
+        "operator_name": bus.get("operator_name", ""),
+        "bus_type": bus.get("bus_type", ""),
+        "departure_time": bus.get("departure_time", ""),
+        "arrival_time": bus.get("arrival_time", ""),
+        "duration": bus.get("duration", ""),
+        "trace_id": bus.get("trace_id") or "",
+        "is_seater": bus.get("is_seater", True),
+        "is_sleeper": bus.get("is_sleeper", True),
+        "session_id": bus_results.get("session_id", ""),
+        "visitor_id": bus_results.get("visitor_id", ""),
+    }
+
+
+def cancel_seat_layout_prefetch(session_key: Any) -> None:
+    """Cancel the running prefetch for a session, if any."""
+    task = _seat_layout_prefetches.pop(session_key, None)
+    if task is not None and not task.done():
+        task.cancel()
+
+
+def prefetch_seat_layouts(
+    bus_results: Dict[str, Any],
+    buses: List[Dict[str, Any]],
+    session_key: Any,
+    count: Optional[int] = None,
+    concurrency: Optional[int] = None,
+) -> Optional[asyncio.Task]:
+    """
+    Warm the seat layout cache for the first `count` buses in the background.
+
+    buses are records with detail sections (the page being shown). At most
+    `concurrency` SeatBind calls run at once; both default to the
+    BUS_SEAT_LAYOUT_PREFETCH_* settings, and a count of 0 disables prefetch. Any earlier prefetch for the
+    same session_key is cancelled first, so moving on to another search
+    stops loading layouts nobody will open. Must be called from a running
+    event loop; returns the task, or None when there is nothing to fetch.
+    """
+    cancel_seat_layout_prefetch(session_key)
+
+    if count is None:
+        count = BUS_SEAT_LAYOUT_PREFETCH_COUNT
+    if concurrency is None:
+        concurrency = BUS_SEAT_LAYOUT_PREFETCH_CONCURRENCY
+    targets = [args for args in (_seat_layout_args(bus_results, bus) for bus in buses[:max(count, 0)]) if args]
+    if not targets:
+        return None
+
+    async def run():
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_one(args):
+            async with semaphore:
+                await get_seat_layout(**args)
+
+        await asyncio.gather(*(fetch_one(args) for args in targets), return_exceptions=True)
+
+    task = asyncio.get_running_loop().create_task(run())
+    _seat_layout_prefetches[session_key] = task
+
+    def _forget(done: asyncio.Task) -> None:
+        if _seat_layout_prefetches.get(session_key) is done:
+            del _seat_layout_prefetches[session_key]
+
+    task.add_done_callback(_forget)
+    return task
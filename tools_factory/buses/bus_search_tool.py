@@ -5,8 +5,15 @@ from pydantic import ValidationError
 # from tools_factory.base_schema import ToolResponseFormat
 # from .bus_renderer import render_bus_results, render_bus_results_with_limit, render_seat_layout
 from .bus_schema import BusSearchInput
-from .bus_search_service import search_buses, build_whatsapp_bus_response
+from .bus_search_service import (
+    BusFilterSpec,
+    search_buses,
+    build_whatsapp_bus_response,
+    bus_actual_price,
+    prefetch_seat_layouts,
+)
 from tools_factory.base_schema import ToolResponseFormat
+from tools_factory.ranking import page_highlights
 from .bus_renderer import render_bus_results_with_limit
 
 
@@ -97,6 +104,10 @@ class BusSearchTool(BaseTool):
 
         print(f"DEBUG: Bus search filters - is_ac={payload.is_ac}, is_seater={payload.is_seater}, is_sleeper={payload.is_sleeper}, is_volvo={payload.is_volvo}, departure_from={payload.departure_time_from}, departure_to={payload.departure_time_to}")
 
+        page = payload.page
+        offset = (page - 1) * limit
+        end = offset + limit
+
         bus_results = await search_buses(
             source_id=payload.source_id,
             destination_id=payload.destination_id,
@@ -109,6 +120,9 @@ class BusSearchTool(BaseTool):
             destination_name=payload.destination_name,
             departure_time_from=payload.departure_time_from,
             departure_time_to=payload.departure_time_to,
+            filter_spec=BusFilterSpec.from_input(payload),
+            # Boarding/dropping points and cancellation policy only for this page
+            detail_slice=slice(offset, end),
         )
 
         has_error = bool(bus_results.get("error"))
@@ -120,9 +134,6 @@ class BusSearchTool(BaseTool):
         all_buses = bus_results.get("buses", [])
         
         # Create paginated version for structured_content ONLY
-        page = payload.page
-        offset = (page - 1) * limit
-        end = offset + limit
         paginated_buses = all_buses[offset:end] if not has_error else []
         
         # Create limited_bus_results as a COPY with paginated buses
@@ -138,9 +149,22 @@ class BusSearchTool(BaseTool):
             "showing_from": offset + 1 if paginated_buses else 0,
             "showing_to": min(end, total_bus_count),
         }
+        # Where the cheapest bus sits across all pages, found in one pass
+        limited_bus_results["highlights"] = page_highlights(
+            all_buses if not has_error else [], limit, cheapest=bus_actual_price,
+        )
         
         bus_count = len(paginated_buses)
 
+        # Warm seat layouts for the top buses of this page (BUS_SEAT_LAYOUT_PREFETCH_COUNT);
+        # a new search in the same session cancels the previous prefetch
+        if session_id:
+            prefetch_seat_layouts(
+                bus_results,
+                paginated_buses if not (has_error or is_whatsapp) else [],
+                session_key=session_id,
+            )
+
         # Build WhatsApp response if needed
         whatsapp_response = None
         if is_whatsapp and not has_error:
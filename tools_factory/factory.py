@@ -1,5 +1,7 @@
 from tools_factory.base import BaseTool
 from tools_factory.flights.flight_search_tool import FlightSearchTool
+from tools_factory.flights.flight_fare_calendar_tool import FlightFareCalendarTool
+from tools_factory.flights.flight_multi_search_tool import FlightMultiSearchTool
 from tools_factory.hotels.hotel_search_tool import HotelSearchTool
 from tools_factory.trains.train_search_tool import TrainSearchTool
 from tools_factory.trains.Train_PnrStatus.pnr_status_tool import TrainPnrStatusTool
@@ -33,6 +35,8 @@ class ToolFactory:
         """Register all available tools"""
         # Search tools (no session needed)
         self.register_tool(FlightSearchTool())
+        self.register_tool(FlightFareCalendarTool())
+        self.register_tool(FlightMultiSearchTool())
         self.register_tool(HotelSearchTool())
         #self.register_tool(BusSearchTool())
         # self.register_tool(BusSeatLayoutTool())
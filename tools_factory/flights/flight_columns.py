@@ -0,0 +1,326 @@
+"""
+Columnar view over processed flight results.
+
+Flight results are lists of nested dicts; every filter, sort or
+cheapest/fastest lookup used to walk those dicts and re-parse times and
+durations. FlightColumns parses each field at most once per list into a
+flat typed array, only when an operation first needs it, and masks,
+orderings and top-K selections then run over whole columns with C-level
+builtins (map/compress/sorted/heapq) instead of per-row predicates.
+Operations return row indices; take() maps them back to the original
+dicts and select() narrows the view itself, keeping the columns already
+parsed, so one view can follow a list from processing to highlights.
+"""
+
+import copy
+import heapq
+import operator
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional
+
+from .flight_filters import FlightFilterSpec, _coerce_stops, _flight_duration_minutes, _time_to_minutes
+
+MISSING = -1
+INF = float("inf")
+
+COLUMNS = ("departure", "arrival", "duration", "stops", "fare", "refundable", "airline")
+
+
+def _min_total_fare(flight: Dict[str, Any]) -> float:
+    fares = []
+    for option in flight.get("fare_options") or []:
+        try:
+            fares.append(float(option.get("total_fare")))
+        except (TypeError, ValueError):
+            continue
+    return min(fares) if fares else INF
+
+
+def _to_fare(value: Any) -> float:
+    try:
+        return float(value) if value else INF
+    except (TypeError, ValueError):
+        return INF
+
+
+def _or_missing(value: Optional[int]) -> int:
+    return MISSING if value is None else value
+
+
+def _departure(flight: Dict[str, Any]) -> int:
+    legs = flight.get("legs")
+    return _or_missing(_time_to_minutes(legs[0].get("departure_time"))) if legs else MISSING
+
+
+def _arrival(flight: Dict[str, Any]) -> int:
+    legs = flight.get("legs")
+    return _or_missing(_time_to_minutes(legs[-1].get("arrival_time"))) if legs else MISSING
+
+
+def _stops(flight: Dict[str, Any]) -> int:
+    return _or_missing(_coerce_stops(flight.get("total_stops")))
+
+
+def _refundable(flight: Dict[str, Any]) -> int:
+    refundable = flight.get("is_refundable")
+    return 1 if refundable is True else 0 if refundable is False else MISSING
+
+
+def _airline_key(flight: Dict[str, Any]) -> tuple:
+    legs = flight.get("legs")
+    first_leg = legs[0] if legs else {}
+    return (first_leg.get("airline_name") or "", first_leg.get("airline_code") or "")
+
+
+def _window_table(window: tuple) -> bytes:
+    """
+    Lookup table over minutes of day: table[m] is 1 when m is inside the
+    window. Its last entry is 0, so MISSING (-1) indexes to "outside".
+    """
+    start, end, wrap = window
+    if wrap:
+        flags = (m >= start or m <= end for m in range(1441))
+    else:
+        flags = (start <= m <= end for m in range(1441))
+    return bytes(flags) + b"\x00"
+
+
+_PARSERS: Dict[str, tuple] = {
+    "departure": ("i", _departure),
+    "arrival": ("i", _arrival),
+    "duration": ("d", _flight_duration_minutes),
+    "stops": ("i", _stops),
+    "fare": ("d", _min_total_fare),
+    "refundable": ("b", _refundable),
+}
+
+
+class FlightColumns:
+    """
+    Parallel arrays over a list of processed flights, parsed on first use.
+
+    Columns: departure/arrival (minutes of day, first leg / last leg),
+    duration (minutes, inf if unknown), stops, fare (cheapest total fare,
+    inf if none), refundable (1/0, -1 if unknown) and airline (index into
+    ``airlines``, a list of distinct (name, code) pairs).
+    """
+
+    def __init__(self, flights: List[Dict[str, Any]]):
+        self.items = flights
+        self._flights = flights
+        self._columns: Dict[str, array] = {}
+        self._airlines: List[tuple] = []
+        self._return_side: Optional["FlightColumns"] = None
+
+    @classmethod
+    def for_combos(cls, combos: List[Dict[str, Any]]) -> "FlightColumns":
+        """
+        View over international round-trip combos.
+
+        Field columns come from the onward flight; fare is the combo fare and
+        duration the onward plus return journey time. mask() also applies the
+        filters to the return flight (without the time windows).
+        """
+        return _ComboColumns(combos)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def column(self, name: str) -> array:
+        if name not in COLUMNS:
+            raise ValueError(f"Unknown flight column: {name}")
+        return self._column(name)
+
+    def _column(self, name: str) -> array:
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = self._parse(name)
+        return values
+
+    def _parse(self, name: str) -> array:
+        if name == "airline":
+            index: Dict[tuple, int] = {}
+            for key in map(_airline_key, self._flights):
+                index.setdefault(key, len(index))
+            self._airlines = list(index)
+            return array("i", map(index.__getitem__, map(_airline_key, self._flights)))
+        if name == "has_legs":
+            return array("b", (1 if flight.get("legs") else 0 for flight in self._flights))
+        typecode, parse = _PARSERS[name]
+        return array(typecode, map(parse, self._flights))
+
+    @property
+    def departure(self) -> array:
+        return self.column("departure")
+
+    @property
+    def arrival(self) -> array:
+        return self.column("arrival")
+
+    @property
+    def duration(self) -> array:
+        return self.column("duration")
+
+    @property
+    def stops(self) -> array:
+        return self.column("stops")
+
+    @property
+    def fare(self) -> array:
+        return self.column("fare")
+
+    @property
+    def refundable(self) -> array:
+        return self.column("refundable")
+
+    @property
+    def airline(self) -> array:
+        return self.column("airline")
+
+    @property
+    def airlines(self) -> List[tuple]:
+        self.column("airline")
+        return self._airlines
+
+    @property
+    def has_legs(self) -> array:
+        return self._column("has_legs")
+
+    def _flags(self, filters: FlightFilterSpec, check_time: bool) -> Optional[Iterable[int]]:
+        """Per-row pass (truthy) / fail flags, or None when nothing is filtered."""
+        flags: Optional[Iterable[int]] = None
+
+        def narrow(more: Iterable[int]) -> None:
+            nonlocal flags
+            flags = more if flags is None else map(operator.and_, flags, more)
+
+        if filters.airline_names:
+            allowed = bytes(filters.allows_airline(name, code) for name, code in self.airlines)
+            narrow(self.has_legs)
+            narrow(map(allowed.__getitem__, self.airline))
+
+        if check_time:
+            for name, window in (("departure", filters.departure_window), ("arrival", filters.arrival_window)):
+                if not window or window == (0, 1440, False):
+                    continue
+                # Rows without legs have nothing to compare times against and pass
+                no_legs = map((1).__xor__, self.has_legs)
+                narrow(map(operator.or_, no_legs, map(_window_table(window).__getitem__, self.column(name))))
+
+        if filters.refundable is not None:
+            narrow(map((1 if filters.refundable else 0).__eq__, self.refundable))
+
+        if filters.stops is not None:
+            narrow(map(filters.stops.__eq__, self.stops))
+
+        return flags
+
+    def mask(self, filters: FlightFilterSpec, check_time: bool = True) -> List[int]:
+        """
+        Indices of rows that pass a FlightFilterSpec.
+
+        Same result as FlightFilterSpec.matches on each dict, but airline
+        matching runs once per distinct airline and times are pre-parsed.
+        """
+        flags = self._flags(filters, check_time)
+        rows = range(len(self.items))
+        return list(rows if flags is None else compress(rows, flags))
+
+    def argsort(self, column: str, indices: Optional[Iterable[int]] = None) -> List[int]:
+        """Stable ascending order of rows (all rows when indices is None)."""
+        values = self.column(column)
+        rows = range(len(self.items)) if indices is None else indices
+        return sorted(rows, key=values.__getitem__)
+
+    def top_k(self, column: str, k: int, indices: Optional[Iterable[int]] = None) -> List[int]:
+        """First k rows of argsort(column) without sorting every row."""
+        values = self.column(column)
+        rows = range(len(self.items)) if indices is None else indices
+        return heapq.nsmallest(k, rows, key=values.__getitem__)
+
+    def ranked(self, column: str, k: Optional[int] = None) -> List[int]:
+        """
+        Every row, the k lowest first in order and the rest after them in
+        their original order (ranking.ranked_indices over a column).
+        """
+        rows = range(len(self.items))
+        if k is None or k >= len(rows):
+            return self.argsort(column)
+        top = self.top_k(column, k) if k > 0 else []
+        chosen = set(top)
+        return top + [i for i in rows if i not in chosen]
+
+    def argmin(self, column: str, indices: Optional[Iterable[int]] = None) -> Optional[int]:
+        """Row with the lowest fare/duration; None when every value is unknown."""
+        best = self.top_k(column, 1, indices)
+        if not best or self.column(column)[best[0]] == INF:
+            return None
+        return best[0]
+
+    def highlights(self, per_page: int) -> Dict[str, Optional[Dict[str, int]]]:
+        """Where the cheapest and fastest rows sit across pages (same shape as ranking.page_highlights)."""
+        highlights: Dict[str, Optional[Dict[str, int]]] = {}
+        for name, column in (("cheapest", "fare"), ("fastest", "duration")):
+            index = self.argmin(column)
+            if index is None:
+                highlights[name] = None
+                continue
+            highlights[name] = {
+                "position": index + 1,
+                "page": index // per_page + 1 if per_page > 0 else 1,
+            }
+        return highlights
+
+    def take(self, indices: Iterable[int]) -> List[Dict[str, Any]]:
+        """The original dicts for the given rows, in that order."""
+        return [self.items[i] for i in indices]
+
+    def select(self, indices: Iterable[int], copy_rows: bool = False) -> "FlightColumns":
+        """
+        View over the given rows, in that order, keeping every column
+        parsed so far. With copy_rows the view's items are shallow copies,
+        so per-page fields set on them never reach this view's dicts.
+        """
+        rows = list(indices)
+        view = copy.copy(self)
+        view.items = self.take(rows)
+        if copy_rows:
+            view.items = [dict(item) for item in view.items]
+        view._flights = view.items if self._flights is self.items else list(map(self._flights.__getitem__, rows))
+        view._columns = {
+            name: array(values.typecode, map(values.__getitem__, rows))
+            for name, values in self._columns.items()
+        }
+        if self._return_side is not None:
+            view._return_side = self._return_side.select(rows)
+        return view
+
+
+class _ComboColumns(FlightColumns):
+    """FlightColumns.for_combos: onward fields, combo fare, round-trip duration."""
+
+    def __init__(self, combos: List[Dict[str, Any]]):
+        super().__init__([combo.get("onward_flight") or {} for combo in combos])
+        self.items = combos
+
+    @property
+    def return_side(self) -> FlightColumns:
+        if self._return_side is None:
+            self._return_side = FlightColumns([combo.get("return_flight") or {} for combo in self.items])
+        return self._return_side
+
+    def _parse(self, name: str) -> array:
+        if name == "fare":
+            return array("d", (_to_fare(combo.get("combo_fare")) for combo in self.items))
+        if name == "duration":
+            onward = array("d", map(_flight_duration_minutes, self._flights))
+            return array("d", map(operator.add, onward, self.return_side.duration))
+        return super()._parse(name)
+
+    def _flags(self, filters: FlightFilterSpec, check_time: bool) -> Optional[Iterable[int]]:
+        flags = super()._flags(filters, check_time)
+        returning = self.return_side._flags(filters, False)
+        if returning is None:
+            return flags
+        return returning if flags is None else map(operator.and_, flags, returning)
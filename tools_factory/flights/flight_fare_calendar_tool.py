@@ -0,0 +1,110 @@
+from tools_factory.base import BaseTool, ToolMetadata
+from pydantic import ValidationError
+
+from .flight_schema import FlightFareCalendarInput
+from .flight_search_service import search_flights_flexible, build_whatsapp_fare_calendar_response
+from .flight_renderer import render_flight_fare_calendar, _format_currency, _format_date
+from tools_factory.base_schema import ToolResponseFormat
+
+
+class FlightFareCalendarTool(BaseTool):
+    """Flexible-date (fare calendar) flight search for EaseMyTrip"""
+
+    def get_metadata(self) -> ToolMetadata:
+        return ToolMetadata(
+            name="search_flight_fare_calendar",
+            description=(
+                "Purpose:\n"
+                "- Show the cheapest one-way fare for each day around a date, so the user can pick the best day to fly. "
+                "Use when the user's dates are flexible (e.g. 'cheapest day to fly Delhi to Mumbai around 15 April', 'any day next week').\n"
+                "- For a fixed date, or to list flights for the chosen day, use search_flights instead.\n"
+                "Parameters (Fields):\n"
+                "- origin (string, required): Origin airport IATA code. Examples: 'DEL' for Delhi, 'BOM' for Mumbai.\n"
+                "- destination (string, required): Destination airport IATA code.\n"
+                "- outboundDate (string, required): Date the window is centred on, YYYY-MM-DD.\n"
+                "- daysBefore (integer, default: 3): Days before outboundDate to include (0-7). Past dates are skipped.\n"
+                "- daysAfter (integer, default: 3): Days after outboundDate to include (0-7).\n"
+                "- adults (integer, default: 1), children (integer, default: 0), infants (integer, default: 0): Passenger counts, same rules as search_flights.\n"
+                "- cabin, stops, refundable, departureTimeWindow, arrivalTimeWindow, fareType, flightNames: Optional filters, same as search_flights. "
+                "The fare shown for each day is the cheapest flight matching them."
+            ),
+            input_schema=FlightFareCalendarInput.model_json_schema(),
+            output_template="ui://widget/flight-carousel.html",
+            category="travel",
+            tags=["flight", "travel", "search", "calendar", "flexible"],
+        )
+
+    async def execute(self, **kwargs) -> ToolResponseFormat:
+        """
+        Execute a fare calendar search with provided parameters.
+        """
+        kwargs.pop("_session_id", None)
+        kwargs.pop("_limit", None)
+        user_type = kwargs.pop("_user_type", "website")
+        render_html = user_type.lower() == "website"
+        is_whatsapp = user_type.lower() == "whatsapp"
+
+        try:
+            payload = FlightFareCalendarInput.model_validate(kwargs)
+        except ValidationError as exc:
+            return ToolResponseFormat(
+                response_text="Invalid fare calendar input",
+                structured_content={
+                    "error": "VALIDATION_ERROR",
+                    "details": exc.errors(),
+                },
+                is_error=True,
+            )
+
+        calendar = await search_flights_flexible(
+            origin=payload.origin,
+            destination=payload.destination,
+            center_date=payload.outbound_date,
+            days_before=payload.days_before,
+            days_after=payload.days_after,
+            adults=payload.adults,
+            children=payload.children,
+            infants=payload.infants,
+            cabin=payload.cabin,
+            stops=payload.stops,
+            refundable=payload.refundable,
+            fare_type=payload.fare_type,
+            departure_time_window=payload.departure_time_window,
+            arrival_time_window=payload.arrival_time_window,
+            airline_names=payload.airline_names,
+        )
+        calendar["passengers"] = {
+            "adults": payload.adults,
+            "children": payload.children,
+            "infants": payload.infants,
+        }
+        has_error = bool(calendar.get("error"))
+
+        if has_error:
+            text = calendar.get("message") or "No fares found for the selected dates."
+        else:
+            cheapest = calendar["cheapest"]
+            summary = calendar["summary"]
+            text = (
+                f"Cheapest day from {calendar['origin_name']} to {calendar['destination_name']} is "
+                f"{_format_date(cheapest['date'])} at {_format_currency(cheapest['min_fare'])}"
+                f"{' on ' + cheapest['airline'] if cheapest.get('airline') else ''}. "
+                f"Fares found for {summary['with_fares']} of {summary['requested']} days. "
+                "Pick a date to see all flights for that day."
+            )
+            if summary["timed_out"] or summary["failed"]:
+                text += f" {summary['timed_out'] + summary['failed']} day(s) could not be loaded."
+
+        return ToolResponseFormat(
+            response_text=text,
+            structured_content=None if is_whatsapp else calendar,
+            html=render_flight_fare_calendar(calendar)
+            if render_html and not has_error
+            else None,
+            whatsapp_response=(
+                build_whatsapp_fare_calendar_response(calendar)
+                if is_whatsapp and not has_error
+                else None
+            ),
+            is_error=has_error,
+        )
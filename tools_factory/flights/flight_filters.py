@@ -0,0 +1,319 @@
+"""
+Flight filter specs and the field parsers they share.
+
+Kept free of imports from the rest of the flights package so both
+flight_search_service and flight_columns can build on it.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _duration_to_minutes(value: Any) -> Optional[int]:
+    """Parse duration strings like '09h 50m', '4h05m', '09:50' into minutes."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    text = str(value).strip().lower()
+    if not text:
+        return None
+
+    # Pattern with hours and minutes
+    match = re.search(r"(?:(\d+)\s*h)?\s*(\d+)\s*m", text)
+    if match:
+        hours = int(match.group(1) or 0)
+        minutes = int(match.group(2))
+        return hours * 60 + minutes
+
+    # Pattern like 4h05m (no space)
+    match = re.search(r"(\d+)h(\d+)", text)
+    if match:
+        hours = int(match.group(1))
+        minutes = int(match.group(2))
+        return hours * 60 + minutes
+
+    # Pattern HH:MM
+    if ":" in text:
+        parts = text.split(":")
+        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
+            hours = int(parts[0])
+            minutes = int(parts[1][:2])
+            return hours * 60 + minutes
+
+    # Fallback digits: treat as HHMM if length>2 else hours
+    digits = "".join(ch for ch in text if ch.isdigit())
+    if digits:
+        if len(digits) > 2:
+            hours = int(digits[:-2])
+            minutes = int(digits[-2:])
+            return hours * 60 + minutes
+        return int(digits) * 60
+
+    return None
+
+
+def _sum_leg_durations(legs: List[Dict[str, Any]]) -> Optional[int]:
+    total = 0
+    found = False
+    for leg in legs or []:
+        minutes = _duration_to_minutes(leg.get("duration"))
+        if minutes is not None:
+            total += minutes
+            found = True
+    return total if found else None
+
+
+def _flight_duration_minutes(flight: Dict[str, Any]) -> int:
+    """Compute duration in minutes for sorting; inf if unknown."""
+    if not flight:
+        return float("inf")
+    minutes = _duration_to_minutes(flight.get("journey_time"))
+    if minutes is None:
+        minutes = _sum_leg_durations(flight.get("legs", []))
+    if minutes is None:
+        return float("inf")
+    return minutes
+
+
+def _coerce_stops(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_single_time(value: Any) -> Optional[int]:
+    """Parse 'HH:MM' or 'HHMM' (24h)."""
+    if value is None:
+        return None
+    raw = str(value).strip()
+    if not raw:
+        return None
+
+    raw = raw.replace(" ", "")
+    if ":" in raw:
+        parts = raw.split(":", 1)
+        if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+            return None
+        hour = int(parts[0])
+        minute = int(parts[1])
+    else:
+        digits = re.sub(r"\D", "", raw)
+        if len(digits) not in (3, 4):
+            return None
+        hour = int(digits[:-2])
+        minute = int(digits[-2:])
+
+    if hour > 24 or minute > 59:
+        return None
+    if hour == 24 and minute > 0:
+        return None
+
+    return hour * 60 + minute
+
+
+def _parse_time_window(window_value: Optional[Any]) -> tuple[int, int, bool]:
+    default_window = (0, 1440, False)
+    if window_value is None:
+        return default_window
+
+    text = str(window_value).strip()
+    if not text:
+        return default_window
+
+    if "-" not in text and "to" not in text:
+        return default_window
+
+    sep = "-" if "-" in text else "to"
+    parts = [p.strip() for p in text.split(sep, 1)]
+    if len(parts) != 2:
+        return default_window
+
+    start = _parse_single_time(parts[0])
+    end = _parse_single_time(parts[1])
+
+    if start is None or end is None:
+        return default_window
+
+    wrap = end < start
+    return (start, end, wrap)
+
+
+def _time_to_minutes(raw_time: Any) -> Optional[int]:
+    if raw_time is None:
+        return None
+
+    text = str(raw_time)
+    if len(text) == 5 and text[2] == ":" and text[:2].isdecimal() and text[3:].isdecimal():
+        # "HH:MM" (the API's own format) without the regex
+        hour = int(text[:2])
+        minute = int(text[3:])
+    else:
+        digits = re.sub(r"\D", "", text)
+        if not digits:
+            return None
+
+        if len(digits) == 3:
+            hour = int(digits[0])
+            minute = int(digits[1:])
+        else:
+            hour = int(digits[:2])
+            minute = int(digits[2:4]) if len(digits) >= 4 else 0
+
+    if hour > 24 or minute > 59:
+        return None
+
+    if hour == 24 and minute > 0:
+        hour, minute = 23, 59
+
+    return hour * 60 + minute
+
+
+def _is_within_window(raw_time: Any, window: tuple[int, int, bool]) -> bool:
+    if not window:
+        return True
+    start, end, wrap = window
+    if start == 0 and end == 1440 and not wrap:
+        return True
+    minutes = _time_to_minutes(raw_time)
+    if minutes is None:
+        return False
+    if wrap:
+        return minutes >= start or minutes <= end
+    return start <= minutes <= end
+
+
+_FULL_DAY = (0, 1440, False)
+
+
+@lru_cache(maxsize=4096)
+def _airline_matches(names: Tuple[str, ...], airline_name: str, airline_code: str) -> bool:
+    airline = airline_name.lower()
+    code = airline_code.lower()
+    return any(n in airline or n in code for n in names)
+
+
+@dataclass(frozen=True)
+class FlightFilterSpec:
+    """
+    Filter parameters of a flight search, parsed once.
+
+    Time windows are (start, end, wraps_midnight) in minutes of day and
+    airline names are lower-cased. The spec is immutable and hashable, so
+    the same instance can be reused across pages and re-searches and can
+    be part of a cache key.
+    """
+
+    departure_window: Tuple[int, int, bool] = _FULL_DAY
+    arrival_window: Tuple[int, int, bool] = _FULL_DAY
+    airline_names: Tuple[str, ...] = ()
+    refundable: Optional[bool] = None
+    stops: Optional[int] = None
+
+    @classmethod
+    def from_context(cls, search_context: Optional[Dict[str, Any]]) -> "FlightFilterSpec":
+        """Spec for a search_context dict (as built by search_flights)."""
+        context = search_context or {}
+        return _compile_filter_spec(
+            context.get("departure_time_window"),
+            context.get("arrival_time_window"),
+            tuple(str(name) for name in context.get("airline_names") or ()),
+            context.get("refundable"),
+            context.get("stops"),
+        )
+
+    @classmethod
+    def from_input(cls, payload: Any) -> "FlightFilterSpec":
+        """Spec for a validated FlightSearchInput (or any input with the same filter fields)."""
+        return _compile_filter_spec(
+            payload.departure_time_window,
+            payload.arrival_time_window,
+            tuple(payload.airline_names or ()),
+            payload.refundable,
+            payload.stops,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self == _NO_FILTERS
+
+    def allows_airline(self, airline_name: Optional[str], airline_code: Optional[str]) -> bool:
+        if not self.airline_names:
+            return True
+        return _airline_matches(self.airline_names, airline_name or "", airline_code or "")
+
+    def matches_fields(
+        self,
+        departure_time: Any,
+        arrival_time: Any,
+        airline_name: Optional[str],
+        airline_code: Optional[str],
+        is_refundable: Any,
+        stops: Any,
+        check_time: bool = True,
+    ) -> bool:
+        """Evaluate the spec against the handful of fields it depends on."""
+        if check_time and not (
+            _is_within_window(departure_time, self.departure_window)
+            and _is_within_window(arrival_time, self.arrival_window)
+        ):
+            return False
+
+        if not self.allows_airline(airline_name, airline_code):
+            return False
+
+        if self.refundable is True and is_refundable is not True:
+            return False
+        if self.refundable is False and is_refundable is not False:
+            return False
+
+        if self.stops is not None and _coerce_stops(stops) != self.stops:
+            return False
+
+        return True
+
+    def matches(self, flight: Dict[str, Any], check_time: bool = True) -> bool:
+        """Evaluate the spec against a processed flight dict."""
+        legs = flight.get("legs") or []
+        if not legs:
+            # Nothing to compare time/airline against
+            if self.airline_names:
+                return False
+            check_time = False
+            first_leg = last_leg = {}
+        else:
+            first_leg, last_leg = legs[0], legs[-1]
+
+        return self.matches_fields(
+            first_leg.get("departure_time"),
+            last_leg.get("arrival_time"),
+            first_leg.get("airline_name"),
+            first_leg.get("airline_code"),
+            flight.get("is_refundable"),
+            flight.get("total_stops"),
+            check_time=check_time,
+        )
+
+
+_NO_FILTERS = FlightFilterSpec()
+
+
+@lru_cache(maxsize=256, typed=True)
+def _compile_filter_spec(
+    departure_time_window: Optional[str],
+    arrival_time_window: Optional[str],
+    airline_names: Tuple[str, ...],
+    refundable: Optional[bool],
+    stops: Any,
+) -> FlightFilterSpec:
+    return FlightFilterSpec(
+        departure_window=_parse_time_window(departure_time_window),
+        arrival_window=_parse_time_window(arrival_time_window),
+        airline_names=tuple(name.lower() for name in airline_names),
+        refundable=refundable if isinstance(refundable, bool) else None,
+        stops=_coerce_stops(stops),
+    )
@@ -0,0 +1,155 @@
+from tools_factory.base import BaseTool, ToolMetadata
+from pydantic import ValidationError
+
+from emt_client.utils import generate_short_link
+from .flight_schema import FlightMultiSearchInput
+from .flight_search_service import (
+    search_flights_multi,
+    attach_multi_route_deep_links,
+    build_whatsapp_multi_route_response,
+)
+from .flight_renderer import render_oneway_flights
+from .flight_columns import FlightColumns
+from tools_factory.base_schema import ToolResponseFormat
+
+
+class FlightMultiSearchTool(BaseTool):
+    """Multi-origin / multi-city flight search for EaseMyTrip"""
+
+    def get_metadata(self) -> ToolMetadata:
+        return ToolMetadata(
+            name="search_flights_multi_route",
+            description=(
+                "Purpose:\n"
+                "- Search several one-way routes in one call and return a single list ranked by fare (or journey time), without duplicates.\n"
+                "- Use for alternative origins or destinations ('flights from Delhi or Jaipur to Goa', 'Mumbai to Goa or Kochi') "
+                "and for multi-city / open-jaw trips where each leg has its own date.\n"
+                "- For a single origin and destination use search_flights.\n"
+                "Parameters (Fields):\n"
+                "- origins (list of strings): Origin airport IATA codes, e.g. ['DEL', 'JAI'].\n"
+                "- destinations (list of strings): Destination airport IATA codes, e.g. ['GOI']. Every origin is searched to every destination.\n"
+                "- outboundDate (string): Travel date YYYY-MM-DD, used with origins/destinations.\n"
+                "- legs (list, optional): Instead of origins/destinations, explicit legs each with origin, destination and outboundDate (multi-city).\n"
+                "- adults (integer, default: 1), children (integer, default: 0), infants (integer, default: 0): Passenger counts, same rules as search_flights.\n"
+                "- cabin, stops, fastest, refundable, departureTimeWindow, arrivalTimeWindow, fareType, flightNames: Optional filters, same as search_flights.\n"
+                "- page (integer, default: 1): Page of the merged results."
+            ),
+            input_schema=FlightMultiSearchInput.model_json_schema(),
+            output_template="ui://widget/flight-carousel.html",
+            category="travel",
+            tags=["flight", "booking", "travel", "search", "multi-city"],
+        )
+
+    async def execute(self, **kwargs) -> ToolResponseFormat:
+        """
+        Execute a multi-route flight search with provided parameters.
+        """
+        kwargs.pop("_session_id", None)
+        limit = kwargs.pop("_limit", 15)
+        user_type = kwargs.pop("_user_type", "website")
+        render_html = user_type.lower() == "website"
+        is_whatsapp = user_type.lower() == "whatsapp"
+        is_chatGPT = user_type.lower() == "chat-gpt"
+
+        if limit is None:
+            limit = 15
+
+        try:
+            payload = FlightMultiSearchInput.model_validate(kwargs)
+        except ValidationError as exc:
+            return ToolResponseFormat(
+                response_text="Invalid multi-route flight search input",
+                structured_content={
+                    "error": "VALIDATION_ERROR",
+                    "details": exc.errors(),
+                },
+                is_error=True,
+            )
+
+        results = await search_flights_multi(
+            legs=payload.route_legs(),
+            adults=payload.adults,
+            children=payload.children,
+            infants=payload.infants,
+            cabin=payload.cabin,
+            stops=payload.stops,
+            fastest=payload.fastest,
+            refundable=payload.refundable,
+            fare_type=payload.fare_type,
+            departure_time_window=payload.departure_time_window,
+            arrival_time_window=payload.arrival_time_window,
+            airline_names=payload.airline_names,
+        )
+        has_error = bool(results.get("error"))
+
+        all_flights = results.get("outbound_flights") or []
+        total_count = len(all_flights)
+        if not has_error:
+            results["highlights"] = FlightColumns(all_flights).highlights(limit)
+
+        # --------------------------------------------------
+        # Pagination + deeplinks for the returned page only
+        # --------------------------------------------------
+        page = payload.page
+        offset = (page - 1) * limit
+        end = offset + limit
+        paginated = all_flights[offset:end]
+
+        if is_chatGPT:
+            for route in results.get("routes", []):
+                route.pop("view_all_link", None)
+        elif paginated:
+            attach_multi_route_deep_links(results, paginated)
+            paginated = generate_short_link(paginated, product_type="flight")
+
+        results["outbound_flights"] = paginated
+        results["pagination"] = {
+            "current_page": page,
+            "per_page": limit,
+            "total_results": total_count,
+            "total_pages": (total_count + limit - 1) // limit if limit > 0 else 1,
+            "has_next_page": end < total_count,
+            "has_previous_page": page > 1,
+            "showing_from": offset + 1 if paginated else 0,
+            "showing_to": min(end, total_count),
+        }
+
+        # --------------------------------------------------
+        # Response text
+        # --------------------------------------------------
+        summary = results.get("summary") or {}
+        if has_error:
+            text = results.get("message") or "No flights found."
+        elif not paginated:
+            text = f"No more flights available. All {total_count} flights have been shown."
+        else:
+            text = (
+                f"Found {total_count} flights across {summary.get('routes', 0)} routes "
+                f"from {results['origin']} to {results['destination']}, "
+                f"ranked by {'journey time' if payload.fastest else 'fare'}."
+            )
+            if results["pagination"]["has_next_page"]:
+                text += " Say 'show more' for additional options."
+            unavailable = summary.get("failed", 0) + summary.get("timed_out", 0)
+            if unavailable:
+                text += f" {unavailable} route(s) could not be searched."
+
+        whatsapp_response = (
+            build_whatsapp_multi_route_response(results)
+            if is_whatsapp and not has_error
+            else None
+        )
+
+        return ToolResponseFormat(
+            response_text=text,
+            structured_content=None if is_whatsapp else results,
+            html=render_oneway_flights(results)
+            if render_html and not has_error and paginated
+            else None,
+            whatsapp_response=(
+                whatsapp_response.model_dump()
+                if whatsapp_response
+                else None
+            ),
+            is_error=has_error,
+        )
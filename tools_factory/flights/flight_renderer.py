@@ -1,6 +1,8 @@
 from typing import Dict, Any, List, Optional
 from jinja2 import Environment, BaseLoader, select_autoescape
 
+from tools_factory.ranking import best_indices
+
 
 _jinja_env = Environment(
     loader=BaseLoader(),
@@ -1461,6 +1463,94 @@ INTERNATIONAL_ROUNDTRIP_TEMPLATE = """
 # HELPER FUNCTIONS
 # =====================================================================
 
+FARE_CALENDAR_TEMPLATE = """
+<style>
+{{ styles }}
+
+.flight-carousel .fare-cal {
+  display: flex;
+  gap: 8px;
+  overflow-x: auto;
+  padding-bottom: 6px;
+}
+
+.flight-carousel .fare-day {
+  flex: 0 0 92px;
+  border: 1px solid #e0e0e0;
+  border-radius: 10px;
+  background: #fff;
+  padding: 8px 6px;
+  text-align: center;
+  text-decoration: none;
+  color: #202020;
+}
+
+.flight-carousel .fare-day.cheapest {
+  border-color: #2e7d32;
+  background: #f1f8f1;
+}
+
+.flight-carousel .fare-day .day-label {
+  font-size: 11px;
+  font-weight: 600;
+}
+
+.flight-carousel .fare-day .day-fare {
+  font-family: inter, sans-serif;
+  font-size: 14px;
+  font-weight: 700;
+  margin-top: 4px;
+}
+
+.flight-carousel .fare-day .day-airline,
+.flight-carousel .fare-day .day-status {
+  font-size: 9px;
+  color: #646d74;
+  margin-top: 2px;
+}
+
+.flight-carousel .fare-day .day-tag {
+  font-size: 8px;
+  font-weight: 600;
+  color: #2e7d32;
+  text-transform: uppercase;
+}
+</style>
+
+<div class="flight-carousel">
+  <main>
+    <div class="rslttp rslt-heading">
+      <div class="ntfctl">
+        <span>{{ origin }}</span> → <span>{{ destination }}</span>
+      </div>
+      <div class="ntfsbt">
+        <span>Lowest fares</span> • <span>{{ cabin }}</span>
+      </div>
+    </div>
+
+    <div class="fare-cal">
+      {% for day in days %}
+      {% if day.link %}
+      <a class="fare-day{% if day.is_cheapest %} cheapest{% endif %}" href="{{ day.link }}" target="_blank" rel="noopener noreferrer">
+      {% else %}
+      <div class="fare-day">
+      {% endif %}
+        {% if day.is_cheapest %}<div class="day-tag">Cheapest</div>{% endif %}
+        <div class="day-label">{{ day.label }}</div>
+        {% if day.fare %}
+        <div class="day-fare">{{ day.fare }}</div>
+        <div class="day-airline">{{ day.airline or '' }}</div>
+        {% else %}
+        <div class="day-status">{{ day.status_text }}</div>
+        {% endif %}
+      {% if day.link %}</a>{% else %}</div>{% endif %}
+      {% endfor %}
+    </div>
+  </main>
+</div>
+"""
+
+
 def _format_currency(value: float) -> str:
     """Format price in Indian Rupees"""
     if not isinstance(value, (int, float)) or value < 0:
@@ -1759,19 +1849,7 @@ def render_oneway_flights(flight_results: Dict[str, Any]) -> str:
 
     fastest_flag = bool(flight_results.get('fastest'))
 
-    def _cheapest_index(items: List[Dict[str, Any]]) -> Optional[int]:
-        best = None
-        idx = None
-        for i, it in enumerate(items):
-            fare = it.get('fare_raw')
-            if fare is None:
-                continue
-            if best is None or fare < best:
-                best = fare
-                idx = i
-        return idx
-
-    cheapest_idx = _cheapest_index(flights_ui)
+    cheapest_idx = best_indices(flights_ui, cheapest=lambda item: item.get('fare_raw'))["cheapest"]
 
     for i, f in enumerate(flights_ui):
         f['is_cheapest'] = (i == cheapest_idx)
@@ -1877,19 +1955,7 @@ def render_international_roundtrip_flights(flight_results: Dict[str, Any]) -> st
 
     fastest_flag = bool(flight_results.get('fastest'))
 
-    def _cheapest_index(items: List[Dict[str, Any]]) -> Optional[int]:
-        best = None
-        idx = None
-        for i, it in enumerate(items):
-            fare = it.get('fare_raw')
-            if fare is None:
-                continue
-            if best is None or fare < best:
-                best = fare
-                idx = i
-        return idx
-
-    cheapest_idx = _cheapest_index(combos_ui)
+    cheapest_idx = best_indices(combos_ui, cheapest=lambda item: item.get('fare_raw'))["cheapest"]
 
     for i, c in enumerate(combos_ui):
         c['is_cheapest'] = (i == cheapest_idx)
@@ -1947,3 +2013,42 @@ def render_flight_results(flight_results: Dict[str, Any]) -> str:
     # Default to one-way
     else:
         return render_oneway_flights(flight_results)
+
+
+def render_flight_fare_calendar(calendar: Dict[str, Any]) -> str:
+    """
+    Render a fare calendar (cheapest fare per day) as a horizontal strip.
+
+    Args:
+        calendar: Result of search_flights_flexible
+
+    Returns:
+        HTML string for the fare calendar
+    """
+    status_text = {"no_flights": "No flights", "timeout": "Not loaded", "error": "Unavailable"}
+    cheapest_date = (calendar.get('cheapest') or {}).get('date')
+
+    days_ui = []
+    for day in calendar.get('days', []):
+        try:
+            label = datetime.strptime(day['date'], "%Y-%m-%d").strftime("%a %d %b")
+        except ValueError:
+            label = day['date']
+        has_fare = day.get('min_fare') is not None
+        days_ui.append({
+            'label': label,
+            'fare': _format_currency(day['min_fare']) if has_fare else None,
+            'airline': day.get('airline'),
+            'status_text': status_text.get(day.get('status'), ''),
+            'link': day.get('view_all_link') if has_fare else None,
+            'is_cheapest': day['date'] == cheapest_date,
+        })
+
+    template = _jinja_env.from_string(FARE_CALENDAR_TEMPLATE)
+    return template.render(
+        styles=BASE_FLIGHT_STYLES,
+        origin=calendar.get('origin') or '--',
+        destination=calendar.get('destination') or '--',
+        cabin=calendar.get('cabin', 'Economy'),
+        days=days_ui,
+    )
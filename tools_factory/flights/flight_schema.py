@@ -1,7 +1,7 @@
 from typing import Optional, List, Any
 from datetime import datetime
 import re
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 
 class FlightSearchInput(BaseModel):
@@ -249,6 +249,264 @@ class FlightSearchInput(BaseModel):
         return None
     
 
+class FlightFareCalendarInput(BaseModel):
+    """Schema for the flexible-date (fare calendar) flight search tool input."""
+
+    origin: str = Field(
+        ...,
+        description="Origin airport code (e.g., 'DEL' for Delhi, 'BOM' for Mumbai)",
+    )
+    destination: str = Field(
+        ...,
+        description="Destination airport code (e.g., 'BOM' for Mumbai, 'DEL' for Delhi)",
+    )
+    outbound_date: str = Field(
+        ...,
+        alias="outboundDate",
+        description="Date the search window is centred on, in YYYY-MM-DD format",
+    )
+    days_before: int = Field(
+        3,
+        alias="daysBefore",
+        ge=0,
+        le=7,
+        description="Days to include before outboundDate (0-7). Past dates are skipped.",
+    )
+    days_after: int = Field(
+        3,
+        alias="daysAfter",
+        ge=0,
+        le=7,
+        description="Days to include after outboundDate (0-7).",
+    )
+    cabin: Optional[str] = Field(
+        None,
+        description="Cabin preference like economy, premium economy, business, or first"
+    )
+    stops: Optional[int] = Field(
+        None,
+        description="Flight stop preference only if specified: 0(for non-stop), 1(stop), or 2(stops)"
+    )
+    refundable: Optional[bool] = Field(
+        None,
+        description="Set true to count only refundable options, false for non-refundable. Omit for no preference."
+    )
+    departure_time_window: Optional[str] = Field(
+        "00:00-24:00",
+        alias="departureTimeWindow",
+        description="Preferred departure time window 'HH:MM-HH:MM' or a period like 'morning'.",
+    )
+    arrival_time_window: Optional[str] = Field(
+        "00:00-24:00",
+        alias="arrivalTimeWindow",
+        description="Preferred arrival time window 'HH:MM-HH:MM' or a period like 'evening'.",
+    )
+    fare_type: Optional[int] = Field(
+        0,
+        alias="fareType",
+        ge=0,
+        le=4,
+        description="Fare type code: 0=standard, 1=defence, 2=student, 3=senior citizen, 4=doctor/nurse.",
+    )
+    airline_names: Optional[List[str]] = Field(
+        None,
+        alias="flightNames",
+        description="Only count these airlines (case-insensitive). Accepts a single name or list.",
+    )
+    adults: int = Field(1, ge=1, le=9, description="Number of adults (1-9). Defaults to 1.")
+    children: int = Field(0, ge=0, le=8, description="Number of children (0-8). Defaults to 0.")
+    infants: int = Field(0, ge=0, le=8, description="Number of infants (0-8). Defaults to 0.")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+    )
+
+    # Same normalization rules as FlightSearchInput
+
+    @field_validator("origin", "destination")
+    @classmethod
+    def normalize_airport_code(cls, v: str) -> str:
+        return FlightSearchInput.normalize_airport_code(v)
+
+    @field_validator("outbound_date")
+    @classmethod
+    def validate_date(cls, v: str) -> str:
+        return FlightSearchInput.validate_date(v)
+
+    @field_validator("refundable", mode="before")
+    @classmethod
+    def coerce_refundable(cls, v):
+        return FlightSearchInput.coerce_refundable(v)
+
+    @field_validator("airline_names", mode="before")
+    @classmethod
+    def normalize_airline_names(cls, v):
+        return FlightSearchInput.normalize_airline_names(v)
+
+    @field_validator("departure_time_window", "arrival_time_window", mode="before")
+    @classmethod
+    def ensure_time_window(cls, v: Optional[str]) -> str:
+        return FlightSearchInput._normalize_window(v)
+
+
+class FlightRouteLeg(BaseModel):
+    """One origin/destination/date search in a multi-route flight search."""
+
+    origin: str = Field(..., description="Origin airport code (e.g., 'DEL')")
+    destination: str = Field(..., description="Destination airport code (e.g., 'GOI')")
+    outbound_date: str = Field(..., alias="outboundDate", description="Travel date in YYYY-MM-DD format")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+    )
+
+    @field_validator("origin", "destination")
+    @classmethod
+    def normalize_airport_code(cls, v: str) -> str:
+        return FlightSearchInput.normalize_airport_code(v)
+
+    @field_validator("outbound_date")
+    @classmethod
+    def validate_date(cls, v: str) -> str:
+        return FlightSearchInput.validate_date(v)
+
+
+class FlightMultiSearchInput(BaseModel):
+    """Schema for the multi-origin / multi-city flight search tool input."""
+
+    origins: Optional[List[str]] = Field(
+        None,
+        description="Origin airport codes to search from, e.g. ['DEL', 'JAI'] for 'from Delhi or Jaipur'.",
+    )
+    destinations: Optional[List[str]] = Field(
+        None,
+        description="Destination airport codes to search to, e.g. ['GOI']. Every origin is searched to every destination.",
+    )
+    outbound_date: Optional[str] = Field(
+        None,
+        alias="outboundDate",
+        description="Travel date (YYYY-MM-DD) used with origins/destinations.",
+    )
+    legs: Optional[List[FlightRouteLeg]] = Field(
+        None,
+        description=(
+            "Explicit one-way searches, each with its own origin, destination and outboundDate "
+            "(multi-city / open-jaw). Use instead of origins/destinations/outboundDate."
+        ),
+    )
+    cabin: Optional[str] = Field(
+        None,
+        description="Cabin preference like economy, premium economy, business, or first"
+    )
+    stops: Optional[int] = Field(
+        None,
+        description="Flight stop preference only if specified: 0(for non-stop), 1(stop), or 2(stops)"
+    )
+    fastest: Optional[bool] = Field(
+        None,
+        description="Set true to rank the merged results by journey time instead of fare.",
+    )
+    refundable: Optional[bool] = Field(
+        None,
+        description="Set true to show only refundable options, false for non-refundable. Omit for no preference."
+    )
+    departure_time_window: Optional[str] = Field(
+        "00:00-24:00",
+        alias="departureTimeWindow",
+        description="Preferred departure time window 'HH:MM-HH:MM' or a period like 'morning'.",
+    )
+    arrival_time_window: Optional[str] = Field(
+        "00:00-24:00",
+        alias="arrivalTimeWindow",
+        description="Preferred arrival time window 'HH:MM-HH:MM' or a period like 'evening'.",
+    )
+    fare_type: Optional[int] = Field(
+        0,
+        alias="fareType",
+        ge=0,
+        le=4,
+        description="Fare type code: 0=standard, 1=defence, 2=student, 3=senior citizen, 4=doctor/nurse.",
+    )
+    airline_names: Optional[List[str]] = Field(
+        None,
+        alias="flightNames",
+        description="Filter by airline names (case-insensitive). Accepts a single name or list.",
+    )
+    page: int = Field(1, ge=1, description="Page number for pagination (1-indexed)")
+    adults: int = Field(1, ge=1, le=9, description="Number of adults (1-9). Defaults to 1.")
+    children: int = Field(0, ge=0, le=8, description="Number of children (0-8). Defaults to 0.")
+    infants: int = Field(0, ge=0, le=8, description="Number of infants (0-8). Defaults to 0.")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+    )
+
+    # Same normalization rules as FlightSearchInput
+
+    @field_validator("origins", "destinations", mode="before")
+    @classmethod
+    def normalize_airport_codes(cls, v):
+        if v is None:
+            return None
+        if isinstance(v, str):
+            v = [p for p in v.split(",")]
+        codes = []
+        for code in v:
+            code = FlightSearchInput.normalize_airport_code(str(code))
+            if code not in codes:
+                codes.append(code)
+        return codes or None
+
+    @field_validator("outbound_date")
+    @classmethod
+    def validate_date(cls, v: Optional[str]) -> Optional[str]:
+        return FlightSearchInput.validate_date(v)
+
+    @field_validator("fastest", mode="before")
+    @classmethod
+    def coerce_fastest(cls, v):
+        return FlightSearchInput.coerce_fastest(v)
+
+    @field_validator("refundable", mode="before")
+    @classmethod
+    def coerce_refundable(cls, v):
+        return FlightSearchInput.coerce_refundable(v)
+
+    @field_validator("airline_names", mode="before")
+    @classmethod
+    def normalize_airline_names(cls, v):
+        return FlightSearchInput.normalize_airline_names(v)
+
+    @field_validator("departure_time_window", "arrival_time_window", mode="before")
+    @classmethod
+    def ensure_time_window(cls, v: Optional[str]) -> str:
+        return FlightSearchInput._normalize_window(v)
+
+    @model_validator(mode="after")
+    def check_routes(self):
+        if self.legs:
+            return self
+        if not (self.origins and self.destinations and self.outbound_date):
+            raise ValueError("Provide either legs, or origins, destinations and outboundDate")
+        if not self.route_legs():
+            raise ValueError("Origins and destinations must differ")
+        return self
+
+    def route_legs(self) -> List[dict]:
+        """One-way searches to run: explicit legs, or every origin x destination pair."""
+        if self.legs:
+            return [leg.model_dump() for leg in self.legs]
+        return [
+            {"origin": origin, "destination": destination, "outbound_date": self.outbound_date}
+            for origin in self.origins or []
+            for destination in self.destinations or []
+            if origin != destination
+        ]
+
+
 class WhatsappFlightFormat(BaseModel):
         type: str = "flight_collection"
         options: list
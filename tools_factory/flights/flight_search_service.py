@@ -6,8 +6,12 @@ This module handles all flight search operations including:
 - Processing individual flight segments
 """
 from .flight_schema import FlightSearchInput,WhatsappFlightFinalResponse,WhatsappFlightFormat
-from datetime import datetime
-from typing import Any, Dict, List, Optional,Set
+import asyncio
+import heapq
+import logging
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote, urlencode
 from emt_client.clients.flight_client import FlightApiClient
 from emt_client.utils import (
@@ -15,10 +19,26 @@ from emt_client.utils import (
     fetch_first_city_code_country,
     generate_short_link,
 )
-from emt_client.config import FLIGHT_BASE_URL, FLIGHT_DEEPLINK
+from emt_client.cache import get_cache
+from emt_client.concurrency import run_with_deadline
+from emt_client.config import (
+    FLIGHT_BASE_URL,
+    FLIGHT_DEEPLINK,
+    FLIGHT_FARE_CALENDAR_CONCURRENCY,
+    FLIGHT_FARE_CALENDAR_TIMEOUT,
+    FLIGHT_MULTI_SEARCH_CONCURRENCY,
+    FLIGHT_MULTI_SEARCH_MAX_ROUTES,
+    FLIGHT_MULTI_SEARCH_TIMEOUT,
+    FLIGHT_SEARCH_CACHE_TTL,
+)
+from tools_factory.ranking import best_indices
+from .flight_columns import FlightColumns
+from .flight_filters import FlightFilterSpec, _compile_filter_spec
 from enum import Enum
 import re
 
+logger = logging.getLogger(__name__)
+
 class CabinClassEnum(int, Enum):
     ECONOMY = 0
     FIRST = 1
@@ -100,50 +120,6 @@ def _clean_time(raw_time: str) -> str:
     return "".join(ch for ch in str(raw_time) if ch.isdigit())
 
 
-def _duration_to_minutes(value: Any) -> Optional[int]:
-    """Parse duration strings like '09h 50m', '4h05m', '09:50' into minutes."""
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return int(value)
-
-    text = str(value).strip().lower()
-    if not text:
-        return None
-
-    # Pattern with hours and minutes
-    match = re.search(r"(?:(\d+)\s*h)?\s*(\d+)\s*m", text)
-    if match:
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2))
-        return hours * 60 + minutes
-
-    # Pattern like 4h05m (no space)
-    match = re.search(r"(\d+)h(\d+)", text)
-    if match:
-        hours = int(match.group(1))
-        minutes = int(match.group(2))
-        return hours * 60 + minutes
-
-    # Pattern HH:MM
-    if ":" in text:
-        parts = text.split(":")
-        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
-            hours = int(parts[0])
-            minutes = int(parts[1][:2])
-            return hours * 60 + minutes
-
-    # Fallback digits: treat as HHMM if length>2 else hours
-    digits = "".join(ch for ch in text if ch.isdigit())
-    if digits:
-        if len(digits) > 2:
-            hours = int(digits[:-2])
-            minutes = int(digits[-2:])
-            return hours * 60 + minutes
-        return int(digits) * 60
-
-    return None
-
 def _coerce_refundable_flag(value: Any) -> Optional[bool]:
     """
     Normalize refundable flags that may arrive as bool, 1/0, or strings like
@@ -191,29 +167,6 @@ def _effective_total_fare(raw_tf: Any, ttdis: Any, icps: Any) -> float:
     return tf
 
 
-def _sum_leg_durations(legs: List[Dict[str, Any]]) -> Optional[int]:
-    total = 0
-    found = False
-    for leg in legs or []:
-        minutes = _duration_to_minutes(leg.get("duration"))
-        if minutes is not None:
-            total += minutes
-            found = True
-    return total if found else None
-
-
-def _flight_duration_minutes(flight: Dict[str, Any]) -> int:
-    """Compute duration in minutes for sorting; inf if unknown."""
-    if not flight:
-        return float("inf")
-    minutes = _duration_to_minutes(flight.get("journey_time"))
-    if minutes is None:
-        minutes = _sum_leg_durations(flight.get("legs", []))
-    if minutes is None:
-        return float("inf")
-    return minutes
-
-
 def _build_segment_strings(
     legs: List[Dict[str, Any]],
     default_departure: Optional[str],
@@ -351,36 +304,80 @@ def _build_fare_options_from_combo(segment: Dict[str, Any], per_leg_fare: float)
     ]
 
 
-def _get_flight_details_for_refs(refs, flight_details_dict):
+def _build_segment_leg(flight_detail: Dict[str, Any], airlines_map: Dict[str, str]) -> Dict[str, Any]:
+    """Map a dctFltDtl entry to the leg structure used by process_segment."""
+    airline_code = flight_detail.get("AC", "")
+    airline_name = airlines_map.get(airline_code, airline_code)
+
+    return {
+        "airline_code": airline_code,
+        "airline_name": airline_name,
+        "flight_number": flight_detail.get("FN", ""),
+        "origin": flight_detail.get("OG", ""),
+        "destination": flight_detail.get("DT", ""),
+        "departure_date": flight_detail.get("DDT", ""),
+        "departure_time": flight_detail.get("DTM", ""),
+        "arrival_date": flight_detail.get("ADT", ""),
+        "arrival_time": flight_detail.get("ATM", ""),
+        "cabin": flight_detail.get("CB", ""),
+        "fare_class": flight_detail.get("FCLS", ""),
+        "booking_code": flight_detail.get("FCLS", ""),
+        "duration": flight_detail.get("DUR", ""),
+        "baggage": f"{flight_detail.get('BW', '')} {flight_detail.get('BU', '')}".strip()
+    }
+
+
+class _LegIndex:
     """
-    Returns list of flight detail objects, one per leg.
+    Per-response memo of dctFltDtl flight id -> leg dict.
+
+    Each flight id is resolved and built once no matter how many segments
+    or combos reference it, so the returned legs are shared between
+    flights and must be treated as read-only.
     """
-    if isinstance(refs, list):
-        details = []
-        for ref in refs:
-            detail = (
-                flight_details_dict.get(str(ref))
-                or flight_details_dict.get(ref)
-            )
-            if detail:
-                details.append(detail)
-        return details
-
-    # single-leg journey
-    detail = (
-        flight_details_dict.get(str(refs))
-        or flight_details_dict.get(refs)
-    )
-    return [detail] if detail else []
+
+    def __init__(self, flight_details_dict: Dict[str, Any], airlines_map: Optional[Dict[str, str]]):
+        self._details = flight_details_dict
+        self._airlines = airlines_map
+        self._segment_legs: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._combo_legs: Dict[Any, Tuple[bool, Optional[Dict[str, Any]]]] = {}
+
+    def segment_leg(self, flight_id: Any) -> Optional[Dict[str, Any]]:
+        """Leg in process_segment shape, or None if the id has no usable detail."""
+        key = str(flight_id)
+        if key not in self._segment_legs:
+            detail = self._details.get(key, {})
+            valid = detail and isinstance(detail, dict)
+            self._segment_legs[key] = _build_segment_leg(detail, self._airlines or {}) if valid else None
+        return self._segment_legs[key]
+
+    def combo_legs(self, refs: Any) -> List[Optional[Dict[str, Any]]]:
+        """Legs for combo refs (a list or a single ref); refs with no detail are skipped."""
+        legs = []
+        for ref in refs if isinstance(refs, list) else [refs]:
+            if ref not in self._combo_legs:
+                detail = self._details.get(str(ref)) or self._details.get(ref)
+                self._combo_legs[ref] = (bool(detail), _build_leg_from_detail(detail, self._airlines) if detail else None)
+            found, leg = self._combo_legs[ref]
+            if found:
+                legs.append(leg)
+        return legs
+
 
 def _process_international_combos(
     journeys: List[Dict[str, Any]],
     flight_details_dict: Dict[str, Any],
     airlines_map: Optional[Dict[str, str]] = None,
+    leg_index: Optional[_LegIndex] = None,
 ) -> List[Dict[str, Any]]:
     """
     Build pre-combined international outbound + return flight combos.
+
+    Legs come from ``leg_index`` (shared with process_segment when given),
+    so a flight referenced by many combos is resolved and built once.
     """
+    if leg_index is None:
+        leg_index = _LegIndex(flight_details_dict, airlines_map)
 
     combos: List[Dict[str, Any]] = []
 
@@ -402,6 +399,9 @@ def _process_international_combos(
         # print(f"Intl combos: unsupported journeys type: {type(journeys)}")
         return combos
 
+    # Spelling of l_OB / l_IB seen on earlier segments of this response
+    resolved_keys: Dict[str, Any] = {}
+
     def _get_combo_list(segment: Dict[str, Any], target: str) -> Any:
         """
         Fetch l_OB / l_IB arrays, tolerant to casing and underscores.
@@ -410,9 +410,14 @@ def _process_international_combos(
         if direct is not None:
             return direct
 
+        known = resolved_keys.get(target)
+        if known is not None and segment.get(known) is not None:
+            return segment[known]
+
         normalized = target.replace("_", "").lower()
         for key, val in segment.items():
             if key and str(key).replace("_", "").lower() == normalized:
+                resolved_keys[target] = key
                 return val
         return None
 
@@ -506,8 +511,6 @@ def _process_international_combos(
 
             segments_with_refs += 1
             
-            outbound_detail = _get_flight_details_for_refs(outbound_ref, flight_details_dict)
-            inbound_detail = _get_flight_details_for_refs(inbound_ref, flight_details_dict)
             # outbound_detail = (
             #     flight_details_dict.get(str(outbound_ref)) #TODO: MAY BE UNCOMMENT LATER COMMENTING FOR TESTING
             #     or flight_details_dict.get(outbound_ref)
@@ -519,12 +522,8 @@ def _process_international_combos(
 
             # outbound_leg = _build_leg_from_detail(outbound_detail, airlines_map)
             # inbound_leg = _build_leg_from_detail(inbound_detail, airlines_map)
-            outbound_leg = [
-                _build_leg_from_detail(d, airlines_map) for d in outbound_detail if d
-            ]
-            inbound_leg = [
-                _build_leg_from_detail(d, airlines_map) for d in inbound_detail if d
-            ]
+            outbound_leg = leg_index.combo_legs(outbound_ref)
+            inbound_leg = leg_index.combo_legs(inbound_ref)
 
             if not outbound_leg or not inbound_leg:
                 continue
@@ -611,7 +610,6 @@ def _process_international_combos(
     return combos
 
 
-
 def build_deep_link(
     is_international,
     flight: Dict[str, Any],
@@ -879,6 +877,221 @@ def _build_view_all_link(search_context: Optional[Dict[str, Any]], use_short_lin
         return raw_link
 
 
+async def _resolve_city(client: FlightApiClient, term: str) -> Tuple[str, str, str]:
+    """(code, country, name) for a city/airport term via autosuggest, falling back to the raw input."""
+    try:
+        return await fetch_first_city_code_country(client, term)
+    except Exception:
+        return term, "", term
+
+
+def _route_info(origin_city: Tuple[str, str, str], destination_city: Tuple[str, str, str]) -> Dict[str, Any]:
+    origin_code, origin_country, origin_name = origin_city
+    destination_code, destination_country, destination_name = destination_city
+
+    if origin_country and destination_country:
+        is_international = not (
+            origin_country.strip().lower() == "india"
+            and destination_country.strip().lower() == "india"
+        )
+    # if origin_country and destination_country:
+    #     is_international = not (
+    #         origin_country.strip().lower() == destination_country.strip().lower()
+    #     )
+    else:
+        is_international = False
+
+    return {
+        "origin_code": origin_code,
+        "origin_country": origin_country,
+        "origin_name": origin_name,
+        "destination_code": destination_code,
+        "destination_country": destination_country,
+        "destination_name": destination_name,
+        "is_international": is_international,
+    }
+
+
+async def _resolve_flight_route(client: FlightApiClient, origin: str, destination: str) -> Dict[str, Any]:
+    """Resolve origin/destination through autosuggest (falling back to the raw input)."""
+    origin_city = await _resolve_city(client, origin)
+    destination_city = await _resolve_city(client, destination)
+    return _route_info(origin_city, destination_city)
+
+
+def _build_search_payload(
+    origin_code: str,
+    destination_code: str,
+    outbound_date: str,
+    return_date: Optional[str],
+    adults: int,
+    children: int,
+    infants: int,
+    cabin_enum: CabinClassEnum,
+    fare_type: Optional[int],
+    is_international: bool,
+) -> Dict[str, Any]:
+    """AirBus_New request body for one search."""
+    is_roundtrip = return_date is not None
+    try:
+        fare_type_code = int(fare_type or 0)
+    except (TypeError, ValueError):
+        fare_type_code = 0
+
+    is_fare_family = (fare_type_code >= 2)
+    if is_international:
+        is_fare_family=False
+    is_armed_force = fare_type_code == 1
+
+    return {
+        "org": origin_code,
+        "dept": destination_code,
+        "adt": str(adults),
+        "chd": str(children),
+        "inf": str(infants),
+        "queryname": gen_trace_id(),
+        "deptDT": outbound_date,
+        "arrDT": return_date if is_roundtrip else None,
+        "FareTypeUI": fare_type_code,
+        "userid": "",
+        "IsDoubelSeat": False,
+        "isDomestic": not is_international,
+        "isOneway": not is_roundtrip,
+        "airline": "undefined",
+        "VIP_CODE": "",
+        "VIP_UNIQUE": "",
+        "Cabin": cabin_enum.value,
+        "currCode": "INR",
+        "appType": 1,
+        "isSingleView": False,
+        "ResType": 0 if is_international else 2,
+        "IsNBA": False,
+        "CouponCode": "",
+        "IsArmedForce": is_armed_force,
+        "AgentCode": "",
+        "IsWLAPP": False,
+        "IsFareFamily": is_fare_family,
+        "serviceid": "EMTSERVICE",
+        "serviceDepatment": "",
+        "IpAddress": "",
+        "LoginKey": "",
+        "UUID": "",
+        "TKN": "",
+        "requesttime": "2025-03-25T09:22:38.407Z",
+        "tokenResponsetime": "2025-03-25T09:22:38.406Z"
+    }
+
+
+# Payload fields that identify a search (queryname/timestamps differ per call)
+_SEARCH_KEY_FIELDS = (
+    "org", "dept", "deptDT", "arrDT", "adt", "chd", "inf",
+    "Cabin", "FareTypeUI", "IsArmedForce", "IsFareFamily", "isDomestic",
+)
+
+
+def get_flight_search_cache():
+    """Shared short-TTL cache of raw AirBus_New responses."""
+    return get_cache("flight_search", ttl_seconds=FLIGHT_SEARCH_CACHE_TTL)
+
+
+async def _fetch_search_response(client: FlightApiClient, payload: Dict[str, Any]) -> Any:
+    """
+    POST AirBus_New through the shared cache.
+
+    Identical searches within FLIGHT_SEARCH_CACHE_TTL (e.g. a fare calendar
+    day the user then opens) reuse one response. Error strings and responses
+    without journeys are not kept.
+    """
+    url = f"{FLIGHT_BASE_URL}/AirAvail_Lights/AirBus_New"
+    key = tuple(payload.get(field) for field in _SEARCH_KEY_FIELDS)
+    cache = get_flight_search_cache()
+
+    data = await cache.get_or_fetch(key, lambda: client.search(url, payload))
+    if not isinstance(data, dict) or not data.get("j"):
+        cache.invalidate(key)
+    return data
+
+
+def get_flight_result_cache():
+    """Shared short-TTL cache of processed, unfiltered search_flights results."""
+    return get_cache("flight_results", ttl_seconds=FLIGHT_SEARCH_CACHE_TTL)
+
+
+def _result_cache_key(
+    origin: str,
+    destination: str,
+    outbound_date: str,
+    return_date: Optional[str],
+    adults: int,
+    children: int,
+    infants: int,
+    cabin_enum: CabinClassEnum,
+    fare_type: Optional[int],
+    use_short_links: bool,
+) -> tuple:
+    """Everything except the filters and ranking that shapes a search result."""
+    return (
+        origin.strip().upper(),
+        destination.strip().upper(),
+        outbound_date,
+        return_date,
+        adults,
+        children,
+        infants,
+        cabin_enum.value,
+        fare_type or 0,
+        use_short_links,
+    )
+
+
+def refine_flight_results(
+    base_results: Dict[str, Any],
+    filters: FlightFilterSpec,
+    fastest: Optional[bool] = None,
+    rank_limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Apply filters and fastest ranking to an unfiltered search_flights result.
+
+    Gives the same flights as a fresh search with those filters (the raw
+    segment checks mirror FlightFilterSpec.matches). Flights and combos are
+    shallow-copied so deeplinks attached to the returned page never leak
+    back into base_results. The FlightColumns kept with base_results are
+    reused, so repeated refinements of a cached search parse each field once.
+
+    Args:
+        base_results: Result of an unfiltered, unranked search with deferred deeplinks
+        filters: Filters to apply
+        fastest: Order by journey time
+        rank_limit: With fastest, order only this many leading results
+    """
+    base_columns = base_results.get("_columns") or {}
+
+    def _refine(key: str, combos: bool = False) -> FlightColumns:
+        view = base_columns.get(key)
+        if view is None:
+            items = base_results.get(key) or []
+            view = FlightColumns.for_combos(items) if combos else FlightColumns(items)
+        if fastest:
+            # Parsed on the cached view rather than the subset, so later refinements reuse it
+            view.column("duration")
+        if not filters.is_empty:
+            view = view.select(view.mask(filters))
+        rows = view.ranked("duration", rank_limit) if fastest else range(len(view))
+        return view.select(rows, copy_rows=True)
+
+    columns = {
+        "outbound_flights": _refine("outbound_flights"),
+        "return_flights": _refine("return_flights"),
+        "international_combos": _refine("international_combos", combos=True),
+    }
+    refined = dict(base_results)
+    for key, view in columns.items():
+        refined[key] = view.items
+    refined["_columns"] = columns
+    return refined
+
+
 async def search_flights(
     origin: str,
     destination: str,
@@ -896,6 +1109,9 @@ async def search_flights(
     arrival_time_window: Optional[str] = None,
     airline_names: Optional[list[str]] = None,
     use_short_links: bool = True,
+    defer_deep_links: bool = False,
+    rank_limit: Optional[int] = None,
+    filter_spec: Optional[FlightFilterSpec] = None,
 ) -> dict:
     """Call EaseMyTrip flight search API.
 
@@ -914,63 +1130,62 @@ async def search_flights(
         departure_time_window: Time-of-day window for departure (e.g., '06:00-12:00')
         arrival_time_window: Time-of-day window for arrival (e.g., '18:00-23:00')
         airline_names: Optional list of airline names to filter results (case-insensitive)
+        defer_deep_links: If true, skip per-flight deeplinks; build them later with
+            attach_deep_links for the flights actually returned
+        rank_limit: With fastest, rank only the first rank_limit results
+            (e.g. page * limit); the remainder keeps API order
+        filter_spec: Precompiled filters (FlightFilterSpec.from_input); when
+            omitted they are compiled from the filter arguments
+
+    With defer_deep_links, an unfiltered search is kept in the result cache
+    for FLIGHT_SEARCH_CACHE_TTL. Re-searching the same route/dates/pax/cabin
+    within that time (another page, or only the filters or fastest changed)
+    re-applies the filters to it locally, without autosuggest or AirBus_New.
 
     Returns:
         Dict containing flight search results with outbound and return flights
     """
-    #token = get_easemytrip_token()
-    trace_id = gen_trace_id()
-    client = FlightApiClient()
-    is_roundtrip = return_date is not None
-    try:
-        origin_code, origin_country, origin_name = await fetch_first_city_code_country(
-            client, origin
-        )
-    except Exception:
-        origin_code, origin_country, origin_name = origin, "", origin
+    cabin_enum = resolve_cabin_enum(cabin)
+    filters = filter_spec if filter_spec is not None else _compile_filter_spec(
+        departure_time_window,
+        arrival_time_window,
+        tuple(str(name) for name in airline_names or ()),
+        refundable,
+        stops,
+    )
 
-    try:
-        destination_code, destination_country, destination_name = await fetch_first_city_code_country(
-            client, destination
+    result_cache = get_flight_result_cache()
+    result_key = None
+    if defer_deep_links:
+        result_key = _result_cache_key(
+            origin, destination, outbound_date, return_date,
+            adults, children, infants, cabin_enum, fare_type, use_short_links,
         )
-    except Exception:
-        destination_code, destination_country, destination_name = destination, "", destination
+        cached = result_cache.get(result_key)
+        if cached is not None:
+            return refine_flight_results(cached, filters, fastest=fastest, rank_limit=rank_limit)
 
-    if origin_country and destination_country:
-        is_international = not (
-            origin_country.strip().lower() == "india"
-            and destination_country.strip().lower() == "india"
-        )
-    # if origin_country and destination_country:
-    #     is_international = not (
-    #         origin_country.strip().lower() == destination_country.strip().lower()
-    #     )
-    else:
-        is_international = False
-    cabin_enum = resolve_cabin_enum(cabin)
+    #token = get_easemytrip_token()
+    client = FlightApiClient()
+    is_roundtrip = return_date is not None
+    route = await _resolve_flight_route(client, origin, destination)
+    origin_code = route["origin_code"]
+    destination_code = route["destination_code"]
+    is_international = route["is_international"]
 
     passengers = {
         "adults": adults,
         "children": children,
         "infants": infants,
     }
-    try:
-        fare_type_code = int(fare_type or 0)
-    except (TypeError, ValueError):
-        fare_type_code = 0
-
-    is_fare_family = (fare_type_code >= 2)
-    if is_international:
-        is_fare_family=False
-    is_armed_force = fare_type_code == 1
 
     search_context = {
         "origin": origin_code,
         "destination": destination_code,
-        "origin_name": origin_name or origin,
-        "destination_name": destination_name or destination,
-        "origin_country": origin_country,
-        "destination_country": destination_country,
+        "origin_name": route["origin_name"] or origin,
+        "destination_name": route["destination_name"] or destination,
+        "origin_country": route["origin_country"],
+        "destination_country": route["destination_country"],
         "outbound_date": outbound_date,
         "return_date": return_date,
         "adults": adults,
@@ -988,51 +1203,19 @@ async def search_flights(
         "airline_names": airline_names,
     }
 
-  
-
-
-    payload = {
-        "org": origin_code,
-        "dept": destination_code,
-        "adt": str(adults),
-        "chd": str(children),
-        "inf": str(infants),
-        "queryname": trace_id,
-        "deptDT": outbound_date,
-        "arrDT": return_date if is_roundtrip else None,
-        "FareTypeUI": fare_type_code,
-        "userid": "",
-        "IsDoubelSeat": False,
-        "isDomestic": not is_international,
-        "isOneway": not is_roundtrip,
-        "airline": "undefined",
-        "VIP_CODE": "",
-        "VIP_UNIQUE": "",
-        "Cabin": cabin_enum.value,
-        "currCode": "INR",
-        "appType": 1,
-        "isSingleView": False,
-        "ResType": 0 if is_international else 2,
-        "IsNBA": False,
-        "CouponCode": "",
-        "IsArmedForce": is_armed_force,
-        "AgentCode": "",
-        "IsWLAPP": False,
-        "IsFareFamily": is_fare_family,
-        "serviceid": "EMTSERVICE",
-        "serviceDepatment": "",
-        "IpAddress": "",
-        "LoginKey": "",
-        "UUID": "",
-        "TKN": "",
-        "requesttime": "2025-03-25T09:22:38.407Z",
-        "tokenResponsetime": "2025-03-25T09:22:38.406Z"
-    }
-
-    
-    url = f"{FLIGHT_BASE_URL}/AirAvail_Lights/AirBus_New"
-   
-    data = await client.search(url, payload)
+    payload = _build_search_payload(
+        origin_code,
+        destination_code,
+        outbound_date,
+        return_date,
+        adults,
+        children,
+        infants,
+        cabin_enum,
+        fare_type,
+        is_international,
+    )
+    data = await _fetch_search_response(client, payload)
 
     # Check if response is error string
     if isinstance(data, str):
@@ -1049,22 +1232,644 @@ async def search_flights(
             "viewAll": None,
         }
 
+    # Unfiltered results are cached unranked; filters/fastest are applied per call
+    cache_result = result_key is not None and filters.is_empty and bool(data.get("j"))
+
     # Process results
-    processed_data = process_flight_results(data, is_roundtrip, is_international, search_context, use_short_links=use_short_links)
+    processed_data = process_flight_results(
+        data,
+        is_roundtrip,
+        is_international,
+        dict(search_context, fastest=None) if cache_result else search_context,
+        use_short_links=use_short_links,
+        defer_deep_links=defer_deep_links,
+        rank_limit=rank_limit,
+        filter_spec=filters,
+    )
     processed_data["origin"] = origin_code
     processed_data["destination"] = destination_code
     processed_data["outbound_date"] = outbound_date
     processed_data["return_date"] = return_date
     processed_data["cabin"] = get_cabin_display_name(cabin_enum)
+
+    if cache_result:
+        result_cache.set(result_key, processed_data)
+        return refine_flight_results(processed_data, filters, fastest=fastest, rank_limit=rank_limit)
     return processed_data
 
 
+def _segment_min_fare(segment: Dict[str, Any], is_international: bool) -> Optional[float]:
+    """Cheapest effective total fare of a raw one-way segment (same fares process_segment reports)."""
+    if is_international:
+        candidates = [segment.get("TF")]
+    else:
+        candidates = [fare.get("TF", 0) for fare in segment.get("lstFr") or [] if isinstance(fare, dict)]
+
+    best = None
+    for raw_fare in candidates:
+        fare = _effective_total_fare(raw_fare, segment.get("TTDIS"), segment.get("ICPS"))
+        if fare and (best is None or fare < best):
+            best = fare
+    return best
+
+
+def _cheapest_in_response(
+    data: Dict[str, Any],
+    is_international: bool,
+    filters: FlightFilterSpec,
+) -> Dict[str, Any]:
+    """
+    Minimum fare of a one-way AirBus_New response, read from raw segments.
+
+    No legs, fare options or deeplinks are built; filters are evaluated the
+    same way process_flight_results does.
+    """
+    airlines_map = data.get("C") or {}
+    flight_details_dict = data.get("dctFltDtl") or {}
+    journeys = data.get("j") or []
+    segments = journeys[0].get("s", []) if journeys and isinstance(journeys[0], dict) else []
+
+    flight_count = 0
+    best_fare = None
+    best_detail: Dict[str, Any] = {}
+    for segment in segments if isinstance(segments, list) else []:
+        bond = _segment_bond(segment, is_international, False)
+        if bond is None:
+            continue
+        details = [flight_details_dict.get(str(fid)) for fid in bond.get("FL", [])]
+        details = [d for d in details if d and isinstance(d, dict)]
+        if not details:
+            continue
+        if not _raw_segment_matches_filters(segment, flight_details_dict, airlines_map, is_international, False, filters):
+            continue
+
+        fare = _segment_min_fare(segment, is_international)
+        if fare is None:
+            continue
+        flight_count += 1
+        if best_fare is None or fare < best_fare:
+            best_fare = fare
+            best_detail = details[0]
+
+    airline_code = best_detail.get("AC", "")
+    return {
+        "min_fare": best_fare,
+        "flight_count": flight_count,
+        "airline": airlines_map.get(airline_code, airline_code) or None,
+        "departure_time": best_detail.get("DTM") or None,
+    }
+
+
+async def search_flights_flexible(
+    origin: str,
+    destination: str,
+    center_date: str,
+    days_before: int = 3,
+    days_after: int = 3,
+    adults: int = 1,
+    children: int = 0,
+    infants: int = 0,
+    cabin: Optional[str] = None,
+    stops: Optional[int] = None,
+    refundable: Optional[bool] = None,
+    fare_type: Optional[int] = 0,
+    departure_time_window: Optional[str] = None,
+    arrival_time_window: Optional[str] = None,
+    airline_names: Optional[list[str]] = None,
+    max_concurrent: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> dict:
+    """One-way fare calendar: cheapest fare per day around a date.
+
+    Origin/destination are resolved once, then one AirBus_New search per day
+    runs with bounded concurrency under a shared deadline. Only per-day
+    minimum fares are extracted. Raw responses go through the search cache,
+    so a follow-up search_flights for the chosen day reuses its response.
+
+    Args:
+        origin: Origin airport code
+        destination: Destination airport code
+        center_date: Date the window is centred on (YYYY-MM-DD)
+        days_before: Days to include before center_date (past days are skipped)
+        days_after: Days to include after center_date
+        adults / children / infants: Passenger counts
+        cabin, stops, refundable, fare_type, departure_time_window,
+            arrival_time_window, airline_names: Same as search_flights
+        max_concurrent: Max searches in flight (default FLIGHT_FARE_CALENDAR_CONCURRENCY)
+        timeout: Seconds for the whole calendar (default FLIGHT_FARE_CALENDAR_TIMEOUT)
+
+    Returns:
+        Dict with route info, ``days`` (date, status, min_fare, flight_count,
+        airline, departure_time, view_all_link), ``cheapest`` and ``summary``
+    """
+    center = datetime.strptime(center_date, "%Y-%m-%d").date()
+    today = datetime.now().date()
+    dates = [
+        center + timedelta(days=offset)
+        for offset in range(-days_before, days_after + 1)
+        if center + timedelta(days=offset) >= today
+    ]
+
+    client = FlightApiClient()
+    route = await _resolve_flight_route(client, origin, destination)
+    is_international = route["is_international"]
+    cabin_enum = resolve_cabin_enum(cabin)
+
+    base_context = {
+        "origin": route["origin_code"],
+        "destination": route["destination_code"],
+        "origin_name": route["origin_name"] or origin,
+        "destination_name": route["destination_name"] or destination,
+        "origin_country": route["origin_country"],
+        "destination_country": route["destination_country"],
+        "return_date": None,
+        "adults": adults,
+        "children": children,
+        "infants": infants,
+        "cabin": cabin_enum.value,
+        "is_international": is_international,
+        "stops": stops,
+        "fare_type": fare_type,
+        "refundable": refundable,
+        "departure_time_window": departure_time_window,
+        "arrival_time_window": arrival_time_window,
+        "airline_names": airline_names,
+    }
+    filters = FlightFilterSpec.from_context(base_context)
+
+    async def _search_day(day_iso: str) -> Dict[str, Any]:
+        payload = _build_search_payload(
+            route["origin_code"],
+            route["destination_code"],
+            day_iso,
+            None,
+            adults,
+            children,
+            infants,
+            cabin_enum,
+            fare_type,
+            is_international,
+        )
+        data = await _fetch_search_response(client, payload)
+        if not isinstance(data, dict):
+            return {"status": "error", "message": str(data)}
+        cheapest = _cheapest_in_response(data, is_international, filters)
+        cheapest["status"] = "ok" if cheapest["min_fare"] is not None else "no_flights"
+        return cheapest
+
+    day_isos = [d.isoformat() for d in dates]
+    outcomes = await run_with_deadline(
+        {iso: (lambda iso=iso: _search_day(iso)) for iso in day_isos},
+        max_concurrent or FLIGHT_FARE_CALENDAR_CONCURRENCY,
+        timeout if timeout is not None else FLIGHT_FARE_CALENDAR_TIMEOUT,
+    )
+
+    days = []
+    for iso in day_isos:
+        status, value = outcomes[iso]
+        if status == "timeout":
+            day = {"status": "timeout"}
+        elif status == "error":
+            logger.warning(f"Fare calendar search failed for {iso}: {value}")
+            day = {"status": "error", "message": str(value)}
+        else:
+            day = value
+
+        day_context = dict(base_context, outbound_date=iso)
+        days.append({
+            "date": iso,
+            "status": day["status"],
+            "min_fare": day.get("min_fare"),
+            "flight_count": day.get("flight_count", 0),
+            "airline": day.get("airline"),
+            "departure_time": day.get("departure_time"),
+            "view_all_link": _build_view_all_link(day_context, use_short_links=False),
+        })
+
+    cheapest_index = best_indices(days, cheapest=lambda d: d["min_fare"])["cheapest"]
+    statuses = [d["status"] for d in days]
+    result = {
+        "origin": route["origin_code"],
+        "destination": route["destination_code"],
+        "origin_name": base_context["origin_name"],
+        "destination_name": base_context["destination_name"],
+        "is_international": is_international,
+        "cabin": get_cabin_display_name(cabin_enum),
+        "center_date": center_date,
+        "days": days,
+        "cheapest": days[cheapest_index] if cheapest_index is not None else None,
+        "summary": {
+            "requested": len(days),
+            "with_fares": statuses.count("ok"),
+            "no_flights": statuses.count("no_flights"),
+            "failed": statuses.count("error"),
+            "timed_out": statuses.count("timeout"),
+        },
+    }
+    if cheapest_index is None:
+        result["error"] = "NO_FARES"
+        result["message"] = (
+            "No fares found for the selected dates." if days
+            else "All requested dates are in the past."
+        )
+    return result
+
+
+def build_whatsapp_fare_calendar_response(calendar: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact WhatsApp payload for a fare calendar."""
+    cheapest = calendar.get("cheapest") or {}
+    return {
+        "type": "flight_fare_calendar",
+        "origin": calendar.get("origin"),
+        "destination": calendar.get("destination"),
+        "currency": "INR",
+        "cheapest_date": cheapest.get("date"),
+        "cheapest_fare": cheapest.get("min_fare"),
+        "days": [
+            {
+                "date": day["date"],
+                "fare": day["min_fare"],
+                "airline": day["airline"],
+                "status": day["status"],
+                "is_cheapest": day["date"] == cheapest.get("date"),
+                "view_all_url": day["view_all_link"] if day["min_fare"] is not None else None,
+            }
+            for day in calendar.get("days", [])
+        ],
+    }
+
+
+def _flight_identity(flight: Dict[str, Any]) -> tuple:
+    """Flight number, origin and departure date/time of every leg; the same itinerary found by two searches compares equal."""
+    return tuple(
+        (
+            leg.get("airline_code"),
+            leg.get("flight_number"),
+            leg.get("origin"),
+            leg.get("departure_date"),
+            leg.get("departure_time"),
+        )
+        for leg in flight.get("legs") or []
+    )
+
+
+def merge_ranked_flights(
+    route_flights: List[List[Dict[str, Any]]],
+    fastest: bool = False,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Merge per-route flight lists into one ranked list without duplicates.
+
+    Each list is ordered once by (fare, duration) -- or (duration, fare)
+    when ``fastest`` -- and the lists are combined with a k-way heap merge.
+    A flight seen again later in the stream (same legs and departure) is a
+    duplicate of a cheaper one already taken and is dropped.
+
+    Returns:
+        (merged flights, number of duplicates dropped)
+    """
+    streams = []
+    for flights in route_flights:
+        columns = FlightColumns(flights)
+        if fastest:
+            keys = list(zip(columns.duration, columns.fare))
+        else:
+            keys = list(zip(columns.fare, columns.duration))
+        order = sorted(range(len(flights)), key=keys.__getitem__)
+        streams.append([(keys[i], flights[i]) for i in order])
+
+    merged: List[Dict[str, Any]] = []
+    seen: Set[tuple] = set()
+    duplicates = 0
+    for _, flight in heapq.merge(*streams, key=lambda pair: pair[0]):
+        identity = _flight_identity(flight)
+        if identity and identity in seen:
+            duplicates += 1
+            continue
+        seen.add(identity)
+        merged.append(flight)
+    return merged, duplicates
+
+
+async def search_flights_multi(
+    legs: List[Dict[str, str]],
+    adults: int = 1,
+    children: int = 0,
+    infants: int = 0,
+    cabin: Optional[str] = None,
+    stops: Optional[int] = None,
+    fastest: Optional[bool] = None,
+    refundable: Optional[bool] = None,
+    fare_type: Optional[int] = 0,
+    departure_time_window: Optional[str] = None,
+    arrival_time_window: Optional[str] = None,
+    airline_names: Optional[list[str]] = None,
+    max_concurrent: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> dict:
+    """Search several one-way routes at once and merge them into one ranked list.
+
+    Covers multi-origin ("from Delhi or Jaipur to Goa") and multi-city /
+    open-jaw searches. Every distinct city is resolved once and all searches
+    share one API client (and so one token). Searches run with bounded
+    concurrency under a shared deadline; their flights are merged by fare
+    (or journey time with ``fastest``) and deduplicated by flight number and
+    departure. Deeplinks are deferred; build them for the returned page with
+    attach_multi_route_deep_links.
+
+    Args:
+        legs: One-way searches, each a dict with origin, destination and
+            outbound_date (YYYY-MM-DD)
+        adults / children / infants: Passenger counts
+        cabin, stops, fastest, refundable, fare_type, departure_time_window,
+            arrival_time_window, airline_names: Same as search_flights
+        max_concurrent: Max searches in flight (default FLIGHT_MULTI_SEARCH_CONCURRENCY)
+        timeout: Seconds for all searches (default FLIGHT_MULTI_SEARCH_TIMEOUT)
+
+    Returns:
+        Dict with merged ``outbound_flights`` (each tagged with ``route_index``),
+        per-route status in ``routes`` and a ``summary``
+    """
+    if len(legs) > FLIGHT_MULTI_SEARCH_MAX_ROUTES:
+        return {
+            "error": "TOO_MANY_ROUTES",
+            "message": f"At most {FLIGHT_MULTI_SEARCH_MAX_ROUTES} routes can be searched at once.",
+            "outbound_flights": [],
+            "routes": [],
+        }
+
+    client = FlightApiClient()
+    terms = list(dict.fromkeys(
+        term for leg in legs for term in (leg["origin"], leg["destination"])
+    ))
+    cities = dict(zip(terms, await asyncio.gather(*(_resolve_city(client, term) for term in terms))))
+    cabin_enum = resolve_cabin_enum(cabin)
+    passengers = {"adults": adults, "children": children, "infants": infants}
+    filter_spec = FlightFilterSpec.from_context({
+        "departure_time_window": departure_time_window,
+        "arrival_time_window": arrival_time_window,
+        "airline_names": airline_names,
+        "refundable": refundable,
+        "stops": stops,
+    })
+
+    routes: List[Dict[str, Any]] = []
+    seen_routes: Set[tuple] = set()
+    for leg in legs:
+        route = _route_info(cities[leg["origin"]], cities[leg["destination"]])
+        key = (route["origin_code"], route["destination_code"], leg["outbound_date"])
+        if key in seen_routes or route["origin_code"] == route["destination_code"]:
+            continue
+        seen_routes.add(key)
+        routes.append({
+            "origin": route["origin_code"],
+            "destination": route["destination_code"],
+            "origin_name": route["origin_name"] or leg["origin"],
+            "destination_name": route["destination_name"] or leg["destination"],
+            "origin_country": route["origin_country"],
+            "destination_country": route["destination_country"],
+            "outbound_date": leg["outbound_date"],
+            "is_international": route["is_international"],
+        })
+
+    def _route_context(route: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **route,
+            "return_date": None,
+            "adults": adults,
+            "children": children,
+            "infants": infants,
+            "passengers": passengers,
+            "cabin": cabin_enum.value,
+            "stops": stops,
+            "fare_type": fare_type,
+            "fastest": fastest,
+            "refundable": refundable,
+            "departure_time_window": departure_time_window,
+            "arrival_time_window": arrival_time_window,
+            "airline_names": airline_names,
+        }
+
+    async def _search_route(index: int) -> Dict[str, Any]:
+        route = routes[index]
+        payload = _build_search_payload(
+            route["origin"],
+            route["destination"],
+            route["outbound_date"],
+            None,
+            adults,
+            children,
+            infants,
+            cabin_enum,
+            fare_type,
+            route["is_international"],
+        )
+        data = await _fetch_search_response(client, payload)
+        if not isinstance(data, dict):
+            raise ValueError(str(data))
+        return process_flight_results(
+            data,
+            False,
+            route["is_international"],
+            _route_context(route),
+            use_short_links=False,
+            defer_deep_links=True,
+            filter_spec=filter_spec,
+        )
+
+    outcomes = await run_with_deadline(
+        {str(i): (lambda i=i: _search_route(i)) for i in range(len(routes))},
+        max_concurrent or FLIGHT_MULTI_SEARCH_CONCURRENCY,
+        timeout if timeout is not None else FLIGHT_MULTI_SEARCH_TIMEOUT,
+    )
+
+    route_flights = []
+    for index, route in enumerate(routes):
+        status, value = outcomes[str(index)]
+        flights = []
+        if status == "ok":
+            flights = value.get("outbound_flights") or []
+            for flight in flights:
+                flight["route_index"] = index
+            route["status"] = "ok" if flights else "no_flights"
+        else:
+            route["status"] = status
+            if status == "error":
+                logger.warning(
+                    f"Multi-route search failed for {route['origin']}-{route['destination']} "
+                    f"on {route['outbound_date']}: {value}"
+                )
+                route["message"] = str(value)
+        route["flight_count"] = len(flights)
+        route["view_all_link"] = _build_view_all_link(_route_context(route), use_short_links=False)
+        route_flights.append(flights)
+
+    merged, duplicates = merge_ranked_flights(route_flights, fastest=bool(fastest))
+    statuses = [route["status"] for route in routes]
+    dates = {route["outbound_date"] for route in routes}
+    result = {
+        "is_multi_route": True,
+        "is_roundtrip": False,
+        "is_international": any(route["is_international"] for route in routes),
+        "origin": " / ".join(dict.fromkeys(route["origin"] for route in routes)),
+        "destination": " / ".join(dict.fromkeys(route["destination"] for route in routes)),
+        "outbound_date": dates.pop() if len(dates) == 1 else None,
+        "return_date": None,
+        "cabin": get_cabin_display_name(cabin_enum),
+        "passengers": passengers,
+        "fastest": fastest,
+        "routes": routes,
+        "outbound_flights": merged,
+        "return_flights": [],
+        "international_combos": [],
+        "summary": {
+            "routes": len(routes),
+            "with_flights": statuses.count("ok"),
+            "no_flights": statuses.count("no_flights"),
+            "failed": statuses.count("error"),
+            "timed_out": statuses.count("timeout"),
+            "duplicates_removed": duplicates,
+        },
+    }
+    if not merged:
+        result["error"] = "NO_FLIGHTS"
+        result["message"] = "No flights found on any of the requested routes."
+    return result
+
+
+def attach_multi_route_deep_links(results: Dict[str, Any], flights: List[Dict[str, Any]]) -> None:
+    """attach_deep_links for merged multi-route flights, using each flight's own route."""
+    routes = results.get("routes") or []
+    for flight in flights:
+        route = routes[flight["route_index"]]
+        attach_deep_links(
+            {
+                "passengers": results.get("passengers"),
+                "outbound_date": route["outbound_date"],
+                "is_international": route["is_international"],
+            },
+            [flight],
+        )
+
+
+def build_whatsapp_multi_route_response(results: Dict[str, Any]) -> WhatsappFlightFinalResponse:
+    """WhatsApp one-way options for a page of merged multi-route flights."""
+    routes = results.get("routes") or []
+    options = []
+    for idx, flight in enumerate(results.get("outbound_flights", []), start=1):
+        route = routes[flight["route_index"]]
+        summary = extract_segment_summary(flight)
+        fare = (flight.get("fare_options") or [{}])[0]
+        options.append({
+            "option_id": idx,
+            "outbound_flight": {
+                "airline": summary["airline"],
+                "flight_number": summary["flight_number"],
+                "origin": route["origin"],
+                "destination": route["destination"],
+                "departure_time": summary["departure_time"],
+                "arrival_time": summary["arrival_time"],
+                "duration": summary["duration"],
+                "stops": summary["stops"],
+                "stop_airports": summary.get("stop_airports", []),
+                "date": route["outbound_date"],
+            },
+            "price": fare.get("total_fare"),
+            "booking_url": flight.get("deepLink"),
+        })
+
+    whatsapp_json = WhatsappFlightFormat(
+        options=options,
+        trip_type="oneway",
+        journey_type="international" if results.get("is_international") else "domestic",
+        currency=results.get("currency", "INR"),
+        view_all_flights_url="",
+    )
+    return WhatsappFlightFinalResponse(
+        response_text=f"Here are the best flight options from {results.get('origin')} to {results.get('destination')}",
+        whatsapp_json=whatsapp_json,
+    )
+
+
+def _segment_bond(segment: Dict[str, Any], is_international: bool, is_roundtrip: bool) -> Optional[Dict[str, Any]]:
+    """First bond of a raw segment (l_OB for international one-way, b otherwise)."""
+    if is_international and not is_roundtrip:
+        bonds = segment.get("l_OB", [])
+    else:
+        bonds = segment.get("b", [])
+    if not isinstance(bonds, list) or len(bonds) == 0:
+        return None
+    return bonds[0]
+
+
+def _bond_stops(bond: Dict[str, Any], is_international: bool, is_roundtrip: bool) -> Any:
+    if is_international and not is_roundtrip:
+        stops = bond.get("STP", "0")
+        stops = re.split(r'[-+]', stops)[0].replace('|', '')
+        if stops == "Non":
+            stops = 0
+        return stops
+    return bond.get("stp", "0")
+
+
+def _bond_is_refundable(bond: Dict[str, Any], segment: Dict[str, Any]) -> bool:
+    refundable_flag = _coerce_refundable_flag(bond.get("RF"))
+    if refundable_flag is None:
+        refundable_flag = _coerce_refundable_flag(segment.get("RF"))
+    return refundable_flag if refundable_flag is not None else False
+
+
+def _raw_segment_matches_filters(
+    segment: Dict[str, Any],
+    flight_details_dict: Dict[str, Any],
+    airlines_map: Dict[str, str],
+    is_international: bool,
+    is_roundtrip: bool,
+    filters: FlightFilterSpec,
+) -> bool:
+    """
+    Evaluate a filter spec directly on a raw segment (bond + dctFltDtl).
+
+    Mirrors the fields process_segment would produce, so rejecting here
+    gives the same result as filtering the processed flight afterwards.
+    Segments that process_segment would drop are passed through.
+    """
+    bond = _segment_bond(segment, is_international, is_roundtrip)
+    if bond is None:
+        return True
+
+    first_detail = last_detail = None
+    for flight_id in bond.get("FL", []):
+        detail = flight_details_dict.get(str(flight_id), {})
+        if not detail or not isinstance(detail, dict):
+            continue
+        if first_detail is None:
+            first_detail = detail
+        last_detail = detail
+
+    if first_detail is None:
+        return True
+
+    airline_code = first_detail.get("AC", "")
+    return filters.matches_fields(
+        first_detail.get("DTM", ""),
+        last_detail.get("ATM", ""),
+        airlines_map.get(airline_code, airline_code),
+        airline_code,
+        _bond_is_refundable(bond, segment),
+        _bond_stops(bond, is_international, is_roundtrip),
+    )
+
+
 def process_flight_results(
     search_response: dict,
     is_roundtrip: bool,
     is_international:bool,
     search_context: Optional[Dict[str, Any]] = None,
     use_short_links: bool = True,
+    defer_deep_links: bool = False,
+    rank_limit: Optional[int] = None,
+    filter_spec: Optional[FlightFilterSpec] = None,
 ) -> dict:
     """Process raw flight search response.
 
@@ -1072,16 +1877,15 @@ def process_flight_results(
         search_response: Raw API response from EaseMyTrip
         is_roundtrip: Whether this is a roundtrip search
         search_context: Original search parameters for deep-link building
+        defer_deep_links: Leave deepLink unset on flights and combos (see attach_deep_links)
+        rank_limit: With fastest, order only this many leading results (None orders all)
+        filter_spec: Precompiled filters (default: compiled from search_context)
 
     Returns:
-        Dict containing processed outbound and return flights
+        Dict containing processed outbound and return flights, plus the
+        FlightColumns of each list under "_columns" (internal; pop it before
+        the result is serialised)
     """
-    def _coerce_stops(value: Any) -> Optional[int]:
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return None
-
     def _build_calendar_suggestions(calendar_data: Any) -> List[Dict[str, Any]]:
         """Pick top 3 alternate airports from lstCalendarFareData."""
         if not isinstance(calendar_data, list):
@@ -1117,135 +1921,7 @@ def process_flight_results(
 
         return suggestions[:3]
 
-    def _parse_single_time(value: Any) -> Optional[int]:
-        """Parse 'HH:MM' or 'HHMM' (24h)."""
-        if value is None:
-            return None
-        raw = str(value).strip()
-        if not raw:
-            return None
-
-        raw = raw.replace(" ", "")
-        if ":" in raw:
-            parts = raw.split(":", 1)
-            if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
-                return None
-            hour = int(parts[0])
-            minute = int(parts[1])
-        else:
-            digits = re.sub(r"\D", "", raw)
-            if len(digits) not in (3, 4):
-                return None
-            hour = int(digits[:-2])
-            minute = int(digits[-2:])
-
-        if hour > 24 or minute > 59:
-            return None
-        if hour == 24 and minute > 0:
-            return None
-
-        return hour * 60 + minute
-
-    def _parse_time_window(window_value: Optional[Any]) -> tuple[int, int, bool]:
-        default_window = (0, 1440, False)
-        if window_value is None:
-            return default_window
-
-        text = str(window_value).strip()
-        if not text:
-            return default_window
-
-        if "-" not in text and "to" not in text:
-            return default_window
-
-        sep = "-" if "-" in text else "to"
-        parts = [p.strip() for p in text.split(sep, 1)]
-        if len(parts) != 2:
-            return default_window
-
-        start = _parse_single_time(parts[0])
-        end = _parse_single_time(parts[1])
-
-        if start is None or end is None:
-            return default_window
-
-        wrap = end < start
-        return (start, end, wrap)
-
-    def _time_to_minutes(raw_time: Any) -> Optional[int]:
-        if raw_time is None:
-            return None
-
-        digits = re.sub(r"\D", "", str(raw_time))
-        if not digits:
-            return None
-
-        if len(digits) == 3:
-            hour = int(digits[0])
-            minute = int(digits[1:])
-        else:
-            hour = int(digits[:2])
-            minute = int(digits[2:4]) if len(digits) >= 4 else 0
-
-        if hour > 24 or minute > 59:
-            return None
-
-        if hour == 24 and minute > 0:
-            hour, minute = 23, 59
-
-        return hour * 60 + minute
-
-    def _is_within_window(raw_time: Any, window: tuple[int, int, bool]) -> bool:
-        if not window:
-            return True
-        start, end, wrap = window
-        if start == 0 and end == 1440 and not wrap:
-            return True
-        minutes = _time_to_minutes(raw_time)
-        if minutes is None:
-            return False
-        if wrap:
-            return minutes >= start or minutes <= end
-        return start <= minutes <= end
-
-    departure_window = _parse_time_window(search_context.get("departure_time_window") if search_context else None)
-    arrival_window = _parse_time_window(search_context.get("arrival_time_window") if search_context else None)
-
-    def _matches_time_filters(flight: Dict[str, Any]) -> bool:
-        legs = flight.get("legs") or []
-        if not legs:
-            return True
-        dep_time = legs[0].get("departure_time")
-        arr_time = legs[-1].get("arrival_time")
-        return _is_within_window(dep_time, departure_window) and _is_within_window(arr_time, arrival_window)
-
-    def _matches_airline_filters(flight: Dict[str, Any]) -> bool:
-        names = search_context.get("airline_names") if search_context else None
-        if not names:
-            return True
-        legs = flight.get("legs") or []
-        if not legs:
-            return False
-        airline = (legs[0].get("airline_name") or "").lower()
-        code = (legs[0].get("airline_code") or "").lower()
-        for name in names:
-            n = str(name).lower()
-            if n in airline or n in code:
-                return True
-        return False
-
-    def _matches_refundable_filters(flight: Dict[str, Any]) -> bool:
-        preference = search_context.get("refundable") if search_context else None
-        if preference is None:
-            return True
-        flag = flight.get("is_refundable")
-        if preference is True:
-            return flag is True
-        if preference is False:
-            return flag is False
-        return True
-
-    stops_filter = _coerce_stops(search_context.get("stops")) if search_context else None
+    filters = filter_spec if filter_spec is not None else FlightFilterSpec.from_context(search_context)
     fastest_flag = bool(search_context.get("fastest")) if search_context else False
 
     outbound_flights = []
@@ -1253,6 +1929,7 @@ def process_flight_results(
 
     airlines_map = search_response.get("C", {})
     flight_details_dict = search_response.get("dctFltDtl", {})
+    leg_index = _LegIndex(flight_details_dict, airlines_map)
     journeys = search_response.get("j", [])
     calendar_suggestions = _build_calendar_suggestions(search_response.get("lstCalendarFareData"))
 
@@ -1277,6 +1954,17 @@ def process_flight_results(
             continue
 
         for segment in segments:
+            # Reject on raw fields first so legs/fares/deeplinks are only built for survivors
+            if not _raw_segment_matches_filters(
+                segment,
+                flight_details_dict,
+                airlines_map,
+                is_international,
+                is_roundtrip,
+                filters,
+            ):
+                continue
+
             processed_flight = process_segment(
                 segment,
                 flight_details_dict,
@@ -1284,25 +1972,27 @@ def process_flight_results(
                 journey_index,
                 is_international,
                 is_roundtrip,
-                search_context
-                
+                search_context,
+                build_link=not defer_deep_links,
+                leg_index=leg_index,
             )
 
-            if (
-                processed_flight
-                and _matches_time_filters(processed_flight)
-                and _matches_airline_filters(processed_flight)
-                and _matches_refundable_filters(processed_flight)
-            ):
+            if processed_flight:
                 if journey_index == 0:
                     outbound_flights.append(processed_flight)
                 elif journey_index == 1 and is_roundtrip:
                     return_flights.append(processed_flight)
 
     if is_international and is_roundtrip:
-        combos = _process_international_combos(journeys, flight_details_dict, airlines_map)
+        combos = _process_international_combos(journeys, flight_details_dict, airlines_map, leg_index)
 
-        if combos and search_context:
+        # Filter before building deeplinks (time window applies to the onward flight only)
+        combo_columns = FlightColumns.for_combos(combos)
+        if not filters.is_empty:
+            combo_columns = combo_columns.select(combo_columns.mask(filters))
+            combos = combo_columns.items
+
+        if combos and search_context and not defer_deep_links:
             passengers = {
                 "adults": search_context.get("adults", 1),
                 "children": search_context.get("children", 0),
@@ -1315,53 +2005,30 @@ def process_flight_results(
                 return_flight=combo["return_flight"],
                 passengers=passengers,
                 )
-        if combos:
-            combos = [
-                combo for combo in combos
-                if _matches_time_filters(combo.get("onward_flight", {}))
-                # and _matches_time_filters(combo.get("return_flight", {}))
-                and _matches_airline_filters(combo.get("onward_flight", {}))
-                and _matches_airline_filters(combo.get("return_flight", {}))
-                and _matches_refundable_filters(combo.get("onward_flight", {}))
-                and _matches_refundable_filters(combo.get("return_flight", {}))
-            ]
     else:
-        combos=[]
-
-    if stops_filter is not None:
-        outbound_flights = [
-            flight for flight in outbound_flights
-            if _coerce_stops(flight.get("total_stops")) == stops_filter
-        ]
-        return_flights = [
-            flight for flight in return_flights
-            if _coerce_stops(flight.get("total_stops")) == stops_filter
-        ]
-        combos = [
-            combo for combo in combos
-            if _coerce_stops(combo.get("onward_flight", {}).get("total_stops")) == stops_filter
-            and _coerce_stops(combo.get("return_flight", {}).get("total_stops")) == stops_filter
-        ]
+        combo_columns = FlightColumns.for_combos([])
 
+    # One view per list, reused for ranking here and for refinements/highlights later
+    columns = {
+        "outbound_flights": FlightColumns(outbound_flights),
+        "return_flights": FlightColumns(return_flights),
+        "international_combos": combo_columns,
+    }
     if fastest_flag:
-        outbound_flights = sorted(outbound_flights, key=_flight_duration_minutes)
-        return_flights = sorted(return_flights, key=_flight_duration_minutes)
-        combos = sorted(
-            combos,
-            key=lambda c: _flight_duration_minutes(c.get("onward_flight", {}))
-            + _flight_duration_minutes(c.get("return_flight", {}))
-        )
+        # Only the first rank_limit rows can be displayed; the rest keep API order
+        columns = {key: view.select(view.ranked("duration", rank_limit)) for key, view in columns.items()}
 
     view_all_link = _build_view_all_link(search_context, use_short_links=use_short_links)
 
     return {
-        "outbound_flights": outbound_flights,
-        "return_flights": return_flights,
+        "outbound_flights": columns["outbound_flights"].items,
+        "return_flights": columns["return_flights"].items,
         "is_roundtrip": is_roundtrip,
         "is_international": is_international,
-        "international_combos": combos,
+        "international_combos": columns["international_combos"].items,
         "viewAll": view_all_link,
         "calendar_suggestions": calendar_suggestions,
+        "_columns": columns,
         }
 
 def process_segment(
@@ -1372,7 +2039,8 @@ def process_segment(
     is_international:bool,
     is_roundtrip,
     search_context: Optional[Dict[str, Any]] = None,
-    
+    build_link: bool = True,
+    leg_index: Optional[_LegIndex] = None,
 ) -> Optional[dict]:
     """Process a single flight segment.
 
@@ -1382,39 +2050,21 @@ def process_segment(
         airlines_map: Dictionary mapping airline codes to names
         journey_index: Index of the journey (0 for outbound, 1 for return)
         search_context: Original search parameters for deep-link building
+        build_link: Whether to build the deepLink now
+        leg_index: Per-response leg memo shared across segments
 
     Returns:
         Processed flight dict or None if segment is invalid
     """
     segment_id = segment.get("id")
     segment_key = segment.get("SK")
-    segment_refundable = _coerce_refundable_flag(segment.get("RF"))
-    bonds=[]
-    if is_international and  not is_roundtrip:
-         bonds = segment.get("l_OB", [])
-    else:
-        bonds = segment.get("b", [])
-    if not isinstance(bonds, list) or len(bonds) == 0:
+    bond = _segment_bond(segment, is_international, is_roundtrip)
+    if bond is None:
         return None
 
-    bond = bonds[0]
-
     journey_time = bond.get("JyTm", "")
-    refundable_flag = _coerce_refundable_flag(bond.get("RF"))
-    if refundable_flag is None:
-        refundable_flag = segment_refundable
-    is_refundable = refundable_flag if refundable_flag is not None else False
-    if is_international and  not is_roundtrip:
-        stops = bond.get("STP", "0")
-        
-
-        stops = re.split(r'[-+]', stops)[0].replace('|', '')
-
-        if stops == "Non":
-            stops=0
-        
-    else:
-        stops = bond.get("stp", "0")
+    is_refundable = _bond_is_refundable(bond, segment)
+    stops = _bond_stops(bond, is_international, is_roundtrip)
     flight_ids = bond.get("FL", [])
 
     # Process flight legs
@@ -1422,30 +2072,13 @@ def process_segment(
     origin = None
     destination = None
 
+    if leg_index is None:
+        leg_index = _LegIndex(flight_details_dict, airlines_map)
+
     for flight_id in flight_ids:
-        flight_detail = flight_details_dict.get(str(flight_id), {})
-        if not flight_detail or not isinstance(flight_detail, dict):
+        leg = leg_index.segment_leg(flight_id)
+        if leg is None:
             continue
-
-        airline_code = flight_detail.get("AC", "")
-        airline_name = airlines_map.get(airline_code, airline_code)
-
-        leg = {
-            "airline_code": airline_code,
-            "airline_name": airline_name,
-            "flight_number": flight_detail.get("FN", ""),
-            "origin": flight_detail.get("OG", ""),
-            "destination": flight_detail.get("DT", ""),
-            "departure_date": flight_detail.get("DDT", ""),
-            "departure_time": flight_detail.get("DTM", ""),
-            "arrival_date": flight_detail.get("ADT", ""),
-            "arrival_time": flight_detail.get("ATM", ""),
-            "cabin": flight_detail.get("CB", ""),
-            "fare_class": flight_detail.get("FCLS", ""),
-            "booking_code": flight_detail.get("FCLS", ""),
-            "duration": flight_detail.get("DUR", ""),
-            "baggage": f"{flight_detail.get('BW', '')} {flight_detail.get('BU', '')}".strip()
-        }
         legs.append(leg)
 
         if origin is None:
@@ -1501,6 +2134,18 @@ def process_segment(
 
     }
 
+    if build_link:
+        flight["deepLink"] = _flight_deep_link(flight, is_international, search_context)
+
+    return flight
+
+
+def _flight_deep_link(
+    flight: Dict[str, Any],
+    is_international: bool,
+    search_context: Optional[Dict[str, Any]],
+) -> str:
+    """Build the booking deeplink for one processed flight."""
     passengers = {
         "adults": search_context.get("adults", 1) if search_context else 1,
         "children": search_context.get("children", 0) if search_context else 0,
@@ -1515,7 +2160,7 @@ def process_segment(
         )
     trip_type = "RoundTrip" if search_context and search_context.get("return_date") else "OneWay"
 
-    flight["deepLink"] = build_deep_link(
+    return build_deep_link(
         is_international,
         flight=flight,
         passengers=passengers,
@@ -1523,7 +2168,44 @@ def process_segment(
         default_departure=default_departure,
     )["deepLink"]
 
-    return flight
+
+def attach_deep_links(
+    flight_results: Dict[str, Any],
+    flights: List[Dict[str, Any]],
+    combos: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """
+    Build deeplinks in place for flights/combos of a search run with defer_deep_links.
+
+    Meant to be called with only the page being returned; items that already
+    have a deepLink are left untouched.
+
+    Args:
+        flight_results: Result of search_flights (supplies dates, passengers, is_international)
+        flights: Processed outbound/return flights to link
+        combos: International round-trip combos to link
+    """
+    passengers = flight_results.get("passengers") or {}
+    search_context = {
+        "adults": passengers.get("adults", 1),
+        "children": passengers.get("children", 0),
+        "infants": passengers.get("infants", 0),
+        "outbound_date": flight_results.get("outbound_date"),
+        "return_date": flight_results.get("return_date"),
+    }
+    is_international = bool(flight_results.get("is_international"))
+
+    for flight in flights:
+        if "deepLink" not in flight:
+            flight["deepLink"] = _flight_deep_link(flight, is_international, search_context)
+
+    for combo in combos or []:
+        if "deepLink" not in combo:
+            combo["deepLink"] = build_roundtrip_combo_deep_link(
+                onward_flight=combo["onward_flight"],
+                return_flight=combo["return_flight"],
+                passengers=passengers,
+            )
 
 def extract_segment_summary(segment: dict) -> dict:
     legs = segment.get("legs") or []
@@ -1713,6 +2395,10 @@ def build_datetime(date_str: Optional[str], time_str: Optional[str]) -> Optional
         return None
 
 
+# Minimum gap between onward arrival and return departure for a domestic round trip
+MIN_ROUNDTRIP_GAP = timedelta(hours=4)
+
+
 def is_valid_domestic_roundtrip(out_flight: dict, ret_flight: dict) -> bool:
     """
     STRICT RULE:
@@ -1733,15 +2419,16 @@ def is_valid_domestic_roundtrip(out_flight: dict, ret_flight: dict) -> bool:
     if not out_arrival or not ret_departure:
         return False
 
-    diff_hours = (ret_departure - out_arrival).total_seconds() / 3600
-    return diff_hours > 4
-from typing import Dict, List, Tuple
+    return ret_departure - out_arrival > MIN_ROUNDTRIP_GAP
 
 
 def filter_domestic_roundtrip_flights(flight_results: Dict) -> Dict:
     """
     Reorders outbound & return flights so that
     valid roundtrip pairs appear FIRST and MATCHED.
+
+    Equivalent to scanning every (outbound, return) pair with
+    is_valid_domestic_roundtrip in index order, but runs in O((N+M) log N).
     """
 
     if not flight_results.get("is_roundtrip"):
@@ -1758,37 +2445,58 @@ def filter_domestic_roundtrip_flights(flight_results: Dict) -> Dict:
         flight_results["return_flights"] = []
         return flight_results
 
-    valid_pairs: List[Tuple[int, int]] = []
-
-    # Step 1: collect valid PAIRS (preserve order)
-    for o_idx, out_f in enumerate(outbound_flights):
-        for r_idx, ret_f in enumerate(return_flights):
-            if is_valid_domestic_roundtrip(out_f, ret_f):
-                valid_pairs.append((o_idx, r_idx))
+    # Step 1: parse each flight's datetimes once (onward arrival / return departure)
+    out_arrivals: List[Optional[datetime]] = []
+    for out_f in outbound_flights:
+        summary = extract_segment_summary(out_f)
+        out_arrivals.append(build_datetime(summary.get("arrival_date"), summary.get("arrival_time")))
+
+    ret_departures: List[Optional[datetime]] = []
+    for ret_f in return_flights:
+        summary = extract_segment_summary(ret_f)
+        ret_departures.append(build_datetime(summary.get("departure_date"), summary.get("departure_time")))
+
+    # A pair is valid when the return departs more than MIN_ROUNDTRIP_GAP after the onward arrival.
+    # Outbounds keep their order and stay if the latest return departure leaves enough gap.
+    latest_return = max((dt for dt in ret_departures if dt), default=None)
+    ordered_outbounds = [
+        out_f
+        for out_f, arrival in zip(outbound_flights, out_arrivals)
+        if arrival and latest_return and latest_return - arrival > MIN_ROUNDTRIP_GAP
+    ]
 
-    if not valid_pairs:
+    if not ordered_outbounds:
         flight_results["outbound_flights"] = []
         flight_results["return_flights"] = []
         return flight_results
 
-    # Step 2: build ordered unique lists based on PAIRS
-    ordered_outbounds = []
-    ordered_returns = []
-
-    seen_out = set()
-    seen_ret = set()
-
-    for o_idx, r_idx in valid_pairs:
-        if o_idx not in seen_out:
-            ordered_outbounds.append(outbound_flights[o_idx])
-            seen_out.add(o_idx)
+    # Step 2: returns are ordered by the first outbound (in list order) they pair with,
+    # then by their own position. Running minimum of arrivals is non-increasing, so
+    # that first outbound is found with a binary search.
+    prefix_min_arrival: List[datetime] = []
+    running_min: Optional[datetime] = None
+    for arrival in out_arrivals:
+        if arrival and (running_min is None or arrival < running_min):
+            running_min = arrival
+        prefix_min_arrival.append(running_min or datetime.max)
+
+    keyed_returns: List[Tuple[int, int]] = []
+    for r_idx, departure in enumerate(ret_departures):
+        if not departure:
+            continue
+        latest_arrival = departure - MIN_ROUNDTRIP_GAP
+        first_out = bisect_left(
+            range(len(prefix_min_arrival)),
+            True,
+            key=lambda o_idx: prefix_min_arrival[o_idx] < latest_arrival,
+        )
+        if first_out < len(prefix_min_arrival):
+            keyed_returns.append((first_out, r_idx))
 
-        if r_idx not in seen_ret:
-            ordered_returns.append(return_flights[r_idx])
-            seen_ret.add(r_idx)
+    keyed_returns.sort()
+    ordered_returns = [return_flights[r_idx] for _, r_idx in keyed_returns]
 
     flight_results["outbound_flights"] = ordered_outbounds
     flight_results["return_flights"] = ordered_returns
 
     return flight_results
-
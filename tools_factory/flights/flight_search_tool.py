@@ -4,8 +4,9 @@ from pydantic import ValidationError
 
 from emt_client.utils import generate_short_link
 from .flight_schema import FlightSearchInput,WhatsappFlightFinalResponse,WhatsappFlightFormat
-from .flight_search_service import search_flights,build_whatsapp_flight_response,filter_domestic_roundtrip_flights,build_suggestion_text
+from .flight_search_service import search_flights,build_whatsapp_flight_response,filter_domestic_roundtrip_flights,build_suggestion_text,attach_deep_links,FlightFilterSpec
 from .flight_renderer import render_flight_results
+from .flight_columns import FlightColumns
 from tools_factory.base_schema import ToolResponseFormat 
 
 
@@ -130,8 +131,14 @@ class FlightSearchTool(BaseTool):
             arrival_time_window=payload.arrival_time_window,
             airline_names=payload.airline_names,
             use_short_links=not is_chatGPT,
+            defer_deep_links=True,
+            # WhatsApp re-filters round trips after the search, so it needs every row ranked
+            rank_limit=None if is_whatsapp else payload.page * limit,
+            filter_spec=FlightFilterSpec.from_input(payload),
         )
         has_error = bool(flight_results.get("error")) 
+        # Parsed columns of each list; internal, never part of the response
+        result_columns = flight_results.pop("_columns", None) or {}
         
         # --------------------------------------------------
         # Passenger context (required for deeplinks)
@@ -161,6 +168,18 @@ class FlightSearchTool(BaseTool):
         total_return_count = len(all_return)
         total_combo_count = len(all_combos)
 
+        # Where the cheapest/fastest options sit across all pages, found in one pass
+        if not has_error:
+            use_combos = bool(is_international and all_combos)
+            highlight_rows = all_combos if use_combos else all_outbound
+            highlight_columns = result_columns.get("international_combos" if use_combos else "outbound_flights")
+            if highlight_columns is None or highlight_columns.items is not highlight_rows:
+                # The WhatsApp round-trip pairing replaced the list after the search
+                highlight_columns = (
+                    FlightColumns.for_combos(all_combos) if use_combos else FlightColumns(all_outbound)
+                )
+            flight_results["highlights"] = highlight_columns.highlights(limit)
+
         # DEBUG
         # print(f"DEBUG: Total outbound flights: {total_outbound_count}")
         # print(f"DEBUG: Total return flights: {total_return_count}")
@@ -187,9 +206,15 @@ class FlightSearchTool(BaseTool):
         # print(f"DEBUG: Paginated combos count: {len(paginated_combos)}")
 
         # --------------------------------------------------
-        # Generate short links for PAGINATED flights
+        # Build deep links + short links for PAGINATED flights only
         # --------------------------------------------------
         if not is_chatGPT:
+            attach_deep_links(
+                flight_results,
+                paginated_outbound + paginated_return,
+                paginated_combos,
+            )
+
             if is_international and paginated_combos:
                 paginated_combos = generate_short_link(
                     paginated_combos,
@@ -0,0 +1,141 @@
+"""
+Columnar index over a hotel listing for local filtering and sorting.
+
+Refining a hotel search ("only 4-star", "sort by price", "under 5000")
+used to send a new HotelListIdWiseNew search plus city resolution.
+HotelIndex parses the listing once into flat arrays (price, star rating)
+so price/star filters and price sorts are applied in-process over the
+last unfiltered listing for the same city/dates/pax, when that listing
+holds the whole inventory rather than the first hotel_count popular
+hotels. Operations return row indices; rows() maps them back to the
+original hotel dicts.
+
+Only fields the listing records carry are indexed. Guest (TA) rating and
+amenities are not part of a listing record, so those filters still go
+upstream and are part of the listing identity.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .hotel_schema import HotelSearchInput, SortType
+
+MISSING = -1
+
+# HotelSearchInput.max_price default, i.e. "no upper bound"
+NO_MAX_PRICE = HotelSearchInput.model_fields["max_price"].default
+
+
+def _to_price(hotel: Dict[str, Any]) -> float:
+    try:
+        return float((hotel.get("price") or {}).get("amount"))
+    except (TypeError, ValueError):
+        return MISSING
+
+
+def _to_stars(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return MISSING
+
+
+@dataclass(frozen=True)
+class HotelRefinement:
+    """
+    The part of a hotel search HotelIndex can apply locally.
+
+    Price bounds are None when unset; stars is a sorted tuple of star
+    ratings. Immutable and hashable, like the flight/bus filter specs.
+    """
+
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    stars: Tuple[int, ...] = ()
+    sort_type: str = SortType.POPULARITY.value
+
+    @classmethod
+    def from_input(cls, search_input: HotelSearchInput) -> "HotelRefinement":
+        max_price = search_input.max_price
+        return cls(
+            min_price=search_input.min_price,
+            max_price=None if max_price == NO_MAX_PRICE else max_price,
+            stars=tuple(sorted({s for s in map(_to_stars, search_input.rating or ()) if s != MISSING})),
+            sort_type=search_input.sort_type,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self == _NO_REFINEMENT
+
+    @staticmethod
+    def base_input(search_input: HotelSearchInput) -> HotelSearchInput:
+        """The same search without the locally applied filters and sort."""
+        return search_input.model_copy(update={
+            "min_price": None,
+            "max_price": NO_MAX_PRICE,
+            "rating": None,
+            "sort_type": SortType.POPULARITY.value,
+        })
+
+
+_NO_REFINEMENT = HotelRefinement()
+
+
+class HotelIndex:
+    """
+    Parallel arrays built once from a list of processed hotels.
+
+    Columns: price (price.amount after discount, -1 if unknown) and stars
+    (star rating, -1 if unknown). Row order is the listing order, i.e.
+    upstream popularity.
+    """
+
+    def __init__(self, hotels: List[Dict[str, Any]]):
+        self.items = hotels
+        self.price = array("d", map(_to_price, hotels))
+        self.stars = array("b", (_to_stars(hotel.get("rating")) for hotel in hotels))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def mask(self, refinement: HotelRefinement) -> List[int]:
+        """Indices of hotels passing the price/star filters, in listing order."""
+        low = refinement.min_price
+        high = refinement.max_price
+        stars = set(refinement.stars)
+        price = self.price
+        star_column = self.stars
+
+        indices = []
+        for i in range(len(self.items)):
+            if stars and star_column[i] not in stars:
+                continue
+            if low is not None or high is not None:
+                amount = price[i]
+                if amount == MISSING:
+                    continue
+                if low is not None and amount < low:
+                    continue
+                if high is not None and amount > high:
+                    continue
+            indices.append(i)
+        return indices
+
+    def order(self, indices: List[int], sort_type: str) -> List[int]:
+        """Sort indices for sort_type; ties (and popularity) keep listing order."""
+        if sort_type == SortType.PRICE_LOW_TO_HIGH.value:
+            price = self.price
+            return sorted(indices, key=lambda i: (price[i] == MISSING, price[i]))
+        if sort_type == SortType.PRICE_HIGH_TO_LOW.value:
+            price = self.price
+            return sorted(indices, key=lambda i: (price[i] == MISSING, -price[i]))
+        return list(indices)
+
+    def select(self, refinement: HotelRefinement) -> List[int]:
+        return self.order(self.mask(refinement), refinement.sort_type)
+
+    def rows(self, indices: List[int]) -> List[Dict[str, Any]]:
+        items = self.items
+        return [items[i] for i in indices]
@@ -1,17 +1,192 @@
-from typing import Dict, Any,List
+import asyncio
+from datetime import datetime
+from typing import Dict, Any,List, Optional, Set
+from urllib.parse import quote
 
 from .hotel_schema import (
     WhatsappHotelFormat,
     WhatsappHotelFinalResponse,
 )
 from .hotel_schema import HotelSearchInput
+from .hotel_index import HotelIndex, HotelRefinement
+from emt_client.cache import get_cache
 from emt_client.clients.hotel_client import HotelApiClient
-from emt_client.config import HOTEL_SEARCH_URL
-from emt_client.utils import resolve_city_name, generate_hotel_search_key, generate_short_link
+from emt_client.config import (
+    HOTEL_DEEPLINK,
+    HOTEL_DETAILS_URL,
+    HOTEL_SEARCH_URL,
+    HOTEL_PREFETCH_PAGES,
+    HOTEL_LISTING_CACHE_TTL,
+    HOTEL_MULTI_SEARCH_CONCURRENCY,
+    HOTEL_MULTI_SEARCH_TIMEOUT,
+    HOTEL_MULTI_SEARCH_MAX_CITIES,
+    HOTEL_DETAILS_ENRICH_COUNT,
+    HOTEL_DETAILS_CONCURRENCY,
+    HOTEL_DETAILS_CACHE_TTL,
+    HOTEL_DETAILS_BUDGET,
+)
+from emt_client.concurrency import run_with_deadline
+from emt_client.utils import resolve_city_name, generate_hotel_search_key, generate_short_link, gen_trace_id
 from .hotel_schema import HotelSearchInput
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 
+def get_hotel_listing_cache():
+    """Shared cache of progressively loaded hotel listings (see search_progressive)."""
+    return get_cache("hotel_listing", ttl_seconds=HOTEL_LISTING_CACHE_TTL)
+
+
+def get_hotel_details_cache():
+    """Shared cache of hotel details per hotel id and stay dates (see enrich_hotels)."""
+    return get_cache("hotel_details", ttl_seconds=HOTEL_DETAILS_CACHE_TTL)
+
+
+# Detail fetches still running after a search's budget ran out, kept referenced until done
+_detail_fetches: Set[asyncio.Task] = set()
+
+# Details attached to listed hotels, with the upstream key spellings tried for each
+_DETAIL_FIELDS = {
+    "description": ("Description", "description", "desc"),
+    "address": ("Address", "address", "adrs"),
+    "amenities": ("Amenities", "amenities", "amen"),
+    "images": ("Images", "images", "imgs"),
+    "checkInTime": ("CheckInTime", "checkInTime"),
+    "checkOutTime": ("CheckOutTime", "checkOutTime"),
+    "policies": ("Policies", "policies", "HotelPolicy"),
+}
+_DETAIL_IMAGE_LIMIT = 5
+
+
+def _summarize_hotel_details(response: Any) -> Optional[Dict[str, Any]]:
+    """The _DETAIL_FIELDS of a hotel details response, or None if it has none of them."""
+    if not isinstance(response, dict):
+        return None
+    data = response.get("HotelDetails") or response.get("hotelDetails") or response.get("data") or response
+    if not isinstance(data, dict):
+        return None
+
+    details = {}
+    for field, keys in _DETAIL_FIELDS.items():
+        value = next((data[key] for key in keys if data.get(key)), None)
+        if value is not None:
+            details[field] = value
+    if isinstance(details.get("images"), list):
+        details["images"] = details["images"][:_DETAIL_IMAGE_LIMIT]
+    return details or None
+
+
+class HotelDeepLinkBuilder:
+    """
+    Hotel details deeplinks for one search.
+
+    Only the hotel ids and the trace id differ between the hotels of a
+    search, so the city, dates, rooms, pax and coordinates are formatted
+    once into a prefix and build() just fills in the per-hotel fields.
+    """
+
+    __slots__ = ("prefix", "suffix")
+
+    def __init__(
+        self,
+        city_name: str,
+        check_in: str,
+        check_out: str,
+        num_rooms: int,
+        pax_string: str,
+        lat: Any = None,
+        lon: Any = None,
+        stype: Any = None,
+    ):
+        encoded_city = quote(city_name, safe="")
+        check_in_fmt = datetime.strptime(check_in, "%Y-%m-%d").strftime("%d/%m/%Y")
+        check_out_fmt = datetime.strptime(check_out, "%Y-%m-%d").strftime("%d/%m/%Y")
+
+        self.prefix = (
+            f"{HOTEL_DEEPLINK}"
+            f"cityName={encoded_city}&"
+            f"sText={encoded_city}&"
+            f"checkinDate={check_in_fmt}&"
+            f"checkoutDate={check_out_fmt}&"
+            f"Rooms={num_rooms}&"
+            f"pax={pax_string}&"
+            f"lat={lat}&"
+            f"lon={lon}&"
+            f"emthid="
+        )
+        self.suffix = f"&stype={stype}"
+
+    def build(self, emt_id: Any = "", hotel_id: Any = "", trace_id: Optional[str] = None) -> Dict[str, str]:
+        """Create the EMT hotel deep-link and trace id for one hotel."""
+        link_trace_id = trace_id or gen_trace_id()
+        deep_link = f"{self.prefix}{emt_id}&hid={hotel_id}&tid={link_trace_id}{self.suffix}"
+        return {"deepLink": deep_link, "traceId": link_trace_id}
+
+
+class _HotelListing:
+    """
+    Hotels of one search, loaded page by page from HotelListIdWiseNew.
+
+    Upstream pages are fetched one at a time under `lock`, so a "show more"
+    request and the background prefetch never ask for the same page twice.
+    """
+
+    __slots__ = (
+        "search_input", "context", "page_size", "use_short_links", "result", "hotels",
+        "hotel_ids", "next_page", "exhausted", "complete", "lock", "prefetch",
+        "prefetch_target", "_index",
+    )
+
+    def __init__(self, search_input: HotelSearchInput, context: Dict[str, Any], page_size: int, use_short_links: bool):
+        self.search_input = search_input
+        self.context = context
+        self.page_size = page_size
+        self.use_short_links = use_short_links
+        self.result: Dict[str, Any] = {}
+        self.hotels: List[Dict[str, Any]] = []
+        self.hotel_ids = set()
+        self.next_page = 1
+        self.exhausted = False
+        # Upstream ran out of hotels (as opposed to hitting hotel_count)
+        self.complete = False
+        self.lock = asyncio.Lock()
+        self.prefetch: Optional[asyncio.Task] = None
+        self.prefetch_target = 0
+        self._index: Optional[HotelIndex] = None
+
+    def add_page(self, hotels: List[Dict[str, Any]], upstream_count: int) -> None:
+        """Append one processed upstream page, skipping hotels already listed."""
+        for hotel in hotels:
+            hotel_id = hotel.get("hotelId")
+            if hotel_id in self.hotel_ids:
+                continue
+            self.hotel_ids.add(hotel_id)
+            self.hotels.append(hotel)
+        self.next_page += 1
+
+        limit = self.search_input.hotel_count
+        if upstream_count < self.page_size:
+            self.complete = True
+        if self.complete or len(self.hotels) >= limit:
+            del self.hotels[limit:]
+            self.exhausted = True
+
+    def index(self) -> Optional[HotelIndex]:
+        """HotelIndex over the listing, built once it is fully loaded."""
+        if self._index is None and self.exhausted:
+            self._index = HotelIndex(self.hotels)
+        return self._index
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Search result with every hotel loaded so far (hotel dicts are copies)."""
+        hotels = [dict(hotel) for hotel in self.hotels]
+        return {
+            **self.result,
+            "totalResults": len(hotels),
+            "hotels": hotels,
+            "has_more": not self.exhausted,
+        }
+
+
 class HotelSearchService:
     """Service layer for hotel search operations"""
     def _generate_view_all(self, deeplink: str, use_short_links: bool = True) -> str:
@@ -128,46 +303,93 @@ class HotelSearchService:
             })
         return rooms
     
+    async def _resolve_search(self, search_input: HotelSearchInput) -> Dict[str, Any]:
+        """Resolve the city and search key shared by every page of a search."""
+        # Step 1: Resolve city names
+        resolved_city, lat, lon, stype = await resolve_city_name(search_input.city_name)
+
+        # Step 2: Generate search key
+        search_key = generate_hotel_search_key(
+            city_code=resolved_city,
+            check_in=search_input.check_in_date,
+            check_out=search_input.check_out_date,
+            num_rooms=search_input.num_rooms,
+            num_adults=search_input.num_adults,
+            num_children=search_input.num_children,
+        )
+        return {
+            "resolved_city": resolved_city,
+            "lat": lat,
+            "lon": lon,
+            "stype": stype,
+            "search_key": search_key,
+        }
+
+    def _build_payload(self, search_input: HotelSearchInput, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the HotelListIdWiseNew request payload (tokens auto-injected by client)."""
+        resolved_city = context["resolved_city"]
+        return {
+            "CheckInDate": search_input.check_in_date,
+            "CheckOut": search_input.check_out_date,
+            "CityCode": resolved_city,
+            "CityName": resolved_city,
+            "HotelCount": search_input.hotel_count,
+            "PageNo": search_input.page_no,
+            "NoOfRooms": search_input.num_rooms,
+            "RoomDetails": self._build_room_details(search_input),
+            "lat": context["lat"],
+            "lon": context["lon"],
+            "SearchKey": context["search_key"],
+            "hotelid": [],
+            "maxPrice": search_input.max_price,
+            "minPrice": search_input.min_price or 1,
+            "sorttype": search_input.sort_type,
+            "wlcode": "",
+            "selectedAmen": search_input.amenities or [],
+            "selectedRating": search_input.rating or [],
+            "selectedTARating": search_input.user_rating or [],
+            "searchType": context["stype"],
+        }
+
+    def _error_result(
+        self,
+        search_input: HotelSearchInput,
+        error: str,
+        message: str,
+        search_key: str = "",
+        city: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        city = city or search_input.city_name
+        return {
+            "error": error,
+            "message": message,
+            "searchKey": search_key,
+            "city": city,
+            "city_name": city,
+            "check_in": search_input.check_in_date,
+            "check_in_date": search_input.check_in_date,
+            "checkIn": search_input.check_in_date,
+            "check_out": search_input.check_out_date,
+            "check_out_date": search_input.check_out_date,
+            "checkOut": search_input.check_out_date,
+            "num_rooms": search_input.num_rooms,
+            "num_adults": search_input.num_adults,
+            "num_children": search_input.num_children,
+            "totalResults": 0,
+            "total_results": 0,
+            "hotels": [],
+        }
+
     async def search(self, search_input: HotelSearchInput, use_short_links: bool = True) -> Dict[str, Any]:
         """Execute hotel search workflow"""
         
         try:
-            # Step 1: Resolve city names
-            resolved_city, lat, lon, stype = await resolve_city_name(search_input.city_name)
-            
-            # Step 2: Generate search key
-            search_key = generate_hotel_search_key(
-                city_code=resolved_city,
-                check_in=search_input.check_in_date,
-                check_out=search_input.check_out_date,
-                num_rooms=search_input.num_rooms,
-                num_adults=search_input.num_adults,
-                num_children=search_input.num_children,
-            )
+            context = await self._resolve_search(search_input)
+            resolved_city = context["resolved_city"]
+            search_key = context["search_key"]
             
             # Step 3: Build request payload (tokens auto-injected by client)
-            payload = {
-                "CheckInDate": search_input.check_in_date,
-                "CheckOut": search_input.check_out_date,
-                "CityCode": resolved_city,
-                "CityName": resolved_city,
-                "HotelCount": search_input.hotel_count,
-                "PageNo": search_input.page_no,
-                "NoOfRooms": search_input.num_rooms,
-                "RoomDetails": self._build_room_details(search_input),
-                "lat": lat,
-                "lon": lon,
-                "SearchKey": search_key,
-                "hotelid": [],
-                "maxPrice": search_input.max_price,
-                "minPrice": search_input.min_price or 1,
-                "sorttype": search_input.sort_type,
-                "wlcode": "",
-                "selectedAmen": search_input.amenities or [],
-                "selectedRating": search_input.rating or [],
-                "selectedTARating": search_input.user_rating or [],
-                "searchType":stype,
-            }
+            payload = self._build_payload(search_input, context)
 
             # print(f"DEBUG: Hotel API payload HotelCount: {payload.get('HotelCount')}")
 
@@ -177,52 +399,440 @@ class HotelSearchService:
             
             # Step 5: Validate response
             if response is None:
-                return {
-                    "error": "API_ERROR",
-                    "message": "Hotel API returned no response",
-                    "searchKey": search_key,
-                    "city": resolved_city,
-                    "city_name": resolved_city,
-                    "check_in": search_input.check_in_date,
-                    "check_in_date": search_input.check_in_date,
-                    "checkIn": search_input.check_in_date,
-                    "check_out": search_input.check_out_date,
-                    "check_out_date": search_input.check_out_date,
-                    "checkOut": search_input.check_out_date,
-                    "num_rooms": search_input.num_rooms,
-                    "num_adults": search_input.num_adults,
-                    "num_children": search_input.num_children,
-                    "totalResults": 0,
-                    "total_results": 0,
-                    "hotels": [],
-                }
+                return self._error_result(
+                    search_input,
+                    "API_ERROR",
+                    "Hotel API returned no response",
+                    search_key=search_key,
+                    city=resolved_city,
+                )
             
             
             # Step 6: Process response
-            return self._process_response(response, resolved_city, search_input, search_key, lat, lon, stype, use_short_links=use_short_links)
+            return self._process_response(
+                response, resolved_city, search_input, search_key,
+                context["lat"], context["lon"], context["stype"],
+                use_short_links=use_short_links,
+            )
             
         except Exception as e:
             # Return error with details
             import traceback
+            return self._error_result(search_input, "SEARCH_ERROR", f"{str(e)} - {traceback.format_exc()}")
+
+    # ------------------------------------------------------------------
+    # Progressive listing
+    # ------------------------------------------------------------------
+
+    def _listing_key(self, search_input: HotelSearchInput, page_size: int, use_short_links: bool) -> tuple:
+        """Everything except the UI page that shapes a hotel listing."""
+        return (
+            search_input.city_name.strip().lower(),
+            search_input.check_in_date,
+            search_input.check_out_date,
+            tuple(tuple(room.values()) for room in self._build_room_details(search_input)),
+            search_input.min_price,
+            search_input.max_price,
+            search_input.sort_type,
+            tuple(search_input.amenities or ()),
+            tuple(search_input.rating or ()),
+            tuple(search_input.user_rating or ()),
+            search_input.hotel_count,
+            page_size,
+            use_short_links,
+        )
+
+    async def _fetch_listing_page(self, listing: _HotelListing) -> bool:
+        """Fetch the listing's next upstream page; False if the call failed."""
+        page_input = listing.search_input.model_copy(
+            update={"hotel_count": listing.page_size, "page_no": listing.next_page}
+        )
+        context = listing.context
+        try:
+            response = await self.client.search(HOTEL_SEARCH_URL, self._build_payload(page_input, context))
+        except Exception:
+            return False
+        if response is None:
+            return False
+
+        page = self._process_response(
+            response, context["resolved_city"], page_input, context["search_key"],
+            context["lat"], context["lon"], context["stype"],
+            # View All link is only taken from the first page
+            use_short_links=listing.use_short_links and listing.next_page == 1,
+        )
+        if listing.next_page == 1:
+            listing.result = {key: value for key, value in page.items() if key != "hotels"}
+        listing.add_page(page["hotels"], len(response.get("htllist") or []))
+        return True
+
+    async def _load_hotels(self, listing: _HotelListing, target: int) -> None:
+        """Fetch upstream pages until `target` hotels are loaded, the listing ends or a call fails."""
+        while len(listing.hotels) < target and not listing.exhausted:
+            async with listing.lock:
+                if len(listing.hotels) >= target or listing.exhausted:
+                    return
+                if not await self._fetch_listing_page(listing):
+                    return
+
+    async def _prefetch_listing(self, listing: _HotelListing) -> None:
+        target = None
+        while target != listing.prefetch_target:
+            target = listing.prefetch_target
+            await self._load_hotels(listing, target)
+
+    def _schedule_prefetch(self, listing: _HotelListing, target: int) -> None:
+        """Load the listing up to `target` hotels in the background."""
+        listing.prefetch_target = max(listing.prefetch_target, target)
+        if listing.exhausted or len(listing.hotels) >= listing.prefetch_target:
+            return
+        if listing.prefetch is None or listing.prefetch.done():
+            listing.prefetch = asyncio.get_running_loop().create_task(self._prefetch_listing(listing))
+
+    def _refine_listing(
+        self,
+        search_input: HotelSearchInput,
+        page_size: int,
+        use_short_links: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Apply price/star filters and sort locally over the cached unfiltered listing.
+
+        Only a listing for the same city/dates/pax that holds the whole
+        inventory (upstream ran out before hotel_count) is used; it is
+        indexed once. A listing capped at hotel_count only has the most
+        popular hotels, so filtering or price-sorting it would pass off part
+        of the matches as all of them. Returns None (search upstream) when
+        there is nothing to refine or no such listing is cached.
+        """
+        refinement = HotelRefinement.from_input(search_input)
+        if refinement.is_empty:
+            return None
+
+        base_input = HotelRefinement.base_input(search_input)
+        base = get_hotel_listing_cache().get(self._listing_key(base_input, page_size, use_short_links))
+        if base is None:
+            return None
+
+        if not base.complete:
+            return None
+
+        index = base.index()
+        rows = index.select(refinement)
+        hotels = [dict(hotel) for hotel in index.rows(rows)]
+        return {
+            **base.result,
+            "totalResults": len(hotels),
+            "hotels": hotels,
+            "has_more": False,
+        }
+
+    async def search_progressive(
+        self,
+        search_input: HotelSearchInput,
+        page_size: int,
+        use_short_links: bool = True,
+        prefetch_pages: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Hotel search that loads upstream pages of `page_size` as they are needed.
+
+        The first call only requests enough hotels for UI page
+        `search_input.page`, so the first results come back quickly. The
+        next `prefetch_pages` (default HOTEL_PREFETCH_PAGES) upstream pages
+        are then fetched in the background into a listing cached for
+        HOTEL_LISTING_CACHE_TTL. "Show more" for the same search is served
+        from that listing, waiting only for pages not loaded yet.
+        search_input.hotel_count caps the listing as it caps search().
+
+        Price/star filters and sorts are applied locally when the same
+        search without them is cached and holds the whole inventory (see
+        _refine_listing).
+
+        Returns the search() result shape with every hotel loaded so far,
+        plus `has_more` while upstream pages remain.
+        """
+        if prefetch_pages is None:
+            prefetch_pages = HOTEL_PREFETCH_PAGES
+        page_size = max(1, min(page_size, search_input.hotel_count))
+        needed = min(search_input.page * page_size, search_input.hotel_count)
+
+        refined = self._refine_listing(search_input, page_size, use_short_links)
+        if refined is not None:
+            return refined
+
+        key = self._listing_key(search_input, page_size, use_short_links)
+        cache = get_hotel_listing_cache()
+        listing = cache.get(key)
+
+        try:
+            if listing is None:
+                context = await self._resolve_search(search_input)
+                listing = _HotelListing(search_input, context, page_size, use_short_links)
+                await self._load_hotels(listing, needed)
+                if listing.next_page == 1:
+                    return self._error_result(
+                        search_input,
+                        "API_ERROR",
+                        "Hotel API returned no response",
+                        search_key=context["search_key"],
+                        city=context["resolved_city"],
+                    )
+                cache.set(key, listing)
+            else:
+                await self._load_hotels(listing, needed)
+        except Exception as e:
+            import traceback
+            return self._error_result(search_input, "SEARCH_ERROR", f"{str(e)} - {traceback.format_exc()}")
+
+        self._schedule_prefetch(listing, needed + max(prefetch_pages, 0) * page_size)
+        return listing.snapshot()
+
+    # ------------------------------------------------------------------
+    # Detail enrichment
+    # ------------------------------------------------------------------
+
+    def _details_key(self, hotel: Dict[str, Any], search_input: HotelSearchInput) -> tuple:
+        return (hotel.get("hotelId"), search_input.check_in_date, search_input.check_out_date)
+
+    async def get_hotel_details(
+        self,
+        hotel: Dict[str, Any],
+        search_input: HotelSearchInput,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Details of one listed hotel for the search's stay dates, or None if unavailable.
+
+        Cached for HOTEL_DETAILS_CACHE_TTL per hotel id and dates; failed
+        lookups are not cached. The returned dict is shared and read-only.
+        """
+        async def fetch():
+            payload = {
+                "HotelId": hotel.get("hotelId"),
+                "EmtId": hotel.get("emtId"),
+                "CheckInDate": search_input.check_in_date,
+                "CheckOut": search_input.check_out_date,
+            }
+            try:
+                response = await self.client.get_hotel_details(HOTEL_DETAILS_URL, payload)
+            except Exception:
+                return None
+            return _summarize_hotel_details(response)
+
+        return await get_hotel_details_cache().get_or_fetch(self._details_key(hotel, search_input), fetch)
+
+    async def enrich_hotels(
+        self,
+        hotels: List[Dict[str, Any]],
+        search_input: HotelSearchInput,
+        count: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        budget: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Details of the first `count` hotels (default HOTEL_DETAILS_ENRICH_COUNT), keyed by hotelId.
+
+        Cached details are returned at once. The rest are fetched with at
+        most `concurrency` (default HOTEL_DETAILS_CONCURRENCY) requests in
+        flight and waited for up to `budget` seconds (default
+        HOTEL_DETAILS_BUDGET), so a slow details API never holds up the
+        listing. Fetches still running then finish in the background and
+        only warm the cache for the next view of the page.
+        """
+        count = HOTEL_DETAILS_ENRICH_COUNT if count is None else count
+        concurrency = HOTEL_DETAILS_CONCURRENCY if concurrency is None else concurrency
+        budget = HOTEL_DETAILS_BUDGET if budget is None else budget
+
+        cache = get_hotel_details_cache()
+        details: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        seen = set()
+        for hotel in hotels[:max(count, 0)]:
+            hotel_id = hotel.get("hotelId")
+            if not hotel_id or hotel_id in seen:
+                continue
+            seen.add(hotel_id)
+            cached = cache.get(self._details_key(hotel, search_input))
+            if cached is not None:
+                details[hotel_id] = cached
+            else:
+                missing.append(hotel)
+        if not missing:
+            return details
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _fetch(hotel: Dict[str, Any]) -> None:
+            async with semaphore:
+                value = await self.get_hotel_details(hotel, search_input)
+            if value is not None:
+                details[hotel["hotelId"]] = value
+
+        async def _fetch_all() -> None:
+            await asyncio.gather(*(_fetch(hotel) for hotel in missing))
+
+        task = asyncio.get_running_loop().create_task(_fetch_all())
+        _detail_fetches.add(task)
+        task.add_done_callback(_detail_fetches.discard)
+        await asyncio.wait({task}, timeout=max(budget, 0))
+        # The background fetch keeps filling `details`; hand out what is ready now
+        return dict(details)
+
+    # ------------------------------------------------------------------
+    # Multi-city search
+    # ------------------------------------------------------------------
+
+    async def search_multi_city(
+        self,
+        search_input: HotelSearchInput,
+        cities: List[str],
+        top_k: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+        timeout: Optional[float] = None,
+        use_short_links: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Search hotels in several cities at once ("Goa or Gokarna").
+
+        search_input supplies dates, pax, filters and sort for every city;
+        its city_name is not searched. Cities are resolved concurrently while
+        the hotel token is fetched once for the shared client, then the
+        searches run with at most `max_concurrent` (default
+        HOTEL_MULTI_SEARCH_CONCURRENCY) in flight under one deadline of
+        `timeout` seconds (default HOTEL_MULTI_SEARCH_TIMEOUT). Cities
+        resolving to the same place are searched once.
+
+        Returns per-city results in `cities` (status, searchKey, viewAll and
+        the city's first `top_k` hotels) and the merged `hotels`: every
+        city's hotels deduplicated by hotel id and ranked by
+        search_input.sort_type (popularity interleaves the cities' own
+        rankings), each tagged with the `city_index` it came from.
+        `top_k` (default all) caps both views.
+        """
+        terms: Dict[str, str] = {}
+        for city in cities:
+            city = (city or "").strip()
+            if city:
+                terms.setdefault(city.lower(), city)
+        if not terms or len(terms) > HOTEL_MULTI_SEARCH_MAX_CITIES:
             return {
-                "error": "SEARCH_ERROR",
-                "message": f"{str(e)} - {traceback.format_exc()}",
+                **self._error_result(
+                    search_input,
+                    "TOO_MANY_CITIES" if terms else "NO_CITIES",
+                    f"Between 1 and {HOTEL_MULTI_SEARCH_MAX_CITIES} cities can be searched at once.",
+                    city=" / ".join(terms.values()),
+                ),
+                "is_multi_city": True,
+                "cities": [],
+            }
+
+        inputs = [search_input.model_copy(update={"city_name": term}) for term in terms.values()]
+        # A failed token fetch is not fatal here: it surfaces again as each city's search error
+        _, *contexts = await asyncio.gather(
+            self.client.token_provider.get_tokens(),
+            *(self._resolve_search(city_input) for city_input in inputs),
+            return_exceptions=True,
+        )
+
+        city_results: List[Dict[str, Any]] = []
+        searches: Dict[str, tuple] = {}
+        seen_cities = set()
+        for city_input, context in zip(inputs, contexts):
+            entry = {
+                "query": city_input.city_name,
+                "city": city_input.city_name,
                 "searchKey": "",
-                "city": search_input.city_name,
-                "city_name": search_input.city_name,
-                "check_in": search_input.check_in_date,
-                "check_in_date": search_input.check_in_date,
-                "checkIn": search_input.check_in_date,
-                "check_out": search_input.check_out_date,
-                "check_out_date": search_input.check_out_date,
-                "checkOut": search_input.check_out_date,
-                "num_rooms": search_input.num_rooms,
-                "num_adults": search_input.num_adults,
-                "num_children": search_input.num_children,
+                "viewAll": "",
                 "totalResults": 0,
-                "total_results": 0,
                 "hotels": [],
             }
+            if isinstance(context, BaseException):
+                entry.update(status="error", message=str(context))
+            else:
+                if context["resolved_city"] in seen_cities:
+                    continue
+                seen_cities.add(context["resolved_city"])
+                entry.update(city=context["resolved_city"], searchKey=context["search_key"])
+                searches[str(len(city_results))] = (city_input, context)
+            city_results.append(entry)
+
+        async def _search_city(key: str) -> Dict[str, Any]:
+            city_input, context = searches[key]
+            response = await self.client.search(HOTEL_SEARCH_URL, self._build_payload(city_input, context))
+            if response is None:
+                raise ValueError("Hotel API returned no response")
+            return self._process_response(
+                response, context["resolved_city"], city_input, context["search_key"],
+                context["lat"], context["lon"], context["stype"],
+                use_short_links=use_short_links,
+            )
+
+        outcomes = await run_with_deadline(
+            {key: (lambda key=key: _search_city(key)) for key in searches},
+            max_concurrent or HOTEL_MULTI_SEARCH_CONCURRENCY,
+            timeout if timeout is not None else HOTEL_MULTI_SEARCH_TIMEOUT,
+        )
+
+        ranked: List[tuple] = []
+        for index, entry in enumerate(city_results):
+            if str(index) not in outcomes:
+                continue
+            status, value = outcomes[str(index)]
+            if status != "ok":
+                entry["status"] = status
+                if status == "error":
+                    entry["message"] = str(value)
+                continue
+            hotels = value["hotels"]
+            entry.update(
+                status="ok" if hotels else "no_hotels",
+                searchKey=value["searchKey"],
+                viewAll=value["viewAll"],
+                totalResults=len(hotels),
+                hotels=hotels[:top_k],
+            )
+            ranked.extend((position, index, hotel) for position, hotel in enumerate(hotels))
+
+        # Popularity order across cities: each city's first hotel, then each city's second, ...
+        ranked.sort(key=lambda row: row[0])
+        merged = []
+        hotel_ids = set()
+        for _, index, hotel in ranked:
+            hotel_id = hotel.get("hotelId")
+            if hotel_id in hotel_ids:
+                continue
+            hotel_ids.add(hotel_id)
+            merged.append({**hotel, "city_index": index})
+        duplicates = len(ranked) - len(merged)
+        hotel_index = HotelIndex(merged)
+        merged = hotel_index.rows(hotel_index.order(list(range(len(merged))), search_input.sort_type)[:top_k])
+
+        statuses = [entry["status"] for entry in city_results]
+        result = {
+            "is_multi_city": True,
+            "city": " / ".join(entry["city"] for entry in city_results),
+            "check_in": search_input.check_in_date,
+            "check_out": search_input.check_out_date,
+            "num_rooms": search_input.num_rooms,
+            "num_adults": search_input.num_adults,
+            "num_children": search_input.num_children,
+            "sort_type": search_input.sort_type,
+            "cities": city_results,
+            "totalResults": len(hotel_index),
+            "hotels": merged,
+            "summary": {
+                "cities": len(city_results),
+                "with_hotels": statuses.count("ok"),
+                "no_hotels": statuses.count("no_hotels"),
+                "failed": statuses.count("error"),
+                "timed_out": statuses.count("timeout"),
+                "duplicates_removed": duplicates,
+            },
+        }
+        if not merged:
+            result["error"] = "NO_HOTELS"
+            result["message"] = "No hotels found in any of the requested cities."
+        return result
     
     def _process_response(
     self,
@@ -245,21 +855,10 @@ class HotelSearchService:
         results = []
         view_all_link = ""
 
-        room_details = self._build_room_details(search_input)
+        deep_links = self._deep_link_builder(resolved_city, search_input, lat, lon, stype)
 
         for index, hotel in enumerate(hotels):
-            deep_link_data = self._build_deep_link(
-                city_name=resolved_city,
-                check_in=search_input.check_in_date,
-                check_out=search_input.check_out_date,
-                num_rooms=search_input.num_rooms,
-                room_details=room_details,
-                emt_id=hotel.get("ecid", ""),
-                hotel_id=hotel.get("hid", ""),
-                lat=lat,
-                lon=lon,
-                stype=stype,
-            )
+            deep_link_data = deep_links.build(hotel.get("ecid", ""), hotel.get("hid", ""))
 
             if index == 0:
                 view_all_link = self._generate_view_all(deep_link_data["deepLink"], use_short_links=use_short_links)
@@ -333,48 +932,42 @@ class HotelSearchService:
             parts.append(f"{rd['NoOfAdult']}_{rd['NoOfChild']}_{rd['childAge']}")
         return "?".join(parts)
 
+    def _deep_link_builder(
+        self,
+        city_name: str,
+        search_input: HotelSearchInput,
+        lat: Any = None,
+        lon: Any = None,
+        stype: Any = None,
+    ) -> HotelDeepLinkBuilder:
+        """Deeplink builder for every hotel of one search."""
+        room_details = self._build_room_details(search_input)
+        return HotelDeepLinkBuilder(
+            city_name=city_name,
+            check_in=search_input.check_in_date,
+            check_out=search_input.check_out_date,
+            num_rooms=search_input.num_rooms,
+            pax_string=self._build_pax_string(room_details) if room_details else str(search_input.num_rooms),
+            lat=lat,
+            lon=lon,
+            stype=stype,
+        )
+
     def _build_deep_link(self, **kwargs) -> Dict[str, str]:
-        """Create the EMT hotel deep-link and trace id."""
-        from emt_client.utils import gen_trace_id
-        from emt_client.config import HOTEL_DEEPLINK
-        from urllib.parse import quote
-        from datetime import datetime
-
-        city_name = kwargs.get("city_name", "")
-        check_in = kwargs.get("check_in", "")
-        check_out = kwargs.get("check_out", "")
+        """Create the EMT hotel deep-link and trace id (one-off; see HotelDeepLinkBuilder)."""
         num_rooms = kwargs.get("num_rooms", 1)
         room_details = kwargs.get("room_details", [])
-        emt_id = kwargs.get("emt_id", "")
-        hotel_id = kwargs.get("hotel_id", "")
-        trace_id = kwargs.get("trace_id")
-        lat = kwargs.get("lat")
-        lon = kwargs.get("lon")
-        stype=kwargs.get("stype")
-
-        link_trace_id = trace_id or gen_trace_id()
-        pax_string = self._build_pax_string(room_details) if room_details else str(num_rooms)
-        encoded_city = quote(city_name, safe="")
-        check_in_fmt = datetime.strptime(check_in, "%Y-%m-%d").strftime("%d/%m/%Y")
-        check_out_fmt = datetime.strptime(check_out, "%Y-%m-%d").strftime("%d/%m/%Y")
-
-        deep_link = (
-            f"{HOTEL_DEEPLINK}"
-            f"cityName={encoded_city}&"
-            f"sText={encoded_city}&"
-            f"checkinDate={check_in_fmt}&"
-            f"checkoutDate={check_out_fmt}&"
-            f"Rooms={num_rooms}&"
-            f"pax={pax_string}&"
-            f"lat={lat}&"
-            f"lon={lon}&"
-            f"emthid={emt_id}&"
-            f"hid={hotel_id}&"
-            f"tid={link_trace_id}"
-            f"&stype={stype}"
+        builder = HotelDeepLinkBuilder(
+            city_name=kwargs.get("city_name", ""),
+            check_in=kwargs.get("check_in", ""),
+            check_out=kwargs.get("check_out", ""),
+            num_rooms=num_rooms,
+            pax_string=self._build_pax_string(room_details) if room_details else str(num_rooms),
+            lat=kwargs.get("lat"),
+            lon=kwargs.get("lon"),
+            stype=kwargs.get("stype"),
         )
-
-        return {"deepLink": deep_link, "traceId": link_trace_id}
+        return builder.build(kwargs.get("emt_id", ""), kwargs.get("hotel_id", ""), kwargs.get("trace_id"))
     
 
     def build_whatsapp_hotel_response(
@@ -5,11 +5,13 @@ Wrapper for hotel search functionality in the Tool Factory
 from typing import Dict, Any, Optional
 from pydantic import ValidationError
 from ..base import BaseTool, ToolMetadata
+from emt_client.config import HOTEL_PREFETCH_PAGES
 from emt_client.utils import generate_short_link
 from .hotel_schema import HotelSearchInput
 from .hotel_search_service import HotelSearchService
 from .hotel_renderer import render_hotel_results
 from tools_factory.base_schema import ToolResponseFormat
+from tools_factory.ranking import page_highlights, to_number
 
 
 class HotelSearchTool(BaseTool):
@@ -78,9 +80,17 @@ class HotelSearchTool(BaseTool):
                 is_error=True,
             )
             
-        # Execute search through service layer
+        # Execute search through service layer; progressively, so "show more"
+        # is served from pages prefetched in the background
         try:
-            results: Dict[str, Any] = await self.service.search(search_input, use_short_links=not is_chatGPT)
+            if HOTEL_PREFETCH_PAGES > 0:
+                results: Dict[str, Any] = await self.service.search_progressive(
+                    search_input,
+                    page_size=limit,
+                    use_short_links=not is_chatGPT,
+                )
+            else:
+                results = await self.service.search(search_input, use_short_links=not is_chatGPT)
         except Exception as exc:
             return ToolResponseFormat(
                 response_text="Hotel search failed",
@@ -109,6 +119,8 @@ class HotelSearchTool(BaseTool):
         offset = (page - 1) * limit
         end = offset + limit
         paginated_hotels = all_hotels[offset:end] if not has_error else []
+        # Progressive search: upstream pages not loaded yet
+        has_more_upstream = bool(results.get("has_more")) and not has_error
 
         # DEBUG: Print pagination result
         # print(f"DEBUG: Offset: {offset}, End: {end}")
@@ -121,15 +133,27 @@ class HotelSearchTool(BaseTool):
             "current_page": page,
             "per_page": limit,
             "total_results": total_hotel_count,
-            "total_pages": (total_hotel_count + limit - 1) // limit if limit > 0 else 1,
-            "has_next_page": end < total_hotel_count,
+            "total_pages": ((total_hotel_count + limit - 1) // limit if limit > 0 else 1) + has_more_upstream,
+            "has_next_page": end < total_hotel_count or has_more_upstream,
             "has_previous_page": page > 1,
             "showing_from": offset + 1 if paginated_hotels else 0,
             "showing_to": min(end, total_hotel_count),
         }
+        # Where the cheapest hotel sits across all pages, found in one pass
+        limited_results["highlights"] = page_highlights(
+            all_hotels if not has_error else [],
+            limit,
+            cheapest=lambda hotel: to_number((hotel.get("price") or {}).get("amount")),
+        )
         
         hotel_count = len(paginated_hotels)
 
+        # Details for the top hotels of the page; only those ready within
+        # HOTEL_DETAILS_BUDGET are attached, the rest warm the cache
+        hotel_details: Dict[str, Any] = {}
+        if paginated_hotels and not is_whatsapp:
+            hotel_details = await self.service.enrich_hotels(paginated_hotels, search_input)
+
         # Generate short links for paginated hotels
         if not is_chatGPT:
             try:
@@ -141,6 +165,10 @@ class HotelSearchTool(BaseTool):
             except Exception as e:
                 # DO NOT FAIL hotel search because of short-link issues
                 pass
+        for hotel in limited_results["hotels"]:
+            details = hotel_details.get(hotel.get("hotelId"))
+            if details:
+                hotel["details"] = dict(details)
         # Build WhatsApp response if needed
         whatsapp_response = None
         if is_whatsapp and not has_error:
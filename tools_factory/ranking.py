@@ -0,0 +1,102 @@
+"""
+Shared ranking helpers for search tools.
+
+Tools only ever show one page of results, so ranking the whole result set
+is wasted work. These helpers pick the top ``k`` rows with a bounded heap
+and find several "best" markers (cheapest, fastest, ...) in one pass.
+
+Ordering is stable (ties keep their original order) and rows whose key is
+None are ranked after every row with a value, so results match a full
+``sorted()`` over the same key.
+"""
+import heapq
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+def _sort_key(keys: Sequence[Any]) -> Callable[[int], tuple]:
+    return lambda i: (keys[i] is None, keys[i] if keys[i] is not None else 0)
+
+
+def top_k_indices(keys: Sequence[Any], k: Optional[int] = None) -> List[int]:
+    """
+    Indices of the ``k`` lowest keys, in rank order.
+
+    ``k`` of None ranks every row (equivalent to a stable argsort).
+    """
+    rows = range(len(keys))
+    if k is None or k >= len(keys):
+        return sorted(rows, key=_sort_key(keys))
+    if k <= 0:
+        return []
+    return heapq.nsmallest(k, rows, key=_sort_key(keys))
+
+
+def ranked_indices(keys: Sequence[Any], k: Optional[int] = None) -> List[int]:
+    """
+    Every index, with the top ``k`` first in rank order and the rest after
+    them in their original order.
+
+    Keeps the result length (and so totals/pagination) unchanged while only
+    paying for the rows that can be displayed.
+    """
+    top = top_k_indices(keys, k)
+    if len(top) == len(keys):
+        return top
+    chosen = set(top)
+    return top + [i for i in range(len(keys)) if i not in chosen]
+
+
+def top_k(items: Sequence[Any], k: Optional[int], key: Callable[[Any], Any]) -> List[Any]:
+    """The ``k`` best items by ``key`` (lowest first)."""
+    keys = [key(item) for item in items]
+    return [items[i] for i in top_k_indices(keys, k)]
+
+
+def best_indices(items: Sequence[Any], **keys: Callable[[Any], Any]) -> Dict[str, Optional[int]]:
+    """
+    Index of the lowest-keyed item for each named key, in a single pass.
+
+    e.g. ``best_indices(flights, cheapest=fare_of, fastest=duration_of)``.
+    Items whose key is None are skipped; the first item wins ties. A marker
+    is None when no item has a value for it.
+    """
+    best: Dict[str, Optional[int]] = {name: None for name in keys}
+    best_value: Dict[str, Any] = {}
+    for index, item in enumerate(items):
+        for name, key in keys.items():
+            value = key(item)
+            if value is None:
+                continue
+            if best[name] is None or value < best_value[name]:
+                best[name] = index
+                best_value[name] = value
+    return best
+
+
+def page_highlights(items: Sequence[Any], per_page: int, **keys: Callable[[Any], Any]) -> Dict[str, Optional[Dict[str, int]]]:
+    """
+    Where the best items sit across all pages of a result set.
+
+    Returns ``{marker: {"position": n, "page": p}}`` (1-based) for each named
+    key, or None for markers no item has a value for.
+    """
+    highlights: Dict[str, Optional[Dict[str, int]]] = {}
+    for name, index in best_indices(items, **keys).items():
+        if index is None:
+            highlights[name] = None
+            continue
+        highlights[name] = {
+            "position": index + 1,
+            "page": index // per_page + 1 if per_page > 0 else 1,
+        }
+    return highlights
+
+
+def to_number(value: Any) -> Optional[float]:
+    """Float value of a fare/price field, or None when it isn't numeric."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,7 +1,11 @@
 """Train Availability Check Module - Check real-time train availability across multiple classes."""
 
 from .availability_check_tool import TrainAvailabilityCheckTool
-from .availability_check_service import AvailabilityCheckService, build_whatsapp_availability_response
+from .availability_check_service import (
+    AvailabilityCheckService,
+    build_whatsapp_availability_response,
+    build_whatsapp_availability_calendar_response,
+)
 from .availability_check_schema import (
     AvailabilityCheckInput,
     ClassAvailabilityInfo,
@@ -9,16 +13,18 @@ from .availability_check_schema import (
     WhatsappAvailabilityFormat,
     WhatsappAvailabilityFinalResponse,
 )
-from .availability_check_renderer import render_availability_check
+from .availability_check_renderer import render_availability_check, render_availability_calendar
 
 __all__ = [
     "TrainAvailabilityCheckTool",
     "AvailabilityCheckService",
     "build_whatsapp_availability_response",
+    "build_whatsapp_availability_calendar_response",
     "AvailabilityCheckInput",
     "ClassAvailabilityInfo",
     "TrainAvailabilityInfo",
     "WhatsappAvailabilityFormat",
     "WhatsappAvailabilityFinalResponse",
     "render_availability_check",
+    "render_availability_calendar",
 ]
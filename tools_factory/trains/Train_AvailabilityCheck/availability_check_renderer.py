@@ -316,6 +316,140 @@ AVAILABILITY_CHECK_TEMPLATE = """
 """
 
 
+AVAILABILITY_CALENDAR_TEMPLATE = """
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:ital,opsz,wght@0,14..32,100..900;1,14..32,100..900&family=Poppins:ital,wght@0,100;0,200;0,300;0,400;0,500;0,600;0,700;0,800;0,900;1,100;1,200;1,300;1,400;1,500;1,600;1,700;1,800;1,900&display=swap');
+
+.train-avl-calendar {
+  font-family: poppins, sans-serif;
+  color: #202020;
+  background: rgba(255, 255, 255, 0.92);
+}
+
+.train-avl-calendar * {
+  font-family: inherit;
+  box-sizing: border-box;
+  margin: 0;
+}
+
+.train-avl-calendar main {
+  max-width: 700px;
+  margin: 0 auto;
+  padding: 20px 0 30px;
+}
+
+.train-avl-calendar .avl-title {
+  font-size: 18px;
+  font-weight: 600;
+  margin-bottom: 4px;
+}
+
+.train-avl-calendar .avl-subtitle {
+  font-size: 12px;
+  color: #646d74;
+  margin-bottom: 12px;
+}
+
+.train-avl-calendar .quota-badge {
+  padding: 2px 8px;
+  background: #e8f5e9;
+  color: #2e7d32;
+  border-radius: 4px;
+  font-weight: 600;
+  font-size: 10px;
+}
+
+.train-avl-calendar .cal-wrapper {
+  overflow-x: auto;
+  border: 1px solid #e0e0e0;
+  border-radius: 12px;
+  background: #fff;
+}
+
+.train-avl-calendar table {
+  border-collapse: collapse;
+  width: 100%;
+}
+
+.train-avl-calendar th,
+.train-avl-calendar td {
+  border-bottom: 1px solid #f0f0f0;
+  padding: 6px;
+  text-align: center;
+  font-size: 10px;
+  white-space: nowrap;
+}
+
+.train-avl-calendar th {
+  font-weight: 600;
+  color: #646d74;
+  background: #fafafa;
+}
+
+.train-avl-calendar td.cls {
+  font-size: 13px;
+  font-weight: 700;
+}
+
+.train-avl-calendar .day-fare {
+  display: block;
+  font-family: inter, sans-serif;
+  font-weight: 600;
+  color: #202020;
+}
+
+.train-avl-calendar a.cell-link {
+  text-decoration: none;
+  display: block;
+}
+
+.train-avl-calendar .available { color: #2e7d32; }
+.train-avl-calendar .waitlist { color: #f57c00; }
+.train-avl-calendar .rac { color: #1976d2; }
+.train-avl-calendar .unavailable { color: #d32f2f; }
+</style>
+
+<div class="train-avl-calendar">
+  <main>
+    <div class="avl-title">{{ train_name }} ({{ train_no }})</div>
+    <div class="avl-subtitle">{{ from_station }} → {{ to_station }} • <span class="quota-badge">{{ quota_name }}</span></div>
+
+    <div class="cal-wrapper">
+      <table>
+        <tr>
+          <th>Class</th>
+          {% for day in date_headers %}
+          <th>{{ day }}</th>
+          {% endfor %}
+        </tr>
+        {% for row in calendar %}
+        <tr>
+          <td class="cls">{{ row.class_code }}</td>
+          {% for day in row.days %}
+          {% set is_regret = 'REGRET' in day.status or 'NOT AVAILABLE' in day.status or 'TRAIN CANCELLED' in day.status or 'ERROR' in day.status %}
+          {% set is_bookable = not is_regret and ('AVAILABLE' in day.status or 'WL' in day.status or 'RAC' in day.status) %}
+          {% set css = 'unavailable' if is_regret else ('waitlist' if 'WL' in day.status else ('rac' if 'RAC' in day.status else ('available' if 'AVAILABLE' in day.status else 'unavailable'))) %}
+          <td>
+            {% if is_bookable %}
+            <a class="cell-link {{ css }}" target="_blank" rel="noopener noreferrer"
+               href="{{ build_book_url(train_no, row.class_code, from_station_code, to_station_code, quota, day.date.replace('-', '/'), from_station, to_station) }}">
+            {% else %}
+            <span class="{{ css }}">
+            {% endif %}
+              {% if day.fare %}<span class="day-fare">Rs.{{ day.fare }}</span>{% endif %}
+              {{ day.status[:12] }}{% if day.status|length > 12 %}...{% endif %}
+            {% if is_bookable %}</a>{% else %}</span>{% endif %}
+          </td>
+          {% endfor %}
+        </tr>
+        {% endfor %}
+      </table>
+    </div>
+  </main>
+</div>
+"""
+
+
 def _get_quota_name(quota: str) -> str:
     """
     Get full quota name from quota code.
@@ -449,3 +583,54 @@ def render_availability_check(
         quota=quota,
         quota_name=_get_quota_name(quota),
     )
+
+
+def render_availability_calendar(
+    train_info: Dict[str, Any],
+    calendar: List[Dict[str, Any]],
+    from_station: str,
+    to_station: str,
+    quota: str,
+    from_station_code: str = "",
+    to_station_code: str = "",
+) -> str:
+    """
+    Render a compact availability calendar (classes x dates) as HTML.
+
+    Args:
+        train_info: Dictionary containing train_no and train_name
+        calendar: List of {class_code, days} where days are {date, status, fare}
+            with dates in DD-MM-YYYY format
+        from_station: Origin station name/code
+        to_station: Destination station name/code
+        quota: Quota code
+        from_station_code: Origin station code
+        to_station_code: Destination station code
+
+    Returns:
+        HTML string with rendered availability calendar
+    """
+    date_headers = []
+    if calendar:
+        for day in calendar[0].get("days", []):
+            try:
+                date_headers.append(datetime.strptime(day["date"], "%d-%m-%Y").strftime("%a %d %b"))
+            except ValueError:
+                date_headers.append(day["date"])
+
+    _jinja_env.globals["build_book_url"] = _build_book_url
+
+    template = _jinja_env.from_string(AVAILABILITY_CALENDAR_TEMPLATE)
+
+    return template.render(
+        train_name=train_info.get("train_name", "Unknown Train"),
+        train_no=train_info.get("train_no", ""),
+        from_station=from_station,
+        to_station=to_station,
+        from_station_code=from_station_code,
+        to_station_code=to_station_code,
+        calendar=calendar,
+        date_headers=date_headers,
+        quota=quota,
+        quota_name=_get_quota_name(quota),
+    )
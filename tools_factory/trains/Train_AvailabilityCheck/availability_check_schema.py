@@ -41,6 +41,13 @@ class AvailabilityCheckInput(BaseModel):
         description="Destination station code. Station codes are typically 2-5 uppercase letters (e.g., 'NDLS' for New Delhi, 'PRYJ' for Prayagraj, 'PUNE' for Pune, 'BLR' for Bangalore). When user mentions 'to [STATION_CODE]' or '[STATION_CODE] from', extract and use this field. If not provided, the full train route will be used (origin to final destination).",
     )
 
+    days: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=14,
+        description="Number of consecutive dates to check starting from journeyDate (1-14). Use when the user asks for availability over a range of dates, e.g. 'next 7 days' or 'this week'. Leave empty to check only journeyDate.",
+    )
+
     model_config = ConfigDict(
         populate_by_name=True,
         extra="forbid",
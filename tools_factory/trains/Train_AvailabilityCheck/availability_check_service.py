@@ -4,15 +4,40 @@ import asyncio
 import logging
 import httpx
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
+from emt_client.cache import get_cache
 from emt_client.clients.train_client import TrainApiClient
-from emt_client.config import TRAIN_NAME_API_URL
+from emt_client.config import TRAIN_NAME_API_URL, TRAIN_AVAILABILITY_CACHE_TTL
 from .availability_check_schema import ClassAvailabilityInfo
 
 
 logger = logging.getLogger(__name__)
 
+# avlDayList dates have been seen both zero-padded and not, with - or / separators
+_AVL_DATE_FORMATS = ("%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%d%b%Y", "%d %b %Y")
+
+
+def _parse_avl_date(date_str: Optional[str]) -> Optional[date]:
+    """Parse an avlDayList availablityDate value, returning None if unrecognised."""
+    if not date_str:
+        return None
+    for fmt in _AVL_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def get_day_availability_cache():
+    """Per-day availability entries harvested from avlDayList, keyed per train/class/quota/date/route."""
+    return get_cache(
+        "train_avail_days",
+        ttl_seconds=TRAIN_AVAILABILITY_CACHE_TTL,
+        max_entries=4096,
+    )
+
 
 async def fetch_train_details(train_no: str) -> Optional[Dict[str, str]]:
     """
@@ -79,31 +104,20 @@ class AvailabilityCheckService:
         Returns:
             Dictionary with success, train_info, and classes list
         """
-        train_name = None
-        from_station_name = None
-        to_station_name = None
-
-        # Only fetch train details if station codes are not provided
-        if not from_station_code or not to_station_code:
-            train_details = await fetch_train_details(train_no)
-
-            if not train_details:
-                return {
-                    "success": False,
-                    "error": f"Could not fetch details for train {train_no}. Please verify the train number.",
-                    "train_info": None,
-                    "classes": [],
-                }
-
-            from_station_code = train_details["from_station_code"]
-            to_station_code = train_details["to_station_code"]
-            from_station_name = train_details.get("from_station_name", "")
-            to_station_name = train_details.get("to_station_name", "")
-            train_name = train_details.get("train_name")
+        route = await self._resolve_route(train_no, from_station_code, to_station_code)
+        if route is None:
+            return {
+                "success": False,
+                "error": f"Could not fetch details for train {train_no}. Please verify the train number.",
+                "train_info": None,
+                "classes": [],
+            }
 
-        # Use station names for display, fallback to codes if not available
-        from_station_display = from_station_name if from_station_name else from_station_code
-        to_station_display = to_station_name if to_station_name else to_station_code
+        train_name = route["train_name"]
+        from_station_code = route["from_station_code"]
+        to_station_code = route["to_station_code"]
+        from_station_display = route["from_station_name"]
+        to_station_display = route["to_station_name"]
 
         # Convert date format: DD-MM-YYYY -> DD/MM/YYYY for API
         api_date = journey_date.replace("-", "/")
@@ -172,6 +186,258 @@ class AvailabilityCheckService:
             },
         }
 
+    async def _resolve_route(
+        self,
+        train_no: str,
+        from_station_code: Optional[str],
+        to_station_code: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve the station codes/names to check availability for.
+
+        Station codes are fetched from the train autosuggest API only when not provided.
+
+        Returns:
+            Dictionary with train_name and station codes/names, or None if the train is unknown
+        """
+        train_name = None
+        from_station_name = None
+        to_station_name = None
+
+        # Only fetch train details if station codes are not provided
+        if not from_station_code or not to_station_code:
+            train_details = await fetch_train_details(train_no)
+
+            if not train_details:
+                return None
+
+            from_station_code = train_details["from_station_code"]
+            to_station_code = train_details["to_station_code"]
+            from_station_name = train_details.get("from_station_name", "")
+            to_station_name = train_details.get("to_station_name", "")
+            train_name = train_details.get("train_name")
+
+        # Use station names for display, fallback to codes if not available
+        return {
+            "train_name": train_name,
+            "from_station_code": from_station_code,
+            "to_station_code": to_station_code,
+            "from_station_name": from_station_name if from_station_name else from_station_code,
+            "to_station_name": to_station_name if to_station_name else to_station_code,
+        }
+
+    async def check_availability_range(
+        self,
+        train_no: str,
+        class_code: str,
+        quota: str,
+        start_date: str,
+        days: int,
+        from_station_code: Optional[str] = None,
+        to_station_code: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Check availability for one class over a window of consecutive dates.
+
+        Every AvailToCheck response carries an avlDayList covering several
+        days. All of those days are harvested into a per-day cache, and a new
+        upstream call is made only for the first date in the window that is
+        still missing, so a week is typically covered by one or two calls.
+
+        Args:
+            train_no: Train number (e.g., "12963")
+            class_code: Class code to check (e.g., "3A")
+            quota: Quota code (GN, TQ, etc.)
+            start_date: First journey date in DD-MM-YYYY format
+            days: Number of consecutive dates to cover (including start_date)
+            from_station_code: Origin station code (optional, fetched if not provided)
+            to_station_code: Destination station code (optional, fetched if not provided)
+
+        Returns:
+            Dictionary with success, train_info, route_info and a days list of
+            {date, status, fare} in date order
+        """
+        route = await self._resolve_route(train_no, from_station_code, to_station_code)
+        if route is None:
+            return {
+                "success": False,
+                "error": f"Could not fetch details for train {train_no}. Please verify the train number.",
+                "train_info": None,
+                "days": [],
+            }
+
+        from_station_code = route["from_station_code"]
+        to_station_code = route["to_station_code"]
+        train_info = {
+            "train_no": train_no,
+            "train_name": route["train_name"] or f"Train {train_no}",
+        }
+
+        first_day = datetime.strptime(start_date, "%d-%m-%Y").date()
+        window = [first_day + timedelta(days=offset) for offset in range(max(days, 1))]
+
+        day_cache = get_day_availability_cache()
+
+        def _day_key(day: date) -> tuple:
+            return (train_no, class_code, quota, day.strftime("%d-%m-%Y"), from_station_code, to_station_code)
+
+        upstream_calls = 0
+        entries: Dict[date, Dict[str, Any]] = {}
+
+        for day in window:
+            cached = day_cache.get(_day_key(day))
+            if cached is not None:
+                entries[day] = cached
+                continue
+
+            # Fetch the first missing date and harvest every day it returns
+            upstream_calls += 1
+            try:
+                response = await self.client.check_availability(
+                    train_no=train_no,
+                    class_code=class_code,
+                    quota=quota,
+                    from_station_code=from_station_code,
+                    to_station_code=to_station_code,
+                    journey_date=day.strftime("%d/%m/%Y"),
+                    from_display=route["from_station_name"],
+                    to_display=route["to_station_name"],
+                )
+            except Exception as e:
+                logger.error(f"Error checking availability for {train_no} {class_code} on {day}: {e}")
+                entries[day] = {"date": day.strftime("%d-%m-%Y"), "status": "ERROR - Please try again", "fare": None}
+                continue
+
+            if response.get("trainName") and response.get("trainNo"):
+                train_info = {"train_no": response["trainNo"], "train_name": response["trainName"]}
+
+            if response.get("ErrorMsg") and response["ErrorMsg"].get("ErrorMessage"):
+                # Quota/date errors apply to the requested date only - don't harvest them,
+                # and don't cache them, so a later lookup asks upstream again
+                entries[day] = {"date": day.strftime("%d-%m-%Y"), "status": response["ErrorMsg"]["ErrorMessage"].strip(), "fare": None}
+                continue
+
+            fare = None
+            if response.get("totalFare"):
+                try:
+                    fare = int(float(response["totalFare"]))
+                except (ValueError, TypeError):
+                    fare = None
+
+            for position, avl_day in enumerate(response.get("avlDayList") or []):
+                # Fall back to the requested date for the first entry if the date is unparseable
+                harvested_day = _parse_avl_date(avl_day.get("availablityDate")) or (day if position == 0 else None)
+                if harvested_day is None:
+                    continue
+
+                day_fare = fare
+                if avl_day.get("totalFare"):
+                    try:
+                        day_fare = int(float(avl_day["totalFare"]))
+                    except (ValueError, TypeError):
+                        pass
+
+                entry = {
+                    "date": harvested_day.strftime("%d-%m-%Y"),
+                    "status": avl_day.get("availablityStatusNew") or "N/A",
+                    "fare": day_fare,
+                }
+                day_cache.set(_day_key(harvested_day), entry)
+                if harvested_day in window:
+                    entries.setdefault(harvested_day, entry)
+
+            if day not in entries:
+                entries[day] = {"date": day.strftime("%d-%m-%Y"), "status": "N/A", "fare": fare}
+
+        logger.info(
+            f"Availability range {train_no} {class_code}: {len(window)} dates covered "
+            f"with {upstream_calls} upstream calls"
+        )
+
+        return {
+            "success": True,
+            "train_info": train_info,
+            "class_code": class_code,
+            "quota": quota,
+            "days": [entries[day] for day in window],
+            "upstream_calls": upstream_calls,
+            "route_info": {
+                "from_station_code": from_station_code,
+                "from_station_name": route["from_station_name"],
+                "to_station_code": to_station_code,
+                "to_station_name": route["to_station_name"],
+            },
+        }
+
+    async def check_availability_calendar(
+        self,
+        train_no: str,
+        classes: List[str],
+        quota: str,
+        start_date: str,
+        days: int,
+        from_station_code: Optional[str] = None,
+        to_station_code: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build an availability calendar (classes x dates) for a train.
+
+        Station codes are resolved once and each class window is checked in parallel
+        via check_availability_range.
+
+        Returns:
+            Dictionary with success, train_info, route_info and calendar
+            (list of {class_code, days})
+        """
+        route = await self._resolve_route(train_no, from_station_code, to_station_code)
+        if route is None:
+            return {
+                "success": False,
+                "error": f"Could not fetch details for train {train_no}. Please verify the train number.",
+                "train_info": None,
+                "calendar": [],
+            }
+
+        results = await asyncio.gather(
+            *(
+                self.check_availability_range(
+                    train_no=train_no,
+                    class_code=class_code,
+                    quota=quota,
+                    start_date=start_date,
+                    days=days,
+                    from_station_code=route["from_station_code"],
+                    to_station_code=route["to_station_code"],
+                )
+                for class_code in classes
+            )
+        )
+
+        # Prefer the train name reported by AvailToCheck over the placeholder
+        train_info = {"train_no": train_no, "train_name": route["train_name"] or f"Train {train_no}"}
+        for result in results:
+            api_train_info = result.get("train_info") or {}
+            if api_train_info.get("train_name") and api_train_info["train_name"] != f"Train {train_no}":
+                train_info = api_train_info
+                break
+        route_info = {
+            "from_station_code": route["from_station_code"],
+            "from_station_name": route["from_station_name"],
+            "to_station_code": route["to_station_code"],
+            "to_station_name": route["to_station_name"],
+        }
+
+        return {
+            "success": True,
+            "train_info": train_info,
+            "route_info": route_info,
+            "start_date": start_date,
+            "calendar": [
+                {"class_code": class_code, "days": result.get("days", [])}
+                for class_code, result in zip(classes, results)
+            ],
+        }
+
     async def _check_single_class(
         self,
         train_no: str,
@@ -271,6 +537,17 @@ class AvailabilityCheckService:
             }
 
 
+def _is_bookable_status(status: str) -> bool:
+    """Check if status indicates seats are available, RAC, or waitlist."""
+    status_upper = status.upper()
+    # Include AVAILABLE, RAC, and any waitlist types (RLWL, GNWL, PQWL, etc.)
+    return (
+        ("AVAILABLE" in status_upper and "NOT AVAILABLE" not in status_upper)
+        or "RAC" in status_upper
+        or "WL" in status_upper
+    )
+
+
 def build_whatsapp_availability_response(
     train_info: Dict[str, Any],
     classes: List[Dict[str, Any]],
@@ -303,17 +580,6 @@ def build_whatsapp_availability_response(
     # Convert journey date to API format (DD-MM-YYYY -> DD/MM/YYYY)
     journey_date_api = journey_date.replace("-", "/")
 
-    # Filter classes to only show available, RAC, or waitlist statuses
-    def _is_bookable_status(status: str) -> bool:
-        """Check if status indicates seats are available, RAC, or waitlist."""
-        status_upper = status.upper()
-        # Include AVAILABLE, RAC, and any waitlist types (RLWL, GNWL, PQWL, etc.)
-        return (
-            ("AVAILABLE" in status_upper and "NOT AVAILABLE" not in status_upper)
-            or "RAC" in status_upper
-            or "WL" in status_upper
-        )
-
     # Format classes for WhatsApp (matching exact requirements format)
     whatsapp_classes = []
     for cls in classes:
@@ -386,6 +652,74 @@ def build_whatsapp_availability_response(
     }
 
 
+def build_whatsapp_availability_calendar_response(
+    train_info: Dict[str, Any],
+    calendar: List[Dict[str, Any]],
+    route_info: Dict[str, Any],
+    quota: str = "GN",
+) -> Dict[str, Any]:
+    """
+    Build WhatsApp-formatted availability calendar (one row of dates per class).
+
+    Args:
+        train_info: Dictionary with train_no and train_name
+        calendar: List of {class_code, days} from check_availability_calendar
+        route_info: Dictionary with station codes and names
+        quota: Quota code (default: "GN")
+
+    Returns:
+        WhatsApp-formatted response dictionary
+    """
+    from .availability_check_renderer import _build_book_url
+
+    from_station_code = route_info.get("from_station_code", "")
+    to_station_code = route_info.get("to_station_code", "")
+    from_station_display = route_info.get("from_station_name", from_station_code)
+    to_station_display = route_info.get("to_station_name", to_station_code)
+
+    whatsapp_classes = []
+    all_days = []
+    for row in calendar:
+        days = []
+        for day in row.get("days", []):
+            bookable = _is_bookable_status(day["status"])
+            days.append({
+                "date": day["date"],
+                "status": day["status"],
+                "fare": day.get("fare"),
+                "booking_link": _build_book_url(
+                    train_no=train_info["train_no"],
+                    class_code=row["class_code"],
+                    from_code=from_station_code,
+                    to_code=to_station_code,
+                    quota=quota,
+                    journey_date=day["date"].replace("-", "/"),
+                    from_display=from_station_display,
+                    to_display=to_station_display,
+                ) if bookable else None,
+            })
+        all_days.extend(days)
+        whatsapp_classes.append({"class": row["class_code"], "days": days})
+
+    first_date = _format_date_display(all_days[0]["date"]) if all_days else ""
+    last_date = _format_date_display(all_days[-1]["date"]) if all_days else ""
+
+    return {
+        "type": "availability_calendar",
+        "status": "RESULT",
+        "response_text": f"Here is availability in {train_info['train_name']} from {first_date} to {last_date}.",
+        "data": {
+            "train": {
+                "train_no": train_info["train_no"],
+                "train_name": train_info["train_name"],
+                "from_station": from_station_display,
+                "to_station": to_station_display,
+            },
+            "classes": whatsapp_classes,
+        },
+    }
+
+
 def _format_date_display(date_str: str) -> str:
     """
     Format date for display.
@@ -9,8 +9,9 @@ from .availability_check_schema import AvailabilityCheckInput
 from .availability_check_service import (
     AvailabilityCheckService,
     build_whatsapp_availability_response,
+    build_whatsapp_availability_calendar_response,
 )
-from .availability_check_renderer import render_availability_check
+from .availability_check_renderer import render_availability_check, render_availability_calendar
 
 
 class TrainAvailabilityCheckTool(BaseTool):
@@ -52,6 +53,9 @@ class TrainAvailabilityCheckTool(BaseTool):
                 is_error=True,
             )
 
+        if payload.days and payload.days > 1:
+            return await self._execute_calendar(payload, is_whatsapp)
+
         # Check availability across multiple classes (route is fetched if not provided)
         result = await self.service.check_availability_multiple_classes(
             train_no=payload.train_no,
@@ -136,6 +140,83 @@ class TrainAvailabilityCheckTool(BaseTool):
             is_error=False,
         )
 
+    async def _execute_calendar(self, payload: AvailabilityCheckInput, is_whatsapp: bool) -> ToolResponseFormat:
+        """Check availability over a window of dates and render it as a calendar."""
+        result = await self.service.check_availability_calendar(
+            train_no=payload.train_no,
+            classes=payload.classes,
+            quota=payload.quota,
+            start_date=payload.journey_date,
+            days=payload.days,
+            from_station_code=payload.from_station_code,
+            to_station_code=payload.to_station_code,
+        )
+
+        if not result.get("success"):
+            return ToolResponseFormat(
+                response_text="Could not check availability",
+                structured_content=result,
+                is_error=True,
+            )
+
+        train_info = result.get("train_info", {})
+        calendar = result.get("calendar", [])
+        route_info = result.get("route_info", {})
+        from_station = route_info.get("from_station_name") or route_info.get("from_station_code", "")
+        to_station = route_info.get("to_station_name") or route_info.get("to_station_code", "")
+
+        response_text = self._build_calendar_response_text(train_info, calendar, payload.journey_date, payload.days)
+
+        whatsapp_response = None
+        if is_whatsapp:
+            whatsapp_response = build_whatsapp_availability_calendar_response(
+                train_info=train_info,
+                calendar=calendar,
+                route_info=route_info,
+                quota=payload.quota,
+            )
+
+        html_content = None
+        if not is_whatsapp:
+            html_content = render_availability_calendar(
+                train_info=train_info,
+                calendar=calendar,
+                from_station=from_station,
+                to_station=to_station,
+                quota=payload.quota,
+                from_station_code=route_info.get("from_station_code", ""),
+                to_station_code=route_info.get("to_station_code", ""),
+            )
+
+        return ToolResponseFormat(
+            response_text=response_text,
+            structured_content=None if is_whatsapp else result,
+            html=html_content,
+            whatsapp_response=whatsapp_response,
+            is_error=False,
+        )
+
+    def _build_calendar_response_text(self, train_info: dict, calendar: list, start_date: str, days: int) -> str:
+        """Build human-readable response text for a date-range check."""
+        train_name = train_info.get("train_name", "Unknown Train")
+        train_no = train_info.get("train_no", "")
+
+        summary_parts = []
+        for row in calendar:
+            available_dates = [
+                day["date"] for day in row.get("days", [])
+                if "AVAILABLE" in day.get("status", "").upper() and "NOT" not in day.get("status", "").upper()
+            ]
+            if available_dates:
+                summary_parts.append(f"{row['class_code']} available on {', '.join(available_dates)}")
+            else:
+                summary_parts.append(f"{row['class_code']} not available on any date")
+
+        return (
+            f"Availability for {train_name} ({train_no}) for {days} days from {start_date}: "
+            f"{'; '.join(summary_parts)}."
+        )
+
     def _build_response_text(self, train_info: dict, classes: list, journey_date: str) -> str:
         """Build human-readable response text."""
         train_name = train_info.get("train_name", "Unknown Train")
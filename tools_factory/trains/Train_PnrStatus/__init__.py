@@ -1,25 +1,35 @@
 """Train PNR Status Tool Module."""
 
 from .pnr_status_tool import TrainPnrStatusTool
-from .pnr_status_service import PnrStatusService, encrypt_pnr
+from .pnr_status_service import (
+    PnrStatusService,
+    encrypt_pnr,
+    normalize_pnr,
+    build_whatsapp_bulk_pnr_response,
+)
 from .pnr_status_schema import (
     PnrStatusInput,
     PnrStatusInfo,
     PassengerInfo,
     WhatsappPnrFormat,
+    WhatsappBulkPnrFormat,
     WhatsappPnrFinalResponse,
 )
-from .pnr_status_renderer import render_pnr_status, render_pnr_error
+from .pnr_status_renderer import render_pnr_status, render_pnr_error, render_pnr_status_bulk
 
 __all__ = [
     "TrainPnrStatusTool",
     "PnrStatusService",
     "encrypt_pnr",
+    "normalize_pnr",
+    "build_whatsapp_bulk_pnr_response",
     "PnrStatusInput",
     "PnrStatusInfo",
     "PassengerInfo",
     "WhatsappPnrFormat",
+    "WhatsappBulkPnrFormat",
     "WhatsappPnrFinalResponse",
     "render_pnr_status",
     "render_pnr_error",
+    "render_pnr_status_bulk",
 ]
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any
 from jinja2 import Environment, BaseLoader, select_autoescape
+from markupsafe import Markup
 
 
 PNR_ERROR_TEMPLATE = """
@@ -476,6 +477,39 @@ PNR_STATUS_TEMPLATE = """
 """
 
 
+PNR_BULK_TEMPLATE = """
+<style>
+.pnr-bulk {
+  font-family: Poppins, sans-serif;
+  color: #202020;
+  max-width: 394px;
+  width: 100%;
+  margin: 0 auto;
+  display: flex;
+  flex-direction: column;
+  gap: 12px;
+}
+
+.pnr-bulk-summary {
+  font-size: 13px;
+  font-weight: 600;
+  color: #646d74;
+  padding: 4px 2px;
+}
+</style>
+
+<div class="pnr-bulk">
+  <div class="pnr-bulk-summary">
+    {{ summary.found }} of {{ summary.checked + summary.invalid }} PNRs found
+    {% if summary.duplicates %}• {{ summary.duplicates }} duplicate{{ 's' if summary.duplicates > 1 }} skipped{% endif %}
+  </div>
+  {% for card in cards %}
+  {{ card }}
+  {% endfor %}
+</div>
+"""
+
+
 def _get_status_class(status: str) -> str:
     """Get CSS class based on booking/current status."""
     if not status:
@@ -566,3 +600,27 @@ def render_pnr_error(pnr_number: str, error_message: str) -> str:
     """
     template = _jinja_env.from_string(PNR_ERROR_TEMPLATE)
     return template.render(pnr_number=pnr_number, error_message=error_message)
+
+
+def render_pnr_status_bulk(bulk_result: Dict[str, Any]) -> str:
+    """
+    Render a bulk PNR status check as a stack of PNR cards.
+
+    Args:
+        bulk_result: Result of PnrStatusService.check_pnr_status_bulk
+
+    Returns:
+        HTML string with one status or error card per PNR, in request order
+    """
+    cards = []
+    for result in bulk_result.get("results", []):
+        if result["success"]:
+            cards.append(Markup(render_pnr_status(result["pnr_info"])))
+        else:
+            cards.append(Markup(render_pnr_error(result["pnr_number"], result["message"])))
+
+    for pnr in bulk_result.get("invalid_pnrs", []):
+        cards.append(Markup(render_pnr_error(pnr, "PNR number must be exactly 10 digits.")))
+
+    template = _jinja_env.from_string(PNR_BULK_TEMPLATE)
+    return template.render(summary=bulk_result.get("summary", {}), cards=cards)
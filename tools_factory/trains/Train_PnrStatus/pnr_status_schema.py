@@ -2,23 +2,46 @@
 
 import re
 from typing import Optional, List
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
+
+# Max PNRs accepted in one bulk check
+MAX_BULK_PNRS = 20
 
 
 class PnrStatusInput(BaseModel):
     """Schema for PNR status check input."""
 
-    pnr_number: str = Field(
-        ...,
+    pnr_number: Optional[str] = Field(
+        default=None,
         alias="pnrNumber",
         description="10-digit Indian Railways PNR number",
     )
 
+    pnr_numbers: Optional[List[str]] = Field(
+        default=None,
+        alias="pnrNumbers",
+        max_length=MAX_BULK_PNRS,
+        description=f"List of 10-digit PNR numbers (up to {MAX_BULK_PNRS}). Use when the user shares more than one PNR, e.g. for group travel.",
+    )
+
     model_config = ConfigDict(
         populate_by_name=True,
         extra="forbid",
     )
 
+    @model_validator(mode="after")
+    def validate_pnr_provided(self) -> "PnrStatusInput":
+        """Require either a single PNR or a list of PNRs."""
+        if not self.pnr_number and not self.pnr_numbers:
+            raise ValueError("Either pnrNumber or pnrNumbers must be provided")
+        return self
+
+    @property
+    def all_pnr_numbers(self) -> List[str]:
+        """Every PNR requested, single PNR first."""
+        pnrs = [self.pnr_number] if self.pnr_number else []
+        return pnrs + list(self.pnr_numbers or [])
+
 
 class PassengerInfo(BaseModel):
     """Individual passenger details from PNR status."""
@@ -70,6 +93,16 @@ class WhatsappPnrFormat(BaseModel):
     passengers: List[dict]
 
 
+class WhatsappBulkPnrFormat(BaseModel):
+    """WhatsApp-friendly format for a bulk PNR status check."""
+
+    type: str = "pnr_status_bulk"
+    total: int
+    found: int
+    pnrs: List[dict]
+    errors: List[dict]
+
+
 class WhatsappPnrFinalResponse(BaseModel):
     """Final WhatsApp response for PNR status."""
 
@@ -1,15 +1,25 @@
 """PNR Status Service - Business logic for checking PNR status."""
 
+import asyncio
 import base64
+import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 
+from emt_client.cache import get_cache
 from emt_client.clients.train_client import TrainApiClient
-from emt_client.config import PNR_ENCRYPTION_KEY, PNR_ENCRYPTION_IV
-from .pnr_status_schema import PassengerInfo, PnrStatusInfo
+from emt_client.config import (
+    PNR_ENCRYPTION_KEY,
+    PNR_ENCRYPTION_IV,
+    PNR_STATUS_BULK_CONCURRENCY,
+    PNR_STATUS_CACHE_TTL,
+)
+from .pnr_status_schema import PassengerInfo, PnrStatusInfo, WhatsappBulkPnrFormat
+
+logger = logging.getLogger(__name__)
 
 
 def encrypt_pnr(pnr_number: str) -> str:
@@ -29,6 +39,24 @@ def encrypt_pnr(pnr_number: str) -> str:
     return base64.b64encode(encrypted).decode("utf-8")
 
 
+def normalize_pnr(pnr_number: str) -> Optional[str]:
+    """
+    Strip spaces/hyphens from a PNR and check it is 10 digits.
+
+    Returns:
+        Normalized PNR, or None if it is not a valid 10-digit PNR
+    """
+    cleaned = re.sub(r"[\s\-]", "", pnr_number or "")
+    if len(cleaned) == 10 and cleaned.isdigit():
+        return cleaned
+    return None
+
+
+def get_pnr_status_cache():
+    """Successful PNR status results, keyed by normalized PNR."""
+    return get_cache("train_pnr_status", ttl_seconds=PNR_STATUS_CACHE_TTL)
+
+
 class PnrStatusService:
     """Service for checking PNR status."""
 
@@ -39,12 +67,96 @@ class PnrStatusService:
         """
         Check PNR status via EaseMyTrip Railways API.
 
+        Successful results are cached for PNR_STATUS_CACHE_TTL seconds and
+        concurrent checks of the same PNR share one upstream call.
+
         Args:
             pnr_number: 10-digit PNR number
 
         Returns:
             Dict containing processed PNR status or error
         """
+        cache_key = normalize_pnr(pnr_number) or re.sub(r"[\s\-]", "", pnr_number or "")
+        cache = get_pnr_status_cache()
+
+        result = await cache.get_or_fetch(cache_key, lambda: self._fetch_pnr_status(pnr_number))
+        if not result.get("success"):
+            # Errors (invalid PNR, upstream failures) are not worth keeping
+            cache.invalidate(cache_key)
+        return result
+
+    async def check_pnr_status_bulk(
+        self,
+        pnr_numbers: List[str],
+        max_concurrent: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Check the status of several PNRs at once.
+
+        PNRs are normalized and de-duplicated (first occurrence wins), malformed
+        ones are reported without an upstream call, and the rest are checked
+        concurrently with at most ``max_concurrent`` requests in flight.
+
+        Args:
+            pnr_numbers: PNR numbers as entered by the user
+            max_concurrent: Max concurrent PnrchkStatus calls (default: PNR_STATUS_BULK_CONCURRENCY)
+
+        Returns:
+            Dict with success, a results list in request order
+            ({pnr_number, success, pnr_info | error, message}), invalid PNRs
+            and summary counts
+        """
+        unique_pnrs: List[str] = []
+        invalid: List[str] = []
+        duplicates = 0
+        for raw in pnr_numbers:
+            pnr = normalize_pnr(raw)
+            if pnr is None:
+                invalid.append(raw)
+            elif pnr in unique_pnrs:
+                duplicates += 1
+            else:
+                unique_pnrs.append(pnr)
+
+        semaphore = asyncio.Semaphore(max_concurrent or PNR_STATUS_BULK_CONCURRENCY)
+
+        async def _check(pnr: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.check_pnr_status(pnr)
+            if result.get("success"):
+                return {"pnr_number": pnr, "success": True, "pnr_info": result["pnr_info"]}
+            return {
+                "pnr_number": pnr,
+                "success": False,
+                "error": result.get("error", "API_ERROR"),
+                "message": result.get("message", "Could not fetch PNR status"),
+            }
+
+        results = await asyncio.gather(*(_check(pnr) for pnr in unique_pnrs))
+        found = sum(1 for r in results if r["success"])
+
+        logger.info(
+            f"Bulk PNR check: {len(unique_pnrs)} checked, {found} found, "
+            f"{len(invalid)} invalid, {duplicates} duplicates skipped | "
+            f"cache={get_pnr_status_cache().metrics()}"
+        )
+
+        return {
+            "success": found > 0,
+            "results": list(results),
+            "invalid_pnrs": invalid,
+            "summary": {
+                "requested": len(pnr_numbers),
+                "checked": len(unique_pnrs),
+                "found": found,
+                "failed": len(unique_pnrs) - found,
+                "invalid": len(invalid),
+                "duplicates": duplicates,
+            },
+        }
+
+    async def _fetch_pnr_status(self, pnr_number: str) -> Dict[str, Any]:
+        """Fetch and process one PNR status (uncached)."""
         try:
             encrypted_pnr = encrypt_pnr(pnr_number)
             response = await self.client.check_pnr_status(encrypted_pnr)
@@ -168,3 +280,24 @@ def build_whatsapp_pnr_response(pnr_info: Dict[str, Any]) -> Dict[str, Any]:
         "chart_status": pnr_info["chart_status"],
         "passengers": passengers,
     }
+
+
+def build_whatsapp_bulk_pnr_response(bulk_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Build WhatsApp-formatted response for a bulk PNR status check."""
+    pnrs = []
+    errors = []
+    for result in bulk_result.get("results", []):
+        if result["success"]:
+            pnrs.append(build_whatsapp_pnr_response(result["pnr_info"]))
+        else:
+            errors.append({"pnr_number": result["pnr_number"], "message": result["message"]})
+
+    for pnr in bulk_result.get("invalid_pnrs", []):
+        errors.append({"pnr_number": pnr, "message": "PNR number must be exactly 10 digits."})
+
+    return WhatsappBulkPnrFormat(
+        total=len(pnrs) + len(errors),
+        found=len(pnrs),
+        pnrs=pnrs,
+        errors=errors,
+    ).model_dump()
@@ -6,8 +6,12 @@ from tools_factory.base import BaseTool, ToolMetadata
 from tools_factory.base_schema import ToolResponseFormat
 
 from .pnr_status_schema import PnrStatusInput
-from .pnr_status_service import PnrStatusService, build_whatsapp_pnr_response
-from .pnr_status_renderer import render_pnr_status, render_pnr_error
+from .pnr_status_service import (
+    PnrStatusService,
+    build_whatsapp_pnr_response,
+    build_whatsapp_bulk_pnr_response,
+)
+from .pnr_status_renderer import render_pnr_status, render_pnr_error, render_pnr_status_bulk
 
 
 class TrainPnrStatusTool(BaseTool):
@@ -20,7 +24,7 @@ class TrainPnrStatusTool(BaseTool):
     def get_metadata(self) -> ToolMetadata:
         return ToolMetadata(
             name="check_pnr_status",
-            description="Check PNR status for Indian Railways train bookings. Requires a 10-digit PNR number.",
+            description="Check PNR status for Indian Railways train bookings. Requires a 10-digit PNR number, or a list of up to 20 PNRs to check several bookings at once.",
             input_schema=PnrStatusInput.model_json_schema(),
             output_template="ui://widget/pnr-status.html",
             category="travel",
@@ -49,8 +53,12 @@ class TrainPnrStatusTool(BaseTool):
                 is_error=True,
             )
 
+        if len(payload.all_pnr_numbers) > 1:
+            return await self._execute_bulk(payload.all_pnr_numbers, is_whatsapp)
+
         # Check PNR status
-        result = await self.service.check_pnr_status(payload.pnr_number)
+        pnr_number = payload.all_pnr_numbers[0]
+        result = await self.service.check_pnr_status(pnr_number)
 
         has_error = bool(result.get("error"))
 
@@ -61,7 +69,7 @@ class TrainPnrStatusTool(BaseTool):
             # Render error HTML for invalid PNR cases (for website users)
             error_html = None
             if not is_whatsapp and error_type == "INVALID_PNR":
-                pnr_num = result.get('pnr_number', payload.pnr_number)
+                pnr_num = result.get('pnr_number', pnr_number)
                 error_html = render_pnr_error(pnr_num, error_message)
 
             return ToolResponseFormat(
@@ -94,6 +102,49 @@ class TrainPnrStatusTool(BaseTool):
             is_error=False,
         )
 
+    async def _execute_bulk(self, pnr_numbers: list, is_whatsapp: bool) -> ToolResponseFormat:
+        """Check several PNRs concurrently and return one aggregated response."""
+        result = await self.service.check_pnr_status_bulk(pnr_numbers)
+
+        if not result.get("success"):
+            return ToolResponseFormat(
+                response_text="Could not fetch status for any of the PNRs provided",
+                structured_content=result,
+                html=None if is_whatsapp else render_pnr_status_bulk(result),
+                is_error=True,
+            )
+
+        lines = []
+        for item in result["results"]:
+            if item["success"]:
+                lines.append(self._build_response_text(item["pnr_info"]))
+            else:
+                lines.append(f"PNR {item['pnr_number']} - {item['message']}")
+        for pnr in result["invalid_pnrs"]:
+            lines.append(f"PNR {pnr} - invalid PNR number")
+
+        summary = result["summary"]
+        response_text = (
+            f"Status for {summary['found']} of {summary['checked'] + summary['invalid']} PNRs:\n"
+            + "\n".join(lines)
+        )
+
+        whatsapp_response = None
+        if is_whatsapp:
+            whatsapp_response = build_whatsapp_bulk_pnr_response(result)
+
+        html_content = None
+        if not is_whatsapp:
+            html_content = render_pnr_status_bulk(result)
+
+        return ToolResponseFormat(
+            response_text=response_text,
+            structured_content=None if is_whatsapp else result,
+            html=html_content,
+            whatsapp_response=whatsapp_response,
+            is_error=False,
+        )
+
     def _build_response_text(self, pnr_info: dict) -> str:
         """Build human-readable response text."""
         passengers = pnr_info.get("passengers", [])
@@ -9,13 +9,18 @@ This module handles all train search operations including:
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from emt_client.clients.train_client import TrainApiClient
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from emt_client.clients.train_client import (
+    TrainApiClient,
+    get_availability_cache,
+    get_availability_limiter,
+)
 from emt_client.utils import resolve_train_station
-from emt_client.config import TRAIN_API_URL
+from emt_client.config import DEBUG_MODE, TRAIN_API_URL, TRAIN_AVAILABILITY_MAX_TRAINS
+from tools_factory.ranking import best_indices, to_number
 from .train_schema import (
     TrainSearchInput,
-    TrainClassAvailability,
     TrainInfo,
     WhatsappTrainFormat,
     WhatsappTrainFinalResponse,
@@ -117,6 +122,26 @@ def generate_view_all_link(
         return ""
 
 
+@lru_cache(maxsize=256)
+def _deeplink_route_prefix(from_station_name: str, to_station_name: str) -> str:
+    """Deeplink prefix up to the class segment; shared by every class of a route."""
+    # Format station names: replace spaces with hyphens
+    from_name_formatted = from_station_name.replace(" ", "-")
+    to_name_formatted = to_station_name.replace(" ", "-")
+    return f"https://railways.easemytrip.com/TrainInfo/{from_name_formatted}-to-{to_name_formatted}/"
+
+
+@lru_cache(maxsize=64)
+def _deeplink_date(departure_date: str) -> str:
+    """Convert a departure date from "29Jan2026" to "29-1-2026" format."""
+    try:
+        dt = datetime.strptime(departure_date, "%d%b%Y")
+        return f"{dt.day}-{dt.month}-{dt.year}"
+    except ValueError:
+        # Fallback: try to use as-is or return empty
+        return departure_date
+
+
 def _build_train_deeplink(
     from_station_name: str,
     to_station_name: str,
@@ -132,22 +157,9 @@ def _build_train_deeplink(
     URL format: https://railways.easemytrip.com/TrainInfo/{from}-to-{to}/{class}/{train}/{from_code}/{to_code}/{quota}/{date}
     Date format: DD-M-YYYY (e.g., 11-2-2026)
     """
-    # Format station names: replace spaces with hyphens
-    from_name_formatted = from_station_name.replace(" ", "-")
-    to_name_formatted = to_station_name.replace(" ", "-")
-
-    # Convert date from "29Jan2026" to "29-1-2026" format
-    try:
-        dt = datetime.strptime(departure_date, "%d%b%Y")
-        date_formatted = f"{dt.day}-{dt.month}-{dt.year}"
-    except ValueError:
-        # Fallback: try to use as-is or return empty
-        date_formatted = departure_date
-
     return (
-        f"https://railways.easemytrip.com/TrainInfo/"
-        f"{from_name_formatted}-to-{to_name_formatted}/"
-        f"{class_code}/{train_number}/{from_station_code}/{to_station_code}/{quota}/{date_formatted}"
+        f"{_deeplink_route_prefix(from_station_name, to_station_name)}"
+        f"{class_code}/{train_number}/{from_station_code}/{to_station_code}/{quota}/{_deeplink_date(departure_date)}"
     )
 
 
@@ -179,14 +191,20 @@ def _process_class_availability(
     to_station_code: str = "",
     quota: str = "GN",
     departure_date: str = "",
-) -> Optional[List[TrainClassAvailability]]:
+    build_link: bool = True,
+) -> Optional[List[Dict[str, Any]]]:
     """Process TrainClassWiseFare to extract class availability info.
 
+    Returns plain dicts with the fields (and field order) of
+    TrainClassAvailability.model_dump().
+
     Note: "Tap To Refresh" is now handled client-side with a button in the UI.
 
     If preferred_class is specified, checks if the train has that class.
     If the train has the preferred class, returns ALL classes for that train.
     If the train doesn't have the preferred class, returns None to exclude the train.
+
+    With build_link=False, book_now is left as None (see attach_train_deep_links).
     """
     # If preferred class is specified, first check if this train has it
     if preferred_class:
@@ -217,29 +235,29 @@ def _process_class_availability(
         # The UI will show a refresh button for N/A, Tap To Refresh, or empty status
 
         # Generate book_now deeplink for this class
-        book_now = _build_train_deeplink(
-            from_station_name=from_station_name,
-            to_station_name=to_station_name,
-            class_code=class_code,
-            train_number=train_number,
-            from_station_code=from_station_code,
-            to_station_code=to_station_code,
-            quota=class_quota or quota,  # Use class-specific quota if available, otherwise use default
-            departure_date=departure_date,
-        )
-
-        classes.append(
-            TrainClassAvailability(
+        book_now = None
+        if build_link:
+            book_now = _build_train_deeplink(
+                from_station_name=from_station_name,
+                to_station_name=to_station_name,
                 class_code=class_code,
-                class_name=class_name,
-                fare=fare,
-                availability_status=availability_status,
-                fare_updated=fare_updated,
-                book_now=book_now,
-                quota=class_quota,
-                quota_name=class_quota_name,
+                train_number=train_number,
+                from_station_code=from_station_code,
+                to_station_code=to_station_code,
+                quota=class_quota or quota,  # Use class-specific quota if available, otherwise use default
+                departure_date=departure_date,
             )
-        )
+
+        classes.append({
+            "class_code": class_code,
+            "class_name": class_name,
+            "fare": fare,
+            "availability_status": availability_status,
+            "fare_updated": fare_updated,
+            "book_now": book_now,
+            "quota": class_quota,
+            "quota_name": class_quota_name,
+        })
 
     return classes
 
@@ -252,11 +270,13 @@ def _process_single_train(
     departure_time_max: Optional[str] = None,
     arrival_time_min: Optional[str] = None,
     arrival_time_max: Optional[str] = None,
-) -> Optional[TrainInfo]:
+    build_links: bool = True,
+) -> Optional[Dict[str, Any]]:
     """
     Process a single train entry from API response, applying class and time filters.
 
-    Returns None if train doesn't match filters.
+    Returns a dict shaped like TrainInfo.model_dump(), or None if the train
+    doesn't match filters.
     """
     train_class_wise_fare = train.get("TrainClassWiseFare", [])
 
@@ -300,6 +320,7 @@ def _process_single_train(
         to_station_code=to_station_code,
         quota=quota,
         departure_date=departure_date,
+        build_link=build_links,
     )
 
     # If classes is None, train doesn't have preferred class - skip it
@@ -311,23 +332,23 @@ def _process_single_train(
     nearby_station = train.get("NearByStation")
     is_nearby = nearby_station is not None and nearby_station != "" and nearby_station != "null"
 
-    return TrainInfo(
-        train_number=train.get("trainNumber", ""),
-        train_name=train.get("trainName", ""),
-        from_station_code=from_station_code,
-        from_station_name=from_station_name,
-        to_station_code=to_station_code,
-        to_station_name=to_station_name,
-        departure_time=departure_time,
-        arrival_time=arrival_time,
-        duration=train.get("duration", ""),
-        distance=train.get("distance", ""),
-        departure_date=train.get("departuredate", ""),
-        arrival_date=train.get("ArrivalDate", ""),
-        running_days=_get_running_days(train),
-        classes=classes,
-        is_nearby_station=is_nearby,
-    )
+    return {
+        "train_number": train.get("trainNumber", ""),
+        "train_name": train.get("trainName", ""),
+        "from_station_code": from_station_code,
+        "from_station_name": from_station_name,
+        "to_station_code": to_station_code,
+        "to_station_name": to_station_name,
+        "departure_time": departure_time,
+        "arrival_time": arrival_time,
+        "duration": train.get("duration", ""),
+        "distance": train.get("distance", ""),
+        "departure_date": train.get("departuredate", ""),
+        "arrival_date": train.get("ArrivalDate", ""),
+        "running_days": _get_running_days(train),
+        "classes": classes,
+        "is_nearby_station": is_nearby,
+    }
 
 
 def process_train_results(
@@ -338,9 +359,14 @@ def process_train_results(
     departure_time_max: Optional[str] = None,
     arrival_time_min: Optional[str] = None,
     arrival_time_max: Optional[str] = None,
+    validate: Optional[bool] = None,
+    defer_deep_links: bool = False,
 ) -> Dict[str, Any]:
     """Process raw train search response with time filtering.
 
+    Trains are built as plain dicts (the API payload is trusted); with
+    validate (default: DEBUG_MODE) each one is also checked against TrainInfo.
+
     Args:
         search_response: Raw API response from EaseMyTrip Railways
         preferred_class: Optional class filter (1A, 2A, 3A, SL, etc.)
@@ -349,10 +375,15 @@ def process_train_results(
         departure_time_max: Filter trains departing at or before this time (HH:MM)
         arrival_time_min: Filter trains arriving at or after this time (HH:MM)
         arrival_time_max: Filter trains arriving at or before this time (HH:MM)
+        validate: Validate every train with TrainInfo (raises ValidationError)
+        defer_deep_links: Leave book_now unset on every class (see attach_train_deep_links)
 
     Returns:
         Dict containing processed train list and quota info
     """
+    if validate is None:
+        validate = DEBUG_MODE
+
     trains = []
     quota_list = search_response.get("quotaList", [])
     train_list = search_response.get("trainBtwnStnsList", [])
@@ -374,11 +405,14 @@ def process_train_results(
             departure_time_max=departure_time_max,
             arrival_time_min=arrival_time_min,
             arrival_time_max=arrival_time_max,
+            build_links=not defer_deep_links,
         )
         if processed_train:
-            if processed_train.is_nearby_station:
+            if validate:
+                TrainInfo.model_validate(processed_train)
+            if processed_train["is_nearby_station"]:
                 has_nearby_stations = True
-            trains.append(processed_train.model_dump())
+            trains.append(processed_train)
 
     return {
         "trains": trains,
@@ -403,6 +437,7 @@ async def search_trains(
     departure_time_max: Optional[str] = None,
     arrival_time_min: Optional[str] = None,
     arrival_time_max: Optional[str] = None,
+    defer_deep_links: bool = False,
 ) -> Dict[str, Any]:
     """Call EaseMyTrip train search API with time filtering.
 
@@ -416,6 +451,8 @@ async def search_trains(
         departure_time_max: Filter trains departing at or before this time (HH:MM)
         arrival_time_min: Filter trains arriving at or after this time (HH:MM)
         arrival_time_max: Filter trains arriving at or before this time (HH:MM)
+        defer_deep_links: If true, skip per-class book_now links; build them later with
+            attach_train_deep_links for the trains actually returned
 
     Returns:
         Dict containing processed train search results
@@ -469,6 +506,7 @@ async def search_trains(
         departure_time_max=departure_time_max,
         arrival_time_min=arrival_time_min,
         arrival_time_max=arrival_time_max,
+        defer_deep_links=defer_deep_links,
     )
     processed_data["from_station"] = from_station
     processed_data["to_station"] = to_station
@@ -487,21 +525,59 @@ async def search_trains(
     return processed_data
 
 
+def attach_train_deep_links(
+    trains: List[Dict[str, Any]],
+    quota: str = "GN",
+    class_codes: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Build book_now links in place for trains of a search run with defer_deep_links.
+
+    Meant to be called with only the page being returned; classes that
+    already have a link are left untouched.
+
+    Args:
+        trains: Processed trains to link
+        quota: Search quota, used for classes without their own quota
+        class_codes: Only link these classes (None links every class)
+    """
+    wanted = set(class_codes) if class_codes is not None else None
+
+    for train in trains:
+        for cls in train.get("classes", []):
+            if cls.get("book_now") or (wanted is not None and cls.get("class_code") not in wanted):
+                continue
+            cls["book_now"] = _build_train_deeplink(
+                from_station_name=train.get("from_station_name", ""),
+                to_station_name=train.get("to_station_name", ""),
+                class_code=cls.get("class_code", ""),
+                train_number=train.get("train_number", ""),
+                from_station_code=train.get("from_station_code", ""),
+                to_station_code=train.get("to_station_code", ""),
+                quota=cls.get("quota") or quota,
+                departure_date=train.get("departure_date", ""),
+            )
+
+
+def _class_fare(cls: Dict[str, Any]) -> Optional[float]:
+    return to_number(cls.get("fare", 0))
+
+
+def train_cheapest_fare(train: Dict[str, Any]) -> Optional[float]:
+    """Lowest class fare of a processed train, or None if no class has a fare."""
+    classes = train.get("classes", [])
+    index = best_indices(classes, cheapest=_class_fare)["cheapest"]
+    return _class_fare(classes[index]) if index is not None else None
+
+
 def extract_train_summary(train: Dict[str, Any]) -> Dict[str, Any]:
     """Extract summary info from processed train data."""
     classes = train.get("classes", [])
 
     # Find cheapest class
-    cheapest_fare = None
-    cheapest_class = None
-    for cls in classes:
-        try:
-            fare = float(cls.get("fare", 0))
-            if cheapest_fare is None or fare < cheapest_fare:
-                cheapest_fare = fare
-                cheapest_class = cls
-        except (ValueError, TypeError):
-            continue
+    cheapest_index = best_indices(classes, cheapest=_class_fare)["cheapest"]
+    cheapest_class = classes[cheapest_index] if cheapest_index is not None else None
+    cheapest_fare = _class_fare(cheapest_class) if cheapest_class is not None else None
 
     return {
         "train_number": train.get("train_number"),
@@ -519,124 +595,231 @@ def extract_train_summary(train: Dict[str, Any]) -> Dict[str, Any]:
 
 
 # Configuration for availability checking
-MAX_CONCURRENT_AVAILABILITY_CHECKS = 5   # Balance speed vs API load
-MAX_TRAINS_TO_CHECK = 20                 # Prevent timeout on large results
+# Concurrency is governed by the shared adaptive AvailToCheck limiter
+# (see emt_client.concurrency); max_concurrent only adds a per-call ceiling.
+MAX_TRAINS_TO_CHECK = TRAIN_AVAILABILITY_MAX_TRAINS  # Prevent timeout on large results
 
 logger = logging.getLogger(__name__)
 
 
-async def check_and_filter_trains_by_availability(
+async def _check_train_availability(
+    avail_service: Any,
+    train: Dict[str, Any],
+    travel_class: str,
+    journey_date: str,
+    quota: str,
+) -> Optional[Dict[str, Any]]:
+    """Check availability for a single train and return enriched data (None if not bookable)."""
+    try:
+        train_no = train.get("train_number")
+        # Use station codes from search API (already correct boarding/alighting stations)
+        from_code = train.get("from_station_code", "")
+        to_code = train.get("to_station_code", "")
+
+        # Call availability check service with station codes from search API
+        result = await avail_service.check_availability_multiple_classes(
+            train_no=train_no,
+            classes=[travel_class],  # Check only the requested class
+            journey_date=journey_date,
+            quota=quota,
+            from_station_code=from_code,
+            to_station_code=to_code,
+        )
+
+        if not result.get("success"):
+            logger.warning(f"Availability check failed for train {train_no}: {result.get('error')}")
+            return None
+
+        # Extract class info
+        classes = result.get("classes", [])
+        if not classes:
+            logger.info(f"No availability data for train {train_no} class {travel_class}")
+            return None
+
+        class_info = classes[0]  # We only checked one class
+        status = class_info.get("status", "")
+
+        # Filter by status (only RAC/AVAILABLE/WAITLIST)
+        status_upper = status.upper()
+        is_bookable = (
+            ("AVAILABLE" in status_upper and "NOT AVAILABLE" not in status_upper) or
+            "WL" in status_upper or
+            "WAITLIST" in status_upper or
+            "RAC" in status_upper
+        )
+
+        if not is_bookable:
+            logger.info(f"Train {train_no} class {travel_class} not bookable: {status}")
+            return None
+
+        # Build booking link using station codes from search API
+        booking_link = _build_booking_link(
+            train_no=train_no,
+            class_code=travel_class,
+            from_code=from_code,
+            to_code=to_code,
+            quota=quota,
+            journey_date=journey_date,
+            from_display=train.get("from_station_name", ""),
+            to_display=train.get("to_station_name", ""),
+        )
+
+        # Enrich train data
+        enriched_train = {**train}  # Copy
+        enriched_train["availability_status"] = status
+        enriched_train["booking_link"] = booking_link
+        enriched_train["fare"] = class_info.get("fare")
+
+        return enriched_train
+
+    except Exception as e:
+        logger.error(f"Error checking availability for train {train.get('train_number')}: {e}")
+        return None
+
+
+async def stream_bookable_trains(
     trains: List[Dict[str, Any]],
     travel_class: str,
     journey_date: str,
     quota: str = "GN",
-    max_concurrent: int = MAX_CONCURRENT_AVAILABILITY_CHECKS,
+    max_concurrent: Optional[int] = None,
     max_trains: int = MAX_TRAINS_TO_CHECK,
-) -> List[Dict[str, Any]]:
+    target_count: Optional[int] = None,
+    progress: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Check real-time availability for each train in the specified class.
-    Filter to only trains with RAC/AVAILABLE/WAITLIST status.
-    Enrich results with status and booking_link.
+    Async-generator variant of check_and_filter_trains_by_availability.
+
+    Yields bookable trains (enriched with availability_status, booking_link
+    and fare) in route order as soon as every earlier train has been
+    resolved. Checks are launched in a sliding window sized by the adaptive
+    AvailToCheck limiter (or max_concurrent), so once target_count bookable
+    trains have been yielded no new checks are started and outstanding ones
+    are cancelled.
 
     Args:
         trains: List of processed train dictionaries from search
         travel_class: Class code to check (e.g., "3A", "SL")
         journey_date: Journey date in DD-MM-YYYY format
         quota: Booking quota (default: "GN")
-        max_concurrent: Max parallel availability checks (default: 5)
-        max_trains: Max trains to check (default: 20)
-
-    Returns:
-        Filtered list of trains with availability_status and booking_link added
+        max_concurrent: Optional hard ceiling on parallel checks for this call
+        max_trains: Max trains to check (default: TRAIN_AVAILABILITY_MAX_TRAINS)
+        target_count: Stop after this many bookable trains (None = check all)
+        progress: Optional dict; ``stopped_early`` is set True when the
+            target was reached with trains still unchecked, i.e. more
+            bookable trains may exist
+
+    Yields:
+        Enriched bookable train dictionaries in original order
     """
     from .Train_AvailabilityCheck.availability_check_service import AvailabilityCheckService
 
     # Limit trains to check (performance)
     trains_to_check = trains[:max_trains]
-
-    # Create availability check service
     avail_service = AvailabilityCheckService()
+    limiter = get_availability_limiter()
 
-    # Semaphore for concurrency control
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def check_single_train(train: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Check availability for a single train and return enriched data."""
-        async with semaphore:
-            try:
-                train_no = train.get("train_number")
-                # Use station codes from search API (already correct boarding/alighting stations)
-                from_code = train.get("from_station_code", "")
-                to_code = train.get("to_station_code", "")
-
-                # Call availability check service with station codes from search API
-                result = await avail_service.check_availability_multiple_classes(
-                    train_no=train_no,
-                    classes=[travel_class],  # Check only the requested class
-                    journey_date=journey_date,
-                    quota=quota,
-                    from_station_code=from_code,
-                    to_station_code=to_code,
-                )
+    if progress is not None:
+        progress["stopped_early"] = False
 
-                if not result.get("success"):
-                    logger.warning(f"Availability check failed for train {train_no}: {result.get('error')}")
-                    return None
-
-                # Extract class info
-                classes = result.get("classes", [])
-                if not classes:
-                    logger.info(f"No availability data for train {train_no} class {travel_class}")
-                    return None
-
-                class_info = classes[0]  # We only checked one class
-                status = class_info.get("status", "")
-
-                # Filter by status (only RAC/AVAILABLE/WAITLIST)
-                status_upper = status.upper()
-                is_bookable = (
-                    ("AVAILABLE" in status_upper and "NOT AVAILABLE" not in status_upper) or
-                    "WL" in status_upper or
-                    "WAITLIST" in status_upper or
-                    "RAC" in status_upper
-                )
+    pending: Dict[asyncio.Task, int] = {}
+    resolved: Dict[int, Optional[Dict[str, Any]]] = {}
+    next_launch = 0
+    next_yield = 0
+    found = 0
 
-                if not is_bookable:
-                    logger.info(f"Train {train_no} class {travel_class} not bookable: {status}")
-                    return None
-
-                # Build booking link using station codes from search API
-                booking_link = _build_booking_link(
-                    train_no=train_no,
-                    class_code=travel_class,
-                    from_code=from_code,
-                    to_code=to_code,
-                    quota=quota,
-                    journey_date=journey_date,
-                    from_display=train.get("from_station_name", ""),
-                    to_display=train.get("to_station_name", ""),
+    try:
+        while next_yield < len(trains_to_check):
+            # Top up the launch window; the limiter gates the actual upstream calls
+            window = max_concurrent or max(limiter.limit, 1)
+            while next_launch < len(trains_to_check) and len(pending) < window:
+                task = asyncio.ensure_future(
+                    _check_train_availability(
+                        avail_service,
+                        trains_to_check[next_launch],
+                        travel_class,
+                        journey_date,
+                        quota,
+                    )
                 )
+                pending[task] = next_launch
+                next_launch += 1
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                resolved[pending.pop(task)] = task.result()
+
+            # Release the resolved prefix in route order
+            while next_yield in resolved:
+                enriched_train = resolved.pop(next_yield)
+                next_yield += 1
+                if enriched_train is None:
+                    continue
+
+                found += 1
+                yield enriched_train
+
+                if target_count and found >= target_count:
+                    if progress is not None:
+                        progress["stopped_early"] = next_yield < len(trains_to_check)
+                    logger.info(
+                        f"Availability check: page filled with {found} bookable trains after "
+                        f"{next_yield}/{len(trains_to_check)} trains, cancelling {len(pending)} pending checks"
+                    )
+                    return
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
-                # Enrich train data
-                enriched_train = {**train}  # Copy
-                enriched_train["availability_status"] = status
-                enriched_train["booking_link"] = booking_link
-                enriched_train["fare"] = class_info.get("fare")
-
-                return enriched_train
 
-            except Exception as e:
-                logger.error(f"Error checking availability for train {train.get('train_number')}: {e}")
-                return None
+async def check_and_filter_trains_by_availability(
+    trains: List[Dict[str, Any]],
+    travel_class: str,
+    journey_date: str,
+    quota: str = "GN",
+    max_concurrent: Optional[int] = None,
+    max_trains: int = MAX_TRAINS_TO_CHECK,
+    target_count: Optional[int] = None,
+    progress: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Check real-time availability for each train in the specified class.
+    Filter to only trains with RAC/AVAILABLE/WAITLIST status.
+    Enrich results with status and booking_link.
 
-    # Check all trains in parallel
-    tasks = [check_single_train(train) for train in trains_to_check]
-    results = await asyncio.gather(*tasks)
+    Args:
+        trains: List of processed train dictionaries from search
+        travel_class: Class code to check (e.g., "3A", "SL")
+        journey_date: Journey date in DD-MM-YYYY format
+        quota: Booking quota (default: "GN")
+        max_concurrent: Optional hard ceiling on parallel checks for this call.
+            Effective concurrency is set by the adaptive AvailToCheck limiter.
+        max_trains: Max trains to check (default: TRAIN_AVAILABILITY_MAX_TRAINS)
+        target_count: Stop once this many bookable trains are found (None = check all)
+        progress: Optional dict, filled as by stream_bookable_trains
 
-    # Filter out None results (failed checks or non-bookable)
-    filtered_trains = [r for r in results if r is not None]
+    Returns:
+        Filtered list of trains with availability_status and booking_link added
+    """
+    filtered_trains = [
+        train
+        async for train in stream_bookable_trains(
+            trains,
+            travel_class=travel_class,
+            journey_date=journey_date,
+            quota=quota,
+            max_concurrent=max_concurrent,
+            max_trains=max_trains,
+            target_count=target_count,
+            progress=progress,
+        )
+    ]
 
-    logger.info(f"Availability check: {len(trains_to_check)} trains checked, {len(filtered_trains)} bookable")
+    logger.info(f"Availability check: {min(len(trains), max_trains)} trains considered, {len(filtered_trains)} bookable")
+    logger.info(f"AvailToCheck limiter: {get_availability_limiter().metrics()}")
+    logger.info(f"AvailToCheck cache: {get_availability_cache().metrics()}")
 
     return filtered_trains
 
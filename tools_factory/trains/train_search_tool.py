@@ -5,7 +5,8 @@ from datetime import datetime, timedelta
 import logging
 
 from .train_schema import TrainSearchInput
-from .train_search_service import search_trains, build_whatsapp_train_response, check_and_filter_trains_by_availability
+from .train_search_service import search_trains, build_whatsapp_train_response, check_and_filter_trains_by_availability, train_cheapest_fare, attach_train_deep_links
+from tools_factory.ranking import page_highlights
 from .train_renderer import render_train_results
 from tools_factory.base_schema import ToolResponseFormat
 
@@ -92,22 +93,28 @@ class TrainSearchTool(BaseTool):
             departure_time_max=payload.departure_time_max,
             arrival_time_min=payload.arrival_time_min,
             arrival_time_max=payload.arrival_time_max,
+            defer_deep_links=True,
         )
 
         has_error = bool(train_results.get("error"))
 
         # NEW: Check availability and filter if class mentioned + WhatsApp user
+        availability_truncated = False
         if not has_error and payload.travel_class and is_whatsapp:
             try:
-                # Check availability for all trains in the specified class
+                # Stream availability in route order and stop once the requested page is full
+                page_target = payload.page * limit
+                availability = {}
                 train_results["trains"] = await check_and_filter_trains_by_availability(
                     trains=train_results.get("trains", []),
                     travel_class=payload.travel_class,
                     journey_date=payload.journey_date,
                     quota=search_quota,
-                    max_concurrent=5,  # Can be made configurable
-                    max_trains=20,     # Can be made configurable
+                    target_count=page_target,
+                    progress=availability,
                 )
+                # Only a page filled with trains left unchecked can have more beyond it
+                availability_truncated = availability.get("stopped_early", False)
 
                 # Update total count
                 train_results["total_count"] = len(train_results["trains"])
@@ -126,20 +133,31 @@ class TrainSearchTool(BaseTool):
             page = payload.page  # Get page from validated payload
             offset = (page - 1) * limit
             end = offset + limit
+            # Where the cheapest train sits across all pages, found in one pass
+            train_results["highlights"] = page_highlights(
+                train_results["trains"], limit, cheapest=train_cheapest_fare,
+            )
             train_results["trains"] = train_results["trains"][offset:end]
 
             # Add pagination metadata
             train_results["pagination"] = {
                 "current_page": page,
                 "per_page": limit,
+                # Early-terminated availability checks may have more bookable trains beyond
+                # this page, so the totals only count those found so far (a lower bound)
                 "total_results": total_trains,
-                "total_pages": (total_trains + limit - 1) // limit if limit > 0 else 0,
-                "has_next_page": end < total_trains,
+                "total_is_lower_bound": availability_truncated,
+                "total_pages": ((total_trains + limit - 1) // limit if limit > 0 else 0) + availability_truncated,
+                "has_next_page": end < total_trains or availability_truncated,
                 "has_previous_page": page > 1,
                 "showing_from": offset + 1 if train_results["trains"] else 0,
                 "showing_to": min(end, total_trains)
             }
 
+            # Book-now links only for the page being returned (WhatsApp never shows them)
+            if not is_whatsapp:
+                attach_train_deep_links(train_results["trains"], quota=search_quota)
+
         trains = train_results.get("trains", [])
         train_count = len(trains)
 
@@ -191,7 +209,10 @@ class TrainSearchTool(BaseTool):
                 current_page = pagination.get("current_page", 1)
                 showing_from = pagination.get("showing_from", 1)
                 showing_to = pagination.get("showing_to", train_count)
-                text = f"Showing trains {showing_from}-{showing_to} of {total} from {payload.from_station} to {payload.to_station}{filter_text} (Page {current_page})"
+                if pagination.get("total_is_lower_bound"):
+                    text = f"Showing trains {showing_from}-{showing_to} from {payload.from_station} to {payload.to_station}{filter_text} (Page {current_page}, more available)"
+                else:
+                    text = f"Showing trains {showing_from}-{showing_to} of {total} from {payload.from_station} to {payload.to_station}{filter_text} (Page {current_page})"
             else:
                 text = f"Found {train_count} trains from {payload.from_station} to {payload.to_station}{filter_text}!"
 